@@ -13,6 +13,9 @@
 
 DEBUG = False
 
+# CORE_TIMER counts at half the core clock of 80 MHz and wraps around after 2**32 ticks (107 s)
+CORE_TIMER_FREQUENCY = 40e6
+
 
 def gen_bit_mask(masked_channels: list, num_channels: int, invert_mask=False) -> int:
     """ generate a bit mask for a list of channels
@@ -343,6 +346,22 @@ def read_counter_pins(self, count_time, bus_correction=0) -> list:
         return np.array(
             [int(end_values[i]) - int(start_value) for i, start_value in enumerate(start_values)])
 
+    def read_counter_pins_and_core_timer(self) -> tuple:
+        """ method to read the high speed counter pins together with the CORE_TIMER of the device
+        The values are read with a single command, so that the time stamp belongs to the counts.
+        The difference of two time stamps gives the gate time as measured by the device clock.
+        RETURNS:
+            counts as int array and the CORE_TIMER value (see CORE_TIMER_FREQUENCY) """
+
+        read_commands = []
+        for pin in self.counter_pins:
+            read_commands += [f"{pin}_EF_READ_A"]
+        read_commands += ["CORE_TIMER"]
+
+        values = ljm.eReadNames(self.handle, len(read_commands), read_commands)
+
+        return np.array(values[:-1]).astype(np.int64), int(values[-1])
+
     def set_flex_pins_to_analog(self, pin_names: List[str], set_digital=False):
         """ A method for the T4 to switch the flexible pins (FIOx and EIO0-4) to ANALOG or DIGITAL
             Inputs:
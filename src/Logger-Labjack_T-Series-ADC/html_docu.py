@@ -50,5 +50,14 @@
     <li>T4 flex pins can also be set to analog in</li>
     <li>Pin name and functions can be found at {pin_names_hyperlink} and {hardware_hyperlink}
     </ul>
+    <p>Stream mode:</p>
+    <ul>
+    <li>With acquisition 'Stream', the analog read pins are sampled by the device clock at the scan rate.</li>
+    <li>Scans are read in blocks of 'Scans per read' in the background. Each step returns the time in s since
+     the start of the stream and the values of all scans received since the start of the step.</li>
+    <li>Digital read pins and extended AIN modes are not available in stream mode.</li>
+    <li>The maximum scan rate depends on the model and the number of channels, see the stream mode section of the
+     T-series datasheet.</li>
+    </ul>
     <p>&nbsp;</p>
     """
\ No newline at end of file
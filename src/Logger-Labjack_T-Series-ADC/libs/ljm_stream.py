@@ -0,0 +1,170 @@
+# This Device Class is published under the terms of the MIT License.
+# Required Third Party Libraries, which are included in the Device Class
+# package for convenience purposes, may have a different license. You can
+# find those in the corresponding folders or contact the maintainer.
+#
+# MIT License
+#
+# Copyright (c) 2025 SweepMe! GmbH (sweep-me.net)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+"""Stream the channels of a LabJack T-series device into a ring buffer.
+
+In stream mode, the device samples the channels of the scan list with its own clock at the scan rate and LJM collects
+the scans in its buffer. A background thread moves blocks of scans from LJM with eStreamRead into a numpy ring buffer,
+so that the driver can return all scans of a time window without a command-response cycle per scan.
+
+Scan n of the stream was taken at n / scan rate seconds after the first scan. Scans that the device skipped, e.g.
+because of a buffer overflow, are returned by LJM with the dummy value -9999 and are stored as nan.
+"""
+
+from __future__ import annotations
+
+import threading
+
+import numpy as np
+from labjack import ljm
+
+# Duration in s of the scans kept in the ring buffer until they are read
+BUFFER_DURATION = 60.0
+
+
+class ScanBuffer:
+    """Ring buffer that keeps the latest scans and counts all scans written since the start.
+
+    Args:
+        number_of_channels: Number of values per scan.
+        size: Number of scans that are kept.
+    """
+
+    def __init__(self, number_of_channels: int, size: int) -> None:
+        self.size = size
+        self.data = np.full((size, number_of_channels), np.nan)
+        self.scan_count = 0
+        self.lock = threading.Lock()
+
+    def write(self, scans: np.ndarray) -> None:
+        """Append scans given as array with one row per scan, the oldest scans are overwritten if the buffer is full."""
+        stop_scan = self.scan_count + len(scans)
+        scans = scans[-self.size:]
+        positions = np.arange(stop_scan - len(scans), stop_scan) % self.size
+        with self.lock:
+            self.data[positions] = scans
+            self.scan_count = stop_scan
+
+    def read(self, start_scan: int) -> tuple[int, np.ndarray]:
+        """Return the index of the first returned scan and a copy of all scans from start_scan on.
+
+        Scans that have already been overwritten are not returned, so the first returned scan can be later than
+        start_scan.
+        """
+        with self.lock:
+            start_scan = max(start_scan, self.scan_count - self.size)
+            positions = np.arange(start_scan, self.scan_count) % self.size
+            return start_scan, self.data[positions]
+
+
+class StreamReader:
+    """Stream channels of a device in a background thread into a ScanBuffer.
+
+    Args:
+        handle: Handle of the opened device.
+        names: Names of the channels to stream, e.g. ["AIN0", "AIN1"].
+        scan_rate: Requested number of scans per second.
+        scans_per_read: Number of scans that are moved from LJM to the buffer per eStreamRead.
+        buffer_duration: Duration in s of the scans that are kept in the buffer.
+    """
+
+    def __init__(self, handle: int, names: list[str], scan_rate: float, scans_per_read: int,
+                 buffer_duration: float = BUFFER_DURATION) -> None:
+        self.handle = handle
+        self.names = list(names)
+        self.scan_rate = float(scan_rate)
+        self.scans_per_read = int(scans_per_read)
+
+        size = max(int(self.scan_rate * buffer_duration), 2 * self.scans_per_read)
+        self.buffer = ScanBuffer(len(self.names), size)
+
+        self.device_scan_backlog = 0
+        self.ljm_scan_backlog = 0
+        self.error: Exception | None = None
+
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def scan_count(self) -> int:
+        """Number of scans received since the start of the stream."""
+        return self.buffer.scan_count
+
+    def start(self) -> float:
+        """Start the stream and the reader thread and return the actual scan rate of the device."""
+        addresses, _ = ljm.namesToAddresses(len(self.names), self.names)
+
+        # Stream with the internal clock and without waiting for a trigger
+        ljm.eWriteNames(self.handle, 2, ["STREAM_TRIGGER_INDEX", "STREAM_CLOCK_SOURCE"], [0, 0])
+
+        self.scan_rate = ljm.eStreamStart(self.handle, self.scans_per_read, len(addresses), addresses, self.scan_rate)
+
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._read_stream, name="LabJack stream reader", daemon=True)
+        self._thread.start()
+
+        return self.scan_rate
+
+    def stop(self) -> None:
+        """Stop the reader thread and the stream."""
+        self._stop_event.set()
+        if self._thread is not None:
+            # eStreamRead returns at the latest after scans_per_read scans
+            self._thread.join()
+            self._thread = None
+
+        try:
+            ljm.eStreamStop(self.handle)
+        except ljm.LJMError as exc:
+            if exc.errorCode != ljm.errorcodes.STREAM_NOT_RUNNING:
+                raise
+
+    def read(self, start_scan: int = 0) -> tuple[np.ndarray, np.ndarray]:
+        """Return the times in s since the first scan and the values of all scans from start_scan on.
+
+        Returns:
+            Times with one value per scan and values with one row per scan and one column per channel.
+        """
+        if self.error is not None:
+            raise self.error
+
+        first_scan, scans = self.buffer.read(start_scan)
+        times = np.arange(first_scan, first_scan + len(scans)) / self.scan_rate
+        return times, scans
+
+    def _read_stream(self) -> None:
+        """Move the scans from LJM to the buffer until the reader is stopped."""
+        try:
+            while not self._stop_event.is_set():
+                data, self.device_scan_backlog, self.ljm_scan_backlog = ljm.eStreamRead(self.handle)
+                scans = np.array(data).reshape(-1, len(self.names))
+                scans[scans == ljm.constants.DUMMY_VALUE] = np.nan
+                self.buffer.write(scans)
+        except Exception as exc:  # noqa: BLE001 - the error is raised in the thread of the driver when reading
+            self.error = exc
@@ -46,6 +46,7 @@
 html_docu = load_source(driver_name + ".html_docu", main_path + os.sep + "html_docu.py")
 
 import numpy as np
+from ljm_stream import StreamReader
 
 
 class Device(Labjack_T_Series_BaseClass.LabjackBaseClass):
@@ -68,6 +69,9 @@ def __init__(self):
         self.output_lows = []
         self.results = np.array([])
 
+        self.stream = None
+        self.window_start_scan = 0
+
     def set_GUIparameter(self):
 
         gui_parameter = {
@@ -77,7 +81,10 @@ def set_GUIparameter(self):
             "Analog": None,
             "Analog read pins": "AIN1, AIN2",
             "Extended AIN mode": list(Labjack_T_Series_BaseClass.ljm_constants.ADC_EF_FUNCTIONS.keys()),
-            "EF config string": ""
+            "EF config string": "",
+            "Acquisition": ["Command-response", "Stream"],
+            "Scan rate in Hz": "1000",
+            "Scans per read": "100",
         }
 
         # "Prevent overwrite of Output by read/analogue"
@@ -129,6 +136,29 @@ def parse_GUIparameter(self):
         AIN_units = [unit for unit in units for ch_name in self.analog_in]
         self.units = AIN_units + [""] * len(self.digital_in)
 
+        # Stream mode
+        self.acquisition = parameter.get("Acquisition", "Command-response")
+        if self.acquisition == "Stream":
+            if self.digital_in:
+                msg = "Digital read pins are not supported in stream mode."
+                raise ValueError(msg)
+            if self.adc_ef_mode.index != 0:
+                msg = "Extended AIN modes are not supported in stream mode."
+                raise ValueError(msg)
+            if not self.analog_in:
+                msg = "Please enter at least one analog read pin for stream mode."
+                raise ValueError(msg)
+
+            try:
+                self.scan_rate = float(parameter.get("Scan rate in Hz", "1000"))
+                self.scans_per_read = int(parameter.get("Scans per read", "100"))
+            except ValueError as exc:
+                msg = "Scan rate and scans per read must be numbers."
+                raise ValueError(msg) from exc
+
+            self.variables = ["Time"] + self.analog_in
+            self.units = ["s"] + ["V"] * len(self.analog_in)
+
         # Parse EF CONFIG
         if self.adc_ef_mode.index != 0:
             ef_config_string: str = parameter["EF config string"]
@@ -197,6 +227,10 @@ def configure(self):
         if self.analog_in:
             self.set_adc_extended_function(self.analog_in, self.adc_ef_mode.index)
 
+        if self.acquisition == "Stream":
+            self.stream = StreamReader(self.handle, self.analog_in, self.scan_rate, self.scans_per_read)
+            self.scan_rate = self.stream.start()
+
         # for standard functions skip advanced config
         if self.adc_ef_mode.index == 0:
             return
@@ -210,8 +244,23 @@ def configure(self):
                 values += [float(item)]
             self.write_names(commands=config_commands, values=values)
 
+    def unconfigure(self):
+
+        if self.stream is not None:
+            self.stream.stop()
+            self.stream = None
+
+    def start(self):
+
+        # The scans of a step are those received from the start of the step until call
+        if self.stream is not None:
+            self.window_start_scan = self.stream.scan_count
+
     def measure(self):
 
+        if self.stream is not None:
+            return
+
         if self.adc_ef_mode.index == 0:
             self.results = self.read_pins(pin_names=self.analog_in + self.digital_in,
                                           auto_switch_to_input=True)
@@ -233,6 +282,10 @@ def measure(self):
     def call(self) -> list:
         """
         """
+        if self.stream is not None:
+            times, scans = self.stream.read(self.window_start_scan)
+            return [times, *scans.T]
+
         return list(self.results)
 
 
@@ -0,0 +1,103 @@
+"""Unit tests for streaming LabJack T-series channels into a ring buffer.
+
+The stream tests use the demo mode of LJM, which emulates a device without hardware. They are skipped if the LJM
+library is not installed.
+"""
+
+import sys
+import time
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+# add libs folder to sys.path to enable import of ljm_stream
+libs_folder = Path(__file__).resolve().parents[2] / "libs"
+if str(libs_folder) not in sys.path:
+    sys.path.insert(0, str(libs_folder))
+
+from labjack import ljm  # noqa: E402
+from ljm_stream import ScanBuffer, StreamReader  # noqa: E402
+
+
+class ScanBufferTests(unittest.TestCase):
+    """Tests for writing and reading scans across the end of the ring buffer."""
+
+    def setUp(self) -> None:
+        self.buffer = ScanBuffer(number_of_channels=2, size=10)
+
+    def write_scans(self, start: int, stop: int) -> None:
+        """Write the scans start...stop-1 with the values (n, -n)."""
+        scans = np.arange(start, stop, dtype=float)
+        self.buffer.write(np.column_stack([scans, -scans]))
+
+    def test_read_from_start_scan(self) -> None:
+        """All scans from the start scan on are returned with the index of the first scan."""
+        self.write_scans(0, 6)
+        self.write_scans(6, 14)
+
+        first_scan, scans = self.buffer.read(7)
+
+        self.assertEqual(first_scan, 7)
+        np.testing.assert_array_equal(scans[:, 0], np.arange(7, 14))
+        np.testing.assert_array_equal(scans[:, 1], -np.arange(7, 14))
+
+    def test_overwritten_scans_are_skipped(self) -> None:
+        """Scans that are no longer in the buffer are not returned."""
+        self.write_scans(0, 25)
+
+        first_scan, scans = self.buffer.read(0)
+
+        self.assertEqual(first_scan, 15)
+        np.testing.assert_array_equal(scans[:, 0], np.arange(15, 25))
+        self.assertEqual(self.buffer.scan_count, 25)
+
+    def test_no_new_scans(self) -> None:
+        """Reading from the current scan count returns an empty block."""
+        self.write_scans(0, 3)
+
+        first_scan, scans = self.buffer.read(3)
+
+        self.assertEqual(first_scan, 3)
+        self.assertEqual(scans.shape, (0, 2))
+
+
+class DemoModeStreamTests(unittest.TestCase):
+    """Timing of a stream of 8 channels at 1 kHz with a device emulated by LJM."""
+
+    def setUp(self) -> None:
+        try:
+            self.handle = ljm.openS("ANY", "ANY", ljm.constants.DEMO_MODE)
+        except (ljm.LJMError, AttributeError) as exc:
+            self.skipTest(f"LJM demo mode not available: {exc}")
+
+    def tearDown(self) -> None:
+        ljm.close(self.handle)
+
+    def test_scans_follow_scan_rate(self) -> None:
+        """The number of scans and their times correspond to the scan rate of the device."""
+        names = [f"AIN{i}" for i in range(8)]
+        reader = StreamReader(self.handle, names, scan_rate=1000, scans_per_read=100)
+        try:
+            scan_rate = reader.start()
+        except ljm.LJMError as exc:
+            self.skipTest(f"Stream not supported in demo mode: {exc}")
+
+        try:
+            time.sleep(0.2)
+            start_scan = reader.scan_count
+            start_time = time.perf_counter()
+            time.sleep(1.0)
+            times, scans = reader.read(start_scan)
+            duration = time.perf_counter() - start_time
+        finally:
+            reader.stop()
+
+        self.assertEqual(scans.shape[1], len(names))
+        self.assertAlmostEqual(len(times) / scan_rate, duration, delta=0.2)
+        np.testing.assert_allclose(np.diff(times), 1 / scan_rate)
+        self.assertEqual(times[0], start_scan / scan_rate)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -25,6 +25,18 @@
     <li>Bus time correction (s): a correction to the measurement duration accounting for the 
     USB/ethernet 'stop' command transmission</li>
     <li>Pin name and functions can be found at {pin_names_hyperlink} and {hardware_hyperlink}</li>
+    <li>Gate:
+    <ul>
+    <li>Software timed: the counters are read before and after waiting for the count time.
+     The gate time varies with the timing of the operating system and the bus.</li>
+    <li>Core timer: the counters are read together with the CORE_TIMER of the device. The rate is calculated
+     with the gate time measured by the device clock, which is returned as 'Gate time'. The gate is opened in
+     'measure' and closed in 'read_result', so several counter loggers count at the same time.
+     The count time must be shorter than 107 s.</li>
+    <li>Stream: the device takes a scan of all counter pins every count time and the counts between two
+     consecutive scans are returned. The gate is defined by the device clock. Only one stream per device is possible,
+     so all counter pins of a device must be read by one logger.</li>
+    </ul></li>
     </ul>
     <p>&nbsp;</p>
     """
\ No newline at end of file
@@ -29,6 +29,7 @@
 # Device: Labjack T-series
 
 import os
+import time
 
 # adding the libs folder to path is needed so that the BaseClass can find the labjack ljm package
 from pysweepme import load_source
@@ -45,6 +46,12 @@
 
 html_docu = load_source(driver_name + ".html_docu", main_path + os.sep + "html_docu.py")
 
+import numpy as np
+from ljm_stream import StreamReader
+
+# counter values and CORE_TIMER are 32 bit and wrap around
+COUNTER_RANGE = 2**32
+
 
 class Device(Labjack_T_Series_BaseClass.LabjackBaseClass):
     """ the Class that will be used by the switch module to control the instrument.
@@ -65,11 +72,19 @@ def __init__(self):
         self.output_highs = []
         self.output_lows = []
 
+        self.results = []
+        self.stream = None
+        self.start_counts = None
+        self.start_core_timer = 0
+        self.start_scan = 0
+        self.gate_start_time = 0.0
+
     def set_GUIparameter(self):
 
         GUIparameter = {
             "Counter read pins": "CIO1, CIO2",
             "Count time s": 1.0,
+            "Gate": ["Software timed", "Core timer", "Stream"],
             "": None,
             "Bus time correction in s": 30e-6,
             "Override clock": True
@@ -94,10 +109,21 @@ def get_GUIparameter(self, parameter):
         if not self.counter_pins:
             raise ValueError("Please specify counter pins or disable logger")
 
-        self.variables = self.counter_pins
+        self.gate = parameter.get("Gate", "Software timed")
+
+        self.variables = list(self.counter_pins)
         self.units = [""] * len(self.variables)
+        if self.gate != "Software timed":
+            self.variables += [f"{pin} rate" for pin in self.counter_pins] + ["Gate time"]
+            self.units += ["1/s"] * len(self.counter_pins) + ["s"]
 
         self.count_time = float(parameter["Count time s"])
+        # the gate time is measured with the 32 bit core timer, which wraps around after about 107 s
+        max_core_timer_time = COUNTER_RANGE / Labjack_T_Series_BaseClass.CORE_TIMER_FREQUENCY
+        if self.gate == "Core timer" and self.count_time >= max_core_timer_time:
+            msg = (f"The count time must be shorter than {max_core_timer_time:.1f} s for the 'Core timer' gate. "
+                   f"Please use the 'Stream' or 'Software timed' gate for longer count times.")
+            raise ValueError(msg)
         self.bus_correction = float(parameter["Bus time correction in s"])
         self.override_clock = bool(parameter['Override clock'])
 
@@ -109,6 +135,21 @@ def configure(self):
         ]
         self.set_pins_to_hs_counter(self.counter_pins, override_clock=self.override_clock)
 
+        if self.gate == "Stream":
+            # The device takes one scan per count time. Each 32-bit counter is streamed as the lower 16 bits
+            # followed by the upper 16 bits that are captured in STREAM_DATA_CAPTURE_16.
+            names = []
+            for pin in self.counter_pins:
+                names += [f"{pin}_EF_READ_A", "STREAM_DATA_CAPTURE_16"]
+            self.stream = StreamReader(self.handle, names, scan_rate=1.0 / self.count_time, scans_per_read=1)
+            self.count_time = 1.0 / self.stream.start()
+
+    def unconfigure(self):
+
+        if self.stream is not None:
+            self.stream.stop()
+            self.stream = None
+
     def call(self):
         """
         """
@@ -116,5 +157,44 @@ def call(self):
 
     def measure(self):
 
-        self.results = self.read_counter_pins(count_time=self.count_time,
-                                              bus_correction=self.bus_correction)
+        if self.gate == "Software timed":
+            self.results = self.read_counter_pins(count_time=self.count_time,
+                                                  bus_correction=self.bus_correction)
+
+        # The gate is started here and closed in read_result, so that the gates of several loggers overlap
+        elif self.gate == "Core timer":
+            self.start_counts, self.start_core_timer = self.read_counter_pins_and_core_timer()
+            self.gate_start_time = time.perf_counter()
+
+        elif self.gate == "Stream":
+            # the next scan opens the gate, the scan after it closes it
+            self.start_scan = self.stream.scan_count
+
+    def read_result(self):
+
+        if self.gate == "Core timer":
+            remaining_time = self.count_time - (time.perf_counter() - self.gate_start_time)
+            if remaining_time > 0:
+                time.sleep(remaining_time)
+
+            end_counts, end_core_timer = self.read_counter_pins_and_core_timer()
+            counts = (end_counts - self.start_counts) % COUNTER_RANGE
+            gate_time = ((end_core_timer - self.start_core_timer) % COUNTER_RANGE
+                         / Labjack_T_Series_BaseClass.CORE_TIMER_FREQUENCY)
+            self.results = [*counts, *(counts / gate_time), gate_time]
+
+        elif self.gate == "Stream":
+            timeout = time.perf_counter() + 2 * self.count_time + 1.0
+            while self.stream.scan_count < self.start_scan + 2:
+                if time.perf_counter() > timeout:
+                    msg = "Labjack counter stream did not return scans in time."
+                    raise TimeoutError(msg)
+                time.sleep(min(self.count_time / 10, 0.01))
+
+            _, scans = self.stream.read(self.start_scan)
+            if len(scans) == 0 or np.any(np.isnan(scans[:2])):
+                msg = "Scans of the counter stream were lost or skipped, please increase the count time."
+                raise RuntimeError(msg)
+            values = scans[:2, 0::2].astype(np.int64) + scans[:2, 1::2].astype(np.int64) * 2**16
+            counts = (values[1] - values[0]) % COUNTER_RANGE
+            self.results = [*counts, *(counts / self.count_time), self.count_time]
@@ -40,6 +40,7 @@
 from yoctopuce.yocto_temperature import *
 from yoctopuce.yocto_humidity import *
 from yoctopuce.yocto_pressure import *
+from timed_reports import READOUT_MODES, TimedReportBuffer
 
 from pysweepme.EmptyDeviceClass import EmptyDevice
 
@@ -49,6 +50,13 @@ class Device(EmptyDevice):
     description =   """
                     https://www.yoctopuce.com/EN/doc/reference/yoctolib-python-EN.html<br>
                     <br>
+                    Readout:<br>
+                    - Polling: each value is requested from the module at every call.<br>
+                    - Timed reports, latest value: the module sends the values with the report frequency,
+                    e.g. '100/s', and the latest values are returned.<br>
+                    - Timed reports, all samples: all values received since the last call are returned as arrays
+                    together with their timestamps in s since 1970 (UTC).<br>
+                    <br>
                     
                     
                     """
@@ -59,10 +67,8 @@ def __init__(self):
         
         self.shortname = "Yocto-Meteo-V2" # short name will be shown in the sequencer
 
-        self.variables = ["Temperature", "Humidity", "Pressure"]
-        self.units = ["°C", "%", "mbar"]
-        self.plottype = [True, True, True]
-        self.savetype = [True, True, True]
+        self.timed_reports = None
+
         
         
 
@@ -70,6 +76,8 @@ def set_GUIparameter(self):
     
         # add keys and values to generate GUI elements in the Parameters-Box
         GUIparameter = {
+                        "Readout": READOUT_MODES,
+                        "Report frequency": "100/s",
                         }
 
         return GUIparameter
@@ -77,6 +85,20 @@ def set_GUIparameter(self):
        
     def get_GUIparameter(self, parameter):
         
+        self.variables = ["Temperature", "Humidity", "Pressure"]
+        self.units = ["°C", "%", "mbar"]
+        self.plottype = [True, True, True]
+        self.savetype = [True, True, True]
+
+        self.readout = parameter.get("Readout", "Polling")
+        self.report_frequency = parameter.get("Report frequency", "100/s")
+
+        if self.readout == "Timed reports, all samples":
+            self.variables.append("Timestamp")
+            self.units.append("s")
+            self.plottype.append(False)
+            self.savetype.append(True)
+
         self.port_serial = parameter["Port"]
       
     def find_Ports(self):
@@ -169,11 +191,31 @@ def initialize(self):
         pass
 
     def configure(self):
-        
-        pass
 
+        if self.readout != "Polling":
+            sensors = [self.temperature_sensor, self.humidity_sensor, self.pressure_sensor]
+            self.timed_reports = TimedReportBuffer(sensors, self.report_frequency)
+            self.timed_reports.start()
+
+            if self.readout == "Timed reports, latest value":
+                self.timed_reports.wait_for_reports()
+
+    def unconfigure(self):
+
+        if self.timed_reports is not None:
+            self.timed_reports.stop()
+            self.timed_reports = None
 
     def call(self):
+
+        if self.readout == "Timed reports, latest value":
+            self.timed_reports.handle_events()
+            return self.timed_reports.latest_values()
+
+        elif self.readout == "Timed reports, all samples":
+            self.timed_reports.handle_events()
+            timestamps, values = self.timed_reports.read_samples()
+            return [*values, timestamps]
     
         values = []
     
@@ -38,6 +38,7 @@
 
 from yoctopuce.yocto_api import *
 from yoctopuce.yocto_temperature import *
+from timed_reports import READOUT_MODES, TimedReportBuffer
 
 from pysweepme.EmptyDeviceClass import EmptyDevice
 
@@ -47,6 +48,13 @@ class Device(EmptyDevice):
     description =   """
                     https://www.yoctopuce.com/EN/doc/reference/yoctolib-python-EN.html<br>
                     <br>
+                    Readout:<br>
+                    - Polling: each value is requested from the module at every call.<br>
+                    - Timed reports, latest value: the module sends the values with the report frequency,
+                    e.g. '100/s', and the latest values are returned.<br>
+                    - Timed reports, all samples: all values received since the last call are returned as arrays
+                    together with their timestamps in s since 1970 (UTC).<br>
+                    <br>
                     A 'zeroAdjust' is performed during initialization.<br>
                     <br>
                     Recalculation from measured value to mA is not done yet.
@@ -59,11 +67,15 @@ def __init__(self):
         
         self.shortname = "Yocto-PT100" # short name will be shown in the sequencer
 
+        self.timed_reports = None
+
 
     def set_GUIparameter(self):
     
         # add keys and values to generate GUI elements in the Parameters-Box
         GUIparameter = {
+                        "Readout": READOUT_MODES,
+                        "Report frequency": "100/s",
                         }
 
         return GUIparameter
@@ -75,6 +87,15 @@ def get_GUIparameter(self, parameter):
         self.units = ["°C"]
         self.plottype = [True]
         self.savetype = [True]
+
+        self.readout = parameter.get("Readout", "Polling")
+        self.report_frequency = parameter.get("Report frequency", "100/s")
+
+        if self.readout == "Timed reports, all samples":
+            self.variables.append("Timestamp")
+            self.units.append("s")
+            self.plottype.append(False)
+            self.savetype.append(True)
         
             
         self.port_serial = parameter["Port"]
@@ -157,7 +178,31 @@ def initialize(self):
         pass
 
 
+    def configure(self):
+
+        if self.readout != "Polling":
+            self.timed_reports = TimedReportBuffer([self.temperature], self.report_frequency)
+            self.timed_reports.start()
+
+            if self.readout == "Timed reports, latest value":
+                self.timed_reports.wait_for_reports()
+
+    def unconfigure(self):
+
+        if self.timed_reports is not None:
+            self.timed_reports.stop()
+            self.timed_reports = None
+
     def call(self):
+
+        if self.readout == "Timed reports, latest value":
+            self.timed_reports.handle_events()
+            return self.timed_reports.latest_values()
+
+        elif self.readout == "Timed reports, all samples":
+            self.timed_reports.handle_events()
+            timestamps, values = self.timed_reports.read_samples()
+            return [*values, timestamps]
     
         values = []
     
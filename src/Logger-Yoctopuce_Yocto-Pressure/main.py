@@ -39,6 +39,7 @@
 from yoctopuce.yocto_api import *
 from yoctopuce.yocto_temperature import *
 from yoctopuce.yocto_pressure import *
+from timed_reports import READOUT_MODES, TimedReportBuffer
 
 from pysweepme.EmptyDeviceClass import EmptyDevice
 
@@ -48,6 +49,13 @@ class Device(EmptyDevice):
     description =   """
                     https://www.yoctopuce.com/EN/doc/reference/yoctolib-python-EN.html<br>
                     <br>
+                    Readout:<br>
+                    - Polling: each value is requested from the module at every call.<br>
+                    - Timed reports, latest value: the module sends the values with the report frequency,
+                    e.g. '100/s', and the latest values are returned.<br>
+                    - Timed reports, all samples: all values received since the last call are returned as arrays
+                    together with their timestamps in s since 1970 (UTC).<br>
+                    <br>
                     
                     
                     """
@@ -58,10 +66,8 @@ def __init__(self):
         
         self.shortname = "Yocto-Pressure" # short name will be shown in the sequencer
 
-        self.variables = ["Temperature", "Pressure"]
-        self.units = ["°C", "mbar"]
-        self.plottype = [True, True]
-        self.savetype = [True, True]
+        self.timed_reports = None
+
         
         
 
@@ -69,6 +75,8 @@ def set_GUIparameter(self):
     
         # add keys and values to generate GUI elements in the Parameters-Box
         GUIparameter = {
+                        "Readout": READOUT_MODES,
+                        "Report frequency": "100/s",
                         }
 
         return GUIparameter
@@ -76,6 +84,20 @@ def set_GUIparameter(self):
        
     def get_GUIparameter(self, parameter):
         
+        self.variables = ["Temperature", "Pressure"]
+        self.units = ["°C", "mbar"]
+        self.plottype = [True, True]
+        self.savetype = [True, True]
+
+        self.readout = parameter.get("Readout", "Polling")
+        self.report_frequency = parameter.get("Report frequency", "100/s")
+
+        if self.readout == "Timed reports, all samples":
+            self.variables.append("Timestamp")
+            self.units.append("s")
+            self.plottype.append(False)
+            self.savetype.append(True)
+
         self.port_serial = parameter["Port"]
       
     def find_Ports(self):
@@ -163,11 +185,30 @@ def initialize(self):
         pass
 
     def configure(self):
-        
-        pass
 
+        if self.readout != "Polling":
+            self.timed_reports = TimedReportBuffer([self.temperature_sensor, self.pressure_sensor], self.report_frequency)
+            self.timed_reports.start()
+
+            if self.readout == "Timed reports, latest value":
+                self.timed_reports.wait_for_reports()
+
+    def unconfigure(self):
+
+        if self.timed_reports is not None:
+            self.timed_reports.stop()
+            self.timed_reports = None
 
     def call(self):
+
+        if self.readout == "Timed reports, latest value":
+            self.timed_reports.handle_events()
+            return self.timed_reports.latest_values()
+
+        elif self.readout == "Timed reports, all samples":
+            self.timed_reports.handle_events()
+            timestamps, values = self.timed_reports.read_samples()
+            return [*values, timestamps]
     
         values = []
     
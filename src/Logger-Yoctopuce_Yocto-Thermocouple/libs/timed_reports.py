@@ -0,0 +1,156 @@
+# This Device Class is published under the terms of the MIT License.
+# Required Third Party Libraries, which are included in the Device Class
+# package for convenience purposes, may have a different license. You can
+# find those in the corresponding folders or contact the maintainer.
+#
+# MIT License
+#
+# Copyright (c) 2025 SweepMe! GmbH (sweep-me.net)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+
+"""Collect the timed reports of Yoctopuce sensors in ring buffers.
+
+With timed reports, a module pushes the values of its sensors at a fixed report frequency, e.g. "100/s". The reports
+are received by the library during YAPI.HandleEvents or YAPI.Sleep and passed to a callback. Compared to polling with
+isOnline and get_currentValue, no USB transaction per value is needed, so that several modules can be logged at high
+rates.
+
+The reports of all sensors of one module at the same report frequency are sent together, so that the n-th report of
+each sensor belongs to the same point in time. read_samples relies on this to return aligned blocks of samples.
+"""
+
+from __future__ import annotations
+
+import functools
+import time
+
+import numpy as np
+from yoctopuce.yocto_api import YAPI, YRefParam
+
+# Options of the drivers' GUI parameter "Readout"
+READOUT_MODES = ["Polling", "Timed reports, latest value", "Timed reports, all samples"]
+
+# Number of reports per sensor that are kept, about 10 min at 100/s
+BUFFER_SIZE = 2**16
+
+
+class TimedReportBuffer:
+    """Ring buffers for the timed reports of several sensors.
+
+    Args:
+        sensors: Yoctopuce sensors, e.g. YVoltage or YTemperature objects.
+        report_frequency: Report frequency as accepted by set_reportFrequency, e.g. "100/s" or "10/m".
+        buffer_size: Number of reports per sensor that are kept until they are read.
+    """
+
+    def __init__(self, sensors: list, report_frequency: str = "100/s", buffer_size: int = BUFFER_SIZE) -> None:
+        if len(sensors) == 0:
+            msg = "At least one sensor is needed for timed reports."
+            raise ValueError(msg)
+
+        self.sensors = list(sensors)
+        self.report_frequency = report_frequency
+        self.buffer_size = buffer_size
+
+        self.timestamps = np.full((len(self.sensors), buffer_size), np.nan)
+        self.values = np.full((len(self.sensors), buffer_size), np.nan)
+
+        # Number of reports received for each sensor and number of aligned reports returned by read_samples
+        self.counts = np.zeros(len(self.sensors), dtype=np.int64)
+        self.read_count = 0
+
+        self.number_of_lost_reports = 0
+        self.previous_report_frequencies: list[str] = []
+
+    def start(self) -> None:
+        """Set the report frequency of all sensors and register the callbacks."""
+        self.previous_report_frequencies = [sensor.get_reportFrequency() for sensor in self.sensors]
+
+        for index, sensor in enumerate(self.sensors):
+            sensor.registerTimedReportCallback(functools.partial(self.add_report, index))
+            if sensor.set_reportFrequency(self.report_frequency) != YAPI.SUCCESS:
+                msg = f"Cannot set report frequency '{self.report_frequency}' of {sensor.get_hardwareId()}."
+                raise ValueError(msg)
+
+    def stop(self) -> None:
+        """Unregister the callbacks and restore the previous report frequencies."""
+        for sensor, report_frequency in zip(self.sensors, self.previous_report_frequencies):
+            sensor.registerTimedReportCallback(None)
+            sensor.set_reportFrequency(report_frequency)
+
+        self.previous_report_frequencies = []
+
+    def add_report(self, index: int, sensor, measure) -> None:
+        """Callback of the timed reports that stores the end time and the average value of the measure."""
+        position = self.counts[index] % self.buffer_size
+        self.timestamps[index, position] = measure.get_endTimeUTC()
+        self.values[index, position] = measure.get_averageValue()
+        self.counts[index] += 1
+
+    @staticmethod
+    def handle_events() -> None:
+        """Let the library process the reports that have been received so far and call the callbacks."""
+        errmsg = YRefParam()
+        if YAPI.HandleEvents(errmsg) != YAPI.SUCCESS:
+            msg = f"Error while receiving timed reports: {errmsg.value}"
+            raise OSError(msg)
+
+    def wait_for_reports(self, timeout: float = 5.0) -> None:
+        """Wait until each sensor has sent at least one report.
+
+        Raises:
+            TimeoutError: If a sensor did not send a report within the timeout in s.
+        """
+        errmsg = YRefParam()
+        end_time = time.perf_counter() + timeout
+        while np.any(self.counts == 0):
+            if time.perf_counter() > end_time:
+                msg = f"No timed reports received within {timeout} s."
+                raise TimeoutError(msg)
+            YAPI.Sleep(10, errmsg)
+
+    def latest_values(self) -> list[float]:
+        """Return the latest value of each sensor, or nan for sensors that did not send a report yet."""
+        positions = (self.counts - 1) % self.buffer_size
+        latest = self.values[np.arange(len(self.sensors)), positions]
+        latest[self.counts == 0] = np.nan
+        return latest.tolist()
+
+    def read_samples(self) -> tuple[np.ndarray, np.ndarray]:
+        """Return the reports received since the last call and remove them from the buffers.
+
+        Only as many reports are returned as every sensor has sent, the remaining reports are returned with the next
+        call. Reports that have been overwritten before they were read are skipped for all sensors and counted in
+        number_of_lost_reports.
+
+        Returns:
+            Timestamps in s since 1970 (UTC) of the first sensor and values with one row per sensor.
+        """
+        # The n-th report of all sensors is dropped once it has been overwritten for any sensor to keep them aligned
+        oldest_count = max(self.read_count, int(np.max(self.counts)) - self.buffer_size)
+        self.number_of_lost_reports += oldest_count - self.read_count
+
+        number_of_samples = max(int(np.min(self.counts)) - oldest_count, 0)
+        positions = np.arange(oldest_count, oldest_count + number_of_samples) % self.buffer_size
+        self.read_count = oldest_count + number_of_samples
+
+        return self.timestamps[0, positions], self.values[:, positions]
@@ -39,6 +39,7 @@
 
 from yoctopuce.yocto_api import *
 from yoctopuce.yocto_temperature import *
+from timed_reports import READOUT_MODES, TimedReportBuffer
 
 from pysweepme.EmptyDeviceClass import EmptyDevice
 
@@ -48,6 +49,13 @@ class Device(EmptyDevice):
     description =   """
                     https://www.yoctopuce.com/EN/doc/reference/yoctolib-python-EN.html<br>
                     <br>
+                    Readout:<br>
+                    - Polling: each value is requested from the module at every call.<br>
+                    - Timed reports, latest value: the module sends the values with the report frequency,
+                    e.g. '100/s', and the latest values are returned.<br>
+                    - Timed reports, all samples: all values received since the last call are returned as arrays
+                    together with their timestamps in s since 1970 (UTC).<br>
+                    <br>
                     
                     """
                    
@@ -58,6 +66,8 @@ def __init__(self):
         
         self.shortname = "Yocto-Thermocouple" # short name will be shown in the sequencer
 
+        self.timed_reports = None
+
         self.sensor_types = {
                                "Type K": YTemperature.SENSORTYPE_TYPE_K,
                                "Type E": YTemperature.SENSORTYPE_TYPE_E, 
@@ -119,6 +129,8 @@ def set_GUIparameter(self):
                         "Temperature unit": ["°C", "K", "°F"],
                         "Sensor1": True,
                         "Sensor2": False,
+                        "Readout": READOUT_MODES,
+                        "Report frequency": "100/s",
                         }
 
         return GUIparameter
@@ -151,6 +163,15 @@ def get_GUIparameter(self, parameter):
             self.units += [self.temperature_unit]
             self.plottype += [True]
             self.savetype += [True]    
+
+        self.readout = parameter.get("Readout", "Polling")
+        self.report_frequency = parameter.get("Report frequency", "100/s")
+
+        if self.readout == "Timed reports, all samples":
+            self.variables.append("Timestamp")
+            self.units.append("s")
+            self.plottype.append(False)
+            self.savetype.append(True)
             
             
     def connect(self):
@@ -200,9 +221,36 @@ def initialize(self):
         
 
     def configure(self):
-        pass
+
+        if self.readout != "Polling":
+            sensors = []
+            if self.sensor1:
+                sensors.append(self.temperature1)
+            if self.sensor2:
+                sensors.append(self.temperature2)
+
+            self.timed_reports = TimedReportBuffer(sensors, self.report_frequency)
+            self.timed_reports.start()
+
+            if self.readout == "Timed reports, latest value":
+                self.timed_reports.wait_for_reports()
+
+    def unconfigure(self):
+
+        if self.timed_reports is not None:
+            self.timed_reports.stop()
+            self.timed_reports = None
 
     def call(self):
+
+        if self.readout == "Timed reports, latest value":
+            self.timed_reports.handle_events()
+            return self.timed_reports.latest_values()
+
+        elif self.readout == "Timed reports, all samples":
+            self.timed_reports.handle_events()
+            timestamps, values = self.timed_reports.read_samples()
+            return [*values, timestamps]
     
         values = []
     
@@ -37,6 +37,7 @@
 
 from yoctopuce.yocto_api import *
 from yoctopuce.yocto_voltage import *
+from timed_reports import READOUT_MODES, TimedReportBuffer
 
 from pysweepme.EmptyDeviceClass import EmptyDevice
 
@@ -44,7 +45,14 @@
 class Device(EmptyDevice):
 
     description =   """
-                    https://www.yoctopuce.com/EN/doc/reference/yoctolib-python-EN.html
+                    https://www.yoctopuce.com/EN/doc/reference/yoctolib-python-EN.html<br>
+                    <br>
+                    Readout:<br>
+                    - Polling: each value is requested from the module at every call.<br>
+                    - Timed reports, latest value: the module sends the values with the report frequency,
+                    e.g. '100/s', and the latest values are returned.<br>
+                    - Timed reports, all samples: all values received since the last call are returned as arrays
+                    together with their timestamps in s since 1970 (UTC).<br>
                     """
 
     def __init__(self):
@@ -53,6 +61,8 @@ def __init__(self):
         
         self.shortname = "Yocto-Volt" # short name will be shown in the sequencer
 
+        self.timed_reports = None
+
 
     def set_GUIparameter(self):
     
@@ -60,6 +70,8 @@ def set_GUIparameter(self):
         GUIparameter = {
                         "Sensor1": True,
                         "Sensor2": True,
+                        "Readout": READOUT_MODES,
+                        "Report frequency": "100/s",
                         }
 
         return GUIparameter
@@ -86,8 +98,16 @@ def get_GUIparameter(self, parameter):
             self.units.append("V")
             self.plottype.append(True)
             self.savetype.append(True)
-            
-            
+
+        self.readout = parameter.get("Readout", "Polling")
+        self.report_frequency = parameter.get("Report frequency", "100/s")
+
+        if self.readout == "Timed reports, all samples":
+            self.variables.append("Timestamp")
+            self.units.append("s")
+            self.plottype.append(False)
+            self.savetype.append(True)
+
         self.port_serial = parameter["Port"]
       
     def find_Ports(self):
@@ -178,7 +198,37 @@ def disconnect(self):
         YAPI.FreeAPI()
     
           
+    def configure(self):
+
+        if self.readout != "Polling":
+            sensors = []
+            if self.use_sensor1:
+                sensors.append(self.sensor1)
+            if self.use_sensor2:
+                sensors.append(self.sensor2)
+
+            self.timed_reports = TimedReportBuffer(sensors, self.report_frequency)
+            self.timed_reports.start()
+
+            if self.readout == "Timed reports, latest value":
+                self.timed_reports.wait_for_reports()
+
+    def unconfigure(self):
+
+        if self.timed_reports is not None:
+            self.timed_reports.stop()
+            self.timed_reports = None
+
     def call(self):
+
+        if self.readout == "Timed reports, latest value":
+            self.timed_reports.handle_events()
+            return self.timed_reports.latest_values()
+
+        elif self.readout == "Timed reports, all samples":
+            self.timed_reports.handle_events()
+            timestamps, values = self.timed_reports.read_samples()
+            return [*values, timestamps]
     
         values = []
     
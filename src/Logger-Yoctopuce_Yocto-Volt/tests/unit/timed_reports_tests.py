@@ -0,0 +1,118 @@
+"""Unit tests for collecting timed reports of Yoctopuce sensors without a module."""
+
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+# add libs folder to sys.path to enable import of timed_reports
+libs_folder = Path(__file__).resolve().parents[2] / "libs"
+if str(libs_folder) not in sys.path:
+    sys.path.insert(0, str(libs_folder))
+
+from timed_reports import TimedReportBuffer  # noqa: E402
+from yoctopuce.yocto_api import YAPI  # noqa: E402
+
+
+class FakeMeasure:
+    """Provides the parts of a YMeasure that are stored by the buffer."""
+
+    def __init__(self, timestamp: float, value: float) -> None:
+        self.timestamp = timestamp
+        self.value = value
+
+    def get_endTimeUTC(self) -> float:
+        return self.timestamp
+
+    def get_averageValue(self) -> float:
+        return self.value
+
+
+class FakeSensor:
+    """Sensor that sends timed reports when report is called, like YAPI.HandleEvents does."""
+
+    def __init__(self, report_frequency: str = "OFF") -> None:
+        self.report_frequency = report_frequency
+        self.callback = None
+
+    def get_reportFrequency(self) -> str:
+        return self.report_frequency
+
+    def set_reportFrequency(self, report_frequency: str) -> int:
+        self.report_frequency = report_frequency
+        return YAPI.SUCCESS
+
+    def registerTimedReportCallback(self, callback: callable) -> int:
+        self.callback = callback
+        return 0
+
+    def report(self, timestamp: float, value: float) -> None:
+        self.callback(self, FakeMeasure(timestamp, value))
+
+
+class TimedReportBufferTests(unittest.TestCase):
+    """Tests for the ring buffers and the alignment of the reports of several sensors."""
+
+    def setUp(self) -> None:
+        self.sensors = [FakeSensor(), FakeSensor("1/s")]
+        self.buffer = TimedReportBuffer(self.sensors, "100/s", buffer_size=8)
+        self.buffer.start()
+
+    def report(self, sensor_index: int, start: int, stop: int) -> None:
+        """Send the reports start...stop-1 with timestamp n / 100 and value n + 1000 * sensor_index."""
+        for n in range(start, stop):
+            self.sensors[sensor_index].report(n / 100, n + 1000 * sensor_index)
+
+    def test_start_and_stop_restore_report_frequency(self) -> None:
+        """The report frequency is set at start and the previous frequency and callback are restored at stop."""
+        self.assertEqual([sensor.report_frequency for sensor in self.sensors], ["100/s", "100/s"])
+
+        self.buffer.stop()
+
+        self.assertEqual([sensor.report_frequency for sensor in self.sensors], ["OFF", "1/s"])
+        self.assertIsNone(self.sensors[0].callback)
+
+    def test_latest_values(self) -> None:
+        """The latest value is returned for each sensor and nan for a sensor without reports."""
+        self.assertTrue(np.all(np.isnan(self.buffer.latest_values())))
+
+        self.report(0, 0, 20)
+        self.assertEqual(self.buffer.latest_values()[0], 19)
+        self.assertTrue(np.isnan(self.buffer.latest_values()[1]))
+
+    def test_samples_are_aligned(self) -> None:
+        """Only reports that all sensors have sent are returned, the others are returned with the next call."""
+        self.report(0, 0, 5)
+        self.report(1, 0, 3)
+
+        timestamps, values = self.buffer.read_samples()
+        np.testing.assert_array_equal(timestamps, [0.0, 0.01, 0.02])
+        np.testing.assert_array_equal(values, [[0, 1, 2], [1000, 1001, 1002]])
+
+        self.report(1, 3, 6)
+        timestamps, values = self.buffer.read_samples()
+        np.testing.assert_array_equal(values, [[3, 4], [1003, 1004]])
+
+        timestamps, values = self.buffer.read_samples()
+        self.assertEqual(values.shape, (2, 0))
+
+    def test_overwritten_reports_are_counted(self) -> None:
+        """Reports that are overwritten before they are read are skipped for all sensors."""
+        self.report(0, 0, 12)
+        self.report(1, 0, 10)
+
+        timestamps, values = self.buffer.read_samples()
+
+        self.assertEqual(self.buffer.number_of_lost_reports, 4)
+        np.testing.assert_array_equal(values, [[4, 5, 6, 7, 8, 9], [1004, 1005, 1006, 1007, 1008, 1009]])
+        np.testing.assert_array_equal(timestamps, [0.04, 0.05, 0.06, 0.07, 0.08, 0.09])
+
+    def test_no_sensors(self) -> None:
+        """A buffer without sensors raises an error."""
+        with self.assertRaises(ValueError):
+            TimedReportBuffer([])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -39,8 +39,12 @@
 import numpy as np
 import os
 import FolderManager
+FolderManager.addFolderToPATH()
 FoMa = FolderManager.FolderManager()
 
+from binary_block import read_binary_block
+from sweep_writer import SWEEP_WRITERS, create_sweep_writer
+
 from EmptyDeviceClass import EmptyDevice
 
 class Device(EmptyDevice):
@@ -56,9 +60,10 @@ def __init__(self):
                                 "timeout": 10.0,
                                 }                             
         #self.port_identication = ["Agilent Technologies"] # temporarily not used by SweepMe!  		
-        self.data_format_type = "ASC" # ASC or REAL  -> REAL is currently not supported by this driver     
+        self.data_format_type = "ASC" # ASC or REAL  -> REAL has not been tested with an instrument yet
         self.if_bandwidth_values = [10 , 15 , 20 , 30 , 50 , 70 , 100 , 150 , 200 , 300 , 500 , 700 , 1e3 , 1.5e3 , 2e3 , 3e3 , 5e3 , 7e3 , 10e3, 15e3 , 20e3 , 30e3 , 50e3 , 70e3 , 100e3][::-1]
         self.calibration_file_extensions = [".csa", ".cst", ".sta", ".cal"]
+        self.sweep_writer = None
                 
              
     def find_calibrations(self):                                             
@@ -98,6 +103,7 @@ def set_GUIparameter(self):
                         "FrequencyStepPointsType": ["Linear (points)", "Logarithmic (points)"],
                         "FrequencyStepPoints": 1e3,                        
                         "Display": True,
+                        "Sweep file": ["None"] + list(SWEEP_WRITERS),
                         }
         return GUIparameter
         
@@ -118,6 +124,7 @@ def get_GUIparameter(self, parameter):
         self.trigger_state = parameter["Trigger"]
         self.trigger_delay = parameter["TriggerDelay"]
         self.update_display = parameter["Display"]
+        self.sweep_file_format = parameter.get("Sweep file", "None")
         
         self.variables = ["Frequency"]
         self.units = ["Hz"]
@@ -186,8 +193,8 @@ def initialize(self):
         
         if self.data_format_type == "ASC":
             self.port.write(":FORM:BORD NORM") # options: NORM or SWAP, SWAP seems not to work with ASC data format
-        # else:
-            # self.port.write(":FORM:BORD SWAP") #SWAP is needed for data format REAL  
+        else:
+            self.port.write(":FORM:BORD SWAP") # little-endian byte order as expected by read_and_parse_data
             
         #self.port.write(":FORM:DATA?")
         #answer = self.port.read()
@@ -305,10 +312,21 @@ def configure(self):
 
         # print("\nErrors after configure:")
         self.read_errors()
+
+        # Files in the temporary folder are saved together with the measurement data
+        self.sweep_writer = create_sweep_writer(
+            self.sweep_file_format,
+            os.path.join(self.get_folder("TEMP"), "ENA507x_%s" % datetime.datetime.now().strftime("%Y%m%d_%H%M%S")),
+            self.Sparameters,
+        )
     
         # print("Errors end")
 
     def unconfigure(self):
+
+        if self.sweep_writer is not None:
+            self.sweep_writer.close()
+            self.sweep_writer = None
         # print("\n")
         # print(time.strftime("%d.%m.%Y %H:%M:%S"))
         
@@ -402,6 +420,10 @@ def read_result(self):
                     error()
                     print(answer)
 
+        # Write the sweep to the sweep file if one is selected
+        if self.sweep_writer is not None:
+            self.sweep_writer.write(self.results[0], self.results[1:])
+
         #print("\nErrors after reading data:")
         #self.read_errors()
    
@@ -428,45 +450,13 @@ def read_and_parse_data(self):
             return True, np.array(list(map(float, data_in.split(","))))
            
         elif self.data_format_type == "REAL":
-            try:
-                data_in = self.port.port.read_raw()
-            except:
-                data_in = self.port.read_raw() # fallback if device class is used by external scripts
-                
-            return True, self.binblock_raw(data_in, 'f4')
+            # REAL transfers 64-bit floats, byte order is set to SWAP during initialize
+            return True, read_binary_block(self.port.port, "<f8")
 
         else:
             debug("The data format %s is unknown: Use 'ASC', 'REAL'" % self.data_format_type)
             return False, []
         
-    def binblock_raw(self, data_in, dtype_in):
-
-        #Grab the beginning section of the data file, which will contain the header.
-        Header = str(data_in[0:12])
-        # ("Header is " + str(Header))
-        
-        #Find the start position of the IEEE header, which starts with a '#'.
-        startpos = Header.find("#")
-        # print("Start Position reported as " + str(startpos))
-        
-        #Check for problem with start position.
-        if startpos < 0:
-            raise IOError("No start of block found")
-            
-        #Find the number that follows '#' symbol.  This is the number of digits in the block length.
-        Size_of_Length = int(Header[startpos+1])
-        # print("Size of Length reported as " + str(Size_of_Length))
-        
-        ##Now that we know how many digits are in the size value, get the size of the data file.
-        Image_Size = int(Header[startpos+2:startpos+2+Size_of_Length])
-        # print("Number of bytes in file are: " + str(Image_Size))
-        
-        # Get the length from the header
-        offset = startpos+Size_of_Length
-        
-        # Extract the data out into a list.
-        return np.frombuffer(data_in[offset:offset+Image_Size],dtype=np.dtype(dtype_in))
-    
     def read_errors(self):
         
         # here we read up to 100 possible error messages until no error is returned
@@ -0,0 +1,101 @@
+"""
+Compare the host side time to read binary blocks with read_raw and slicing and with the streaming block reader.
+The instrument is replaced by a fake VISA library that returns the data from memory in chunks, so no instrument is
+needed. The data corresponds to the 16 S-parameter traces of a 4-port measurement with 100k points each in data
+format REAL,64. With an instrument, the transfer time adds to both variants.
+"""
+
+import contextlib
+import os
+import sys
+import time
+
+import numpy as np
+from pyvisa import constants
+
+# add libs folder to sys.path to enable import of binary_block
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "libs"))
+
+from binary_block import read_binary_block  # noqa: E402
+
+number_of_points = 100_000
+number_of_traces = 16
+repetitions = 5
+transfer_size = 2**20  # maximum number of bytes that the fake instrument returns per read
+
+
+class FakeVisaLibrary:
+    """Returns the message in chunks of at most the requested size and the transfer size."""
+
+    def __init__(self, message: bytes) -> None:
+        self.message = message
+        self.position = 0
+
+    def read(self, session: int, count: int) -> tuple[bytes, int]:
+        count = min(count, transfer_size)
+        chunk = self.message[self.position : self.position + count]
+        self.position += len(chunk)
+        if self.position == len(self.message):
+            return chunk, constants.StatusCode.success
+        return chunk, constants.StatusCode.success_max_count_read
+
+
+class FakeResource:
+    """Provides the parts of a pyvisa message based resource that are used by both variants."""
+
+    chunk_size = 20 * 1024  # pyvisa default
+
+    def __init__(self, message: bytes) -> None:
+        self.session = 1
+        self.visalib = FakeVisaLibrary(message)
+
+    def read_raw(self) -> bytes:
+        """Read until the end of the message like pyvisa's read_raw."""
+        ret = bytearray()
+        status = constants.StatusCode.success_max_count_read
+        while status != constants.StatusCode.success:
+            chunk, status = self.visalib.read(self.session, self.chunk_size)
+            ret.extend(chunk)
+        return bytes(ret)
+
+    @contextlib.contextmanager
+    def read_termination_context(self, new_termination: str) -> None:
+        yield
+
+    @contextlib.contextmanager
+    def ignore_warning(self, *warnings: int) -> None:
+        yield
+
+
+def binblock_raw(data_in: bytes, dtype_in: str) -> np.ndarray:
+    """Previous implementation of the drivers that parses a complete block returned by read_raw."""
+    header = str(data_in[0:12])
+    startpos = header.find("#")
+    size_of_length = int(header[startpos + 1])
+    image_size = int(header[startpos + 2 : startpos + 2 + size_of_length])
+    offset = startpos + size_of_length
+    return np.frombuffer(data_in[offset : offset + image_size], dtype=np.dtype(dtype_in))
+
+
+def read_traces(read_trace: callable, message: bytes) -> float:
+    """Return the best time to read all traces with the given function."""
+    durations = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        for _ in range(number_of_traces):
+            values = read_trace(FakeResource(message))
+            trace = values[::2] + 1j * values[1::2]
+        durations.append(time.perf_counter() - start)
+    assert len(trace) == number_of_points
+    return min(durations)
+
+
+data = np.random.default_rng().standard_normal(2 * number_of_points).astype("<f8").tobytes()
+message = f"#{len(str(len(data)))}{len(data)}".encode() + data + b"\n"
+
+read_raw_duration = read_traces(lambda resource: binblock_raw(resource.read_raw(), "<f8"), message)
+block_reader_duration = read_traces(lambda resource: read_binary_block(resource, "<f8"), message)
+
+print(f"{number_of_traces} traces with {number_of_points} complex points ({len(data) / 1e6:.1f} MB each)")
+print(f"read_raw and slicing: {read_raw_duration * 1e3:.1f} ms")
+print(f"streaming block reader: {block_reader_duration * 1e3:.1f} ms")
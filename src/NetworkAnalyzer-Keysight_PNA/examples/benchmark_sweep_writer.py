@@ -0,0 +1,44 @@
+"""
+Compare the time to write 4-port sweeps with 10k points as Touchstone text file to the time of the binary NPZ and
+HDF5 sweep writers. No instrument is needed, the S-parameters are random numbers.
+"""
+
+import importlib.util
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# add libs folder to sys.path to enable import of sweep_writer
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "libs"))
+
+from sweep_writer import create_sweep_writer  # noqa: E402
+
+number_of_points = 10_000
+number_of_sweeps = 20
+names = [f"S{i}{j}" for i in range(1, 5) for j in range(1, 5)]
+
+rng = np.random.default_rng()
+frequencies = np.linspace(10e6, 20e9, number_of_points)
+sparameters = [rng.standard_normal(number_of_points) + 1j * rng.standard_normal(number_of_points) for _ in names]
+
+
+def write_with_writer(file_format: str, path: Path) -> None:
+    """Write all sweeps with the sweep writer of the given file format."""
+    writer = create_sweep_writer(file_format, path, names)
+    for _ in range(number_of_sweeps):
+        writer.write(frequencies, sparameters)
+    writer.close()
+
+
+file_formats = ["Touchstone", "NPZ"] + (["HDF5"] if importlib.util.find_spec("h5py") else [])
+
+print(f"{number_of_sweeps} sweeps, 4 ports, {number_of_points} points")
+with tempfile.TemporaryDirectory() as folder:
+    for file_format in file_formats:
+        start = time.perf_counter()
+        write_with_writer(file_format, Path(folder) / file_format)
+        print(f"{file_format} writer: {(time.perf_counter() - start) / number_of_sweeps * 1e3:.1f} ms per sweep")
@@ -40,6 +40,11 @@
 from pysweepme.ErrorMessage import error, debug
 from pysweepme import FolderManager
 
+FolderManager.addFolderToPATH()
+
+from binary_block import read_binary_block
+from sweep_writer import SWEEP_WRITERS, create_sweep_writer
+
 FoMa = FolderManager.FolderManager()
 
 
@@ -65,6 +70,8 @@ def __init__(self):
         http://na.support.keysight.com/pna/help/latest/Programming/GP-IB_Command_Finder/SCPI_Command_Tree.htm
         """
 
+        self.sweep_writer = None
+
         self.data_format_type = "REAL,64"
         # options:
         # "ASC" -> ascii,
@@ -141,6 +148,8 @@ def set_GUIparameter(self):
             ],
             "FrequencyStepPoints": 1e6,
             "Display": True,
+            "Trace readout": ["Per trace", "All traces in one transfer"],
+            "Sweep file": ["None"] + list(SWEEP_WRITERS),
         }
 
         return GUIparameter
@@ -167,6 +176,8 @@ def get_GUIparameter(self, parameter):
         self.trigger_delay = parameter["TriggerDelay"]
 
         self.update_display = parameter["Display"]
+        self.trace_readout = parameter.get("Trace readout", "Per trace")
+        self.sweep_file_format = parameter.get("Sweep file", "None")
 
         self.variables = ["Frequency"]
         self.units = ["Hz"]
@@ -270,6 +281,10 @@ def initialize(self):
         # self.port.write(":FORM:BORD NORM") # options: NORM or SWAP
         self.port.write(":FORM:BORD SWAP")  # SWAP is needed
 
+        # Real and imaginary parts for the S-parameter data of CALC:DATA:SNP:PORTs?
+        if self.trace_readout == "All traces in one transfer":
+            self.port.write(":MMEM:STOR:TRAC:FORM:SNP RI")
+
     def configure(self):
         # Performs a standard Preset, then deletes the default trace, measurement
         # and window. The PNA screen becomes blank.
@@ -555,8 +570,20 @@ def configure(self):
             self.port.write(":SENS%i:CORR OFF" % (channel_number))
             # print("Correction is OFF")
 
+        """ Sweep file """
+        # Files in the temporary folder are saved together with the measurement data
+        self.sweep_writer = create_sweep_writer(
+            self.sweep_file_format,
+            os.path.join(self.get_folder("TEMP"), "PNA_%s" % datetime.datetime.now().strftime("%Y%m%d_%H%M%S")),
+            self.Sparameters,
+        )
+
     def unconfigure(self):
 
+        if self.sweep_writer is not None:
+            self.sweep_writer.close()
+            self.sweep_writer = None
+
         self.port.write("SYST:ERR:COUN?")
         error_count = int(self.port.read())
 
@@ -593,25 +620,21 @@ def request_result(self):
         self.port.write("*OPC?")
         self.port.read()
 
-        # Averages
-        self.port.write("STAT:OPER:COND?")
-        ans = self.port.read()
-        if int(ans) == 1280:
-            pass
-            # print("Average and Device Status: ok")
-        n_traces_av_ok = 0
-        for i in range(1, 42):  # 42 registers
-            self.port.write("STAT:OPER:AVER%i:COND?" % i)
-            ans = self.port.read()
-            n_traces_av_ok += bin(int(ans))[2:-1].count("1")
-            if bin(int(ans))[-1] == "0":
-                break  # bit0 unequal to zero if more registers have to be considered
-        # print("Averaging status bits", bin(int(ans)))
-        # number of 1s = number of traces (max 14) succesfully avgd, last bit should be 0
-        # print("Averaging of %i traces done succesfully" %n_traces_av_ok)
+        # Averages: the averaging summary bit of the operation status register is set if all traces are averaged,
+        # so the single averaging registers STAT:OPER:AVER<n>:COND? do not need to be read one by one.
+        if self.number_averages > 1:
+            self.port.write("STAT:OPER:COND?")
+            condition = int(self.port.read())
+            if not condition & 256:  # bit 8: averaging summary
+                debug("Keysight PNA: Averaging is not completed for all traces.")
 
     def read_result(self):
 
+        if self.trace_readout == "All traces in one transfer":
+            self.results = self.read_snp_data()
+            self.write_sweep()
+            return
+
         self.results = []
 
         """ Frequencies """
@@ -650,6 +673,8 @@ def read_result(self):
                 error()
                 print(answer)
 
+        self.write_sweep()
+
     def call(self):
         return self.results
 
@@ -665,6 +690,36 @@ def finish(self):
 
     """ further function as needed by this device class are defined here """
 
+    def read_snp_data(self):
+        """Read frequencies and all S-parameters of the used ports in a single transfer and return the results.
+
+        CALC:DATA:SNP:PORTs? returns the frequencies followed by the real and imaginary parts of each S-parameter,
+        each as a block of all points. The S-parameters are ordered as in a Touchstone file, i.e. S11, S21, S12, S22
+        for two ports and row by row (S11, S12, S13, ...) for more ports.
+        """
+        ports = sorted({int(spar[1]) for spar in self.Sparameters} | {int(spar[2]) for spar in self.Sparameters})
+        number_of_ports = len(ports)
+
+        if number_of_ports == 2:
+            order = [(i, j) for j in ports for i in ports]
+        else:
+            order = [(i, j) for i in ports for j in ports]
+
+        self.port.write('CALC1:DATA:SNP:PORTs? "%s"' % ",".join(map(str, ports)))
+        data = self.read_and_parse_data()
+
+        rows = np.reshape(data, (1 + 2 * number_of_ports**2, -1))
+        frequencies = rows[0]
+        sdata = rows[1::2] + 1j * rows[2::2]
+
+        index = {"S%i%i" % (i, j): n for n, (i, j) in enumerate(order)}
+        return [frequencies] + [sdata[index[spar]] for spar in self.Sparameters]
+
+    def write_sweep(self):
+        """Write the frequencies and S-parameters of the last sweep to the sweep file if one is selected."""
+        if self.sweep_writer is not None:
+            self.sweep_writer.write(self.results[0], self.results[1:])
+
     # used during read_result to read and interpret the returned results
     def read_and_parse_data(self):
 
@@ -673,24 +728,11 @@ def read_and_parse_data(self):
             return np.array(list(map(float, data_in.split(","))))
 
         elif self.data_format_type == "REAL,32":
-            try:
-                data_in = self.port.port.read_raw()
-            except Exception:
-                data_in = (
-                    self.port.read_raw()
-                )  # fallback if device class is used by external scripts
-
-            return self.binblock_raw(data_in, "f4")
+            # byte order is set to SWAP, i.e. little-endian, during initialize
+            return read_binary_block(self.port.port, "<f4")
 
         elif self.data_format_type == "REAL,64":
-            try:
-                data_in = self.port.port.read_raw()
-            except Exception:
-                data_in = (
-                    self.port.read_raw()
-                )  # fallback if device class is used by external scripts
-
-            return self.binblock_raw(data_in, "f8")
+            return read_binary_block(self.port.port, "<f8")
 
         else:
             debug(
@@ -698,34 +740,3 @@ def read_and_parse_data(self):
                 % self.data_format_type
             )
             return False
-
-    def binblock_raw(self, data_in, dtype_in):
-
-        # Grab the beginning section of the data file, which will contain the header.
-        Header = str(data_in[0:12])
-        # print("Header is " + str(Header))
-
-        # Find the start position of the IEEE header, which starts with a '#'.
-        startpos = Header.find("#")
-        # print("Start Position reported as " + str(startpos))
-
-        # Check for problem with start position.
-        if startpos < 0:
-            raise IOError("No start of block found")
-
-        # Find the number that follows '#' symbol.  This is the number of digits in
-        # the block length.
-        Size_of_Length = int(Header[startpos + 1])
-        # print("Size of Length reported as " + str(Size_of_Length))
-
-        # Now we know how many digits are in the size value, get the size of the data file
-        Image_Size = int(Header[startpos + 2 : startpos + 2 + Size_of_Length])
-        # print("Number of bytes in file are: " + str(Image_Size))
-
-        # Get the length from the header
-        offset = startpos + Size_of_Length
-
-        # Extract the data out into a list.
-        return np.frombuffer(
-            data_in[offset : offset + Image_Size], dtype=np.dtype(dtype_in)
-        )
@@ -0,0 +1,128 @@
+"""Unit tests for reading IEEE 488.2 binary blocks without an instrument."""
+
+import contextlib
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+from pyvisa import constants
+
+# add libs folder to sys.path to enable import of binary_block
+libs_folder = Path(__file__).resolve().parents[2] / "libs"
+if str(libs_folder) not in sys.path:
+    sys.path.insert(0, str(libs_folder))
+
+from binary_block import read_binary_block  # noqa: E402
+
+
+class FakeVisaLibrary:
+    """Returns a message in reads of at most transfer_size bytes like VISA does for large responses."""
+
+    def __init__(self, resource: "FakeResource") -> None:
+        self.resource = resource
+
+    def read(self, session: int, count: int) -> tuple[bytes, int]:
+        resource = self.resource
+        count = min(count, resource.transfer_size, len(resource.message) - resource.position)
+        chunk = resource.message[resource.position : resource.position + count]
+
+        if resource.read_termination and b"\n" in chunk:
+            chunk = chunk[: chunk.index(b"\n") + 1]
+        resource.position += len(chunk)
+
+        if resource.position == len(resource.message):
+            status = constants.StatusCode.success
+        elif resource.read_termination and chunk.endswith(b"\n"):
+            status = constants.StatusCode.success_termination_character_read
+        else:
+            status = constants.StatusCode.success_max_count_read
+        return chunk, status
+
+
+class FakeResource:
+    """Minimal message based resource that sends a single message."""
+
+    def __init__(self, message: bytes, transfer_size: int = 1000) -> None:
+        self.message = message
+        self.position = 0
+        self.transfer_size = transfer_size
+        self.read_termination = "\n"
+        self.session = 1
+        self.visalib = FakeVisaLibrary(self)
+
+    @contextlib.contextmanager
+    def read_termination_context(self, new_termination: str) -> None:
+        termination = self.read_termination
+        self.read_termination = new_termination
+        yield
+        self.read_termination = termination
+
+    @contextlib.contextmanager
+    def ignore_warning(self, *warnings: int) -> None:
+        yield
+
+
+class BinaryBlockTests(unittest.TestCase):
+    """Tests for definite and indefinite length blocks that arrive in several reads."""
+
+    def setUp(self) -> None:
+        # The third value consists of line feed bytes to test that the termination character does not end the block
+        line_feeds = np.frombuffer(b"\n" * 8, dtype="<f8")[0]
+        self.values = np.array([1.0, 10.0, line_feeds, -2.5] * 1000, dtype="<f8")
+        self.data = self.values.tobytes()
+
+    def test_definite_length_block_in_several_reads(self) -> None:
+        """The data is read completely even if it contains line feeds and arrives in several reads."""
+        header = f"#{len(str(len(self.data)))}{len(self.data)}".encode()
+        resource = FakeResource(header + self.data + b"\n")
+
+        values = read_binary_block(resource, "<f8", chunk_size=4096)
+
+        np.testing.assert_array_equal(values, self.values)
+        self.assertEqual(resource.position, len(resource.message), "Termination was not read.")
+
+    def test_indefinite_length_block(self) -> None:
+        """An indefinite length block is read until the end of the message without the final line feed."""
+        resource = FakeResource(b"#0" + self.data + b"\n")
+
+        values = read_binary_block(resource, "<f8")
+
+        np.testing.assert_array_equal(values, self.values)
+        self.assertEqual(resource.read_termination, "\n", "Read termination was not restored.")
+
+    def test_byte_order(self) -> None:
+        """The byte order of the dtype is used to interpret the data."""
+        data = self.values.astype(">f4").tobytes()
+        resource = FakeResource(f"#{len(str(len(data)))}{len(data)}".encode() + data + b"\n")
+
+        values = read_binary_block(resource, ">f4")
+
+        np.testing.assert_array_equal(values, self.values.astype("f4"))
+
+    def test_result_is_view_on_buffer(self) -> None:
+        """The returned array shares the memory of the read buffer instead of owning a copy."""
+        resource = FakeResource(b"#216" + self.data[:16] + b"\n")
+
+        values = read_binary_block(resource, "<f8")
+
+        self.assertFalse(values.flags.owndata)
+        self.assertTrue(values.flags.writeable)
+
+    def test_missing_header(self) -> None:
+        """A response without '#' raises an error."""
+        resource = FakeResource(b"1.0,2.0,3.0,4.0,5.0,6.0\n")
+
+        with self.assertRaises(OSError):
+            read_binary_block(resource, "<f8")
+
+    def test_incomplete_block(self) -> None:
+        """A message that ends before the declared length raises an error."""
+        resource = FakeResource(b"#3100" + self.data[:50])
+
+        with self.assertRaises(OSError):
+            read_binary_block(resource, "<f8")
+
+
+if __name__ == "__main__":
+    unittest.main()
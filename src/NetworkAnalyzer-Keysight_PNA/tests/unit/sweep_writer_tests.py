@@ -0,0 +1,106 @@
+"""Unit tests for writing network analyzer sweeps to Touchstone, NPZ and HDF5 files."""
+
+import importlib.util
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+# add libs folder to sys.path to enable import of sweep_writer
+libs_folder = Path(__file__).resolve().parents[2] / "libs"
+if str(libs_folder) not in sys.path:
+    sys.path.insert(0, str(libs_folder))
+
+from sweep_writer import Hdf5Writer, NpzWriter, TouchstoneWriter, create_sweep_writer  # noqa: E402
+
+
+def read_touchstone(file_path: Path) -> np.ndarray:
+    """Return the numbers of a Touchstone file as one row per frequency point, independent of the line breaks."""
+    lines = [line for line in file_path.read_text().splitlines() if line[0] not in "!#"]
+    numbers = np.array(" ".join(lines).split(), dtype=float)
+    number_of_ports = int(file_path.suffix[2:-1])
+    return numbers.reshape(-1, 1 + 2 * number_of_ports**2)
+
+
+class SweepWriterTests(unittest.TestCase):
+    """Tests that the written files contain the sweeps in the expected order."""
+
+    def setUp(self) -> None:
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = Path(self.folder.name) / "sweeps"
+        self.frequencies = np.linspace(1e9, 2e9, 11)
+        rng = np.random.default_rng(0)
+        self.sparameters = [rng.standard_normal(11) + 1j * rng.standard_normal(11) for _ in range(4)]
+
+    def tearDown(self) -> None:
+        self.folder.cleanup()
+
+    def test_touchstone_two_ports(self) -> None:
+        """Two-port files use the order S11, S21, S12, S22, independent of the measured order."""
+        names = ["S11", "S12", "S21", "S22"]
+        writer = TouchstoneWriter(self.path, names)
+        writer.write(self.frequencies, self.sparameters)
+        writer.write(self.frequencies, self.sparameters)
+        writer.close()
+
+        file_path = Path(self.folder.name) / "sweeps_00002.s2p"
+        self.assertIn("# HZ S RI R 50", file_path.read_text())
+
+        rows = read_touchstone(file_path)
+        np.testing.assert_allclose(rows[:, 0], self.frequencies)
+        for column, name in enumerate(["S11", "S21", "S12", "S22"]):
+            expected = self.sparameters[names.index(name)]
+            np.testing.assert_allclose(rows[:, 1 + 2 * column] + 1j * rows[:, 2 + 2 * column], expected, rtol=1e-8)
+
+    def test_touchstone_matrix_rows_on_separate_lines(self) -> None:
+        """For more than two ports, each row of the S-parameter matrix starts a new line."""
+        names = [f"S{i}{j}" for i in (1, 2, 3) for j in (1, 2, 3)]
+        sparameters = [np.full(2, n + 1j * n) for n in range(9)]
+        writer = TouchstoneWriter(self.path, names)
+        writer.write([1e9, 2e9], sparameters)
+
+        lines = (Path(self.folder.name) / "sweeps_00001.s3p").read_text().splitlines()[2:]
+        self.assertEqual(len(lines), 6)
+        self.assertEqual(lines[1].split(), ["3", "3", "4", "4", "5", "5"])
+
+    def test_touchstone_needs_all_sparameters(self) -> None:
+        """A part of the S-parameter matrix cannot be written as Touchstone file."""
+        with self.assertRaises(ValueError):
+            TouchstoneWriter(self.path, ["S21"])
+
+    def test_npz(self) -> None:
+        """All sweeps of a run are stored in one container that can be read with numpy.load."""
+        writer = create_sweep_writer("NPZ", self.path, ["S11", "S21", "S12", "S22"])
+        self.assertIsInstance(writer, NpzWriter)
+        for _ in range(3):
+            writer.write(self.frequencies, self.sparameters)
+        writer.close()
+
+        with np.load(self.path.with_suffix(".npz")) as data:
+            self.assertEqual(list(data["sparameter_names"]), ["S11", "S21", "S12", "S22"])
+            np.testing.assert_array_equal(data["frequencies_00003"], self.frequencies)
+            np.testing.assert_array_equal(data["sparameters_00003"], self.sparameters)
+
+    @unittest.skipUnless(importlib.util.find_spec("h5py"), "h5py is not installed")
+    def test_hdf5(self) -> None:
+        """The datasets contain one entry per written sweep after closing."""
+        import h5py
+
+        writer = Hdf5Writer(self.path, ["S11", "S21", "S12", "S22"])
+        for _ in range(3):
+            writer.write(self.frequencies, self.sparameters)
+        writer.close()
+
+        with h5py.File(self.path.with_suffix(".h5"), "r") as file:
+            self.assertEqual(file["sparameters"].shape, (3, 4, 11))
+            np.testing.assert_array_equal(file["sparameters"][2], self.sparameters)
+
+    def test_no_writer(self) -> None:
+        """No writer is created if no sweep file is selected."""
+        self.assertIsNone(create_sweep_writer("None", self.path, ["S21"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
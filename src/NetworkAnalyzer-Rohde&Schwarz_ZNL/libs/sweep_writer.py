@@ -0,0 +1,242 @@
+# This Device Class is published under the terms of the MIT License.
+# Required Third Party Libraries, which are included in the Device Class
+# package for convenience purposes, may have a different license. You can
+# find those in the corresponding folders or contact the maintainer.
+#
+# MIT License
+#
+# Copyright (c) 2025 SweepMe! GmbH (sweep-me.net)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Write the S-parameter sweeps of network analyzer drivers to files while measuring.
+
+Each sweep is passed to the writers as one block of numbers:
+- Touchstone: one .sNp file per sweep with real and imaginary parts, written with numpy.savetxt. The numbers are
+  formatted as text point by point, so this format is not suited for fast sweeps with many points.
+- NPZ: one .npz container per run that gets the frequencies and S-parameters of each sweep as uncompressed arrays.
+- HDF5: one .h5 container per run with datasets that are extended by one sweep per write (requires h5py).
+
+Only NPZ and HDF5 write each sweep as binary block without formatting the numbers in Python.
+"""
+
+from __future__ import annotations
+
+import zipfile
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+import numpy as np
+
+# Number of sweeps by which the HDF5 datasets grow, so that they do not need to be resized for every sweep
+HDF5_GROWTH = 64
+
+
+class SweepWriter(ABC):
+    """Base class of the writers. Call write() for each sweep and close() at the end of the run."""
+
+    suffix = ""
+
+    def __init__(self, path: str | Path, sparameter_names: list[str]) -> None:
+        """Create a writer for the given S-parameters, e.g. ["S11", "S21"].
+
+        Args:
+            path: File path without suffix. The suffix and, if necessary, the sweep number are added.
+            sparameter_names: Names of the S-parameters in the order in which they are passed to write().
+        """
+        self.path = Path(path)
+        self.sparameter_names = list(sparameter_names)
+        self.number_of_sweeps = 0
+
+    def write(self, frequencies: np.ndarray, sparameters: list[np.ndarray]) -> None:
+        """Write one sweep of complex S-parameters that are given in the order of the S-parameter names."""
+        self.write_sweep(np.asarray(frequencies, dtype=float), np.asarray(sparameters, dtype=complex))
+        self.number_of_sweeps += 1
+
+    @abstractmethod
+    def write_sweep(self, frequencies: np.ndarray, sparameters: np.ndarray) -> None:
+        """Write the frequencies and the S-parameter array with one row per S-parameter."""
+
+    def close(self) -> None:
+        """Finish the file of the run."""
+
+
+class TouchstoneWriter(SweepWriter):
+    """Writes each sweep to a Touchstone file <path>_<sweep number>.s<N>p.
+
+    Touchstone files contain the full S-parameter matrix of N ports, so all N^2 S-parameters of the used ports must
+    be measured.
+    """
+
+    def __init__(self, path: str | Path, sparameter_names: list[str], reference_impedance: float = 50.0) -> None:
+        """Create the writer and the format of a data line for the ports of the S-parameters."""
+        super().__init__(path, sparameter_names)
+
+        ports = sorted({int(name[1]) for name in sparameter_names} | {int(name[2]) for name in sparameter_names})
+        self.number_of_ports = len(ports)
+        self.suffix = f".s{self.number_of_ports}p"
+
+        # Touchstone order: S11, S21, S12, S22 for 2 ports and row by row (S11, S12, S13, ...) for more ports
+        if self.number_of_ports == 2:
+            order = [f"S{i}{j}" for j in ports for i in ports]
+        else:
+            order = [f"S{i}{j}" for i in ports for j in ports]
+
+        missing = [name for name in order if name not in self.sparameter_names]
+        if missing:
+            msg = (
+                f"Touchstone files need all S-parameters of ports {', '.join(map(str, ports))}. "
+                f"Missing: {', '.join(missing)}. Use NPZ or HDF5 to save a part of the S-parameters."
+            )
+            raise ValueError(msg)
+        self.order = [self.sparameter_names.index(name) for name in order]
+
+        self.header = (
+            f"! {self.number_of_ports}-port S-parameters: {' '.join(order)}\n"
+            f"# HZ S RI R {reference_impedance:g}"
+        )
+
+        # For more than 2 ports, each row of the matrix starts a new line with at most 4 values per line
+        pair = "%.9g %.9g"
+        if self.number_of_ports <= 2:
+            self.line_format = " ".join(["%.12g"] + [pair] * self.number_of_ports**2)
+        else:
+            matrix_row = "\n".join(
+                " ".join([pair] * len(ports[i : i + 4])) for i in range(0, self.number_of_ports, 4)
+            )
+            self.line_format = "%.12g " + "\n".join([matrix_row] * self.number_of_ports)
+
+    def write_sweep(self, frequencies: np.ndarray, sparameters: np.ndarray) -> None:
+        """Write the sweep as one block with a row per frequency point."""
+        sparameters = sparameters[self.order]
+
+        block = np.empty((len(frequencies), 1 + 2 * len(sparameters)))
+        block[:, 0] = frequencies
+        block[:, 1::2] = sparameters.real.T
+        block[:, 2::2] = sparameters.imag.T
+
+        file_path = self.path.with_name(f"{self.path.name}_{self.number_of_sweeps + 1:05d}{self.suffix}")
+        np.savetxt(file_path, block, fmt=self.line_format, header=self.header, comments="", newline="\n")
+
+
+class NpzWriter(SweepWriter):
+    """Writes all sweeps of a run into <path>.npz.
+
+    The container has the array 'sparameter_names' and for each sweep the arrays 'frequencies_<sweep number>' and
+    'sparameters_<sweep number>' with one row per S-parameter. It can be read with numpy.load.
+    The container is closed after each sweep, so that it stays readable if the run is aborted.
+    """
+
+    suffix = ".npz"
+
+    def __init__(self, path: str | Path, sparameter_names: list[str]) -> None:
+        """Create the container with the S-parameter names."""
+        super().__init__(path, sparameter_names)
+        self.file_path = self.path.with_name(self.path.name + self.suffix)
+
+        with zipfile.ZipFile(self.file_path, mode="w", compression=zipfile.ZIP_STORED) as container:
+            self.write_array(container, "sparameter_names", np.array(self.sparameter_names))
+
+    def write_sweep(self, frequencies: np.ndarray, sparameters: np.ndarray) -> None:
+        """Append the arrays of the sweep to the container."""
+        with zipfile.ZipFile(self.file_path, mode="a", compression=zipfile.ZIP_STORED) as container:
+            self.write_array(container, f"frequencies_{self.number_of_sweeps + 1:05d}", frequencies)
+            self.write_array(container, f"sparameters_{self.number_of_sweeps + 1:05d}", sparameters)
+
+    @staticmethod
+    def write_array(container: zipfile.ZipFile, name: str, array: np.ndarray) -> None:
+        """Write the array in .npy format directly into the container without an intermediate file."""
+        with container.open(name + ".npy", mode="w", force_zip64=True) as file:
+            np.lib.format.write_array(file, np.ascontiguousarray(array), allow_pickle=False)
+
+
+class Hdf5Writer(SweepWriter):
+    """Writes all sweeps of a run into <path>.h5 with the datasets 'frequencies' and 'sparameters'.
+
+    The datasets have one entry per sweep and are chunked by sweep. The names of the S-parameters are stored in the
+    attribute 'names' of 'sparameters'. All sweeps must have the same number of points.
+    """
+
+    suffix = ".h5"
+
+    def __init__(self, path: str | Path, sparameter_names: list[str]) -> None:
+        """Create the container. The datasets are created with the first sweep when the number of points is known."""
+        super().__init__(path, sparameter_names)
+
+        import h5py  # optional dependency that is only needed for this writer
+
+        self.file = h5py.File(self.path.with_name(self.path.name + self.suffix), "w")
+        self.frequencies = None
+        self.sparameters = None
+
+    def write_sweep(self, frequencies: np.ndarray, sparameters: np.ndarray) -> None:
+        """Write the sweep into the preallocated datasets and extend them if they are full."""
+        number_of_points = len(frequencies)
+
+        if self.frequencies is None:
+            self.frequencies = self.file.create_dataset(
+                "frequencies",
+                shape=(HDF5_GROWTH, number_of_points),
+                maxshape=(None, number_of_points),
+                chunks=(1, number_of_points),
+                dtype=float,
+            )
+            self.sparameters = self.file.create_dataset(
+                "sparameters",
+                shape=(HDF5_GROWTH, len(self.sparameter_names), number_of_points),
+                maxshape=(None, len(self.sparameter_names), number_of_points),
+                chunks=(1, len(self.sparameter_names), number_of_points),
+                dtype=complex,
+            )
+            self.sparameters.attrs["names"] = self.sparameter_names
+
+        if number_of_points != self.frequencies.shape[1]:
+            msg = f"All sweeps must have {self.frequencies.shape[1]} points, but got {number_of_points}."
+            raise ValueError(msg)
+
+        if self.number_of_sweeps == len(self.frequencies):
+            self.frequencies.resize(self.number_of_sweeps + HDF5_GROWTH, axis=0)
+            self.sparameters.resize(self.number_of_sweeps + HDF5_GROWTH, axis=0)
+
+        self.frequencies[self.number_of_sweeps] = frequencies
+        self.sparameters[self.number_of_sweeps] = sparameters
+        self.file.flush()
+
+    def close(self) -> None:
+        """Remove the preallocated but unused entries and close the file."""
+        if self.frequencies is not None:
+            self.frequencies.resize(self.number_of_sweeps, axis=0)
+            self.sparameters.resize(self.number_of_sweeps, axis=0)
+        self.file.close()
+
+
+# Options of the drivers' GUI parameter "Sweep file"
+SWEEP_WRITERS = {
+    "Touchstone": TouchstoneWriter,
+    "NPZ": NpzWriter,
+    "HDF5": Hdf5Writer,
+}
+
+
+def create_sweep_writer(file_format: str, path: str | Path, sparameter_names: list[str]) -> SweepWriter | None:
+    """Return a writer for the file format of SWEEP_WRITERS or None if the format is "None"."""
+    if file_format == "None":
+        return None
+    return SWEEP_WRITERS[file_format](path, sparameter_names)
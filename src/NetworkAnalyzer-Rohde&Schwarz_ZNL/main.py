@@ -37,10 +37,17 @@
 import numpy as np
 from pysweepme.EmptyDeviceClass import EmptyDevice
 from pysweepme.ErrorMessage import debug  # , error
+from pysweepme.FolderManager import addFolderToPATH
+
+addFolderToPATH()
+
+from binary_block import read_binary_block
+from sweep_writer import SWEEP_WRITERS, create_sweep_writer
 
 VERBOSE = False
 ZNL_DEFAULT_CAL_DIR = r"C:\Users\Public\Documents\Rohde-Schwarz\ZNL\Calibration\Data"
 DATA_FMT = "REAL,32"  # valid: "ASCII", "REAL,64", "REAL,32"
+BINARY_DTYPES = {"REAL,32": "<f4", "REAL,64": "<f8"}  # byte order is set to NORMal, i.e. little-endian on R&S
 """ VNA nomenclature
     Trace: empty/filled complex data container
         - data trace
@@ -94,6 +101,7 @@ def __init__(self) -> None:
         ]
 
         self.calibration_file_extensions = [".cal"]
+        self.sweep_writer = None
 
     def set_GUIparameter(self) -> dict:  # noqa: N802
         """Returns a dictionary with keys and values to generate GUI elements in the SweepMe! GUI."""
@@ -119,6 +127,7 @@ def set_GUIparameter(self) -> dict:  # noqa: N802
                       ],
             "FrequencyStepPoints": 1e6,
             "Display": True,
+            "Sweep file": ["None", *SWEEP_WRITERS],
         }
 
     def get_GUIparameter(self, parameter: dict) -> None:  # noqa: N802
@@ -140,6 +149,7 @@ def get_GUIparameter(self, parameter: dict) -> None:  # noqa: N802
         self.trigger_delay = parameter["TriggerDelay"]
 
         self.update_display = parameter["Display"]
+        self.sweep_file_format = parameter.get("Sweep file", "None")
 
         self.variables = ["Frequency"]
         self.units = ["Hz"]
@@ -287,6 +297,14 @@ def configure(self) -> None:
             msg = "Correction 'ON' Requested but no calibration file specified."
             raise OSError(msg)
 
+        # Files in the temporary folder are saved together with the measurement data
+        timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+        self.sweep_writer = create_sweep_writer(
+            self.sweep_file_format,
+            os.path.join(self.get_folder("TEMP"), f"ZNL_{timestamp}"),
+            self.Sparam_names,
+        )
+
     def poweron(self) -> None:
         """Turn on the device when entering a sequencer branch if it was not already used in the previous branch."""
         self.set_output_on()
@@ -297,6 +315,10 @@ def poweroff(self) -> None:
 
     def unconfigure(self) -> None:
         """Unconfigure the device. This function is called when the procedure leaves a branch of the sequencer."""
+        if self.sweep_writer is not None:
+            self.sweep_writer.close()
+            self.sweep_writer = None
+
         self.check_errors()
 
         # abort all ongoing sweeps
@@ -350,6 +372,9 @@ def read_result(self) -> None:
             data_str = self.get_trace_data(channel=channel, trace_name=tr_name, fmt="SDAT")
             self.results.append(self.parse_data(data_str))
 
+        if self.sweep_writer is not None:
+            self.sweep_writer.write(self.results[0], self.results[1:])
+
     def call(self) -> list:
         """Return the measurement results. Must return as many values as defined in self.variables."""
         return self.results
@@ -362,27 +387,11 @@ def finish(self) -> None:
 
     # """ further function as needed by this device class are defined here """
 
-    def binblock_raw(self, data_in, dtype_) -> np.array:
-        """Convert binary data to numeric."""
-        # Grab the beginning section of the data file, which will contain the header.
-        header = str(data_in[0:12])
-        # Find the start position of the IEEE header, which starts with a '#'.
-        startpos = header.find("#")
-        # check for problem with start position.
-        if startpos < 0:
-            raise OSError("No start of block found")
-
-        # number after '#' symbol is the number of digits in the block length.
-        digits_block_length = int(header[startpos + 1])
-
-        # Now we know how many digits are in the size value, get the size of the data file
-        image_size = int(header[startpos + 2 : startpos + 2 + digits_block_length])
-
-        # Get the length from the header
-        offset = startpos + digits_block_length
-
-        dtype_ = np.dtype(dtype_)
-        return np.frombuffer(data_in[offset : offset + image_size], dtype=dtype_)
+    def read_data(self):
+        """Read the response to a data query as ASCII string or as binary block."""
+        if self.data_format_type == "ASCII":
+            return self.port.read()
+        return read_binary_block(self.port.port, BINARY_DTYPES[self.data_format_type])
 
     def find_calibrations(self, cal_dir=ZNL_DEFAULT_CAL_DIR) -> list:
         """Called by the SweepMe NetworkAnalyser module returns available calibrations on ZNL at default driectory."""
@@ -400,9 +409,9 @@ def parse_data(self, data_str):
         if self.data_format_type == "ASCII":
             data = np.fromstring(data_str, sep=",", dtype="d")
 
-        elif self.data_format_type == "REAL,64" or self.data_format_type == "REAL,32":
-            dtype = "f8" if self.data_format_type == "REAL,64" else "f4"
-            data = self.binblock_raw(data_str, dtype)
+        elif self.data_format_type in BINARY_DTYPES:
+            # binary blocks are already converted by read_data
+            data = data_str
 
         else:
             err_mesg = f"""
@@ -510,6 +519,8 @@ def set_data_transfer_format(self, fmt_type) -> None:
         if fmt_type.upper() not in allowed_fmts:
             raise OSError(f"Data format {fmt_type} not in{allowed_fmts}")
         self.port.write(f":FORM:DATA {fmt_type}")
+        # Unlike Keysight, R&S analyzers use little-endian for NORMal (the default) and big-endian for SWAPped
+        self.port.write(":FORM:BORD NORM")
 
     def get_data_transfer_format(self):
         self.port.write(":FORMat:DATA?")
@@ -585,7 +596,7 @@ def set_power_level(self, power_dB: float, channel: int = 1) -> None:
     def get_applied_frequency_data(self, channel=1):
         """Get the frequencies that were applied during sweep (as opposed to the requested frequencies)."""
         self.port.write(f"CALC{channel}:DATA:STIM?")
-        return self.port.read() if self.data_format_type == "ASCII" else self.port.port.read_raw()
+        return self.read_data()
 
     def set_averaging(self, n_avg, channel=1) -> None:
         onoff = "OFF" if n_avg == 1 else "ON"
@@ -688,21 +699,12 @@ def get_trace_data(self, channel, trace_name, fmt="SDAT"):
         """
         self.port.write(f":CALCULATE{channel}:DATA:TRAC? '{trace_name}', {fmt}")
         t0 = time.time()
-        if self.data_format_type == "ASCII":
-            ascdata_in = self.port.read()
-            self.check_operation_complete()
-            t1 = time.time()
-            if VERBOSE:
-                print(f"spar data read and transfered in {t1 - t0:.4f}s")
-            return ascdata_in
-        else:
-            # read_raw needed if driver used outside sweepMe
-            bindata_in = self.port.port.read_raw()
-            self.check_operation_complete()
-            t1 = time.time()
-            if VERBOSE:
-                print(f"spar data read and transfered in {t1 - t0:.2f}s")
-            return bindata_in
+        data_in = self.read_data()
+        self.check_operation_complete()
+        t1 = time.time()
+        if VERBOSE:
+            print(f"spar data read and transfered in {t1 - t0:.4f}s")
+        return data_in
 
     def get_trace_number(self, tr_name):
         self.port.write(f"CONFigure:TRACe:NAME:ID? {tr_name}")
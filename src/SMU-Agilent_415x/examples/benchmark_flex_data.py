@@ -0,0 +1,68 @@
+"""
+Compare the time to decode the ASCII response of a list sweep with the previous loop over all records and with the
+fixed-width decoder of libs/flex_data.py. The response is generated in memory, so no instrument is needed.
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+# add libs folder to sys.path to enable import of flex_data
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "libs"))
+
+import flex_data  # noqa: E402
+
+number_of_points = 50_000
+repetitions = 5
+
+data_status_codes = {1: "A / D converter overflowed.", 8: "This unit reached its compliance setting."}
+
+
+def decode_loop(reply: str) -> dict[str, list[float]]:
+    """Previous implementation of the driver that decodes the records one by one."""
+    data = {}
+    error_messages = set()
+    for data_point in reply.split(","):
+        status = data_point[:3]
+        data_id = data_point[3:5]
+        value = float(data_point[5:])
+
+        if status.isdigit():
+            status = int(status)
+            if status != 0 and status != 128:
+                for i in data_status_codes:
+                    if i & status == i:
+                        error_messages.add(data_status_codes[i])
+
+        if value > 1e37:
+            value = float("nan")
+
+        if data_id not in data:
+            data[data_id] = []
+        data[data_id].append(value)
+    return data
+
+
+def decode_numpy(reply: str) -> dict[str, np.ndarray]:
+    records = flex_data.decode_records(reply, status_length=3)
+    flex_data.combine_status(records)
+    return flex_data.split_by_id(records)
+
+
+def measure(function: callable, reply: str) -> float:
+    durations = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        function(reply)
+        durations.append(time.perf_counter() - start)
+    return min(durations)
+
+
+values = np.random.default_rng().standard_normal(number_of_points) * 1e-3
+reply = ",".join(f"000B{'IV'[n % 2]}{value:+.5E}" for n, value in enumerate(values))
+
+print(f"List sweep response with {number_of_points} records")
+print(f"loop over records: {measure(decode_loop, reply) * 1e3:.1f} ms")
+print(f"fixed-width decoder: {measure(decode_numpy, reply) * 1e3:.1f} ms")
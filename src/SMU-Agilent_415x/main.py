@@ -31,9 +31,15 @@
 # Device: Agilent 415x
 
 import numpy as np
+import threading
 import time
 from EmptyDeviceClass import EmptyDevice
 from ErrorMessage import error
+from FolderManager import addFolderToPATH
+
+addFolderToPATH()
+
+import flex_data
 
 
 class Device(EmptyDevice):
@@ -147,6 +153,14 @@ def __init__(self):
                                 128: "EOD(End of Data).",
                                 }
 
+        # Background drain of the output buffer during list sweeps
+        self.drain_thread = None
+        self.stop_drain = threading.Event()
+        self.drain_lock = threading.Lock()
+        self.data_chunks = {}  # decoded values per data id, e.g. "BI", as list of arrays
+        self.data_status = 0  # bitwise OR of the status codes of all records
+        self.drain_error = None
+
     def set_GUIparameter(self):
         
         gui_parameter = {
@@ -344,6 +358,8 @@ def configure(self):
                     
     def unconfigure(self):
 
+        self.finish_drain()
+
         if self.sweepvalue == "List sweep":
             if "Data" in self.device_communication[self.instrument_id]:
                 del self.device_communication[self.instrument_id]["Data"]
@@ -404,24 +420,27 @@ def measure(self):
                 self.execute_measurement()
                 # self.port.write("*OPC?")  # old solution with using 'operation complete' to check end of measurement
 
+                # records are read while the staircase sweep is running
+                self.start_drain()
+
     def request_result(self):
 
         if self.use_vsu:
             return  # no measurement possible with VSU channels
     
-        # only the module in List sweep mode must check whether measurement execution has finished
-        if self.sweepvalue == "List sweep":
+        # only the module in List sweep mode must wait until the output buffer is drained
+        if self.sweepvalue == "List sweep" and self.drain_thread is not None:
             # self.port.read()  # reading the answer of the *OPC? query in 'request_result', not used anymore
 
             status_timeout = 120  # two minutes for taking a list sweep should be enough
             starttime = time.perf_counter()
             while time.perf_counter() - starttime < status_timeout:
-                self.port.write("*STB?")
-                stb = self.port.read()
-                # print("Status byte:", stb)  # stb should be an integer
-                if int(stb) & 2 != 2:  # if second bit 2**1 is in status byte, the logic sum will be 2
+                self.drain_thread.join(0.1)
+                if not self.drain_thread.is_alive() or self.is_run_stopped():
                     break
-                time.sleep(0.1)
+
+            # the values received so far stay available if the sweep has been stopped or timed out
+            self.finish_drain()
        
     def read_result(self):
 
@@ -440,48 +459,17 @@ def read_result(self):
                 if "No error" not in e:
                     print("Error message Agilent 415x:", e)
         
-                self.device_communication[self.instrument_id]["Data"] = {}
+                if self.drain_error is not None:
+                    raise self.drain_error
 
-                error_messages = set()
+                # Records that arrived after the end of the drain, e.g. if the sweep did not report end of data
+                while self.get_number_data() > 0:
+                    self.add_records(self.read_measurement_data())
+                self.publish_data()
 
-                while True:
-                
-                    data_number = self.get_number_data()
-                    print("Number of points in buffer:", data_number)
-                    
-                    if int(data_number) > 0:
-                    
-                        reply = self.read_measurement_data()
-                        # print("RMD? response:", reply)
-                        
-                        for data_point in reply.split(","):
-
-                            status = data_point[:3]  #
-                            # chan_str = data_point[3]  # channel string
-                            # data_type = data_point[4]
-                            data_id = data_point[3:5]  # e.g. "BI" with B for channel 2, and I for currents,
-                            data = float(data_point[5:])
-
-                            if status.isdigit():
-                                status = int(status)
-
-                                if status != 0 and status != 128:  # 0 = ok, 128 = end of data
-                                    for i in self.data_status_codes:
-                                        if i & status == i:  # bitwise AND operator & is used
-                                            error_messages.add(self.data_status_codes[i])
-
-                            if data > 1e37:
-                                data = float('nan')  # a number larger than 1e37 indicates a false value that would 
-
-                            # We save all values in a separate list per identifier
-                            if data_id not in self.device_communication[self.instrument_id]["Data"]:
-                                # create a new empty list for each data_id
-                                self.device_communication[self.instrument_id]["Data"][data_id] = []
-                            # append data to list
-                            self.device_communication[self.instrument_id]["Data"][data_id].append(data)
-
-                    else:
-                        break
+                error_messages = {
+                    message for code, message in self.data_status_codes.items() if self.data_status & code == code
+                }
 
                 if len(error_messages) > 0:
                     print("The following error messages are found after staircase sweep:")
@@ -542,6 +530,70 @@ def call(self):
     
         return [self.v, self.i]
 
+    """ Here, functions start that drain the output buffer during list sweeps """
+
+    def start_drain(self):
+        """Start a thread that reads and decodes the records of the output buffer while the sweep is running."""
+        self.data_chunks = {}
+        self.data_status = 0
+        self.drain_error = None
+        self.device_communication[self.instrument_id]["Data"] = {}
+
+        self.stop_drain.clear()
+        self.drain_thread = threading.Thread(target=self.drain_buffer, daemon=True)
+        self.drain_thread.start()
+
+    def drain_buffer(self):
+        """Read records until the end of data status (128) is received or the sweep is not running anymore.
+
+        This function runs in the drain thread, which is the only user of the port while it is alive.
+        """
+        try:
+            while not self.stop_drain.is_set():
+                if self.get_number_data() > 0:
+                    if self.add_records(self.read_measurement_data()) & 128:
+                        break
+                # bit 2**1 of the status byte is set as long as the measurement is running
+                elif int(self.get_status_byte()) & 2 != 2:
+                    # records can arrive between the two queries
+                    if self.get_number_data() == 0:
+                        break
+                else:
+                    time.sleep(0.05)
+        except Exception as e:
+            self.drain_error = e
+
+    def finish_drain(self):
+        """Stop the drain thread and make the values received so far available."""
+        if self.drain_thread is None:
+            return
+
+        self.stop_drain.set()
+        self.drain_thread.join()
+        self.drain_thread = None
+        self.publish_data()
+
+    def add_records(self, reply):
+        """Decode the records of a RMD? response, store their values and return the status of all records."""
+        # records "AAABCDDDDDDDDDDDD" with status AAA, channel B, data type C, and value DDD...
+        records = flex_data.decode_records(reply, status_length=3)
+
+        with self.drain_lock:
+            # 0 = ok, 128 = end of data are no errors
+            self.data_status |= flex_data.combine_status(records)
+            # data_id is e.g. "BI" with B for channel 2, and I for currents
+            for data_id, values in flex_data.split_by_id(records).items():
+                self.data_chunks.setdefault(data_id, []).append(values)
+
+        return flex_data.combine_status(records, ignored=())
+
+    def publish_data(self):
+        """Save the values received so far in a separate array per identifier."""
+        with self.drain_lock:
+            self.device_communication[self.instrument_id]["Data"] = {
+                data_id: np.concatenate(chunks) for data_id, chunks in self.data_chunks.items()
+            }
+
     """ Here, convenience functions start that wrap the commands into python functions """
           
     def get_identification(self):
@@ -868,6 +920,11 @@ def read_errors(self):
         self.port.write(":SYST:ERR?")
         return self.port.read()
         
+    def get_status_byte(self):
+
+        self.port.write("*STB?")
+        return self.port.read()
+
     def get_number_data(self):
     
         self.port.write("NUB?")
@@ -900,7 +957,11 @@ def set_data_format(self, form, mode):
                 with measurement data.
 
         """
-        
+        # the measurement data is decoded with flex_data, which only supports the ASCII formats
+        if int(form) in (3, 4):
+            msg = "Agilent 415x: Binary data formats (FMT 3 and 4) are not supported, please use an ASCII format."
+            raise ValueError(msg)
+
         self.port.write("FMT %i,%i" % (int(form), int(mode)))
 
 
@@ -0,0 +1,86 @@
+"""Unit tests for decoding FLEX measurement data without an instrument."""
+
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+# add libs folder to sys.path to enable import of flex_data
+libs_folder = Path(__file__).resolve().parents[2] / "libs"
+if str(libs_folder) not in sys.path:
+    sys.path.insert(0, str(libs_folder))
+
+import flex_data  # noqa: E402
+
+
+class DecodeRecordsTests(unittest.TestCase):
+    """Tests for the fixed-width decoding of comma separated records."""
+
+    def test_records_with_3_digit_status(self) -> None:
+        """The header of the 415x is split into status, channel and data type."""
+        records = flex_data.decode_records("000AI+1.23456E-03,000Av+2.00000E+00,128BI-5.00000E-12\r\n")
+
+        self.assertEqual(records["status"].tolist(), [b"000", b"000", b"128"])
+        self.assertEqual(records["channel"].tolist(), [b"A", b"A", b"B"])
+        self.assertEqual(records["data_type"].tolist(), [b"I", b"v", b"I"])
+        np.testing.assert_array_equal(records["value"], [1.23456e-3, 2.0, -5e-12])
+
+    def test_records_with_1_character_status(self) -> None:
+        """The header of the B1500 has a single status character."""
+        records = flex_data.decode_records("NAI+1.234560E-03,NAT+0.000500E+00", status_length=1)
+
+        self.assertEqual(records["status"].tolist(), [b"N", b"N"])
+        self.assertEqual(records["data_type"].tolist(), [b"I", b"T"])
+        np.testing.assert_array_equal(records["value"], [1.23456e-3, 5e-4])
+
+    def test_records_without_header(self) -> None:
+        """Records without header only contain the value."""
+        records = flex_data.decode_records("+1.00000E-03,-2.00000E+00", status_length=0)
+
+        np.testing.assert_array_equal(records["value"], [1e-3, -2.0])
+
+    def test_records_of_different_length(self) -> None:
+        """Records with whitespace or different number of digits are decoded as well."""
+        records = flex_data.decode_records("000AI+1.0E-03, 000AV+2.00000E+00,000AI+3E-3")
+
+        self.assertEqual(records["channel"].tolist(), [b"A", b"A", b"A"])
+        np.testing.assert_array_equal(records["value"], [1e-3, 2.0, 3e-3])
+
+    def test_invalid_data_is_nan(self) -> None:
+        """Values above 1e37 indicate invalid data."""
+        records = flex_data.decode_records("NAI+199.999E+99,NAI+1.00000E+00", status_length=1)
+
+        self.assertTrue(np.isnan(records["value"][0]))
+        self.assertEqual(records["value"][1], 1.0)
+
+    def test_empty_response(self) -> None:
+        """An empty response returns no records."""
+        self.assertEqual(len(flex_data.decode_records("\r\n")), 0)
+
+    def test_split_by_id(self) -> None:
+        """The values are grouped by channel and data type in the order of the first occurrence."""
+        records = flex_data.decode_records("000BI+1.00000E+00,000AV+2.00000E+00,000BI+3.00000E+00")
+
+        values = flex_data.split_by_id(records)
+
+        self.assertEqual(list(values), ["BI", "AV"])
+        np.testing.assert_array_equal(values["BI"], [1.0, 3.0])
+
+    def test_combine_status(self) -> None:
+        """All status bits are combined, except for 0 (ok) and 128 (end of data)."""
+        records = flex_data.decode_records("001AI+1.00000E+00,008AI+1.00000E+00,128AI+1.00000E+00,000AI+1.00000E+00")
+
+        self.assertEqual(flex_data.combine_status(records), 9)
+
+    def test_parse_value(self) -> None:
+        """Single values are returned with and without header."""
+        self.assertEqual(flex_data.parse_value("NAI+1.00000E-03\r\n"), 1e-3)
+        self.assertEqual(flex_data.parse_value("000AV-2.00000E+00"), -2.0)
+        self.assertEqual(flex_data.parse_value("+1.50000E+00"), 1.5)
+        self.assertEqual(flex_data.parse_value("1.5"), 1.5)
+        self.assertTrue(np.isnan(flex_data.parse_value("+199.999E+99")))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+# This Device Class is published under the terms of the MIT License.
+# Required Third Party Libraries, which are included in the Device Class
+# package for convenience purposes, may have a different license. You can
+# find those in the corresponding folders or contact the maintainer.
+#
+# MIT License
+#
+# Copyright (c) 2026 SweepMe! GmbH (sweep-me.net)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Decode the ASCII measurement data of instruments that use the FLEX command set.
+
+The Agilent 415x, Keysight B1500 and HP 4142B return measurement data as comma separated records. With header
+(FMT 1), a record consists of the status, the channel letter, the data type and the value, e.g. "000AI+1.23456E-03"
+for the 415x with a 3-digit status or "NAI+1.234560E-03" for the B1500 with a 1-character status. Without header
+(FMT 2), a record is only the value.
+
+All records of a response have the same length, so the response is viewed as 2D byte array with one record per row
+and the columns of status, channel, data type and value are converted at once.
+
+The binary output formats (FMT 3 and 4) are not supported. Their bit layouts and range tables differ between the
+instrument families, and decoding them is left to a separate change that can be checked against the manuals.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+INVALID_DATA_LIMIT = 1e37
+"""Values above this limit indicate invalid data and are replaced by nan, e.g. 199.999E+99 of the B1500."""
+
+
+def record_dtype(status_length: int) -> np.dtype:
+    """Return the dtype of the decoded records for the given length of the status field."""
+    return np.dtype([
+        ("status", f"S{max(status_length, 1)}"),
+        ("channel", "S1"),
+        ("data_type", "S1"),
+        ("value", np.float64),
+    ])
+
+
+def decode_records(response: str | bytes, status_length: int = 3) -> np.ndarray:
+    """Decode a response with comma separated data records into a structured array.
+
+    Args:
+        response: Response to a query of measurement data, e.g. RMD? or the data after XE.
+        status_length: Number of characters of the status in the header, 3 for the 415x and 1 for the B1500 and
+            4142B. Use 0 for records without header. Then, status, channel and data type are empty.
+
+    Returns:
+        Structured array with the fields status, channel, data_type as bytes and value as float.
+    """
+    if isinstance(response, str):
+        response = response.encode("ascii")
+    response = response.strip()
+
+    dtype = record_dtype(status_length)
+    if not response:
+        return np.zeros(0, dtype=dtype)
+
+    header_length = status_length + 2 if status_length > 0 else 0
+    record_length = response.find(b",")
+    if record_length < 0:
+        record_length = len(response)
+
+    # Records have a fixed length. Otherwise, e.g. with whitespace around the commas, they are converted one by one.
+    if (len(response) + 1) % (record_length + 1) != 0 or record_length <= header_length:
+        return decode_records_slow(response, status_length)
+
+    table = np.frombuffer(response + b",", dtype=np.uint8).reshape(-1, record_length + 1)
+    if np.any(table[:, -1] != ord(",")):
+        return decode_records_slow(response, status_length)
+
+    records = np.zeros(len(table), dtype=dtype)
+    if header_length:
+        records["status"] = column_as_bytes(table, 0, status_length)
+        records["channel"] = column_as_bytes(table, status_length, status_length + 1)
+        records["data_type"] = column_as_bytes(table, status_length + 1, header_length)
+    records["value"] = column_as_bytes(table, header_length, record_length).astype(np.float64)
+
+    records["value"][records["value"] > INVALID_DATA_LIMIT] = np.nan
+    return records
+
+
+def decode_records_slow(response: bytes, status_length: int = 3) -> np.ndarray:
+    """Decode records of different lengths one by one. See decode_records."""
+    header_length = status_length + 2 if status_length > 0 else 0
+    parts = [part.strip() for part in response.split(b",")]
+
+    records = np.zeros(len(parts), dtype=record_dtype(status_length))
+    for record, part in zip(records, parts):
+        if header_length:
+            record["status"] = part[:status_length]
+            record["channel"] = part[status_length : status_length + 1]
+            record["data_type"] = part[status_length + 1 : header_length]
+        record["value"] = float(part[header_length:])
+
+    records["value"][records["value"] > INVALID_DATA_LIMIT] = np.nan
+    return records
+
+
+def column_as_bytes(table: np.ndarray, start: int, stop: int) -> np.ndarray:
+    """Return the columns start to stop of a 2D byte array as 1D array of byte strings."""
+    return np.ascontiguousarray(table[:, start:stop]).view(f"S{stop - start}").ravel()
+
+
+def split_by_id(records: np.ndarray) -> dict[str, np.ndarray]:
+    """Return the values of the records by data ID, i.e. channel letter and data type, e.g. "BI".
+
+    The IDs are in the order of their first occurrence and the values in the order of the records.
+    """
+    # the two characters of an ID are combined into one integer, which is faster to compare than strings
+    ids = records["channel"].view(np.uint8).astype(np.uint16) << 8 | records["data_type"].view(np.uint8)
+    unique_ids, first_index = np.unique(ids, return_index=True)
+
+    return {
+        (chr(data_id >> 8) + chr(data_id & 0xFF)).strip("\x00"): records["value"][ids == data_id]
+        for data_id in unique_ids[np.argsort(first_index)].tolist()
+    }
+
+
+def combine_status(records: np.ndarray, ignored: tuple[int, ...] = (0, 128)) -> int:
+    """Return the bitwise OR of all numeric status codes except the ignored ones, e.g. 128 for end of data."""
+    digits = np.ascontiguousarray(records["status"]).view(np.uint8).reshape(len(records), -1) - np.uint8(ord("0"))
+
+    status = np.zeros(len(records), dtype=np.int64)
+    is_used = np.ones(len(records), dtype=bool)
+    for column in digits.T:
+        is_used &= column <= 9  # other characters wrap around to values above 9
+        status = 10 * status + column
+    for code in ignored:
+        is_used &= status != code
+    status = status[is_used]
+    return int(np.bitwise_or.reduce(status)) if len(status) > 0 else 0
+
+
+def parse_value(answer: str) -> float:
+    """Return the value of a single record with or without header, e.g. "NAI+1.23456E-03" or "+1.23456E-03"."""
+    answer = answer.strip()
+    start = len(answer) - len(answer.lstrip("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"))
+    # digits of a status header are followed by letters, digits of the value are preceded by nothing or a sign
+    if start == len(answer) or answer[start] not in "+-":
+        start = 0
+    value = float(answer[start:])
+    return float("nan") if value > INVALID_DATA_LIMIT else value
@@ -33,10 +33,15 @@
 from collections import OrderedDict
 
 from pysweepme.EmptyDeviceClass import EmptyDevice
+from pysweepme.FolderManager import addFolderToPATH
 
 import numpy as np
 import time
 
+addFolderToPATH()
+
+import flex_data
+
 
 class Device(EmptyDevice):
 
@@ -418,55 +423,38 @@ def read_result(self) -> None:
         if self.list_master:
             results = self.port.read()
 
-            # Initialize the list results dictionary
+            # records "ABCDDDDDDDDDDDDD" with status A, channel B, data type C (I, V, T) and value DDD...
+            records = flex_data.decode_records(results, status_length=1)
+            # A-J, a-j for slots 1-10 and subchannel 1/2 (a/A)
+            channel_numbers = records["channel"].view(np.uint8) - ord("A") + 1
+            is_timestamp = records["data_type"] == b"T"
+
+            # save the values in the device communication dictionary
+            list_results = self.device_communication[self.driver_port_string]["list_results"]
             for channel in self.device_communication[self.driver_port_string]["channels"]:
-                self.device_communication[self.driver_port_string]["list_results"][channel] = {
-                    "measurements": [],
-                    "timestamps": [],
+                is_channel = channel_numbers == channel
+                list_results[channel] = {
+                    "measurements": records["value"][is_channel & ~is_timestamp],
+                    "timestamps": records["value"][is_channel & is_timestamp],
                 }
 
-            for result in results.split(','):
-                result = result.strip()
-                header = result[:3]
-                status = header[0]  # not used yet, can be used to check for errors
-                channel_id = header[1]  # A-J, a-j for slots 1-10 and subchannel 1/2 (a/A)
-                channel_num = ord(channel_id) - ord('A') + 1
-                data_type = header[2]  # can be I,V,T
-                value = float(result[3:])  # the actual value
-
-                # save the value in the device communication dictionary
-                if data_type == "T":
-                    self.device_communication[self.driver_port_string]["list_results"][channel_num]["timestamps"].append(value)
-                else:
-                    self.device_communication[self.driver_port_string]["list_results"][channel_num]["measurements"].append(value)
-
             # make timestamps relative to the first timestamp of the list master
-            master_timestamps = self.device_communication[self.driver_port_string]["list_results"][self.channel]["timestamps"]
-            if master_timestamps:
+            master_timestamps = list_results[self.channel]["timestamps"]
+            if len(master_timestamps) > 0:
                 t0 = master_timestamps[0]
                 for channel in self.device_communication[self.driver_port_string]["channels"]:
-                    timestamps = self.device_communication[self.driver_port_string]["list_results"][channel]["timestamps"]
-                    relative_timestamps = [t - t0 for t in timestamps]
-                    self.device_communication[self.driver_port_string]["list_results"][channel]["timestamps"] = relative_timestamps
+                    list_results[channel]["timestamps"] = list_results[channel]["timestamps"] - t0
 
         elif self.list_follower:
             # list followers read results from device_communication in call
             return
 
         else:
-            answer = self.port.query(f"TI {self.channel},0")
-            try:
-                self.measured_current = float(answer)
-            except ValueError:
-                self.measured_current = float(answer[3:])  # sometimes NAI comes first, we have to strip it
-
-            answer = self.port.query(f"TV {self.channel},0")
-            try:
-                self.measured_voltage = float(answer)
-            except ValueError:
-                self.measured_voltage = float(answer[3:])  # sometimes NAI comes first, we have to strip it
+            # sometimes NAI comes first, it is stripped by parse_value
+            self.measured_current = flex_data.parse_value(self.port.query(f"TI {self.channel},0"))
+            self.measured_voltage = flex_data.parse_value(self.port.query(f"TV {self.channel},0"))
 
-    def call(self) -> list[float] | list[list[float]]:
+    def call(self) -> list[float] | list[list[float] | np.ndarray]:
         """Return the measurement results. Must return as many values as defined in self.variables."""
         if self.list_follower or self.list_master:
             device_communication = self.device_communication[self.driver_port_string]
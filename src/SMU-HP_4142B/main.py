@@ -32,6 +32,11 @@
 
 
 from pysweepme.EmptyDeviceClass import EmptyDevice
+from pysweepme.FolderManager import addFolderToPATH
+
+addFolderToPATH()
+
+import flex_data
 
 
 class Device(EmptyDevice):
@@ -192,16 +197,14 @@ def call(self):
         answer = self.port.read()
         # print("Current:", answer)
         
-        # If NAI comes first, we have to strip it. Please toggle the lines, if needed.
-        i = float(answer)
-        # i = float(answer[3:])
+        # If NAI comes first, it is stripped by parse_value
+        i = flex_data.parse_value(answer)
         
         answer = self.port.read()
         # print("Voltage:", answer)
         
-        # If NAV comes first, we have to strip it. Please toggle the lines, if needed.
-        v = float(answer)
-        # v = float(answer[3:])
+        # If NAV comes first, it is stripped by parse_value
+        v = flex_data.parse_value(answer)
     
         return [v,i]
 
@@ -0,0 +1,128 @@
+# This Device Class is published under the terms of the MIT License.
+# Required Third Party Libraries, which are included in the Device Class
+# package for convenience purposes, may have a different license. You can
+# find those in the corresponding folders or contact the maintainer.
+#
+# MIT License
+#
+# Copyright (c) 2025 SweepMe! GmbH (sweep-me.net)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Read IEEE 488.2 binary blocks from a pyvisa resource into numpy arrays.
+
+A definite length block has the form #<number of digits><length><data>, e.g. #3128<128 bytes>, and an indefinite
+length block has the form #0<data> and ends with the message. The data is read in chunks into a buffer, so the
+block does not need to arrive in a single read, and returned as numpy array that shares the memory of the buffer.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+from pyvisa import constants
+
+# Reading large chunks reduces the number of VISA calls, the pyvisa default chunk size is 20 kB.
+CHUNK_SIZE = 2**20
+
+# Number of bytes that may precede the '#' of the header, e.g. whitespace or a left-over termination character
+MAX_HEADER_OFFSET = 16
+
+
+def read_binary_block(resource, dtype: str | np.dtype, chunk_size: int = CHUNK_SIZE) -> np.ndarray:
+    """Read one binary block from the resource and return it as array of the given dtype.
+
+    The termination that follows the block is read as well. For indefinite length blocks, the read termination is
+    disabled while reading, so that termination characters inside the data do not end the block.
+
+    Args:
+        resource: pyvisa message based resource, e.g. self.port.port of a SweepMe! driver.
+        dtype: Data type including the byte order, e.g. "<f4" for little-endian 32-bit floats.
+        chunk_size: Maximum number of bytes per read.
+
+    Returns:
+        Array view of the data without copying it.
+    """
+    dtype = np.dtype(dtype)
+
+    with resource.ignore_warning(
+        constants.StatusCode.success_device_not_present,
+        constants.StatusCode.success_max_count_read,
+    ):
+        number_of_digits = read_block_header_digits(resource)
+
+        if number_of_digits == 0:
+            with resource.read_termination_context(None):
+                buffer, status = read_until_end(resource, chunk_size)
+            # The message of an indefinite length block ends with a line feed that is not part of the data.
+            length = len(buffer) - 1 if buffer.endswith(b"\n") else len(buffer)
+        else:
+            length = int(read_exactly(resource, bytearray(number_of_digits), chunk_size)[0])
+            buffer, status = read_exactly(resource, bytearray(length), chunk_size)
+
+        # Read the termination of the message if the end was not reached with the data
+        if status != constants.StatusCode.success:
+            read_until_end(resource, chunk_size)
+
+    # Ignore incomplete items, e.g. if the block length is not a multiple of the item size.
+    return np.frombuffer(buffer, dtype=dtype, count=length // dtype.itemsize)
+
+
+def read_block_header_digits(resource) -> int:
+    """Read the start of the header up to and including the number of digits of the length and return the digits."""
+    for _ in range(MAX_HEADER_OFFSET):
+        byte, _ = resource.visalib.read(resource.session, 1)
+        if byte == b"#":
+            digit, _ = resource.visalib.read(resource.session, 1)
+            return int(digit)
+
+    msg = "No start of binary block found."
+    raise OSError(msg)
+
+
+def read_exactly(resource, buffer: bytearray, chunk_size: int = CHUNK_SIZE) -> tuple[bytearray, int]:
+    """Fill the buffer with data from the resource and return the buffer and the status of the last read."""
+    view = memoryview(buffer)
+    position = 0
+    status = constants.StatusCode.success_max_count_read
+
+    while position < len(buffer):
+        chunk, status = resource.visalib.read(resource.session, min(chunk_size, len(buffer) - position))
+        view[position : position + len(chunk)] = chunk
+        position += len(chunk)
+
+        if status == constants.StatusCode.success and position < len(buffer):
+            msg = f"Binary block ended after {position} of {len(buffer)} bytes."
+            raise OSError(msg)
+
+    return buffer, status
+
+
+def read_until_end(resource, chunk_size: int = CHUNK_SIZE) -> tuple[bytearray, int]:
+    """Read from the resource until the end of the message and return the data and the status of the last read.
+
+    The message ends with the END indicator or with the termination character if the read termination is enabled.
+    """
+    buffer = bytearray()
+    status = constants.StatusCode.success_max_count_read
+
+    while status not in (constants.StatusCode.success, constants.StatusCode.success_termination_character_read):
+        chunk, status = resource.visalib.read(resource.session, chunk_size)
+        buffer += chunk
+
+    return buffer, status
@@ -29,8 +29,25 @@
 # * Module: SMU
 # * Instrument: Keithley 2450
 
+import time
+
+import numpy as np
 from pysweepme.EmptyDeviceClass import EmptyDevice
 from pysweepme.ErrorMessage import debug
+from pysweepme.FolderManager import addFolderToPATH
+
+addFolderToPATH()
+
+from binary_block import read_binary_block
+
+# Name of the source configuration list that holds the values of a list sweep
+LIST_NAME = "SweepMeList"
+
+# Number of list values that are stored with one TSP command
+LIST_CHUNK_SIZE = 100
+
+# Power line frequency used to estimate the duration of a list sweep, 50 Hz gives the longer integration time
+LINE_FREQUENCY = 50.0
 
 
 class Device(EmptyDevice):
@@ -80,6 +97,16 @@ def set_GUIparameter(self) -> dict:
             "Average": 1,
             "Compliance": 100e-6,
             "4wire": False,
+
+            "ListSweepCheck": True,
+            "ListSweepType": ["Sweep", "Custom"],
+            "ListSweepStart": 0.0,
+            "ListSweepEnd": 1.0,
+            "ListSweepStepPointsType": ["Step width:", "Points (lin.):", "Points (log.):"],
+            "ListSweepStepPointsValue": 0.1,
+            "ListSweepCustomValues": "",
+            "ListSweepDual": False,
+            "ListSweepHoldtime": 0.0,
         }
 
     def get_GUIparameter(self, parameter: dict) -> None:
@@ -91,6 +118,36 @@ def get_GUIparameter(self, parameter: dict) -> None:
         self.speed = parameter["Speed"]
         self.range = parameter["Range"]
         self.average = int(parameter["Average"])
+        self.port_string = parameter.get("Port", "")
+
+        # When this driver is used with pysweepme, the SweepValue parameter might be missing.
+        self.sweepvalue = parameter.get("SweepValue", "SweepEditor")
+
+        if self.sweepvalue == "List sweep":
+            self.listtype = parameter["ListSweepType"]
+            self.listsweep_start = float(parameter["ListSweepStart"])
+            self.listsweep_end = float(parameter["ListSweepEnd"])
+            self.listsweep_steppoints_type = parameter["ListSweepStepPointsType"]
+            self.listsweep_steppoints_value = float(parameter["ListSweepStepPointsValue"])
+            self.listsweep_dual = bool(parameter["ListSweepDual"])
+            self.custom_values = str(parameter["ListSweepCustomValues"])
+
+            # source delay, time between applying a source value and the measurement, 0 if empty
+            try:
+                self.listsweep_hold = float(parameter["ListSweepHoldtime"])
+            except ValueError:
+                self.listsweep_hold = 0.0
+
+            # the time stamp of each measurement point is returned additionally
+            self.variables = ["Voltage", "Current", "Timestamp"]
+            self.units = ["V", "A", "s"]
+            self.plottype = [True, True, True]
+            self.savetype = [True, True, True]
+        else:
+            self.variables = ["Voltage", "Current"]
+            self.units = ["V", "A"]
+            self.plottype = [True, True]
+            self.savetype = [True, True]
 
     def connect(self) -> None:
         """Connect to the device. This function is called only once at the start of the measurement."""
@@ -103,6 +160,11 @@ def connect(self) -> None:
 
     def initialize(self) -> None:
         """Initialize the device. This function is called only once at the start of the measurement."""
+        if self.sweepvalue == "List sweep" and self.language != "TSP":
+            msg = ("Keithley 2450: List sweeps need the TSP command set. Please change the command set via "
+                   "Menu -> System -> Settings -> Command Set.")
+            raise Exception(msg)
+
         if self.language == "SCPI2400":
             self.port.write("*IDN?")
             self.vendor, self.model, self.serialno, self.version = self.port.read().split(",")
@@ -180,6 +242,9 @@ def configure(self) -> None:
         if self.route_out == "Rear":
             self.route_rear()
 
+        if self.sweepvalue == "List sweep":
+            self.set_list_sweep(self.get_list_sweep_values(), self.listsweep_hold)
+
     def deinitialize(self) -> None:
         """Deinitialize the device. This function is called only once at the end of the measurement."""
         self.rsen_off()
@@ -210,20 +275,29 @@ def apply(self) -> None:
         """'apply' is used to set the new setvalue that is always available as 'self.value'."""
         self.value = str(self.value)
 
+        if self.sweepvalue == "List sweep":
+            # the source values are applied by the trigger model of the list sweep
+            return
+
         source = self.source[0:4].upper()  # VOLT or CURR
         if self.language == "SCPI2400":
             self.port.write(":SOUR:" + source + ":LEV %s" % self.value)
+            # wait until the level is applied instead of triggering and reading a measurement
+            self.port.write("*OPC?")
+            self.port.read()
 
         elif self.language == "TSP":
             self.port.write("smu.source.level = %s" % self.value)
-
-        # needed to trigger a measurement and thus to trigger the final output of the level
-        # should be replaced by TSP command 'waitcomplete()' or SCPI '*OPC?' handling
-        self.measure()
-        self.call()
+            # waitcomplete() returns when the level is applied, the print makes the reply wait for it
+            self.port.write("waitcomplete() print(1)")
+            self.port.read()
 
     def measure(self) -> None:
         """Trigger the acquisition of new data."""
+        if self.sweepvalue == "List sweep":
+            self.port.write("defbuffer1.clear() trigger.model.initiate()")
+            return
+
         if self.language == "SCPI2400":
             self.port.write("READ?")
 
@@ -236,8 +310,16 @@ def measure(self) -> None:
             # self.port.write("print(smu.measure.read(data))")
             # print("Reading", self.port.read())
 
+    def request_result(self) -> None:
+        """Wait until the list sweep is completed."""
+        if self.sweepvalue == "List sweep":
+            self.wait_for_trigger_model()
+
     def call(self) -> list[float]:
         """Return the measurement results. Must return as many values as defined in self.variables."""
+        if self.sweepvalue == "List sweep":
+            return self.read_list_sweep()
+
         if self.language == "SCPI2400":
             answer = self.port.read().split(",")
             self.v, self.i = answer[0:2]
@@ -265,6 +347,139 @@ def call(self) -> list[float]:
 
     # Convenience functions start here
 
+    def get_list_sweep_values(self) -> np.ndarray:
+        """Return the source values of the list sweep as defined by the list sweep GUI parameters."""
+        if self.listtype == "Custom":
+            try:
+                return np.array(self.custom_values.split(","), dtype=float)
+            except ValueError:
+                msg = "Wrong custom values format. Please use comma-separated values for custom list sweeps."
+                raise ValueError(msg) from None
+
+        start = self.listsweep_start
+        end = self.listsweep_end
+
+        if self.listsweep_steppoints_type.startswith("Step width"):
+            if self.listsweep_steppoints_value == 0.0:
+                if end != start:
+                    msg = "Start and end value must be equal if step width is zero."
+                    raise ValueError(msg)
+                points = 1
+            else:
+                points = round(abs(end - start) / abs(self.listsweep_steppoints_value) + 1)
+            values = np.linspace(start, end, points)
+
+        elif self.listsweep_steppoints_type.startswith("Points (lin.)"):
+            values = np.linspace(start, end, int(self.listsweep_steppoints_value))
+
+        elif self.listsweep_steppoints_type.startswith("Points (log.)"):
+            values = np.geomspace(start, end, int(self.listsweep_steppoints_value))
+
+        # forward and backward sweep, the end value is applied only once
+        if self.listsweep_dual:
+            values = np.append(values, values[-2::-1])
+
+        return values
+
+    def set_list_sweep(self, values: np.ndarray, hold: float) -> None:
+        """Store the source values in a configuration list and load a trigger model that sweeps through the list.
+
+        Each point is measured into defbuffer1, so that all readings, source values and time stamps can be read
+        with a single printbuffer call after the sweep.
+
+        Args:
+            values: Source values in V or A.
+            hold: Source delay in s, i.e. the time between applying a source value and the measurement.
+        """
+        if len(values) < 1:
+            msg = "Number of steps must be larger than 0."
+            raise ValueError(msg)
+
+        # delete the list of a previous branch, pcall suppresses the error if it does not exist
+        self.port.write('pcall(smu.source.configlist.delete, "%s")' % LIST_NAME)
+        self.port.write('smu.source.configlist.create("%s")' % LIST_NAME)
+
+        # every stored source configuration contains the source level, several values are stored per command
+        for index in range(0, len(values), LIST_CHUNK_SIZE):
+            chunk = ",".join(format(value, ".9e") for value in values[index:index + LIST_CHUNK_SIZE])
+            self.port.write('for _, v in ipairs({%s}) do smu.source.level = v smu.source.configlist.store("%s") end'
+                            % (chunk, LIST_NAME))
+
+        self.port.write('smu.source.sweeplist("%s", 1, %.6f, 1, smu.OFF, defbuffer1)' % (LIST_NAME, hold))
+        self.list_sweep_timeout = self.get_list_sweep_timeout(len(values), hold)
+
+        # binary data is read in little-endian byte order
+        self.port.write("format.byteorder = format.LITTLEENDIAN")
+
+    def get_list_sweep_timeout(self, number_of_points: int, hold: float) -> float:
+        """Return the time in s after which a list sweep is considered to be stuck.
+
+        The duration of a point is estimated from the source delay and the integration time of all averaged readings,
+        including the reference readings of auto zero. Twice the estimated duration and 10 s are allowed.
+        """
+        integration_time = self.average * 3 * self.nplc / LINE_FREQUENCY
+        return 2 * number_of_points * (hold + integration_time) + 10.0
+
+    def wait_for_trigger_model(self, poll_interval: float = 0.05) -> None:
+        """Wait until the trigger model is no longer running. Polling does not depend on the timeout of the port.
+
+        The trigger model is aborted if the run is stopped by the user or the list sweep takes longer than expected,
+        e.g. if it waits for a trigger that never comes.
+        """
+        timeout = time.perf_counter() + self.list_sweep_timeout
+        while True:
+            self.port.write("print(trigger.model.state())")
+            state = self.port.read()
+            if "RUNNING" not in state and "WAITING" not in state and "BUILDING" not in state:
+                break
+
+            if self.is_run_stopped():
+                self.port.write("trigger.model.abort()")
+                return
+
+            if time.perf_counter() > timeout:
+                self.port.write("trigger.model.abort()")
+                msg = ("Keithley 2450: List sweep was not completed within %.1f s, trigger model state: %s"
+                       % (self.list_sweep_timeout, state))
+                raise TimeoutError(msg)
+
+            time.sleep(poll_interval)
+
+        if "FAILED" in state or "ABORT" in state:
+            msg = "Keithley 2450: List sweep was not completed, trigger model state: %s" % state
+            raise Exception(msg)
+
+    def read_list_sweep(self) -> list[np.ndarray]:
+        """Read readings, source values and relative time stamps of all points from defbuffer1 in one transfer.
+
+        The data is transferred as 64-bit floating point numbers. Socket connections do not signal the end of a
+        message, which is needed for the binary block of printbuffer, so ASCII data is used for them.
+        """
+        printbuffer = "printbuffer(1, defbuffer1.n, defbuffer1.readings, defbuffer1.sourcevalues, " \
+                      "defbuffer1.relativetimestamps)"
+
+        if self.port_string.endswith("SOCKET"):
+            self.port.write(printbuffer)
+            data = np.array(self.port.read().split(","), dtype=float)
+        else:
+            self.port.write("format.data = format.REAL64 %s format.data = format.ASCII" % printbuffer)
+            data = read_binary_block(self.port.port, "<f8")
+
+        # printbuffer returns the values of the buffers alternately for each point
+        readings, source_values, timestamps = data.reshape(-1, 3).T
+
+        if self.source.startswith("Voltage"):
+            self.v, self.i = source_values, readings
+        elif self.source.startswith("Current"):
+            self.v, self.i = readings, source_values
+
+        # large values indicate errors
+        error_threshold_value = 1e20
+        self.v = np.where(self.v > error_threshold_value, np.nan, self.v)
+        self.i = np.where(self.i > error_threshold_value, np.nan, self.i)
+
+        return [self.v, self.i, timestamps]
+
     @staticmethod
     def convert_unit_prefix(number_text: str) -> str:
         """This function converts a unit prefix such as n, µ or m to the scientific e notation."""
@@ -50,7 +50,7 @@
 
 importlib.reload(ProxyClass)
 
-from ProxyClass import Proxy
+from ProxyClass import Proxy, ServerConnection
 
 
 class Device(EmptyDevice):
@@ -122,6 +122,7 @@ def __init__(self) -> None:
         # Communication Parameter
         self.port_string: str = "192.168.0.1"
         self.identifier: str = "Keithley_4200-SCS_" + self.port_string
+        self.connection_identifier: str = self.identifier + "_connection"
         self.command_set: str = "LPTlib"
         self.card_id: int = 1
 
@@ -238,6 +239,7 @@ def apply_gui_parameters(self, parameters: dict) -> None:
         """Receive the values of the GUI parameters that were set by the user in the SweepMe! GUI."""
         self.port_string = parameters.get("Port", "")
         self.identifier = "Keithley_4200-SCS_" + self.port_string
+        self.connection_identifier = self.identifier + "_connection"
 
         self.route_out = parameters.get("RouteOut", "")
         self.current_range = parameters.get("Range", "")
@@ -414,6 +416,12 @@ def connect(self) -> None:
             self.connect_to_lptlib_server()
             self.card_id = self.lpt.getinstid(self.card_name)
 
+    def disconnect(self) -> None:
+        """Close the connection to the LPTlib server that is shared by all channels."""
+        if self.command_set == "LPTlib" and self.connection_identifier in self.device_communication:
+            self.device_communication[self.connection_identifier].close()
+            del self.device_communication[self.connection_identifier]
+
     def initialize(self) -> None:
         """Initialize the device. This function is called only once at the start of the measurement."""
         self.check_test_parameter()
@@ -567,16 +575,7 @@ def configure_lptlib(self) -> None:
                 value=self.param.KI_RPM_SMU,
             )
 
-        # return real measured value when in compliance, not indicator value like 7.0e22
-        self.lpt.setmode(self.card_id, self.param.KI_LIM_MODE, self.param.KI_VALUE)
-
-        # Protection
-        if self.source == "Voltage in V":
-            self.lpt.limiti(self.card_id, float(self.protection))  # compliance/protection
-        elif self.source == "Current in A":
-            self.lpt.limitv(self.card_id, float(self.protection))  # compliance/protection
-
-        # Integration/Speed for intgX and sintgX commands. Allowed values are from 0.01 to 10
+        # Custom speed parameters cannot be set via lptlib
         if self.speed.lower() == "custom":
             msg = "Custom speed mode can only be used with US command set via GPIB."
             raise NotImplementedError(msg)
@@ -585,27 +584,39 @@ def configure_lptlib(self) -> None:
             # delay factor = KI_DELAY_FACTOR
             # filter factor =
 
-        # TODO: lptlib allows for setting NPLC integration to custom values between 0.01 and 10
-        # but we cannot set filter factor (only for CVU cards)
-        # we could set the delay factor, but it does not make much sense because we can also use SweepMes Hold
+        # The following calls are independent of each other and are sent to the server in one request
+        with self.lpt.batch():
+            # return real measured value when in compliance, not indicator value like 7.0e22
+            self.lpt.setmode(self.card_id, self.param.KI_LIM_MODE, self.param.KI_VALUE)
 
-        nplc_value = self.speed_dict[self.speed]
-        self.lpt.setmode(self.card_id, self.param.KI_INTGPLC, nplc_value)
+            # Protection
+            if self.source == "Voltage in V":
+                self.lpt.limiti(self.card_id, float(self.protection))  # compliance/protection
+            elif self.source == "Current in A":
+                self.lpt.limitv(self.card_id, float(self.protection))  # compliance/protection
 
-        # Current Range
-        current_range_value = self.current_ranges[self.current_range]
-        if "auto" in self.current_range.lower() or "limited" in self.current_range.lower():
-            self.lpt.rangei(self.card_id, 0)  # auto-ranging
+            # Integration/Speed for intgX and sintgX commands. Allowed values are from 0.01 to 10
+            # TODO: lptlib allows for setting NPLC integration to custom values between 0.01 and 10
+            # but we cannot set filter factor (only for CVU cards)
+            # we could set the delay factor, but it does not make much sense because we can also use SweepMes Hold
 
-            if "limited" in self.current_range.lower():
-                self.lpt.lorangei(self.card_id, current_range_value)  # minimum current range for auto-ranging
-        else:
-            self.lpt.rangei(self.card_id, current_range_value)  # fixed range
+            nplc_value = self.speed_dict[self.speed]
+            self.lpt.setmode(self.card_id, self.param.KI_INTGPLC, nplc_value)
 
-        # self.lpt.lorangev(self.card_id, 1e-1)  # low range voltage
+            # Current Range
+            current_range_value = self.current_ranges[self.current_range]
+            if "auto" in self.current_range.lower() or "limited" in self.current_range.lower():
+                self.lpt.rangei(self.card_id, 0)  # auto-ranging
 
-        # Range delay off
-        self.lpt.setmode(self.card_id, self.param.KI_RANGE_DELAY, 0.0)  # disable range delay
+                if "limited" in self.current_range.lower():
+                    self.lpt.lorangei(self.card_id, current_range_value)  # minimum current range for auto-ranging
+            else:
+                self.lpt.rangei(self.card_id, current_range_value)  # fixed range
+
+            # self.lpt.lorangev(self.card_id, 1e-1)  # low range voltage
+
+            # Range delay off
+            self.lpt.setmode(self.card_id, self.param.KI_RANGE_DELAY, 0.0)  # disable range delay
 
     def start(self) -> None:
         """Preparation before applying a new value."""
@@ -693,17 +704,18 @@ def trigger_ready(self) -> None:
     def configure_list_sweep(self, array_size: int) -> None:
         """When using list mode, the results arrays must be registered to be read out in parallel."""
         # Do not reset the measurement dictionary as maybe another channel has already registered arrays
-        current_key = self.list_measurement_keys["current"]
-        self.lpt.prepare_measurement("smeasi", current_key, self.card_id, array_size=array_size)
+        with self.lpt.batch():
+            current_key = self.list_measurement_keys["current"]
+            self.lpt.prepare_measurement("smeasi", current_key, self.card_id, array_size=array_size)
 
-        voltage_key = self.list_measurement_keys["voltage"]
-        self.lpt.prepare_measurement("smeasv", voltage_key, self.card_id, array_size=array_size)
+            voltage_key = self.list_measurement_keys["voltage"]
+            self.lpt.prepare_measurement("smeasv", voltage_key, self.card_id, array_size=array_size)
 
-        # For now only the list master returns the time stamps as the list receivers are too late to change the number
-        # of their return values
-        if self.list_master:
-            time_key = self.list_measurement_keys["time"]
-            self.lpt.prepare_measurement("smeast", time_key, self.card_id, array_size=array_size)
+            # For now only the list master returns the time stamps as the list receivers are too late to change the
+            # number of their return values
+            if self.list_master:
+                time_key = self.list_measurement_keys["time"]
+                self.lpt.prepare_measurement("smeast", time_key, self.card_id, array_size=array_size)
 
     def measure(self) -> None:
         """Start the pulse or list measurements. This cannot be done in 'apply' as the sweep value does not change."""
@@ -765,11 +777,17 @@ def read_result(self) -> None:
     def call(self) -> list:
         """'call' is a mandatory function that must be used to return as many values as defined in self.variables."""
         if self.list_master or self.list_receiver:
-            # Read out the registered lists of measured values
-            voltage = self.lpt.read_measurement(self.list_measurement_keys["voltage"])
-            current = self.lpt.read_measurement(self.list_measurement_keys["current"])
+            # Read out the registered lists of measured values in one request
+            with self.lpt.batch():
+                voltage_result = self.lpt.read_measurement(self.list_measurement_keys["voltage"])
+                current_result = self.lpt.read_measurement(self.list_measurement_keys["current"])
+                if self.list_master:
+                    time_stamps_result = self.lpt.read_measurement(self.list_measurement_keys["time"])
+            voltage = voltage_result.value
+            current = current_result.value
+
             if self.list_master:
-                time_stamps = self.lpt.read_measurement(self.list_measurement_keys["time"])
+                time_stamps = time_stamps_result.value
                 time_stamps_zeroed = [stamp - time_stamps[0] for stamp in time_stamps]  # start at 0
                 return [voltage, current, time_stamps, time_stamps_zeroed]
             else:
@@ -777,8 +795,11 @@ def call(self) -> list:
 
         if not self.pulse_mode:
             if self.command_set == "LPTlib":
-                self.measured_voltage = self.lpt.intgv(self.card_id)
-                self.measured_current = self.lpt.intgi(self.card_id)
+                with self.lpt.batch():
+                    voltage_result = self.lpt.intgv(self.card_id)
+                    current_result = self.lpt.intgi(self.card_id)
+                self.measured_voltage = voltage_result.value
+                self.measured_current = current_result.value
 
                 # needed to give some time to update the plot
                 # it seems that the LPTlib access is somehow blocking the entire program
@@ -824,8 +845,15 @@ def connect_to_lptlib_server(self) -> None:
             tcp_ip = tcp_ip_port_split[0]
             tcp_port = int(tcp_ip_port_split[1]) if len(tcp_ip_port_split) == 2 else 8888
 
-        self.lpt = Proxy(tcp_ip, tcp_port, "lpt")
-        self.param = Proxy(tcp_ip, tcp_port, "param")
+        # All channels of one 4200-SCS share one persistent connection to the server
+        if self.connection_identifier in self.device_communication:
+            connection = self.device_communication[self.connection_identifier]
+        else:
+            connection = ServerConnection(tcp_ip, tcp_port)
+            self.device_communication[self.connection_identifier] = connection
+
+        self.lpt = Proxy(tcp_ip, tcp_port, "lpt", connection=connection)
+        self.param = Proxy(tcp_ip, tcp_port, "param", connection=connection, constant_attributes=True)
 
         try:
             self.lpt.initialize()
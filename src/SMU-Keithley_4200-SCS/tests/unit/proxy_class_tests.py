@@ -0,0 +1,263 @@
+import asyncio
+import json
+import sys
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# add libs folder to sys.path to enable import of ProxyClass
+here = Path(__file__).resolve().parent
+libs_folder = here.parent.parent / "libs"
+if str(libs_folder) not in sys.path:
+    sys.path.insert(0, str(libs_folder))
+
+from ProxyClass import Proxy, RemoteException, ServerConnection
+from tblib import Traceback
+
+
+class MockServer:
+    """Minimal lptlib server that answers newline-framed JSON requests on localhost.
+
+    Every function returns the sum of its arguments, every attribute is reported as callable. If 'one_shot' is True,
+    the connection is closed after each response like the previous client expected it. If 'batch_support' is True,
+    a JSON array of requests is answered with a JSON array of results.
+    """
+
+    def __init__(self, one_shot: bool = False, batch_support: bool = True) -> None:
+        self.one_shot = one_shot
+        self.batch_support = batch_support
+        self.connections = 0
+        self.closed_connections = 0
+        self.requests = 0
+        self._writers = set()
+        self.port = None
+
+        self.loop = asyncio.new_event_loop()
+        self._started = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self) -> "MockServer":
+        self._thread.start()
+        self._started.wait()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        server = self.loop.run_until_complete(asyncio.start_server(self._handle, "127.0.0.1", 0))
+        self.port = server.sockets[0].getsockname()[1]
+        self._started.set()
+        self.loop.run_forever()
+        server.close()
+        # cancel the handlers of connections that are still open
+        tasks = asyncio.all_tasks(self.loop)
+        for task in tasks:
+            task.cancel()
+        self.loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+        self.loop.close()
+
+    def respond(self, request):
+        if isinstance(request, list):
+            if self.batch_support:
+                return [self.respond(item) for item in request]
+            return {"status": "exception", "message": "TypeError('list indices must be integers or slices')"}
+        if "attribute" in request:
+            if request["attribute"].startswith("KI_"):
+                return {"status": "success", "return": {"type": "int", "value": 7}}
+            return {"status": "success", "return": {"type": "callable", "value": None}}
+        if request["function"] == "fail":
+            try:
+                raise ValueError("fail")
+            except ValueError as e:
+                return {"status": "exception", "message": repr(e), "traceback": Traceback(e.__traceback__).to_dict()}
+        if request["function"] == "get_list":
+            return {"status": "success", "return": [{"type": "float", "value": 0.5}] * request["args"][0]["value"]}
+        value = sum(arg["value"] for arg in request["args"])
+        return {"status": "success", "return": {"type": type(value).__name__, "value": value}}
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        self._writers.add(writer)
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            self.requests += 1
+            writer.write(json.dumps(self.respond(json.loads(line))).encode("utf-8") + b"\n")
+            await writer.drain()
+            if self.one_shot:
+                break
+        self._close(writer)
+
+    def _close(self, writer: asyncio.StreamWriter) -> None:
+        if writer in self._writers:
+            self._writers.remove(writer)
+            writer.close()
+            self.closed_connections += 1
+
+    def close_connections(self) -> None:
+        """Close all open connections from the server side."""
+        self.loop.call_soon_threadsafe(lambda: [self._close(writer) for writer in list(self._writers)])
+        self.wait_for_closed_connections(self.connections)
+
+    def wait_for_closed_connections(self, number: int) -> None:
+        """Wait until the server has closed the given number of connections."""
+        timeout = time.monotonic() + 5
+        while self.closed_connections < number:
+            if time.monotonic() > timeout:
+                raise TimeoutError(f"Server closed {self.closed_connections} instead of {number} connections.")
+            time.sleep(0.001)
+
+
+def command(value: int) -> str:
+    """Return the request of a function call whose response is the given value."""
+    return json.dumps({"class": "lpt", "function": "f", "args": [{"type": "int", "value": value}], "kwargs": {}})
+
+
+class ProxyConnectionTests(unittest.TestCase):
+
+    def test_calls_reuse_one_connection(self) -> None:
+        with MockServer() as server:
+            lpt = Proxy("127.0.0.1", server.port, "lpt")
+            for value in range(10):
+                self.assertEqual(lpt.forcev(1, value), 1 + value)
+            self.assertEqual(server.connections, 1)
+            # the attribute type is only queried for the first call
+            self.assertEqual(server.requests, 11)
+
+    def test_connection_is_shared_between_proxies(self) -> None:
+        with MockServer() as server:
+            connection = ServerConnection("127.0.0.1", server.port)
+            lpt = Proxy("127.0.0.1", server.port, "lpt", connection=connection)
+            param = Proxy("127.0.0.1", server.port, "param", connection=connection)
+            lpt.intgi(1)
+            param.setmode(2)
+            self.assertEqual(server.connections, 1)
+            connection.close()
+
+    def test_pipelined_requests_keep_order(self) -> None:
+        with MockServer() as server:
+            connection = ServerConnection("127.0.0.1", server.port)
+            responses = connection.send([command(n) for n in range(50)])
+            self.assertEqual([json.loads(r)["return"]["value"] for r in responses], list(range(50)))
+            connection.close()
+
+    def test_reconnects_if_server_closes_connection(self) -> None:
+        with MockServer(one_shot=True) as server:
+            connection = ServerConnection("127.0.0.1", server.port)
+            for n in range(3):
+                responses = connection.send([command(n)])
+                self.assertEqual(json.loads(responses[0])["return"]["value"], n)
+                server.wait_for_closed_connections(n + 1)
+            self.assertFalse(connection.keeps_connection)
+            self.assertEqual(server.connections, 3)
+
+            # each request is sent on a new connection now
+            responses = connection.send([command(n) for n in range(3)])
+            self.assertEqual([json.loads(r)["return"]["value"] for r in responses], [0, 1, 2])
+            self.assertEqual(server.connections, 6)
+            connection.close()
+
+    def test_reconnects_if_idle_connection_was_closed(self) -> None:
+        with MockServer() as server:
+            connection = ServerConnection("127.0.0.1", server.port)
+            connection.send([command(1)])
+            server.close_connections()
+            responses = connection.send([command(2)])
+            self.assertEqual(json.loads(responses[0])["return"]["value"], 2)
+            self.assertEqual(server.connections, 2)
+            self.assertEqual(server.requests, 2)
+            connection.close()
+
+    def test_unanswered_requests_are_not_sent_again(self) -> None:
+        with MockServer(one_shot=True) as server:
+            connection = ServerConnection("127.0.0.1", server.port)
+            connection.keeps_connection = True
+            with self.assertRaises(ConnectionResetError):
+                connection.send([command(n) for n in range(3)])
+            server.wait_for_closed_connections(1)
+            self.assertEqual(server.connections, 1)
+            self.assertEqual(server.requests, 1)
+            connection.close()
+
+    def test_connection_refused(self) -> None:
+        with MockServer() as server:
+            port = server.port
+        lpt = Proxy("127.0.0.1", port, "lpt")
+        with self.assertRaises(ConnectionRefusedError):
+            lpt.initialize()
+
+    def test_remote_exception(self) -> None:
+        with MockServer() as server:
+            lpt = Proxy("127.0.0.1", server.port, "lpt")
+            with self.assertRaises(RemoteException):
+                lpt.fail()
+            # the connection is still usable afterwards
+            self.assertEqual(lpt.forcev(1, 2), 3)
+
+    def test_calls_open_one_socket(self) -> None:
+        number_of_calls = 300
+        with MockServer() as server:
+            with mock.patch("asyncio.open_connection", wraps=asyncio.open_connection) as open_connection:
+                lpt = Proxy("127.0.0.1", server.port, "lpt")
+                for value in range(number_of_calls):
+                    lpt.forcev(1, value)
+                lpt._connection.send([command(n) for n in range(number_of_calls)])
+            self.assertEqual(open_connection.call_count, 1)
+            self.assertEqual(server.requests, 2 * number_of_calls + 1)
+
+
+class ProxyBatchTests(unittest.TestCase):
+
+    def test_batch_is_sent_in_one_request(self) -> None:
+        with MockServer() as server:
+            lpt = Proxy("127.0.0.1", server.port, "lpt")
+            with lpt.batch():
+                voltage = lpt.intgv(1)
+                current = lpt.intgi(2)
+                values = lpt.get_list(3)
+                with self.assertRaises(RuntimeError):
+                    _ = voltage.value
+            self.assertEqual(server.requests, 1)
+            self.assertEqual(voltage.value, 1)
+            self.assertEqual(current.value, 2)
+            self.assertEqual(values.value, [0.5, 0.5, 0.5])
+
+    def test_batch_exceptions_are_mapped_to_items(self) -> None:
+        with MockServer() as server:
+            lpt = Proxy("127.0.0.1", server.port, "lpt")
+            with self.assertRaises(RemoteException), lpt.batch():
+                first = lpt.forcev(1, 1)
+                failed = lpt.fail()
+                last = lpt.forcev(1, 2)
+            self.assertEqual(first.value, 2)
+            self.assertEqual(last.value, 3)
+            with self.assertRaises(RemoteException):
+                _ = failed.value
+
+    def test_batch_falls_back_to_pipelined_requests(self) -> None:
+        with MockServer(batch_support=False) as server:
+            connection = ServerConnection("127.0.0.1", server.port)
+            lpt = Proxy("127.0.0.1", server.port, "lpt", connection=connection)
+            with lpt.batch():
+                results = [lpt.forcev(1, value) for value in range(5)]
+            self.assertEqual([result.value for result in results], [1, 2, 3, 4, 5])
+            self.assertFalse(connection.batch_supported)
+            self.assertEqual(server.connections, 1)
+            connection.close()
+
+    def test_constant_attributes_are_cached(self) -> None:
+        with MockServer() as server:
+            param = Proxy("127.0.0.1", server.port, "param", constant_attributes=True)
+            self.assertEqual(param.KI_VALUE, 7)
+            self.assertEqual(param.KI_VALUE, 7)
+            self.assertEqual(server.requests, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
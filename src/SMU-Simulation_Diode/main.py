@@ -31,8 +31,6 @@
 
 from __future__ import annotations
 
-import random
-
 import numpy as np
 from pysweepme.EmptyDeviceClass import EmptyDevice
 
@@ -88,54 +86,78 @@ def initialize(self) -> None:
     def call(self) -> list[float]:
         """Return the measurement results. Must return as many values as defined in self.variables."""
         if self.source.startswith("Voltage"):
-            v_exp = self.value
-            measured_currents = []
+            voltages, currents = self.simulate_iv_curve(np.array([self.value], dtype=float), self.average)
+            self.v = voltages[0]
+            self.i = currents[0]
 
-            delta_v = -1
-            for _ in range(self.average):
-                i = 0
+        elif self.source.startswith("Current"):
+            pass
 
-                # Measure the current until the current is stable or 1500 iterations are reached
-                while abs(abs(self.value - v_exp) - delta_v) > 1e-3 and i < 1500:
-                    i += 1
+        return [float(self.v), float(self.i)]
 
-                    measured_current = self.simulate_current(v_exp)
-                    delta_v = 1e2 * (abs(measured_current)) ** 0.5  # some SCLC
+    """Simulated Diode"""
 
-                    # Measured voltage cannot be higher than the applied voltage
-                    if abs(v_exp) + delta_v > self.value:
-                        v_exp -= 0.001 * np.sign(self.value)
+    def simulate_iv_curve(self, applied_voltages: np.ndarray, average: int = 1) -> tuple[np.ndarray, np.ndarray]:
+        """Simulate the measured voltages and currents for an array of applied voltages in one call.
 
-                measured_currents.append(measured_current)
+        Args:
+            applied_voltages: Voltages applied by the simulated SMU.
+            average: Number of current measurements that are averaged for each voltage.
 
-            self.v = self.simulate_voltage(self.value)
-            self.i = np.mean(measured_currents)
+        Returns:
+            Arrays of the measured voltages and the averaged measured currents.
+        """
+        applied_voltages = np.asarray(applied_voltages, dtype=float)
+        diode_voltages = self.solve_diode_voltage(applied_voltages)
 
-        elif self.source.startswith("Current"):
-            pass
+        # measure all averages of all voltages at once, each with its own noise
+        currents = self.simulate_current(np.repeat(diode_voltages[:, np.newaxis], average, axis=1))
 
-        return [float(self.v), float(self.i)]
+        return self.simulate_voltage(applied_voltages), np.mean(currents, axis=1)
 
-    """Simulated Diode"""
+    def solve_diode_voltage(self, applied_voltages: np.ndarray) -> np.ndarray:
+        """Return the voltage across the diode for each applied voltage.
 
-    def simulate_current(self, applied_voltage: float) -> float:
-        """Simulate the current of a diode with linear leakage and some resolution noise."""
-        if applied_voltage == 0:
-            return 0
+        Part of the applied voltage V drops as 100 * sqrt(|I|) (some SCLC), so that the drop d fulfills
+        d = 100 * sqrt(|I(V - sign(V) * d)|). The drop is found by a vectorized bisection.
+        """
+        sign = np.sign(applied_voltages)
+
+        # The residual is negative for no drop and increases with the drop. At a drop of |V|, the diode voltage and
+        # thus the current is zero, so the solution is always between 0 and |V|.
+        lower = np.zeros_like(applied_voltages)
+        upper = np.abs(applied_voltages)
+
+        def residual(drop: np.ndarray) -> np.ndarray:
+            current = np.clip(self.diode_current(applied_voltages - sign * drop), -self.protection, self.protection)
+            return drop - 1e2 * np.abs(current) ** 0.5
+
+        for _ in range(50):
+            middle = 0.5 * (lower + upper)
+            is_below = residual(middle) < 0
+            lower = np.where(is_below, middle, lower)
+            upper = np.where(is_below, upper, middle)
 
-        noise = 0 if self.speed == "No Noise" else random.random() / 1e10
-        current = 1e-15 * (np.exp(applied_voltage / 1.4 / 0.025) - 1) + applied_voltage / 1e9 + noise
+        return applied_voltages - sign * 0.5 * (lower + upper)
 
-        if current > self.protection:
-            current = self.protection
-        elif current < -self.protection:
-            current = -self.protection
+    @staticmethod
+    def diode_current(applied_voltage: np.ndarray | float) -> np.ndarray | float:
+        """Return the current of a diode with linear leakage without noise and compliance."""
+        with np.errstate(over="ignore"):
+            return 1e-15 * (np.exp(applied_voltage / 1.4 / 0.025) - 1) + applied_voltage / 1e9
 
-        return current
+    def simulate_current(self, applied_voltage: np.ndarray | float) -> np.ndarray | float:
+        """Simulate the current of a diode with linear leakage and some resolution noise."""
+        applied_voltage = np.asarray(applied_voltage, dtype=float)
+
+        noise = 0 if self.speed == "No Noise" else np.random.random(applied_voltage.shape) / 1e10
+        current = np.clip(self.diode_current(applied_voltage) + noise, -self.protection, self.protection)
+        current = np.where(applied_voltage == 0, 0.0, current)
 
-    def simulate_voltage(self, applied_voltage: float) -> float:
+        return current if current.ndim else float(current)
+
+    def simulate_voltage(self, applied_voltage: np.ndarray | float) -> np.ndarray | float:
         """Simulate the measured voltage including some noise depending on the measurement speed."""
         if self.speed not in self.speedvalues:
             return applied_voltage
-        return applied_voltage + random.random() * 1e-2 / self.speedvalues[self.speed]
-
+        return applied_voltage + np.random.random(np.shape(applied_voltage)) * 1e-2 / self.speedvalues[self.speed]
@@ -34,6 +34,11 @@
 
 import numpy as np
 from pysweepme.EmptyDeviceClass import EmptyDevice
+from pysweepme.FolderManager import addFolderToPATH
+
+addFolderToPATH()
+
+from binary_block import read_binary_block
 
 
 class Device(EmptyDevice):
@@ -86,6 +91,18 @@ def __init__(self) -> None:
             "16 Bits (50 MSa)": "BITS16_2",
         }
 
+        self.waveform_formats = {
+            "Word": "WORD",
+            "Byte": "BYTE",
+            "ASCII": "ASC",
+        }
+
+        # data types of the binary waveform points, the byte order of WORD is set to LSBFirst in initialize
+        self.waveform_data_types = {
+            "Word": np.dtype("<i2"),
+            "Byte": np.dtype("i1"),
+        }
+
     def set_GUIparameter(self) -> dict:
         """Returns a dictionary with keys and values to generate GUI elements in the SweepMe! GUI."""
         gui_parameter = {
@@ -106,6 +123,7 @@ def set_GUIparameter(self) -> dict:
             "Acquisition": ["Continuous", "Single"],
             "Average": ["None", "2", "4", "8", "16", "32", "64", "128", "256", "512", "1024"],
             "VoltageRange": ["Voltage range in V", "Voltage scale in V/div"],
+            "Waveform encoding": list(self.waveform_formats.keys()),
         }
 
         for i in range(1, 5):
@@ -143,6 +161,8 @@ def get_GUIparameter(self, parameter: dict) -> None:
         # retrieve the selection of the voltage range / voltage scale drop down box
         self.voltagerange = parameter["VoltageRange"]
 
+        self.waveform_encoding = parameter.get("Waveform encoding", "Word")
+
         # reset measurement parameters
         self.variables = ["Time"]
         self.units = ["s"]
@@ -173,11 +193,6 @@ def initialize(self) -> None:
         if len(self.channels) == 0:
             raise Exception("Please select at least one channel to be read out")
 
-        if int(10*float(self.triggertimeout)) % 2 != 0:
-            # values are multiplied by 10 to allow comparison operation in integer realm
-            msg = "Trigger timeout can only be set in steps of 0.2s"
-            raise Exception(msg)
-
         # self.port.write("*IDN?")                # Query device name
         # print("ID Checkup")
         # print(self.port.read())
@@ -185,9 +200,10 @@ def initialize(self) -> None:
         # Clears all the event registers, and also clears the error queue.
         self.port.write("*CLS")
 
-        # sets encoding to ASCii instead of BYTE or WORD; BYTE and WORD would allow for a much quicker data transfer,
-        # but values would have to be processed first before use.
-        self.port.write(":WAV:FORM ASC")
+        # sets encoding to WORD, BYTE, or ASCii; BYTE and WORD allow for a much quicker data transfer, and the
+        # digitizer levels are scaled to voltages using the preamble.
+        self.port.write(":WAV:FORM %s" % self.waveform_formats[self.waveform_encoding])
+        self.port.write(":WAV:BYT LSBF")  # least significant byte first to match the byte order of the PC
 
         # sets data type to RAW, transmitting only true sampling points, no interpolation
         self.port.write(":WAV:TYPE RAW")
@@ -271,9 +287,13 @@ def configure(self) -> None:
 
     def measure(self) -> None:
         """Trigger the acquisition of new data."""
-        if self.average != "none" and self.acquisition.startswith("Cont"):
+        if self.average != "None" and self.acquisition.startswith("Cont"):
             self.port.write(":CDIS")  # clear display to reset the averaging counter when using continuous trigger
-            time.sleep(0.3)
+            self.wait_for_operation_complete()
+
+        # reading the acquisition done event register clears it, so that a previous acquisition is not reported
+        self.port.write(":ADER?")
+        self.port.read()
 
         if self.acquisition.startswith("Single"):
             self.port.write(":SING")  # performs single acquisition
@@ -281,94 +301,86 @@ def measure(self) -> None:
             self.port.write(":RUN")  # run continuous acquisition; not required when using single trigger
 
         time.sleep(float(self.triggerdelay))
-        trigcounter = 0
-        while True:
-            # check if trigger acquisition was successful;
-            # if averaging is enabled, it will return 1 only when all average samples have been taken
-            self.port.write(":ADER?")
-            triggerstat = int(self.port.read())
-            print("triggerstatus:", triggerstat)
-
-            # if no trigger was acquired, wait loops in 0.2s increments
-            if triggerstat == 0 and trigcounter < int(round(float(self.triggertimeout),1)*5):
-                trigcounter += 1
-                time.sleep(0.2)
-
-            # timeout in trigger wait loop, stops the acquisition
-            elif trigcounter >= int(round(float(self.triggertimeout),1)*5):
-                self.port.write(":STOP")
-                if self.average == "none":
-                    msg = "Oscilloscope could not trigger before timeout"
-                    raise Exception(msg)
-                else:
-                    msg = "Oscilloscope could not trigger for sufficient averaging samples before timeout"
-                    raise Exception(msg)
+
+        # if averaging is enabled, the acquisition is only done when all average samples have been taken
+        if not self.wait_for_acquisition(float(self.triggertimeout)):
+            self.port.write(":STOP")
+            if self.average == "None":
+                msg = "Oscilloscope could not trigger before timeout"
+                raise Exception(msg)
             else:
-                break
+                msg = "Oscilloscope could not trigger for sufficient averaging samples before timeout"
+                raise Exception(msg)
 
         if self.acquisition.startswith("Cont"):
             self.port.write(":STOP")  # stop continuous acquisition; not required when using single trigger
+            self.wait_for_operation_complete()
 
         slot = 0  # run variable for data sorting
 
-        time.sleep(0.2)
-        self.port.write(":WAV:PRE?")  # retrieving the waveform preamble
-        time.sleep(0.2)
-
-        # This section retrieves the preamble which describes all properties of the stroes waveform.
-        # While not all attributes are used, they remain included for debugging purposes.
-        preamble = self.port.read().split(",")
-        wav_format=preamble[0]
-        acq_mode=preamble[1]
-        numberpoints=int(preamble[2])
-        av_count=int(preamble[3])
-        x_inc=float(preamble[4])
-        x_orig=float(preamble[5])
-        x_ref=float(preamble[6])
-        y_inc=float(preamble[7])
-        y_orig=float(preamble[8])
-        y_ref=float(preamble[9])
-
-        # print ("wav_format:", wav_format, "acq_mode:", acq_mode, "numberpoints:", numberpoints,
-        # "av_count:", av_count, "x_inc:", x_inc, "x_org:", x_orig, "x_ref:", x_ref, "y_inc:", y_inc,
-        # "y_org:", y_orig, "y_ref:", y_ref)
-
         for i in self.channels:
 
             self.port.write(":WAV:SOUR CHAN%s" % i)  # select channel to be read
 
+            self.port.write(":WAV:PRE?")  # retrieving the waveform preamble of the selected channel
+
+            # This section retrieves the preamble which describes all properties of the stored waveform.
+            preamble = self.port.read().split(",")
+            numberpoints = int(preamble[2])
+            x_inc = float(preamble[4])
+            x_orig = float(preamble[5])
+            y_inc = float(preamble[7])
+            y_orig = float(preamble[8])
+            y_ref = float(preamble[9])
+
             if slot == 0:  # only for first measurement
-                channels = len(self.channels)  # number of measured channels
                 # generate empty array of correct size for channels + data
-                self.voltages = np.zeros((numberpoints, len(self.channels)))
+                self.voltages = np.empty((numberpoints, len(self.channels)))
 
-            # generate linear time array FROM, TO, STEPSAMOUNT
-            self.timecode = np.linspace(x_orig, (x_orig+x_inc*numberpoints), numberpoints)
+                # generate linear time array FROM, TO, STEPSAMOUNT
+                self.timecode = np.linspace(x_orig, (x_orig+x_inc*numberpoints), numberpoints)
 
-            self.port.write(":WAV:DATA?;*OPC")  # retrieve waveform values from scope
-            time.sleep(0.2)  # give scope time to prepare waveform data for download
-            datapoints = self.port.read().split(",")  # read values from scope
+            # retrieve waveform values from scope, the read waits until the scope has prepared the data
+            self.port.write(":WAV:DATA?")
+            if self.waveform_encoding == "ASCII":
+                data = np.array(self.port.read().split(",")[:numberpoints], dtype=float)  # read values from scope
+            else:
+                data = read_binary_block(self.port.port, self.waveform_data_types[self.waveform_encoding])
 
-            opccounter = 0  # set counter for OPC loop back to zero
+            # inputs voltage data for channel i into correct column of data array
+            if self.waveform_encoding == "ASCII":
+                self.voltages[:, slot] = data
+            else:
+                # scale the digitizer levels to voltages
+                np.subtract(data[:numberpoints], y_ref, out=self.voltages[:, slot])
+                self.voltages[:, slot] *= y_inc
+                self.voltages[:, slot] += y_orig
+            slot += 1  # set correct column for next channel
 
-            while True:
-                # query scope in loop whether [OP]eration of waveform data tranmission is [C]ompleted
-                self.port.write("*OPC?")
-                completed = int(self.port.read())
-                if completed == 0 and opccounter < 25:  # loop time hardcoded to 5s
-                    opccounter += 1
-                    time.sleep(0.2)
-                else:
-                    break
+    def wait_for_acquisition(self, timeout: float) -> bool:
+        """Wait until the acquisition is done and return False if it did not finish within the timeout.
 
-            data = []
-            for i in np.arange(numberpoints):
-                data.append(datapoints[i])  # put waveform values of current channel into data output list
+        The acquisition done event register is polled with exponentially increasing intervals starting at 1 ms, so
+        that short acquisitions are detected quickly without flooding the scope with queries during long ones.
+        """
+        start_time = time.perf_counter()
+        poll_interval = 1e-3
+        while True:
+            self.port.write(":ADER?")
+            if int(self.port.read()) == 1:
+                return True
 
-            data = np.array(data)  # convert list to data array
+            remaining_time = timeout - (time.perf_counter() - start_time)
+            if remaining_time <= 0:
+                return False
 
-            self.voltages[:, slot] = data  # inputs voltage data for channel i into correct column of data array
-            slot += 1  # set correct column for next channel
+            time.sleep(min(poll_interval, remaining_time))
+            poll_interval = min(2 * poll_interval, 0.1)
+
+    def wait_for_operation_complete(self) -> None:
+        """Wait until all pending operations are completed."""
+        self.port.write("*OPC?")
+        self.port.read()
 
     def call(self) -> list:
         """Return the measurement results. Must return as many values as defined in self.variables."""
@@ -34,6 +34,11 @@
 
 import numpy as np
 from pysweepme.EmptyDeviceClass import EmptyDevice
+from pysweepme.FolderManager import addFolderToPATH
+
+addFolderToPATH()
+
+from binary_block import read_binary_block
 
 
 class Device(EmptyDevice):
@@ -80,6 +85,18 @@ def __init__(self):
                                 "Single": ":SING",
                                 }
 
+        self.waveform_formats = {
+                                "Word": "WORD",
+                                "Byte": "BYTE",
+                                "ASCII": "ASC",
+                                }
+
+        # data types of the binary waveform points, WORD is transmitted with the low byte first
+        self.waveform_data_types = {
+                                   "Word": np.dtype("<u2"),
+                                   "Byte": np.dtype("u1"),
+                                   }
+
     def set_GUIparameter(self):
 
         gui_parameter = {
@@ -101,6 +118,7 @@ def set_GUIparameter(self):
                          "Acquisition": list(self.aquisitiontypes.keys()),
                          "Average": ["None", "2", "4", "8", "16", "32", "64", "128", "256", "512", "1024"],
                          "VoltageRange": ["Voltage range in V"],
+                         "Waveform encoding": ["Word", "Byte", "ASCII"],
                        }
 
         for i in range(1,5):
@@ -130,6 +148,8 @@ def get_GUIparameter(self, parameter: dict):
 
         self.average = parameter["Average"]
 
+        self.waveform_encoding = parameter.get("Waveform encoding", "Word")
+
         self.channels = []
         self.channel_names = {}
         self.channel_ranges = {}
@@ -169,8 +189,8 @@ def initialize(self):
             msg=("Please select at least one channel to be read out")
             raise Exception(msg)
 
-        # sets encoding to ASCii insetad of BYTE or WORD
-        self.port.write("WAV:FORM ASC")
+        # sets encoding to WORD (2 bytes per point, low byte first), BYTE, or ASCii
+        self.port.write("WAV:FORM %s" % self.waveform_formats[self.waveform_encoding])
         # normal waveform capture, means capturing screen content
         self.port.write("WAV:MODE NORM")
 
@@ -263,7 +283,6 @@ def apply(self):
     def measure(self):
 
         time.sleep(float(self.triggerdelay))
-        trigcounter = 0
 
         # setting trigger sweep mode / trigger aquisition
         if self.aquisitiontype == "As is":
@@ -275,86 +294,83 @@ def measure(self):
             # will execute either :RUN oder :SINGle SCPI command depending on choice of aquisition type (continuous or single)
             self.port.write("%s" % self.aquisitiontypes[self.aquisitiontype])
 
-        time.sleep(0.4)
+        # make sure the scope has processed :RUN or :SINGle before the trigger status is queried
+        self.port.write("*OPC?")
+        self.port.read()
+
         # The RIGOL does not allow to determine the amount of successful acquired averaging samples.
         # It also returns TD for trigger status during continuous triggering when a trigger was successful, but already waiting for a new one.
         # Therefore, the only solution is to STOP the scope after a manual set trigger timeout period which has to be adjusted accordingly.
         # For normal (non-averaging) use, this is not a problem.
-
-        while True:
-            # check if trigger counter ran into timeout limit;
-            if trigcounter >= self.triggertimeout:
-                self.port.write(":STOP")
-                break
-
-            # query the status of the trigger to determine success of triggering
-            self.port.write("TRIG:STAT?")
-            triggerstat=self.port.read()
-            # observing the trigger status in the debug window
-            print ("Trigger Status: ", triggerstat)
-            # check if trigger is still running; for exiting SINGLE triggering as well as manual stopping the scope via button on instrument
-            # also: trigger status TD is only available shortly after triggering. For events with a low frequency of appearance, TD trigger state might be missed and exiting relies on the timeout counter.
-            if triggerstat == "STOP":
-                break
-            # check if an event was triggered in CONTINUOUS mode
-            elif self.aquisitiontype.startswith("Cont") == 1 and triggerstat == "TD":
-                break
-            else:
-                trigcounter += 1
-                time.sleep(1)
-
-
-        self.port.write("WAV:PRE?")
-        preamble = self.port.read().split(",")
-
-        # splitting preamble values into seperate variables for further use
-        wav_format=preamble[0]
-        acq_mode=preamble[1]
-        numberpoints=int(preamble[2])
-        av_count=int(preamble[3])
-        x_inc=float(preamble[4])
-        x_orig=float(preamble[5])
-        x_ref=float(preamble[6])
-        y_inc=float(preamble[7])
-        y_orig=float(preamble[8])
-        y_ref=float(preamble[9])
+        if not self.wait_for_trigger(self.triggertimeout):
+            self.port.write(":STOP")
 
         slot = 0
 
         for i in self.channels:
-            if "inputarray" in locals():
-                del inputarray
-
-            #create empty inputarray array
-            inputarray = []
-
             # select channel to be read
             self.port.write("WAV:SOUR CHAN%s" % i)
 
+            # the preamble depends on the selected channel as each channel has its own vertical scaling
+            self.port.write("WAV:PRE?")
+            preamble = self.port.read().split(",")
+
+            # splitting preamble values into seperate variables for further use
+            x_inc = float(preamble[4])
+            x_orig = float(preamble[5])
+            y_inc = float(preamble[7])
+            y_orig = float(preamble[8])
+            y_ref = float(preamble[9])
+
             self.port.write("WAV:DATA?")
-            inputarray=self.port.read().split(",")
+            if self.waveform_encoding == "ASCII":
+                data = np.array(self.port.read().split(","), dtype=float)
+            else:
+                data = read_binary_block(self.port.port, self.waveform_data_types[self.waveform_encoding])
 
             # only for first measurement
             if slot == 0:
-                # number of measured channels
-                channels = len(self.channels)
                 # generate empty array of correct size for channels + data
-                self.voltages = np.zeros((len(inputarray), len(self.channels)))
+                self.voltages = np.empty((len(data), len(self.channels)))
                 # generate linear time array FROM, TO, STEPSAMOUNT
-                self.timecode = np.linspace(x_orig, (x_orig+x_inc*(len(inputarray))), len(inputarray))
-
-            data = []
-            for n in np.arange(len(inputarray)):
-                # sort the values as data
-                data.append(inputarray[n])
-
-            # convert list to data array
-            data = np.array(data)
+                self.timecode = np.linspace(x_orig, (x_orig+x_inc*(len(data))), len(data))
 
             # inputs voltage data for channel i into correct column of data array
-            self.voltages[:, slot] = data
+            if self.waveform_encoding == "ASCII":
+                self.voltages[:, slot] = data
+            else:
+                # scale the digitizer levels to voltages
+                np.subtract(data, y_orig + y_ref, out=self.voltages[:, slot])
+                self.voltages[:, slot] *= y_inc
             # set correct column for next channel
             slot += 1
 
+    def wait_for_trigger(self, timeout):
+        """Wait until the acquisition is stopped or, in continuous mode, triggered and return False on timeout.
+
+        The trigger status is polled with exponentially increasing intervals starting at 1 ms, so that short
+        acquisitions are detected quickly without flooding the scope with queries during long ones.
+        """
+        start_time = time.perf_counter()
+        poll_interval = 1e-3
+        while True:
+            # query the status of the trigger to determine success of triggering
+            self.port.write("TRIG:STAT?")
+            triggerstat = self.port.read()
+            # check if trigger is still running; for exiting SINGLE triggering as well as manual stopping the scope via button on instrument
+            # also: trigger status TD is only available shortly after triggering. For events with a low frequency of appearance, TD trigger state might be missed and exiting relies on the timeout.
+            if triggerstat == "STOP":
+                return True
+            # check if an event was triggered in CONTINUOUS mode
+            if self.aquisitiontype.startswith("Cont") and triggerstat == "TD":
+                return True
+
+            remaining_time = timeout - (time.perf_counter() - start_time)
+            if remaining_time <= 0:
+                return False
+
+            time.sleep(min(poll_interval, remaining_time))
+            poll_interval = min(2 * poll_interval, 0.1)
+
     def call(self):
         return [self.timecode] + [self.voltages[:,i] for i in range(self.voltages.shape[1])]
@@ -0,0 +1,39 @@
+"""
+Compare the transfer and parsing time of binary and ASCII waveform encoding.
+To use this example in your own project, you need to modify the driver path, the driver name, and the port string.
+Use a long record length, e.g. 10M points, to see the difference.
+"""
+
+import os
+import time
+
+import pysweepme  # use "pip install pysweepme" in command line to install
+
+# the name of the driver where this example file is in
+driver_name = os.path.dirname(os.path.dirname((os.path.abspath(__file__)))).split(os.sep)[-1]
+
+# the path of the driver where this example file is in
+driver_path = os.path.dirname((os.path.dirname(os.path.dirname((os.path.abspath(__file__))))))
+
+port_string = "TCPIP0::192.168.0.10::inst0::INSTR"  # replace with your port string
+
+scope = pysweepme.get_driver(driver_name, driver_path, port_string)
+scope.port.port.timeout = 120000  # long records need more time than the default timeout
+
+scope.port.write("DAT:SOU CH1")
+scope.port.write("DAT:STARt 1")
+scope.port.write("DAT:STOP 999999999999")
+scope.port.write("WFMO:BYT_NR 2")
+
+for encoding in ["ASCII", "Binary"]:
+    scope.waveform_encoding = encoding
+    scope.port.write("DAT:ENCdg ASCii" if encoding == "ASCII" else "DAT:ENCdg RIBinary")
+
+    scope.port.write("WFMOutpre?")
+    preamble = scope.port.read().split(";")
+
+    start = time.perf_counter()
+    data = scope.get_waveform(preamble)
+    duration = time.perf_counter() - start
+
+    print(f"{encoding}: {len(data)} points in {duration:.3f} s")
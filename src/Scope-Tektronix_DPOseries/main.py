@@ -34,6 +34,11 @@
 
 import numpy as np
 from pysweepme.EmptyDeviceClass import EmptyDevice
+from pysweepme.FolderManager import addFolderToPATH
+
+addFolderToPATH()
+
+from binary_block import read_binary_block
 
 
 class Device(EmptyDevice):
@@ -98,6 +103,7 @@ def set_GUIparameter(self) -> dict:  # noqa: N802
             # Average of 1 is not yet supported
             "Average": ["As is", "1", "2", "4", "8", "16", "32", "64", "128", "256", "512", "1024"],
             "VoltageRange": ["Voltage range in V"],
+            "Waveform encoding": ["Binary", "ASCII"],
         }
 
         for i in range(1, 5):
@@ -139,6 +145,8 @@ def get_GUIparameter(self, parameter: dict) -> None:  # noqa: N802
 
         self.acquisition = parameter["Acquisition"]
 
+        self.waveform_encoding = parameter.get("Waveform encoding", "Binary")
+
         self.channels = []
         self.channel_names = {}
         self.channel_ranges = {}
@@ -171,7 +179,10 @@ def initialize(self) -> None:
             raise ValueError(msg)
 
         self.port.write("DAT:STOP 999999999999")  # ensure that the entire waveform is recorded
-        self.port.write("DAT:ENCdg ASCii")  # sets encoding
+        if self.waveform_encoding == "ASCII":
+            self.port.write("DAT:ENCdg ASCii")  # sets encoding
+        else:
+            self.port.write("DAT:ENCdg RIBinary")  # signed integer, most significant byte first
         self.port.write("WFMO:BYT_NR 2")  # set number of bytes
 
     def configure(self) -> None:
@@ -311,8 +322,8 @@ def measure(self) -> None:
             # the digitization levels of the oscilloscope
             y_mult, y_offset, y_zero = float(preamble[13]), float(preamble[14]), float(preamble[15])
 
-            data = self.get_waveform()
-            volt_data = (data - (y_offset + y_zero)) * y_mult  # calculates correct voltages
+            data = self.get_waveform(preamble)
+            volt_data = (data - y_offset) * y_mult + y_zero  # calculates correct voltages
 
             self.voltages[:, slot] = volt_data  # inputs voltage data for channel i into correct column of data array
 
@@ -331,11 +342,24 @@ def reset(self) -> None:
         """Reset the device."""
         self.port.write("*RST")
 
-    def get_waveform(self) -> np.array:
-        """Return the waveform data."""
+    def get_waveform(self, preamble: list[str]) -> np.ndarray:
+        """Return the waveform data in digitizing levels.
+
+        Args:
+            preamble: The answer of 'WFMOutpre?' split at ';' that describes the binary format of the data.
+        """
         self.port.write("CURVe?")  # queries the waveform from the oscilloscope
-        curve_points = self.port.read().split(",")  # turn str object from query into list
-        return np.array(list(map(float, curve_points)))
+
+        if self.waveform_encoding == "ASCII":
+            return np.array(self.port.read().split(","), dtype=float)
+
+        # Preamble fields: BYT_NR, BIT_NR, ENCDG, BN_FMT (RI signed, RP unsigned), BYT_OR (MSB or LSB first)
+        byte_number = int(preamble[0])
+        kind = "u" if preamble[3].strip().upper() == "RP" else "i"
+        byte_order = "<" if preamble[4].strip().upper() == "LSB" else ">"
+        data_type = np.dtype(f"{byte_order}{kind}{byte_number}")
+
+        return read_binary_block(self.port.port, data_type)
 
     def get_acquisition_number(self) -> int:
         """Return the number of acquisitions."""
@@ -1,7 +1,9 @@
 import json
 import builtins
 import asyncio
+import contextlib
 import logging
+import threading
 
 # As SweepMe! 1.5.5 does not come with tblib, we only use it
 # if it is available
@@ -30,17 +32,177 @@ def __init__(self, variable_reference_name):
         self._variable_reference_name = variable_reference_name
 
 
+class BatchResult:
+    """
+    Placeholder for the return value of a call that was collected in a batch. The value is available after the batch
+    has been sent, i.e. after leaving the 'with proxy.batch():' block. If the call failed on the server side, accessing
+    the value raises the corresponding RemoteException.
+    """
+
+    def __init__(self):
+        self._value = None
+        self._exception = None
+        self._done = False
+
+    @property
+    def value(self):
+        if not self._done:
+            raise RuntimeError("The batch has not been sent to the server yet.")
+        if self._exception is not None:
+            raise self._exception
+        return self._value
+
+
+class ServerConnection:
+    """
+    Persistent connection to the server that can be shared by several Proxy objects, e.g. the 'lpt' and 'param'
+    proxies of all channels of one 4200-SCS.
+
+    Requests and responses are framed by a newline. Several requests can be written at once (pipelining) and the
+    responses are read back in the same order, so that a call costs one round trip instead of a TCP handshake plus a
+    round trip.
+
+    Requests are never sent twice, as they might have been executed already. If the server closes the connection
+    before it answered all written requests, a ConnectionError is raised. A connection that was closed by the server
+    while it was idle is re-opened before anything is written. Requests are only pipelined after the server answered
+    a second request on the same connection. If the server closes the connection after each response instead, a new
+    connection is opened for each request like the previous client did.
+    """
+
+    read_limit = 2 ** 24
+    """Maximum length of a response line in bytes, list sweep results can exceed the asyncio default of 64 kB."""
+
+    def __init__(self, address: str, port: int):
+        self.loop = asyncio.new_event_loop()
+        self.address = address
+        self.port = port
+
+        # set to False if the server does not answer a JSON array of requests, batches are then sent pipelined
+        self.batch_supported = True
+
+        # None as long as it is unknown whether the server keeps the connection open after a response
+        self.keeps_connection = None
+
+        self._reader = None
+        self._writer = None
+        self._lock = threading.Lock()
+
+    def __del__(self):
+        # The event loop is not run during garbage collection, the socket is closed together with its transport.
+        # Use close() to shut down the connection cleanly.
+        if self._writer is not None:
+            self._writer.close()
+        if not self.loop.is_running():
+            self.loop.close()
+
+    @property
+    def is_connected(self) -> bool:
+        return self._writer is not None and not self._writer.is_closing()
+
+    async def _async_open(self) -> None:
+        self._reader, self._writer = await asyncio.open_connection(self.address, self.port, limit=self.read_limit)
+
+    async def _async_close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+        self._reader = None
+        self._writer = None
+
+    async def _async_is_closed_by_server(self) -> bool:
+        # give the event loop the chance to process an end of file that was received since the last request
+        for _ in range(2):
+            await asyncio.sleep(0)
+        return self._reader.at_eof() or self._writer.is_closing()
+
+    async def _async_exchange(self, commands: list, responses: list) -> None:
+        if not self.is_connected:
+            await self._async_open()
+
+        self._writer.write(b"".join(command.encode("utf-8") + b"\n" for command in commands))
+        await self._writer.drain()
+
+        for _ in commands:
+            data = await self._reader.readline()
+            if not data:
+                raise ConnectionResetError(
+                    "Connection closed by the server before all requests were answered. The requests are not sent "
+                    "again as they might have been executed already."
+                )
+            responses.append(data.decode("utf-8"))
+
+    def send(self, commands: list) -> list:
+        """Send the commands and return the responses in the same order.
+
+        The commands are written at once if the server is known to keep the connection open, otherwise one by one.
+        """
+        responses = []
+        with self._lock:
+            while len(responses) < len(commands):
+                if self.is_connected and (
+                    self.keeps_connection is False or self.loop.run_until_complete(self._async_is_closed_by_server())
+                ):
+                    # nothing has been written to this connection yet, so the commands can be sent on a new one
+                    logger.debug("Connection closed by the server, reconnecting.")
+                    self.loop.run_until_complete(self._async_close())
+                    if self.keeps_connection is None:
+                        self.keeps_connection = False
+
+                is_reused = self.is_connected
+                if self.keeps_connection:
+                    pending = commands[len(responses):]
+                else:
+                    pending = commands[len(responses):len(responses) + 1]
+
+                try:
+                    self.loop.run_until_complete(self._async_exchange(pending, responses))
+                except BaseException:
+                    # pending responses would otherwise be read as the responses of the next request
+                    self.loop.run_until_complete(self._async_close())
+                    raise
+
+                if is_reused and self.keeps_connection is None:
+                    self.keeps_connection = True
+        return responses
+
+    def close(self) -> None:
+        if not self.loop.is_closed():
+            self.loop.run_until_complete(self._async_close())
+            self.loop.close()
+
+
 class Proxy:
     _target_class: str
 
-    def __init__(self, address: str, port: int, target_class: str):
-        self.loop = asyncio.new_event_loop()
+    def __init__(
+        self,
+        address: str,
+        port: int,
+        target_class: str,
+        connection: ServerConnection = None,
+        constant_attributes: bool = False,
+    ):
         self._target_class = target_class
         self.address = address
         self.port = port
-        
-    def __del__(self):
-        self.loop.close()
+
+        # a connection that is handed over is shared with other Proxy objects and closed by its owner, an own
+        # connection is closed when the Proxy is garbage collected
+        self._connection = ServerConnection(address, port) if connection is None else connection
+
+        # names of the server-side attributes that are known to be callable, so that they do not need to be queried
+        # again before each call
+        self._callables = set()
+
+        # values of non-callable attributes are only requested once if they are known to be constant, e.g. 'param'
+        self._constant_attributes = constant_attributes
+        self._attribute_values = {}
+
+        # list of (command_json, BatchResult) that is collected while a batch is active
+        self._batch = None
 
     def _convert_argument_from_json(self, arg):
         if isinstance(arg, list):
@@ -66,24 +228,70 @@ def _convert_argument_to_json(self, arg):
             "value": arg
         }
 
-    async def _async_send_to_server(self, command: str) -> str:
-        reader, writer = await asyncio.open_connection(
-            self.address, self.port)
+    def _send_to_server(self, command: str) -> str:
+        return self._connection.send([command])[0]
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Collect all calls of the with-block and send them as one JSON array request when the block is left.
 
-        writer.write(command.encode("utf-8") + b'\n')
-        await writer.drain()
+        Inside the block, each call returns a BatchResult whose value can be accessed after the block. Attributes
+        accessed inside the block are assumed to be functions. If any call fails on the server side, the first
+        RemoteException is raised when leaving the block. Nested blocks are sent together with the outermost one.
+        """
+        if self._batch is not None:
+            yield
+            return
 
-        data = await reader.readline()
+        self._batch = []
+        try:
+            yield
+            batch = self._batch
+        finally:
+            self._batch = None
+        self._send_batch(batch)
 
-        writer.close()
-        return data.decode("utf-8")
+    def _send_batch(self, batch: list) -> None:
+        if not batch:
+            return
 
-    def _send_to_server(self, command: str) -> str:
-        result = self.loop.run_until_complete(self._async_send_to_server(command))
-        return result
+        results = None
+        if self._connection.batch_supported:
+            command = json.dumps([command_json for command_json, _ in batch])
+            logger.debug(f"Batch request: {command}")
+            try:
+                response = json.loads(self._send_to_server(command))
+            except (ConnectionError, ValueError):
+                response = None
+            logger.debug(f"Batch response: {response}")
+
+            if isinstance(response, list) and len(response) == len(batch):
+                results = response
+            else:
+                logger.debug("Server does not support batch requests, sending requests pipelined.")
+                self._connection.batch_supported = False
+
+        if results is None:
+            responses = self._connection.send([json.dumps(command_json) for command_json, _ in batch])
+            results = [json.loads(response) for response in responses]
+
+        first_exception = None
+        for (_, batch_result), result in zip(batch, results):
+            try:
+                batch_result._value = self._convert_argument_from_json(self.unpack_result(result)["return"])
+            except RemoteException as e:
+                batch_result._exception = e
+                if first_exception is None:
+                    first_exception = e
+            batch_result._done = True
+
+        if first_exception is not None:
+            raise first_exception
 
     def unpack_result(self, response):
-        result = json.loads(response)
+        # results of a batch are already decoded
+        result = json.loads(response) if isinstance(response, str) else response
         status = result.get("status", "invalid")
         if status == "success":
             return result
@@ -114,6 +322,11 @@ def handle_call(*args, **kwargs):
                 "args": [self._convert_argument_to_json(arg) for arg in args],
                 "kwargs": {k: self._convert_argument_to_json(v) for k, v in kwargs.items()}
             }
+            if self._batch is not None:
+                batch_result = BatchResult()
+                self._batch.append((command_json, batch_result))
+                return batch_result
+
             command = json.dumps(command_json)
             logger.debug(f"Request: {command}")
             result = self._send_to_server(command)
@@ -122,6 +335,11 @@ def handle_call(*args, **kwargs):
             return self._convert_argument_from_json(result_json["return"])
 
         if function[0] != "_":
+            if function in self._callables or self._batch is not None:
+                return handle_call
+            if function in self._attribute_values:
+                return self._attribute_values[function]
+
             # try to determine if it is an attribute and not a function
             command_json = {
                 "class": self._target_class,
@@ -131,8 +349,12 @@ def handle_call(*args, **kwargs):
             result = self._send_to_server(command)
             result_json = self.unpack_result(result)
             if result_json["return"]["type"] == "callable":
+                self._callables.add(function)
                 return handle_call
             logger.debug(f"Request: {command}")
             logger.debug(f"Response: {result}")
-            return self._convert_argument_from_json(result_json["return"])
+            value = self._convert_argument_from_json(result_json["return"])
+            if self._constant_attributes:
+                self._attribute_values[function] = value
+            return value
         return None
@@ -0,0 +1,60 @@
+"""
+Compare the time to read a sequence file with 1M waveform rows with the previous parser based on numpy.genfromtxt,
+with the sequence file reader based on numpy.loadtxt and with the cached sequence file.
+The file is written to a temporary folder, so no instrument or WGFMU library is needed.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# add libraries folder to sys.path to enable import of pywgfmu
+sys.path.insert(
+    0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "libraries", "libs_common"),
+)
+
+from pywgfmu import sequence_file  # noqa: E402
+
+number_of_rows = 1_000_000
+
+
+def read_genfromtxt(path: str) -> tuple[np.ndarray, np.ndarray]:
+    """Previous implementation of the driver that counts the header lines and parses the file with genfromtxt."""
+    with open(path, encoding="utf-8") as file:
+        number_of_header_lines = 0
+        while True:
+            number_of_header_lines += 1
+            if file.readline().strip().startswith("time in s"):
+                break
+
+    data = np.genfromtxt(path, delimiter=";", skip_header=number_of_header_lines)
+    return data[:, 0], data[:, 1]
+
+
+def measure(function: callable, path: str) -> float:
+    start = time.perf_counter()
+    function(path)
+    return time.perf_counter() - start
+
+
+with tempfile.TemporaryDirectory() as folder:
+    path = os.path.join(folder, "sequence.csv")
+    voltages = np.sin(np.linspace(0, 100, number_of_rows))
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("measure_start;points;interval in s;averaging in s\n0.001;10;0.00001;0\n")
+        file.write("time in s;voltage in V\n")
+        np.savetxt(file, np.column_stack([np.full(number_of_rows, 1e-6), voltages]), delimiter=";", fmt="%.9g")
+
+    genfromtxt_duration = measure(read_genfromtxt, path)
+    loadtxt_duration = measure(sequence_file.read_sequence_file, path)
+    first_load_duration = measure(sequence_file.load_sequence_file, path)
+    cached_load_duration = measure(sequence_file.load_sequence_file, path)
+
+print(f"Sequence file with {number_of_rows} rows")
+print(f"genfromtxt: {genfromtxt_duration * 1e3:.0f} ms")
+print(f"loadtxt: {loadtxt_duration * 1e3:.0f} ms")
+print(f"loadtxt, first load with cache: {first_load_duration * 1e3:.0f} ms")
+print(f"loadtxt, cached: {cached_load_duration * 1e3:.2f} ms")
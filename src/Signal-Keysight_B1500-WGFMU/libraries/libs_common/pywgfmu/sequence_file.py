@@ -0,0 +1,175 @@
+# This Device Class is published under the terms of the MIT License.
+# Required Third Party Libraries, which are included in the Device Class
+# package for convenience purposes, may have a different license. You can
+# find those in the corresponding folders or contact the maintainer.
+#
+# MIT License
+#
+# Copyright (c) 2026 SweepMe! GmbH (sweep-me.net)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Read the sequence files of the Signal-Keysight_B1500-WGFMU driver.
+
+The file is ``;``-delimited with up to three sections, identified by their header rows. The measure-event averaging
+column is optional (defaults to 0.0). The ``range_start`` section is optional:
+
+    measure_start;points;interval;averaging   <- averaging column optional
+    0.001;10;0.00001;0
+    range_start;current_range                 <- section optional
+    0.0005;1 uA
+    time in s;voltage in V
+    0;0
+    0.001;1
+
+The short event sections are read line by line and the waveform section is parsed at once by numpy.loadtxt. Files
+are cached by path, modification time and size, so that a file is only parsed again if it has changed.
+"""
+
+from __future__ import annotations
+
+import os
+
+import numpy as np
+
+from .wgfmu import CurrentMeasurementRange
+
+RANGES = {
+    "1 uA": CurrentMeasurementRange.RANGE_1uA,
+    "10 uA": CurrentMeasurementRange.RANGE_10uA,
+    "100 uA": CurrentMeasurementRange.RANGE_100uA,
+    "1 mA": CurrentMeasurementRange.RANGE_1mA,
+    "10 mA": CurrentMeasurementRange.RANGE_10mA,
+}
+"""Current ranges of the range_start section."""
+
+_cache: dict[str, SequenceFile] = {}
+
+
+class SequenceFile:
+    """Measurement events, range events and waveform of a sequence file.
+
+    The arrays are read-only, as they are shared by all users of the cached file.
+    """
+
+    def __init__(
+        self,
+        measure_events: list[tuple[float, int, float, float]],
+        range_events: list[tuple[float, CurrentMeasurementRange]],
+        time_increments_s: np.ndarray,
+        voltages: np.ndarray,
+        identity: tuple[str, int, int] = ("", 0, 0),
+    ) -> None:
+        """Create the sequence. identity is (path, modification time in ns, size) of the file."""
+        if len(time_increments_s) == 0 or len(voltages) == 0:
+            msg = "No time increments or voltage values found in the CSV file."
+            raise ValueError(msg)
+
+        if len(time_increments_s) != len(voltages):
+            msg = (
+                f"Number of time increments ({len(time_increments_s)}) does not match number of voltage values "
+                f"({len(voltages)})."
+            )
+            raise ValueError(msg)
+
+        self.measure_events = measure_events
+        self.range_events = range_events
+        self.time_increments_s = np.ascontiguousarray(time_increments_s, dtype=np.float64)
+        self.voltages = np.ascontiguousarray(voltages, dtype=np.float64)
+        self.time_increments_s.flags.writeable = False
+        self.voltages.flags.writeable = False
+        self.identity = identity
+
+        self._scaled_voltages: dict[float, np.ndarray] = {}
+
+    def get_voltages(self, amplitude: float | None = None) -> np.ndarray:
+        """Return the voltages, scaled so that the maximum absolute voltage equals the amplitude if it is given."""
+        if amplitude is None:
+            return self.voltages
+
+        amplitude = float(amplitude)
+        if amplitude not in self._scaled_voltages:
+            max_voltage = np.max(np.abs(self.voltages))
+            voltages = self.voltages * (amplitude / max_voltage) if max_voltage != 0 else self.voltages.copy()
+            voltages.flags.writeable = False
+            self._scaled_voltages[amplitude] = voltages
+
+        return self._scaled_voltages[amplitude]
+
+
+def read_sequence_file(path: str) -> SequenceFile:
+    """Parse the sequence file without using the cache."""
+    measure_events = []
+    range_events = []
+
+    with open(path, encoding="utf-8") as file:
+        section: str | None = None
+
+        while True:
+            line = file.readline()
+            if not line:
+                msg = f"No waveform section starting with 'time in s' found in '{path}'."
+                raise ValueError(msg)
+
+            line = line.strip()
+            if line.startswith("measure_start"):
+                section = "measure"
+                continue
+            if line.startswith("range_start"):
+                section = "range"
+                continue
+            if line.startswith("time in s"):
+                break
+
+            if section == "range":
+                start_str, range_str = line.split(";")
+                range_str = range_str.strip()
+                if range_str not in RANGES:
+                    msg = f"Unknown current range '{range_str}'. Valid: {list(RANGES)}."
+                    raise ValueError(msg)
+                range_events.append((float(start_str), RANGES[range_str]))
+            else:  # default to measure-events section for backwards compatibility
+                parts = [p.strip() for p in line.split(";")]
+                if len(parts) < 3:
+                    msg = f"Measure-event row needs at least 3 columns, got: '{line}'."
+                    raise ValueError(msg)
+                measure_start, points, interval = parts[0], parts[1], parts[2]
+                average = parts[3] if len(parts) >= 4 and parts[3] else "0"
+                measure_events.append((float(measure_start), int(points), float(interval), float(average)))
+
+        # The file position is at the first waveform row, so the header lines do not need to be skipped.
+        data = np.loadtxt(file, delimiter=";", usecols=(0, 1), ndmin=2, dtype=np.float64)
+
+    return SequenceFile(measure_events, range_events, data[:, 0], data[:, 1])
+
+
+def load_sequence_file(path: str) -> SequenceFile:
+    """Return the sequence of a file. The result is cached until the file is modified."""
+    path = os.path.abspath(path)
+    status = os.stat(path)
+    identity = (path, status.st_mtime_ns, status.st_size)
+
+    cached = _cache.get(path)
+    if cached is not None and cached.identity == identity:
+        return cached
+
+    sequence = read_sequence_file(path)
+    sequence.identity = identity
+    _cache[path] = sequence
+    return sequence
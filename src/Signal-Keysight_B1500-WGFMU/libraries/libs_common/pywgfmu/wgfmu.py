@@ -33,6 +33,8 @@
 import time
 from enum import Enum
 
+import numpy as np
+
 dll_path = r"C:\Windows\System32\wgfmu.dll"  # alternative path: r'C:\Windows\SysWOW64\wgfmu.dll' (32 Bit)
 _dll: ctypes.WinDLL
 
@@ -76,6 +78,22 @@ def make_double_array(values: list[float] | None = None, len_: int = 0):
     return make_generic_array(len_, data_type=ctypes.c_double)
 
 
+def as_double_buffer(values) -> np.ndarray:
+    """Return the values as C-contiguous float64 array. Arrays that already have this layout are not copied."""
+    return np.ascontiguousarray(values, dtype=np.float64)
+
+
+def make_double_pointer(array: np.ndarray):
+    """Return a C `double *` to the data of a C-contiguous float64 array.
+
+    The pointer does not keep the array alive, so the array must be referenced until the DLL call returns.
+    """
+    if array.dtype != np.float64 or not array.flags.c_contiguous:
+        msg = "Array must be a C-contiguous float64 array."
+        raise ValueError(msg)
+    return array.ctypes.data_as(ctypes.POINTER(ctypes.c_double))
+
+
 # Initialization functions
 
 def open_session(address: str) -> None:
@@ -319,6 +337,32 @@ def add_vector_array(pattern: str, time_values: list[float], voltage_values: lis
     )
 
 
+def add_vectors_numpy(pattern: str, time_values: np.ndarray, voltage_values: np.ndarray) -> None:
+    """Adds multiple vectors given as numpy arrays to the specified waveform pattern.
+
+    C-contiguous float64 arrays are passed to the DLL without copying, other arrays are converted once.
+
+    Args:
+        pattern: The name of the waveform pattern.
+        time_values: Incremental time values in seconds (time since last point), rounded to multiples of 10ns.
+        voltage_values: Output voltages in volts.
+    """
+    time_values = as_double_buffer(time_values)
+    voltage_values = as_double_buffer(voltage_values)
+
+    if time_values.ndim != 1 or time_values.shape != voltage_values.shape:
+        raise ValueError("time_values and voltage_values must be one-dimensional and have the same length")
+    if np.any((time_values < 1e-8) | (time_values > 10995)):
+        raise ValueError("time_values must be between 10ns and 10995s")
+
+    _dll.WGFMU_addVectors(
+        make_char_pointer(pattern),
+        make_double_pointer(time_values),
+        make_double_pointer(voltage_values),
+        ctypes.c_int32(len(time_values)),
+    )
+
+
 def get_pattern_force_value_size(pattern: str) -> int:
     """Gets the size of the force value array for the given pattern."""
     c_size = ctypes.c_int32()
@@ -479,27 +523,111 @@ def get_measure_value(channel: int, index: int) -> tuple[float, float]:
 
 def get_measure_values(channel: int, start_index: int, count: int) -> tuple[list[float], list[float]]:
     """Returns measurement data (time and value) for multiple points."""
+    times, values = get_measure_values_numpy(channel, start_index, count)
+    return times.tolist(), values.tolist()
+
+
+def get_measure_values_numpy(
+    channel: int,
+    start_index: int,
+    count: int,
+    times: np.ndarray | None = None,
+    values: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Returns measurement data (time and value) for multiple points as numpy arrays.
+
+    The DLL writes directly into the arrays. If times and values are given, e.g. slices of preallocated arrays, they
+    must be C-contiguous float64 arrays with at least count elements and the data is written into them.
+
+    Returns:
+        Views of the elements of times and values that were read.
+    """
     if count < 1:
         raise ValueError("count must be at least 1")
     if start_index < 0:
         raise ValueError("start_index must be non-negative")
 
-    c_times = make_double_array(len_=count)
-    c_values = make_double_array(len_=count)
+    times = np.empty(count) if times is None else times[:count]
+    values = np.empty(count) if values is None else values[:count]
+    if len(times) < count or len(values) < count:
+        raise ValueError(f"times and values must have at least {count} elements")
 
+    c_count = ctypes.c_int32(count)
     status = _dll.WGFMU_getMeasureValues(
         ctypes.c_int32(channel),
         ctypes.c_int32(start_index),
-        ctypes.byref(ctypes.c_int32(count)),
-        ctypes.byref(c_times),
-        ctypes.byref(c_values),
+        ctypes.byref(c_count),
+        make_double_pointer(times),
+        make_double_pointer(values),
     )
 
     # if the DLL returns an error code, surface it
     if isinstance(status, int) and status != 0:
         raise OSError(f"WGFMU_getMeasureValues returned error code {status}")
 
-    times = [float(c_times[i]) for i in range(count)]
-    values = [float(c_values[i]) for i in range(count)]
+    # the DLL returns the number of points that were read
+    count = min(count, int(c_count.value))
+    return times[:count], values[:count]
 
-    return times, values
+
+class MeasureValueReader:
+    """Reads the measurement data of a channel in chunks while the sequence is running.
+
+    The DLL writes the values directly into preallocated arrays, which grow if the DLL reports more points than they
+    can hold. Call read_available repeatedly during the run and once after it is completed.
+    """
+
+    def __init__(self, channel: int, chunk_size: int = 2**16) -> None:
+        """Create the reader for the given channel. chunk_size is the maximum number of points per DLL call."""
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        self.channel = channel
+        self.chunk_size = chunk_size
+        self.number_of_points = 0
+        self.total_points = 0
+        self._times = np.empty(0)
+        self._values = np.empty(0)
+
+    @property
+    def times(self) -> np.ndarray:
+        """Time stamps of the points read so far as view of the preallocated array."""
+        return self._times[:self.number_of_points]
+
+    @property
+    def values(self) -> np.ndarray:
+        """Measured values of the points read so far as view of the preallocated array."""
+        return self._values[:self.number_of_points]
+
+    def read_available(self) -> int:
+        """Read all points that were completed since the last call and return the number of new points."""
+        completed_points, self.total_points = get_measure_value_size(self.channel)
+        self.reserve(max(completed_points, self.total_points))
+
+        start_index = self.number_of_points
+        while self.number_of_points < completed_points:
+            count = min(self.chunk_size, completed_points - self.number_of_points)
+            times, _ = get_measure_values_numpy(
+                self.channel,
+                self.number_of_points,
+                count,
+                self._times[self.number_of_points:],
+                self._values[self.number_of_points:],
+            )
+            if len(times) == 0:
+                break
+            self.number_of_points += len(times)
+
+        return self.number_of_points - start_index
+
+    def reserve(self, size: int) -> None:
+        """Grow the arrays to hold at least size points, keeping the points read so far."""
+        if size <= len(self._times):
+            return
+
+        # grow at least by a factor of two to keep the number of copies low if the total increases repeatedly
+        size = max(size, 2 * len(self._times))
+        for name in ("_times", "_values"):
+            array = np.empty(size)
+            array[:self.number_of_points] = getattr(self, name)[:self.number_of_points]
+            setattr(self, name, array)
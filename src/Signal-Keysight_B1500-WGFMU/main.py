@@ -37,7 +37,7 @@
 
 import numpy as np
 from pysweepme.EmptyDeviceClass import EmptyDevice
-from pywgfmu import wgfmu
+from pywgfmu import sequence_file, wgfmu
 
 
 class Device(EmptyDevice):
@@ -71,6 +71,7 @@ def __init__(self) -> None:
         self.measure_events: list[tuple[float, int, float, float]] = []
         # list of (start_time, CurrentMeasurementRange) — only applied in current measure mode
         self.range_events: list[tuple[float, wgfmu.CurrentMeasurementRange]] = []
+        self.sequence: sequence_file.SequenceFile | None = None
         self.time_increments_s: np.ndarray = np.array([])
         self.voltages: np.ndarray = np.array([])
 
@@ -81,9 +82,15 @@ def __init__(self) -> None:
 
         self.measure_mode: str = "Measure Voltage"
 
+        # Readout
+        self.readout_modes = ["After completion", "Chunked during run"]
+        self.readout: str = "After completion"
+        self.chunk_size: int = 2**16
+        self.reader: wgfmu.MeasureValueReader | None = None
+
         # Measured values
-        self.measured_timestamps: list[float] = []
-        self.measured_voltages: list[float] = []
+        self.measured_timestamps: np.ndarray = np.array([])
+        self.measured_voltages: np.ndarray = np.array([])
 
     def update_gui_parameters(self, parameters: dict[str, Any]) -> dict[str, Any]:
         """Determine the new GUI parameters of the driver depending on the current parameters."""
@@ -110,6 +117,8 @@ def update_gui_parameters(self, parameters: dict[str, Any]) -> dict[str, Any]:
             # "Impedance": ['Auto', 'High-Z', '50 Ohm'],
             # "Trigger": ['None', 'External', 'Internal'],
             "ArbitraryWaveformFile": "Path to file",
+            "Readout": self.readout_modes,
+            "Points per read": 2**16,
         }
 
     def apply_gui_parameters(self, parameters: dict[str, Any]) -> None:
@@ -136,6 +145,8 @@ def apply_gui_parameters(self, parameters: dict[str, Any]) -> None:
         # self.impedance = parameters.get("Impedance", "Auto")
         # self.trigger = parameters.get("Trigger", "None")
         self.csv_file_path = parameters.get("ArbitraryWaveformFile", "Path to file")
+        self.readout = parameters.get("Readout", "After completion")
+        self.chunk_size = int(parameters.get("Points per read", 2**16))
 
         if "Voltage" in self.measure_mode:
             self.variables = ["Timestamp", "Voltage"]
@@ -161,6 +172,8 @@ def initialize(self) -> None:
                 self.device_communication[self.device_communication_key] = {}
 
             self.device_communication[self.device_communication_key]["wgfmu_session_open"] = True
+            # patterns that were created in this session, see configure
+            self.device_communication[self.device_communication_key]["wgfmu_patterns"] = {}
             self.device_communication[self.device_communication_key][
                 "wgfmu_master_channel"] = -1  # updates in configure
 
@@ -190,59 +203,30 @@ def configure(self) -> None:
         """Configure the device. This function is called every time the device is used in the sequencer."""
         self.read_csv()
 
-        if self.scaling_mode == "Amplitude in V":
-            # scale the voltage values to the specified amplitude while level
-            max_voltage = np.max(np.abs(self.voltages))
-            if max_voltage != 0:
-                self.voltages *= float(self.scaling_value) / max_voltage
-
-        pattern_name = f"sweepme_pattern_{self.channel}"
-
         if self.time_increments_s[0] != 0.0:
             msg = f"Time increments in the CSV file should start with 0.0, but got {self.time_increments_s[0]}."
             raise ValueError(msg)
 
-        wgfmu.create_pattern(pattern_name, self.voltages[0])
-        wgfmu.add_vector_array(
-            pattern_name,
-            time_values=self.time_increments_s[1:].tolist(),
-            voltage_values=self.voltages[1:].tolist(),
-        )
+        measure_mode = "Voltage" if "voltage" in self.measure_mode.lower() else "Current"
+
+        # A pattern is only created once per file, scaling and measure mode and reused in further configure calls.
+        amplitude = float(self.scaling_value) if self.scaling_mode == "Amplitude in V" else None
+        pattern_key = (self.channel, self.sequence.identity, amplitude, measure_mode)
+        patterns = self.communication_dict.setdefault("wgfmu_patterns", {})
+        pattern_name = patterns.get(pattern_key)
+
+        if pattern_name is None:
+            pattern_name = f"sweepme_pattern_{self.channel}_{len(patterns)}"
+            self.create_pattern(pattern_name, self.sequence.get_voltages(amplitude), measure_mode)
+            patterns[pattern_key] = pattern_name
 
         count = self.calculate_repetitions()
         wgfmu.add_sequence(self.channel, pattern_name, count=count)
 
         # For long range box, there might be a different mode
         wgfmu.set_operation_mode(self.channel, wgfmu.OperationMode.FASTIV)
-
-        measure_mode = "Voltage" if "voltage" in self.measure_mode.lower() else "Current"
         wgfmu.set_measure_mode(self.channel, measure_mode)
 
-        # Add measurement events
-        for number, measurement_event in enumerate(self.measure_events):
-            measure_start, points, interval, average = measurement_event
-            event_name = f"Event_{self.channel}_{number}"
-            wgfmu.set_measure_event(
-                pattern_name,
-                event=event_name,
-                start_time=measure_start,
-                points=points,
-                interval=interval,
-                average=average,
-                mode="average",
-            )
-
-        # Range events are only valid in current measurement mode. Without them the WGFMU stays on its default (least
-        # sensitive) current range
-        if measure_mode == "Current":
-            for number, (start_time, range_enum) in enumerate(self.range_events):
-                wgfmu.set_range_event(
-                    pattern_name,
-                    event=f"Range_{self.channel}_{number}",
-                    start_time=start_time,
-                    range=range_enum,
-                )
-
     def unconfigure(self) -> None:
         """Unconfigure the device. This function is called when the procedure leaves a branch of the sequencer."""
         if self.communication_dict.get("wgfmu_master_channel", -1) == self.channel:
@@ -269,9 +253,21 @@ def measure(self) -> None:
                     break
                 time.sleep(0.1)
 
+        if self.readout == "Chunked during run" and self.measure_events:
+            self.reader = wgfmu.MeasureValueReader(self.channel, self.chunk_size)
+            self.publish_results(self.reader.times, self.reader.values)
+        else:
+            self.reader = None
+
     def request_result(self) -> None:
-        """Each channel waits until its status is not 'RUNNING'."""
+        """Each channel waits until its status is not 'RUNNING'.
+
+        In chunked readout, the points completed so far are read and published while waiting.
+        """
         while not self.is_run_stopped():
+            if self.reader is not None and self.reader.read_available():
+                self.publish_results(self.reader.times, self.reader.values)
+
             status, elapsed_time, estimated_total_time = wgfmu.get_channel_status(self.channel)
             if status != wgfmu.ChannelStatus.RUNNING:
                 break
@@ -288,96 +284,87 @@ def read_result(self) -> None:
             # No measurement events defined, so no results to read
             return
 
+        if self.reader is not None:
+            # only the points that were completed after the last read during the run are left
+            self.reader.read_available()
+            if self.reader.number_of_points < 1:
+                msg = "No measurement points completed. Cannot read results."
+                raise RuntimeError(msg)
+            self.measured_timestamps, self.measured_voltages = self.reader.times, self.reader.values
+            self.publish_results(self.measured_timestamps, self.measured_voltages)
+            return
+
         completed_points, total_points = wgfmu.get_measure_value_size(self.channel)
         if completed_points < 1:
             msg = "No measurement points completed. Cannot read results."
             raise RuntimeError(msg)
-        self.measured_timestamps, self.measured_voltages = wgfmu.get_measure_values(self.channel, 0, completed_points)
+        self.measured_timestamps, self.measured_voltages = wgfmu.get_measure_values_numpy(
+            self.channel, 0, completed_points,
+        )
 
-    def call(self) -> list[list[float]]:
+    def call(self) -> list[np.ndarray]:
         """Return the measurement results. Must return as many values as defined in self.variables."""
         return [self.measured_timestamps, self.measured_voltages]
 
     # Helper functions
 
-    def read_csv(self) -> None:
-        """Read the csv file and extract measurement events, range events, time stamps and voltage values.
+    def publish_results(self, timestamps: np.ndarray, values: np.ndarray) -> None:
+        """Share the results read so far via device_communication, e.g. to plot them during a long run.
 
-        The file is ``;``-delimited with up to three sections, identified by their
-        header rows. The measure-event averaging column is optional (defaults to
-        0.0). The ``range_start`` section is optional and only consumed in
-        current measurement mode:
-
-            measure_start;points;interval;averaging   <- averaging column optional
-            0.001;10;0.00001;0
-            range_start;current_range                 <- section optional
-            0.0005;1 uA
-            time in s;voltage in V
-            0;0
-            0.001;1
+        The arrays are views of the readout buffers, so they must not be modified by the receiver.
         """
-        self.measure_events = []
-        self.range_events = []
+        self.communication_dict.setdefault("wgfmu_results", {})[self.channel] = (timestamps, values)
 
-        if not self.csv_file_path or self.csv_file_path == "Path to file" or not Path(self.csv_file_path).is_file():
-            msg = f"CSV file path is not set or file does not exist: '{self.csv_file_path}'."
-            raise ValueError(msg)
+    def create_pattern(self, pattern_name: str, voltages: np.ndarray, measure_mode: str) -> None:
+        """Create the pattern of the waveform with its measurement and range events."""
+        wgfmu.create_pattern(pattern_name, voltages[0])
+        wgfmu.add_vectors_numpy(
+            pattern_name,
+            time_values=self.time_increments_s[1:],
+            voltage_values=voltages[1:],
+        )
 
-        range_map = {
-            "1 uA": wgfmu.CurrentMeasurementRange.RANGE_1uA,
-            "10 uA": wgfmu.CurrentMeasurementRange.RANGE_10uA,
-            "100 uA": wgfmu.CurrentMeasurementRange.RANGE_100uA,
-            "1 mA": wgfmu.CurrentMeasurementRange.RANGE_1mA,
-            "10 mA": wgfmu.CurrentMeasurementRange.RANGE_10mA,
-        }
+        # Add measurement events
+        for number, measurement_event in enumerate(self.measure_events):
+            measure_start, points, interval, average = measurement_event
+            event_name = f"Event_{self.channel}_{number}"
+            wgfmu.set_measure_event(
+                pattern_name,
+                event=event_name,
+                start_time=measure_start,
+                points=points,
+                interval=interval,
+                average=average,
+                mode="average",
+            )
 
-        with open(self.csv_file_path, "r", encoding="utf-8") as fh:
-            number_of_header_lines = 0
-            section: str | None = None
-
-            while True:
-                next_line = fh.readline().strip()
-                number_of_header_lines += 1
-
-                if next_line.startswith("measure_start"):
-                    section = "measure"
-                    continue
-                if next_line.startswith("range_start"):
-                    section = "range"
-                    continue
-                if next_line.startswith("time in s"):
-                    break
+        # Range events are only valid in current measurement mode. Without them the WGFMU stays on its default (least
+        # sensitive) current range
+        if measure_mode == "Current":
+            for number, (start_time, range_enum) in enumerate(self.range_events):
+                wgfmu.set_range_event(
+                    pattern_name,
+                    event=f"Range_{self.channel}_{number}",
+                    start_time=start_time,
+                    range=range_enum,
+                )
 
-                if section == "range":
-                    start_str, range_str = next_line.split(";")
-                    range_str = range_str.strip()
-                    if range_str not in range_map:
-                        msg = f"Unknown current range '{range_str}'. Valid: {list(range_map)}."
-                        raise ValueError(msg)
-                    self.range_events.append((float(start_str), range_map[range_str]))
-                else:  # default to measure-events section for backwards compatibility
-                    parts = [p.strip() for p in next_line.split(";")]
-                    if len(parts) < 3:
-                        msg = f"Measure-event row needs at least 3 columns, got: '{next_line}'."
-                        raise ValueError(msg)
-                    measure_start, points, interval = parts[0], parts[1], parts[2]
-                    average = parts[3] if len(parts) >= 4 and parts[3] else "0"
-                    self.measure_events.append(
-                        (float(measure_start), int(points), float(interval), float(average)),
-                    )
-
-        data = np.genfromtxt(self.csv_file_path, delimiter=";", skip_header=number_of_header_lines)
-        self.time_increments_s = data[:, 0]
-        self.voltages = data[:, 1]
-
-        if len(self.time_increments_s) == 0 or len(self.voltages) == 0:
-            msg = "No time increments or voltage values found in the CSV file."
-            raise ValueError(msg)
+    def read_csv(self) -> None:
+        """Read the csv file and extract measurement events, range events, time stamps and voltage values.
 
-        if len(self.time_increments_s) != len(self.voltages):
-            msg = f"Number of time increments ({len(self.time_increments_s)}) does not match number of voltage values ({len(self.voltages)})."
+        The file format is described in pywgfmu/sequence_file.py. The parsed file is cached until it is modified, so
+        that repeated configure calls do not parse it again.
+        """
+        if not self.csv_file_path or self.csv_file_path == "Path to file" or not Path(self.csv_file_path).is_file():
+            msg = f"CSV file path is not set or file does not exist: '{self.csv_file_path}'."
             raise ValueError(msg)
 
+        self.sequence = sequence_file.load_sequence_file(self.csv_file_path)
+        self.measure_events = self.sequence.measure_events
+        self.range_events = self.sequence.range_events
+        self.time_increments_s = self.sequence.time_increments_s
+        self.voltages = self.sequence.voltages
+
     def calculate_repetitions(self) -> int:
         """Calculate the number of repetitions based on the end condition and end value."""
         if self.end_condition == "Repetitions":
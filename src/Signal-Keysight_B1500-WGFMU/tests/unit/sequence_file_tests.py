@@ -0,0 +1,100 @@
+"""Unit tests for reading sequence files without the WGFMU library."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+# add libraries folder to sys.path to enable import of pywgfmu
+libs_folder = Path(__file__).resolve().parents[2] / "libraries" / "libs_common"
+if str(libs_folder) not in sys.path:
+    sys.path.insert(0, str(libs_folder))
+
+from pywgfmu import sequence_file  # noqa: E402
+from pywgfmu.wgfmu import CurrentMeasurementRange  # noqa: E402
+
+example_file = Path(__file__).resolve().parents[2] / "examples" / "example_sequence.csv"
+
+
+class SequenceFileTests(unittest.TestCase):
+    """Tests for parsing and caching sequence files."""
+
+    def setUp(self) -> None:
+        self.folder = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.folder.name, "sequence.csv")
+
+    def tearDown(self) -> None:
+        sequence_file._cache.clear()
+        self.folder.cleanup()
+
+    def write(self, text: str) -> None:
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write(text)
+
+    def test_example_file(self) -> None:
+        """All sections of the example file are read."""
+        sequence = sequence_file.read_sequence_file(str(example_file))
+
+        self.assertEqual(sequence.measure_events, [(0.001, 10, 1e-05, 0.0), (0.002, 2, 1e-05, 0.0)])
+        self.assertEqual(sequence.range_events, [(0.0, CurrentMeasurementRange.RANGE_1uA)])
+        np.testing.assert_array_equal(sequence.time_increments_s, [0.0, 0.001, 0.001, 0.001])
+        np.testing.assert_array_equal(sequence.voltages, [0.0, 1.0, 1.0, 0.0])
+
+    def test_optional_sections_and_trailing_delimiters(self) -> None:
+        """Files without averaging column and range section and with trailing delimiters can be read."""
+        self.write("measure_start;points;interval in s;\n0.001;10;0.00001\ntime in s;voltage in V;\n0;0;\n0.5;-1;\n")
+
+        sequence = sequence_file.read_sequence_file(self.path)
+
+        self.assertEqual(sequence.measure_events, [(0.001, 10, 1e-05, 0.0)])
+        self.assertEqual(sequence.range_events, [])
+        np.testing.assert_array_equal(sequence.voltages, [0.0, -1.0])
+
+    def test_missing_waveform_section(self) -> None:
+        """A file without waveform section raises an error."""
+        self.write("measure_start;points;interval in s;\n0.001;10;0.00001\n")
+
+        with self.assertRaises(ValueError):
+            sequence_file.read_sequence_file(self.path)
+
+    def test_unknown_range(self) -> None:
+        """An unknown current range raises an error."""
+        self.write("range_start;current_range\n0;2 uA\ntime in s;voltage in V\n0;0\n")
+
+        with self.assertRaises(ValueError):
+            sequence_file.read_sequence_file(self.path)
+
+    def test_cache_is_updated_when_file_changes(self) -> None:
+        """The same sequence is returned until the file is modified."""
+        self.write("time in s;voltage in V\n0;0\n0.001;1\n")
+        sequence = sequence_file.load_sequence_file(self.path)
+        self.assertIs(sequence_file.load_sequence_file(self.path), sequence)
+
+        self.write("time in s;voltage in V\n0;0\n0.001;1\n0.001;2\n")
+        os.utime(self.path, ns=(0, os.stat(self.path).st_mtime_ns + 10**9))
+
+        changed = sequence_file.load_sequence_file(self.path)
+        self.assertIsNot(changed, sequence)
+        self.assertEqual(len(changed.voltages), 3)
+        self.assertNotEqual(changed.identity, sequence.identity)
+
+    def test_scaled_voltages_are_cached_and_read_only(self) -> None:
+        """Scaling does not modify the voltages of the file and the scaled voltages are reused."""
+        self.write("time in s;voltage in V\n0;0\n0.001;-2\n0.001;1\n")
+        sequence = sequence_file.load_sequence_file(self.path)
+
+        scaled = sequence.get_voltages(1.0)
+
+        np.testing.assert_array_equal(scaled, [0.0, -1.0, 0.5])
+        np.testing.assert_array_equal(sequence.voltages, [0.0, -2.0, 1.0])
+        self.assertIs(sequence.get_voltages(1.0), scaled)
+        self.assertIs(sequence.get_voltages(), sequence.voltages)
+        with self.assertRaises(ValueError):
+            sequence.voltages[0] = 1.0
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,10 +2,12 @@
 from pathlib import Path
 import ctypes
 
+import numpy as np
+
 # add libs folder to sys.path to enable import of pywgfmu
 import sys
 here = Path(__file__).resolve().parent
-libs_folder = here.parent.parent / "libs"
+libs_folder = here.parent.parent / "libraries" / "libs_common"
 if str(libs_folder) not in sys.path:
     sys.path.insert(0, str(libs_folder))
 
@@ -99,5 +101,170 @@ def test_get_pattern_force_values(self) -> None:
         self.assertEqual(times, expected_time_stamps)
 
 
+class StubDLL:
+    """Implements the WGFMU DLL functions used for bulk data in Python, so that no instrument library is needed.
+
+    Patterns store the incremental times and voltages passed to WGFMU_addVectors. The measured values of a channel
+    are the time stamps 1e-6 * index and the values 0.5 * index.
+    """
+
+    def __init__(self) -> None:
+        self.patterns: dict[bytes, list[np.ndarray]] = {}
+        self.number_of_points = 1000
+        self.completed_points = 1000
+        self.calls: list[tuple[int, int]] = []
+
+    def WGFMU_getMeasureValueSize(self, c_channel, completed_reference, total_reference) -> int:
+        completed_reference._obj.value = self.completed_points
+        total_reference._obj.value = self.number_of_points
+        return 0
+
+    def WGFMU_addVectors(self, pattern, time_pointer, voltage_pointer, c_count) -> int:
+        count = c_count.value
+        times = np.ctypeslib.as_array(time_pointer, shape=(count,)).copy()
+        voltages = np.ctypeslib.as_array(voltage_pointer, shape=(count,)).copy()
+        self.patterns[pattern.value] = [times, voltages]
+        return 0
+
+    def WGFMU_getMeasureValues(self, c_channel, c_start_index, count_reference, time_pointer, value_pointer) -> int:
+        c_count = count_reference._obj
+        start = c_start_index.value
+        self.calls.append((start, c_count.value))
+        count = max(min(c_count.value, self.completed_points - start), 0)
+        c_count.value = count
+
+        times = np.ctypeslib.as_array(time_pointer, shape=(count,))
+        values = np.ctypeslib.as_array(value_pointer, shape=(count,))
+        times[:] = 1e-6 * np.arange(start, start + count)
+        values[:] = 0.5 * np.arange(start, start + count)
+        return 0
+
+
+class StubDLLTestCase(unittest.TestCase):
+    """Base class for tests that replace the WGFMU DLL with a StubDLL."""
+
+    def setUp(self) -> None:
+        self.dll = StubDLL()
+        self.previous_dll = getattr(wgfmu, "_dll", None)
+        wgfmu._dll = self.dll
+
+    def tearDown(self) -> None:
+        wgfmu._dll = self.previous_dll
+
+
+class WGFMUNumpyTests(StubDLLTestCase):
+    """Tests for the numpy variants of the bulk data functions with a stub DLL."""
+
+    def test_add_vectors_numpy_passes_array_data(self) -> None:
+        """The DLL receives the values of the arrays, also for slices and integer arrays."""
+        time_values = np.full(5, 1e-3)
+        voltages = np.arange(10.0)[::2]  # not contiguous, is converted
+
+        wgfmu.add_vectors_numpy("pattern", time_values, voltages)
+
+        times, values = self.dll.patterns[b"pattern"]
+        np.testing.assert_array_equal(times, time_values)
+        np.testing.assert_array_equal(values, [0.0, 2.0, 4.0, 6.0, 8.0])
+
+    def test_add_vectors_numpy_does_not_copy_contiguous_arrays(self) -> None:
+        """C-contiguous float64 arrays are used as buffers directly."""
+        time_values = np.full(3, 1e-3)
+        self.assertIs(wgfmu.as_double_buffer(time_values), time_values)
+
+    def test_add_vectors_numpy_validates(self) -> None:
+        """Different lengths and time values out of range raise an error."""
+        with self.assertRaises(ValueError):
+            wgfmu.add_vectors_numpy("pattern", np.full(3, 1e-3), np.zeros(2))
+
+        with self.assertRaises(ValueError):
+            wgfmu.add_vectors_numpy("pattern", np.array([1e-3, 1e-9]), np.zeros(2))
+
+    def test_get_measure_values_numpy(self) -> None:
+        """The values are returned as float64 arrays."""
+        times, values = wgfmu.get_measure_values_numpy(101, 10, 5)
+
+        self.assertEqual(times.dtype, np.float64)
+        np.testing.assert_allclose(times, 1e-6 * np.arange(10, 15))
+        np.testing.assert_array_equal(values, 0.5 * np.arange(10, 15))
+
+    def test_get_measure_values_numpy_writes_into_given_arrays(self) -> None:
+        """The DLL writes into the given arrays and views of them are returned."""
+        times = np.zeros(100)
+        values = np.zeros(100)
+
+        returned_times, returned_values = wgfmu.get_measure_values_numpy(101, 0, 20, times[50:], values[50:])
+
+        self.assertTrue(np.shares_memory(returned_times, times))
+        np.testing.assert_array_equal(values[50:70], 0.5 * np.arange(20))
+        np.testing.assert_array_equal(returned_values, values[50:70])
+        self.assertFalse(np.any(values[70:]))
+
+    def test_get_measure_values_numpy_returns_points_read(self) -> None:
+        """Only the number of points reported by the DLL is returned."""
+        times, values = wgfmu.get_measure_values_numpy(101, 990, 20)
+
+        self.assertEqual(len(times), 10)
+        self.assertEqual(len(values), 10)
+
+    def test_get_measure_values_numpy_validates_arrays(self) -> None:
+        """Arrays that are too short or have another data type raise an error."""
+        with self.assertRaises(ValueError):
+            wgfmu.get_measure_values_numpy(101, 0, 20, np.zeros(10), np.zeros(10))
+
+        with self.assertRaises(ValueError):
+            wgfmu.get_measure_values_numpy(101, 0, 20, np.zeros(20, dtype=np.float32), np.zeros(20))
+
+    def test_get_measure_values_returns_lists(self) -> None:
+        """The list variant returns the same values as lists."""
+        times, values = wgfmu.get_measure_values(101, 0, 3)
+
+        self.assertIsInstance(times, list)
+        self.assertEqual(values, [0.0, 0.5, 1.0])
+
+
+class MeasureValueReaderTests(StubDLLTestCase):
+    """Tests for reading the measurement data in chunks during a run with a stub DLL."""
+
+    def test_reads_new_points_in_chunks(self) -> None:
+        """Each call reads only the points completed since the last call, at most chunk_size per DLL call."""
+        reader = wgfmu.MeasureValueReader(101, chunk_size=150)
+
+        self.dll.completed_points = 400
+        self.assertEqual(reader.read_available(), 400)
+        self.assertEqual(self.dll.calls, [(0, 150), (150, 150), (300, 100)])
+
+        self.dll.calls.clear()
+        self.dll.completed_points = 1000
+        self.assertEqual(reader.read_available(), 600)
+        self.assertEqual(self.dll.calls[0], (400, 150))
+        self.assertEqual(reader.read_available(), 0)
+
+        np.testing.assert_allclose(reader.times, 1e-6 * np.arange(1000))
+        np.testing.assert_array_equal(reader.values, 0.5 * np.arange(1000))
+
+    def test_arrays_are_preallocated(self) -> None:
+        """The arrays are allocated for the total number of points and are not copied while reading."""
+        reader = wgfmu.MeasureValueReader(101, chunk_size=100)
+
+        self.dll.completed_points = 100
+        reader.read_available()
+        times = reader.times
+        self.dll.completed_points = 1000
+        reader.read_available()
+
+        self.assertTrue(np.shares_memory(times, reader.times))
+
+    def test_arrays_grow_with_total_points(self) -> None:
+        """If the DLL reports more points than before, the points read so far are kept."""
+        reader = wgfmu.MeasureValueReader(101)
+        reader.read_available()
+
+        self.dll.number_of_points = self.dll.completed_points = 3000
+        self.assertEqual(reader.read_available(), 2000)
+
+        self.assertEqual(reader.number_of_points, 3000)
+        np.testing.assert_array_equal(reader.values, 0.5 * np.arange(3000))
+
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
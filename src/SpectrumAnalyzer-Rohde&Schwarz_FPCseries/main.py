@@ -37,6 +37,11 @@
 import pyvisa.errors
 from pysweepme import debug
 from pysweepme.EmptyDeviceClass import EmptyDevice
+from pysweepme.FolderManager import addFolderToPATH
+
+addFolderToPATH()
+
+from binary_block import read_binary_block
 
 
 class Device(EmptyDevice):
@@ -267,7 +272,7 @@ def read_result(self) -> None:
         # There are three options to retrieve trace data
         # Option 1 works, but uses slow ASCII data format
         # Option 2 would be best option, but there are still problems with reading the bytes correctly.
-        # Option 3 works with binary data format, but uses pyisa function instead of functions from PortManager
+        # Option 3 works with binary data format and reads the block in chunks into a single buffer
 
         # Option 1: works!
         # self.port.write("FORMAT:DATA ASCII")  # data format, binary
@@ -290,9 +295,9 @@ def read_result(self) -> None:
         # print(answer)
         # results = np.array(struct.unpack("f", answer))
 
-        # Option 3: works!
-        results = self.port.port.query_binary_values(cmd, datatype="f", container=np.ndarray)
-        self.power_values = results
+        # Option 3: works! Data format REAL,32 is little-endian by default.
+        self.port.write(cmd)
+        self.power_values = read_binary_block(self.port.port, "<f4")
 
         points = len(self.power_values)
 
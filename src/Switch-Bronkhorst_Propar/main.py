@@ -56,6 +56,15 @@ class Device(EmptyDevice):
                      the corresponding address your controller unit has.</li>
                     <li>The baudrate is only used for communication via RS-232. Otherwise, the default value is used.
                     </li>
+                    <li>All measured values of a controller are read with a single chained propar message.</li>
+                    </ul>
+                    <p><strong>Further FLOW-BUS nodes:</strong></p>
+                    <ul>
+                    <li>Further controllers at the same FLOW-BUS port can be read out by entering their addresses
+                     separated by commas, e.g. '4, 5, 6'.</li>
+                    <li>Each node returns flow in %, temperature, density, and the optional values selected for the
+                     main controller.</li>
+                    <li>The setpoint is only applied to the controller selected with 'Address'.</li>
                     </ul>
                     <p><strong>Custom unit:</strong></p>
                     <ul>
@@ -100,6 +109,10 @@ def __init__(self) -> None:
 
         self.flow_controller: propar.instrument | None = None
 
+        self.node_addresses: list[int] = []
+        """FLOW-BUS addresses of further nodes at the same port that are read out together with the flow controller."""
+        self.nodes: list[propar.instrument] = []
+
         # Measurement Parameters
         self.sweepmode: str = "Flow in %"
 
@@ -117,6 +130,7 @@ def __init__(self) -> None:
         self.fluid_name: str = ""
         self.measure_valve_output: bool = False
         self.valve_output: float = 0.0
+        self.node_results: list = []
 
     def update_gui_parameters(self, parameters: dict[str, Any]) -> dict[str, Any]:
         """Determine the new GUI parameters of the driver depending on the current parameters."""
@@ -128,6 +142,8 @@ def update_gui_parameters(self, parameters: dict[str, Any]) -> dict[str, Any]:
 
         if parameters.get("Address", "RS232") == "RS232":
             new_parameters["Baudrate"] = ["38400", "115200"]
+        else:
+            new_parameters["Further FLOW-BUS addresses"] = ""
 
         new_parameters.update({
             "": None,  # empty line
@@ -147,6 +163,12 @@ def apply_gui_parameters(self, parameters: dict[str, Any]) -> None:
         self.address = parameters.get("Address", "RS232")
         self.baudrate = parameters.get("Baudrate", "38400")
 
+        self.node_addresses = []
+        if self.address.startswith("FLOW-BUS"):
+            node_addresses = parameters.get("Further FLOW-BUS addresses", "")
+            self.node_addresses = [int(address) for address in node_addresses.replace(";", ",").split(",")
+                                   if address.strip() != ""]
+
         self.custom_unit = parameters.get("Custom unit (c.u.)", "")
         self.use_custom_unit = self.custom_unit != ""
         self.conversion_factor = parameters.get("Flow in c.u. at 100%", "1.0")
@@ -177,6 +199,20 @@ def apply_gui_parameters(self, parameters: dict[str, Any]) -> None:
             self.measure_valve_output = True
             self.add_return_variable("Valve output", "%", plottype = True, savetype = True)
 
+        for address in self.node_addresses:
+            self.add_return_variable(f"Flow node {address}", "%", plottype = True, savetype = True)
+            self.add_return_variable(f"Temperature node {address}", "°C", plottype = True, savetype = True)
+            self.add_return_variable(f"Density node {address}", "g/l", plottype = True, savetype = True)
+
+            if self.measure_capacity:
+                self.add_return_variable(f"Capacity node {address}", "ln/min", plottype = True, savetype = True)
+
+            if self.measure_fluid_name:
+                self.add_return_variable(f"Fluid name node {address}", "", plottype = False, savetype = True)
+
+            if self.measure_valve_output:
+                self.add_return_variable(f"Valve output node {address}", "%", plottype = True, savetype = True)
+
     def add_return_variable(self, name: str, unit: str = "", plottype: bool = True, savetype: bool = True) -> None:
         """Add a return variable to the device class."""
         self.variables.append(name)
@@ -198,6 +234,9 @@ def connect(self) -> None:
             address_number = int(self.address.split()[-1])
             self.flow_controller = propar.instrument(self.port_string, address = address_number)
 
+        # Instruments at the same port share the propar master and thus the serial connection
+        self.nodes = [propar.instrument(self.port_string, address = address) for address in self.node_addresses]
+
         # Can be used to find nodes
         # self.flow_controller.get_nodes()
 
@@ -253,18 +292,23 @@ def request_result(self) -> None:
         It means that one needs to check whether the controller has a pressure sensor first or whether the value is
         returned with status Ok
         """
-        self.flow_rate = self.get_measured_flow_rate()
-        self.temperature = self.get_temperature()
-        self.density = self.get_density()
+        values = self.read_measured_values(self.flow_controller)
+        self.flow_rate, self.temperature, self.density = values[:3]
 
+        values = iter(values[3:])
         if self.measure_capacity:
-            self.capacity = self.get_capacity()
+            self.capacity = next(values)
 
         if self.measure_fluid_name:
-            self.fluid_name = self.get_fluid_name()
+            self.fluid_name = next(values)
 
         if self.measure_valve_output:
-            self.valve_output = self.get_valve_output()
+            self.valve_output = next(values)
+
+        # Further nodes are polled one after another with one message each in the same pass
+        self.node_results = []
+        for node in self.nodes:
+            self.node_results.extend(self.read_measured_values(node))
 
     def call(self) -> list:
         """Return the measurement results. Must return as many values as defined in self.variables."""
@@ -290,6 +334,8 @@ def call(self) -> list:
         if self.measure_valve_output:
             results.append(self.valve_output)
 
+        results.extend(self.node_results)
+
         return results
 
     # Device specific functions
@@ -343,6 +389,59 @@ def get_parameter(self, *args) -> str:
 
         return values[0]["data"]
 
+    def read_parameters(self, indices: list[int], instrument: propar.instrument | None = None) -> list:
+        """Read several parameters indicated by their dde_nr indices with a single chained propar message.
+
+        All parameters of a propar message must belong to the same node. Thus, the parameters of several nodes are read
+        with one message per node.
+
+        Args:
+            indices: dde_nr indices of the parameters.
+            instrument: Propar instrument of the node. Defaults to the flow controller.
+
+        Returns:
+            List of the parameter values in the order of the indices.
+        """
+        if instrument is None:
+            instrument = self.flow_controller
+
+        params = [self.database.get_parameter(index) for index in indices]
+        values = instrument.read_parameters(params)
+
+        # In case of a timeout or an error of the whole message, a single item with the status is returned
+        if len(values) != len(params):
+            msg = (f"Bronkhorst: Reading parameters {indices} of node {instrument.address} failed with status "
+                   f"{values[0]['status']}.")
+            raise Exception(msg)
+
+        return [value["data"] for value in values]
+
+    def read_measured_values(self, instrument: propar.instrument) -> list:
+        """Read flow rate, temperature, density and the selected optional values of a node with a single message.
+
+        Returns:
+            List of flow rate in %, temperature, density, and capacity, fluid name and valve output if selected.
+        """
+        indices = [8, 142, 170]
+        if self.measure_capacity:
+            indices.append(21)
+        if self.measure_fluid_name:
+            indices.append(25)
+        if self.measure_valve_output:
+            indices.append(55)
+
+        values = dict(zip(indices, self.read_parameters(indices, instrument)))
+
+        results = [self.convert_flow_rate(values[8]), values[142], values[170]]
+        if self.measure_capacity:
+            results.append(self.convert_capacity(values[21]))
+        if self.measure_fluid_name:
+            results.append(values[25])
+        if self.measure_valve_output:
+            results.append(self.convert_valve_output(values[55]))
+
+        return results
+
     def set_parameter(self, index: int | float | str, value) -> None:
         """Convenience function to set the value of a parameter indicated by the dde_nr index."""
         if isinstance(index, (int, float)):
@@ -369,7 +468,7 @@ def get_identification(self) -> str:
     def get_flow_rate_setpoint(self) -> float:
         """Get the setpoint flowrate in %."""
         value = self.get_parameter(9)
-        return float(value)/32000 * 100.0  # conversion to %
+        return self.convert_flow_rate(value)
 
     def set_flow_rate(self, rate: float) -> None:
         """Set the setpoint flow rate in %."""
@@ -381,7 +480,12 @@ def set_flow_rate(self, rate: float) -> None:
     def get_measured_flow_rate(self) -> float:
         """Get the measured flow rate in %."""
         value = self.get_parameter(8)
-        return float(value)/32000 * 100.0  # conversion to %
+        return self.convert_flow_rate(value)
+
+    @staticmethod
+    def convert_flow_rate(value: int) -> float:
+        """Convert a flow rate or setpoint in the range 0..32000 to %."""
+        return float(value)/32000 * 100.0
 
     def get_temperature(self) -> str:
         """Returns the temperature of the sensor in °C."""
@@ -398,6 +502,11 @@ def set_density(self, density: float) -> str:
     def get_capacity(self) -> float:
         """Get the readout value at 100% in capacity (readout) unit."""
         value = self.get_parameter(21)
+        return self.convert_capacity(value)
+
+    @staticmethod
+    def convert_capacity(value: float) -> float:
+        """Convert the capacity value to float, returns -1 if the value cannot be converted."""
         try:
             value = float(value)
         except:
@@ -417,8 +526,13 @@ def get_fluid_name(self) -> str:
 
     def get_valve_output(self) -> float:
         """Get the valve output signal in % ."""
-        # Value is given as 24-bit number in range 0..14.3Vdc/0..23.3Vdc
         value = self.get_parameter(55)
+        return self.convert_valve_output(value)
+
+    @staticmethod
+    def convert_valve_output(value: int) -> float:
+        """Convert the valve output signal to %, returns -1 if the value cannot be converted."""
+        # Value is given as 24-bit number in range 0..14.3Vdc/0..23.3Vdc
         try:
             value = float(value) / 2**24 * 100  # conversion to %
         except:
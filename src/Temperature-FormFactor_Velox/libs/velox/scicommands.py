@@ -0,0 +1,1457 @@
+# MIT License
+#
+# Copyright 2025 FormFactor GmbH
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this software 
+# and associated documentation files (the “Software”), to deal in the Software without 
+# restriction, including without limitation the rights to use, copy, modify, merge, publish, 
+# distribute, sublicense, and/or sell copies of the Software, and to permit persons to whom the 
+# Software is furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all copies or 
+# substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED “AS IS”, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR 
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, 
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL 
+# THE AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR 
+# OTHER LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, 
+# ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR 
+# OTHER DEALINGS IN THE SOFTWARE.
+
+"""
+Velox SCI Command Table
+This module provides the function interface to the FormFactor Velox software suite
+as a table of 677 SCI commands, generated from the SCI module of 2025-02-12.
+
+Each entry holds the parameters and the response fields as "Name:type" lists
+and the command description. The function for a command is created from its
+entry on first access, e.g. velox.ReadMapPosition2, instead of defining all
+functions when the module is imported.
+
+The response is converted to the types of the response fields. A str field at
+the end of the response takes all remaining values joined by spaces. Responses
+with more than one field are returned as the namedtuple <Command>_Response.
+"""
+from collections import namedtuple
+from decimal import Decimal
+
+from velox.vxmessageserver import MessageServerInterface
+
+FIELD_TYPES = {"int": int, "Decimal": Decimal, "str": str}
+
+
+def _parseFields(fieldString):
+    """ Split a "Name:type,Name:type" string into a list of (name, type) tuples """
+    if not fieldString:
+        return []
+    return [tuple(field.split(':')) for field in fieldString.split(',')]
+
+
+def _createResponseParser(commandName, responseFields):
+    """ Return a function that converts the list of response values to the types of the response fields """
+    if not responseFields:
+        return lambda rsp: None
+
+    names = [name for name, _ in responseFields]
+    types = [FIELD_TYPES[fieldType] for _, fieldType in responseFields]
+    lastIndex = len(types) - 1
+    joinLast = types[-1] is str
+
+    def convert(rsp):
+        values = [types[i](rsp[i]) for i in range(lastIndex if joinLast else lastIndex + 1)]
+        if joinLast:
+            values.append("" if len(rsp) < lastIndex + 1 else ' '.join(rsp[lastIndex:]))
+        return values
+
+    if len(names) == 1:
+        return lambda rsp: convert(rsp)[0]
+
+    responseType = namedtuple(commandName + "_Response", ",".join(names))
+    return lambda rsp: responseType(*convert(rsp))
+
+
+def createSciCommand(commandName):
+    """ Create the function for the SCI command with the given name from the command table.
+        Raises KeyError if the command is unknown. """
+    parameterString, responseString, description = SCI_COMMANDS[commandName]
+    parameterFields = _parseFields(parameterString)
+
+    # All parameters are optional. Parameters that are not given are sent as empty strings, so Velox uses its default.
+    parameters = ', '.join('{}:{}=""'.format(name, fieldType) for name, fieldType in parameterFields)
+    arguments = ''.join(', ' + name for name, _ in parameterFields)
+    source = (
+        'def {0}({1}):\n'
+        '    return parseResponse(MessageServerInterface.sendSciCommand("{0}"{2}))\n'
+    ).format(commandName, parameters, arguments)
+
+    namespace = {
+        'MessageServerInterface': MessageServerInterface,
+        'parseResponse': _createResponseParser(commandName, _parseFields(responseString)),
+        'Decimal': Decimal,
+    }
+    exec(source, namespace)
+    sciCommand = namespace[commandName]
+    sciCommand.__module__ = 'velox'
+    sciCommand.__doc__ = description
+    return sciCommand
+
+
+# Command name: (parameters, response fields, description)
+SCI_COMMANDS = {
+    'EchoData': ('TestCmd:str', 'TestRsp:str',
+        'Test Command for the Kernel Communication. Like a ping command, the given text\nstring is returned unchanged.\nStatus: published\n----------\nParameters:\n    TestCmd:str = "Test"\n----------\nResponse:\n    TestRsp:str\n----------\nCommand Timeout: 5000\nExample:EchoData Test'),
+    'ReportKernelVersion': ('Module:str', 'Version:Decimal,Description:str',
+        'Returns the version information of the Kernel. The "Version" value contains\nversion number and revision level of the actual Kernel implementation. The text\nstring contains a code description, version number and the revision date.\nStatus: published\n----------\nParameters:\n    Module:str = "K"\n----------\nResponse:\n    Version:Decimal\n    Description:str\n----------\nCommand Timeout: 5000\nExample:ReportKernelVersion K'),
+    'ReadProberStatus': ('', 'FlagsBusy:int,FlagsContact:int,Mode:str,IsQuiet:int',
+        'Returns an actual status information of the Probe Station.\nStatus: published\n----------\nResponse:\n    FlagsBusy:int\n    FlagsContact:int\n    Mode:str\n    IsQuiet:int\n----------\nCommand Timeout: 5000\nExample:ReadProberStatus'),
+    'EnableMotorQuiet': ('WantQuietModeOn:int,Stage:str', '',
+        'Toggles the motor power for quiet probing. In most applications this feature is\nnot required. However, for special measurements it may be necessary to reduce\nthe noise of the system. Quiet on turns off the motor power for all stages (or\nthe one specified with the optional parameter). Quiet off will turn on the motor\npower of all stages (or the one specified with the optional parameter) for\nsubsequent movements. A move command will also turn on the motor power of the\nmoved stage automatically. For automatically switching of the quiet mode refer\nto Auto Quiet functionality.  Sending \'EnableMotorQuiet 1\' will enable the quiet\nmode for all stages. Sending \'EnableMotorQuiet 1 C\' will only enable the quiet\nmode for the Chuck stage. Sending \'EnableMotorQuiet 1 1\' will only enable the\nquiet mode for the Positioner1 stage. Sending \'EnableMotorQuiet 0 S\' will only\ndisable the quiet mode for the Scope stage.\nStatus: published\n----------\nParameters:\n    WantQuietModeOn:int = 0\n    Stage:str = "None"\n----------\nCommand Timeout: 10000\nExample:EnableMotorQuiet 1'),
+    'SetChuckVacuum': ('WantChuckVacuumOn:int', '',
+        'Toggles the Chuck vacuum on (1) or off (0). Can return vacuum timeout error for\nstations with wafer vacuum sensors in case no wafer was detected.\nStatus: published\n----------\nParameters:\n    WantChuckVacuumOn:int = 0\n----------\nCommand Timeout: 10000\nExample:SetChuckVacuum 1'),
+    'SetMicroLight': ('WantIlluminatorOn:int', '',
+        'Toggles the microscope light channel of the peripheral output board and all\ncameras. Notifications: 7\nStatus: published\n----------\nParameters:\n    WantIlluminatorOn:int = 2\n----------\nCommand Timeout: 5000\nExample:SetMicroLight 1'),
+    'SetBeaconStatus': ('FlagsMode:int,PulseWidthRed:int,PulseWidthGreen:int,PulseWidthYellow:int,PulseWidthBlue:int,PulseWidthWhite:int', '',
+        'This command controls the beacon channel of the peripheral output board. All\nlights can be switched on, off, or blinking. Setting an interval to zero means,\nthat the corresponding light will be statically on or off. The minimum blinking\ninterval is 50ms.\nStatus: published\n----------\nParameters:\n    FlagsMode:int = 0\n    PulseWidthRed:int = 1000\n    PulseWidthGreen:int = 0\n    PulseWidthYellow:int = 0\n    PulseWidthBlue:int = 0\n    PulseWidthWhite:int = 0\n----------\nCommand Timeout: 5000\nExample:SetBeaconStatus 1 1000'),
+    'SetOutput': ('Channel:int,WantOutputOn:int,PulseTime:int', '',
+        'Controls the Velox output channel signals. It can be used to activate/deactivate\noutputs.\nStatus: published\n----------\nParameters:\n    Channel:int = 1\n    WantOutputOn:int = 0\n    PulseTime:int = -1\n----------\nCommand Timeout: 5000\nExample:SetOutput 4 0'),
+    'StopAllMovements': ('', '',
+        'Stops all Probe Station movements immediately. The response status value of any\npending movement will signify that the stop command was executed.\nStatus: published\n----------\nCommand Timeout: 5000\nExample:StopAllMovements'),
+    'InkDevice': ('FlagsInker:int,PulseWidth:int', '',
+        'Inks the current device under test. The range of PulseWidth is 20ms to 2000ms.\nFor correct function, the inkers have to be linked to default outputs.\nStatus: published\n----------\nParameters:\n    FlagsInker:int = 0\n    PulseWidth:int = 50\n----------\nCommand Timeout: 10000\nExample:InkDevice 1 40'),
+    'ReadProbeSetup': ('', 'TypePositioner1:int,TypePositioner2:int,TypePositioner3:int,TypePositioner4:int,TypePositioner5:int,AxisPositioner1:int,AxisPositioner2:int,AxisPositioner3:int,AxisPositioner4:int,AxisPositioner5:int,TypePositioner6:int,AxisPositioner6:int',
+        'Returns the current Positioner configuration.  The output pattern is:  1. Type\nPositioner 1 2. Type Positioner 2 3. Type Positioner 3 4. Type Positioner 4 5.\nType Positioner 5 6. Axis Positioner 1 (Bit 0: XY, Bit 1: Z) 7. Axis Positioner\n2 (Bit 0: XY, Bit 1: Z) 8. Axis Positioner 3 (Bit 0: XY, Bit 1: Z) 9. Axis\nPositioner 4 (Bit 0: XY, Bit 1: Z) 10. Axis Positioner 5 (Bit 0: XY, Bit 1: Z)\n11. Type Positioner 6 12. Axis Positioner 6 (Bit 0: XY, Bit 1: Z)\nStatus: published\n----------\nResponse:\n    TypePositioner1:int\n    TypePositioner2:int\n    TypePositioner3:int\n    TypePositioner4:int\n    TypePositioner5:int\n    AxisPositioner1:int\n    AxisPositioner2:int\n    AxisPositioner3:int\n    AxisPositioner4:int\n    AxisPositioner5:int\n    TypePositioner6:int\n    AxisPositioner6:int\n----------\nCommand Timeout: 5000\nExample:ReadProbeSetup'),
+    'ReadSystemStatus': ('', 'Name:str,System:str,ChuckXY:int,ChuckZ:int,ChuckTheta:int,ScopeXY:int,ScopeZ:int,EdgeSensor:int,OperationalMode:str,Turret:int,TemperatureChuck:int,AuxSiteCount:int,PlatenXY:int,PlatenZ:int,LoaderGateState:str,NucleusType:str',
+        'Returns the system options which are currently enabled at the Probe Station.\nStatus: published\n----------\nResponse:\n    Name:str\n    System:str\n    ChuckXY:int\n    ChuckZ:int\n    ChuckTheta:int\n    ScopeXY:int\n    ScopeZ:int\n    EdgeSensor:int\n    OperationalMode:str\n    Turret:int\n    TemperatureChuck:int\n    AuxSiteCount:int\n    PlatenXY:int\n    PlatenZ:int\n    LoaderGateState:str\n    NucleusType:str\n----------\nCommand Timeout: 10000\nExample:ReadSystemStatus'),
+    'SetExternalMode': ('Mode:str', '',
+        'If \'R\' is sent, it sets the external mode of the Kernel. This disables most of\nthe UI functions. Otherwise, this command re-enables all functions of the UI.\nStatus: published\n----------\nParameters:\n    Mode:str = "L"\n----------\nCommand Timeout: 5000\nExample:SetExternalMode L'),
+    'SetStageLock': ('Stage:str,WantStageLock:int,Application:str', '',
+        'Enables or disables the stage lock functionality. Stages which are locked can\'t\nbe moved in any way. If the joystick controller is locked, the display and the\nkeys are deactivated. The name of the application can be stored by using the\nApplication Name parameter and is shown in lock-caused error messages.\nStatus: published\n----------\nParameters:\n    Stage:str = "0"\n    WantStageLock:int = 1\n    Application:str = ""\n----------\nCommand Timeout: 10000\nExample:SetStageLock C 0 WaferMap'),
+    'ReadSensor': ('Channel:int,Type:str', 'IsSensorOn:int',
+        'Returns the actual status of the specified input channel, output channel or edge\nsensor. The signal table is described in the Hardware Manual. Each used IO-board\nhas 16 channels (max. 4 IO-boards are supported), what results in a domain of 64\nchannel numbers. Beyond this range there are pseudo channels, which are used for\nspecial purposes. Pseudo channels: 65 - Edge sensor one; 66 - Edge sensor two\nStatus: published\n----------\nParameters:\n    Channel:int = 1\n    Type:str = "Input"\n----------\nResponse:\n    IsSensorOn:int\n----------\nCommand Timeout: 10000\nExample:ReadSensor 11 I'),
+    'GetStageLock': ('Stage:str', 'Locks:int,Application:str',
+        'Reads whether stages or joystick controller are locked.\nStatus: published\n----------\nParameters:\n    Stage:str = "0"\n----------\nResponse:\n    Locks:int\n    Application:str\n----------\nCommand Timeout: 10000\nExample:GetStageLock C'),
+    'SetBackSideMode': ('WantBackSideMode:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command sets bottomside mode. In this mode the Z axis is reverse and the\ncommand MoveChuckLoad is not allowed.\nStatus: internal\n----------\nParameters:\n    WantBackSideMode:int = 0\n----------\nCommand Timeout: 5000\nExample:SetBackSideMode 1'),
+    'GetBackSideMode': ('', 'IsBackSideModeOn:int',
+        'Returns the current side mode.\nStatus: published\n----------\nResponse:\n    IsBackSideModeOn:int\n----------\nCommand Timeout: 5000\nExample:GetBackSideMode'),
+    'SetDarkMode': ('WantSetDarkMode:int', '',
+        'Switches off all LEDs on the station, on the Positioner and also the light of\nthe cameras.\nStatus: published\n----------\nParameters:\n    WantSetDarkMode:int = 0\n----------\nCommand Timeout: 5000\nExample:SetDarkMode 1'),
+    'GetDarkMode': ('', 'IsDarkMode:int',
+        'Returns the current mode of the light sources.\nStatus: published\n----------\nResponse:\n    IsDarkMode:int\n----------\nCommand Timeout: 5000\nExample:GetDarkMode'),
+    'DockChuckCamera': ('ConnectCamera:str,Velocity:Decimal', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nConnect or disconnect the Chuck camera to the Chuck stage. The command is only\navailable for the Prober type PA300BEP.\nStatus: internal\n----------\nParameters:\n    ConnectCamera:str = "ParkPos"\n    Velocity:Decimal = 100\n----------\nCommand Timeout: 300000\nExample:DockChuckCamera P 75'),
+    'ReadCBoxStage': ('', 'Stage:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the current selected stage of the joystick controller.\nStatus: internal\n----------\nResponse:\n    Stage:str\n----------\nCommand Timeout: 5000\nExample:ReadCBoxStage'),
+    'SetCBoxStage': ('Stage:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSets the current stage of the joystick controller.\nStatus: internal\n----------\nParameters:\n    Stage:str = "Chuck"\n----------\nCommand Timeout: 5000\nExample:SetCBoxStage C'),
+    'ReadCBoxPosMonConf': ('Stage:str', 'PosRef:str,Unit:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the current setting of the joystick controllers position monitor for the\nspecified stage.\nStatus: internal\n----------\nParameters:\n    Stage:str = "Chuck"\n----------\nResponse:\n    PosRef:str\n    Unit:str\n----------\nCommand Timeout: 5000\nExample:ReadCBoxPosMonConf C'),
+    'SetCBoxPosMonConf': ('Stage:str,PosRef:str,Unit:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nConfigures the joystick controller position monitor for the specified stage.\nStatus: internal\n----------\nParameters:\n    Stage:str = "Chuck"\n    PosRef:str = "Zero"\n    Unit:str = "Microns"\n----------\nCommand Timeout: 5000\nExample:SetCBoxPosMonConf C Z Y'),
+    'ReadCBoxCurrSpeed': ('Stage:str', 'CBoxSpeed:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the current speed of the joystick controller for the specified stage.\nStatus: internal\n----------\nParameters:\n    Stage:str = "Chuck"\n----------\nResponse:\n    CBoxSpeed:str\n----------\nCommand Timeout: 5000\nExample:ReadCBoxCurrSpeed C'),
+    'SetCBoxCurrSpeed': ('Stage:str,CBoxSpeed:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSets the current speed of the joystick controller for the specified stage.\nStatus: internal\n----------\nParameters:\n    Stage:str = "Chuck"\n    CBoxSpeed:str = "Speed4"\n----------\nCommand Timeout: 5000\nExample:SetCBoxCurrSpeed C 3'),
+    'MoveChuckAsync': ('XValue:Decimal,YValue:Decimal,PosRef:str,Unit:str,Velocity:Decimal,Comp:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nMoves the Chuck stage to the specified X,Y position without waiting for the move\nto be finished If Chuck Z is in Contact Height or higher, the Chuck will drop to\nseparation.\nStatus: internal\n----------\nParameters:\n    XValue:Decimal = 0\n    YValue:Decimal = 0\n    PosRef:str = "Home"\n    Unit:str = "Microns"\n    Velocity:Decimal = 100\n    Comp:str = "Technology"\n----------\nCommand Timeout: 5000\nExample:MoveChuckAsync 5000. 5000. R Y 100'),
+    'MoveScopeAsync': ('XValue:Decimal,YValue:Decimal,PosRef:str,Unit:str,Velocity:Decimal,Comp:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nMoves the Scope stage to the specified X,Y position without waiting for the move\nto be finished.\nStatus: internal\n----------\nParameters:\n    XValue:Decimal = 0\n    YValue:Decimal = 0\n    PosRef:str = "Home"\n    Unit:str = "Microns"\n    Velocity:Decimal = 100\n    Comp:str = "Technology"\n----------\nCommand Timeout: 5000\nExample:MoveScopeAsync 5000 5000 R Y 100'),
+    'MoveProbeAsync': ('Probe:int,XValue:Decimal,YValue:Decimal,PosRef:str,Unit:str,Velocity:Decimal,Comp:str', 'ProbeEcho:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nMoves the probe stage to the specified X,Y position without waiting for the move\nto be finished.\nStatus: internal\n----------\nParameters:\n    Probe:int = 1\n    XValue:Decimal = 0\n    YValue:Decimal = 0\n    PosRef:str = "Home"\n    Unit:str = "Microns"\n    Velocity:Decimal = 100\n    Comp:str = "Technology"\n----------\nResponse:\n    ProbeEcho:int\n----------\nCommand Timeout: 5000'),
+    'ReadChuckStatus': ('', 'FlagsInit:int,FlagsMode:int,FlagsLimit:int,FlagsMoving:int,Comp:str,IsVacuumOn:int,PresetHeight:str,LoadPos:str,IsLiftDown:int,CameraConnection:str,IsQuiet:int',
+        'Returns the current Chuck status. Every bit in the bit fields works like a\nboolean value: One &lt;1&gt; means true/on and zero &lt;0&gt; means false/off.\nIts counted from LSB to MSB.   - FlagsInit: X, Y, Z, Theta - FlagsMode:\nHasOvertravel, HasAutoZ, HasInterlock, ContactSearch, IsContactSet,\nEdgeInterlock, QuietContact, IsLocked - FlagsLimit: XHigh, XLow, YHigh, YLow,\nZHigh, ZLow, ThetaHigh, ThetaLow - FlagsMoving: X, Y, Z, Theta  All parameters\nare provided as indirect access (e.g. first bit of M_pvecFlagsInit can be\naccessed by M_pbIsInitX).\nStatus: published\n----------\nResponse:\n    FlagsInit:int\n    FlagsMode:int\n    FlagsLimit:int\n    FlagsMoving:int\n    Comp:str\n    IsVacuumOn:int\n    PresetHeight:str\n    LoadPos:str\n    IsLiftDown:int\n    CameraConnection:str\n    IsQuiet:int\n----------\nCommand Timeout: 5000\nExample:ReadChuckStatus'),
+    'ReadChuckPosition': ('Unit:str,PosRef:str,Comp:str', 'X:Decimal,Y:Decimal,Z:Decimal',
+        'Returns the current Chuck stage position in X, Y and Z.\nStatus: published\n----------\nParameters:\n    Unit:str = "Microns"\n    PosRef:str = "Home"\n    Comp:str = "Technology"\n----------\nResponse:\n    X:Decimal\n    Y:Decimal\n    Z:Decimal\n----------\nCommand Timeout: 5000\nExample:ReadChuckPosition Y Z'),
+    'ReadChuckHeights': ('Unit:str', 'Contact:Decimal,Overtravel:Decimal,AlignDist:Decimal,SepDist:Decimal,SearchGap:Decimal',
+        'Returns the current settings used for the Chuck Z movement. `Contact` is the\ncontact-height from zero in Technology compensation. The other heights are\nrelative to this. If no contact is set, the value will be -1.\nStatus: published\n----------\nParameters:\n    Unit:str = "Microns"\n----------\nResponse:\n    Contact:Decimal\n    Overtravel:Decimal\n    AlignDist:Decimal\n    SepDist:Decimal\n    SearchGap:Decimal\n----------\nCommand Timeout: 5000\nExample:ReadChuckHeights Y'),
+    'InitChuck': ('FlagsInit:int,FlagsDirection:int,FlagsMoveRange:int', '',
+        'Machine Coordinate System: Chuck X Y Z Theta  - _FlagsInit_: X, Y, Z, Theta -\n_FlagsDirection_: X, Y, Z, Theta (true means plus direction) - _FlagsMoveRange_:\nX, Y, Z, Theta   All flags can be accessed by indirect members.  Initializes the\nChuck stage and resets current coordinate system. Should be used only in cases\nwhen the reported coordinates do not correspond to real position of mechanics.\nFind Move Range starts the initialization in the defined direction and then\nmoves to the other limit and finds the whole range of the axes.\nStatus: published\n----------\nParameters:\n    FlagsInit:int = 0\n    FlagsDirection:int = 0\n    FlagsMoveRange:int = 0\n----------\nCommand Timeout: 180000\nExample:InitChuck 7 0 0'),
+    'MoveChuck': ('XValue:Decimal,YValue:Decimal,PosRef:str,Unit:str,Velocity:Decimal,Comp:str', '',
+        'Moves the Chuck stage to the specified X,Y position. If Chuck Z is in Contact\nHeight or higher, Interlock and Auto Z flags will be analyzed and stage will\nbehave correspondingly - can move to separation first or return an error:\nStatus: published\n----------\nParameters:\n    XValue:Decimal = 0\n    YValue:Decimal = 0\n    PosRef:str = "Home"\n    Unit:str = "Microns"\n    Velocity:Decimal = 100\n    Comp:str = "Technology"\n----------\nCommand Timeout: 30000\nExample:MoveChuck 5000. 5000. R Y 100'),
+    'MoveChuckIndex': ('XSteps:int,YSteps:int,PosRef:str,Velocity:Decimal', '',
+        'Moves the Chuck stage in index steps. This command modifies Die Home Position.\nStatus: published\n----------\nParameters:\n    XSteps:int = 0\n    YSteps:int = 0\n    PosRef:str = "Home"\n    Velocity:Decimal = 100\n----------\nCommand Timeout: 30000\nExample:MoveChuckIndex 1 1 R 100'),
+    'MoveChuckSubsite': ('XValue:Decimal,YValue:Decimal,Unit:str,Velocity:Decimal', '',
+        'Moves the Chuck stage to the specified X, Y sub-site position. Die home position\nis defined by destination position of last successful MoveChuck or\nMoveChuckIndex commands. MoveChuckVelocity does not touch die home position. If\nyou have moved Chuck with MoveChuckVelocity, "MoveChuckSubsite 0 0" will move it\nback to die home position.\nStatus: published\n----------\nParameters:\n    XValue:Decimal = 0\n    YValue:Decimal = 0\n    Unit:str = "Microns"\n    Velocity:Decimal = 100\n----------\nCommand Timeout: 30000\nExample:MoveChuckSubsite 200 200 Y 100'),
+    'MoveChuckContact': ('Velocity:Decimal', '',
+        'Performs a movement of Chuck Z axis to preset Contact Height or will return\nerror if no Contact Height is set.\nStatus: published\n----------\nParameters:\n    Velocity:Decimal = 100\n----------\nCommand Timeout: 60000\nExample:MoveChuckContact 100'),
+    'MoveChuckAlign': ('Velocity:Decimal', '',
+        'Moves the Chuck Z axis to the align height. If no Contact height is set will\nreturn an error.\nStatus: published\n----------\nParameters:\n    Velocity:Decimal = 100\n----------\nCommand Timeout: 60000\nExample:MoveChuckAlign 100'),
+    'MoveChuckSeparation': ('Velocity:Decimal', '',
+        'Moves the Chuck Z axis to the separation height. Returns error if no Contact\nheight is set.\nStatus: published\n----------\nParameters:\n    Velocity:Decimal = 100\n----------\nCommand Timeout: 60000\nExample:MoveChuckSeparation 100'),
+    'MoveChuckLoad': ('LoadPosition:str', '',
+        'Moves the Chuck stage in X, Y, Z and Theta to the load position.\nStatus: published\n----------\nParameters:\n    LoadPosition:str = "First"\n----------\nCommand Timeout: 90000\nExample:MoveChuckLoad 1'),
+    'MoveChuckZ': ('Height:Decimal,PosRef:str,Unit:str,Velocity:Decimal,Comp:str', '',
+        'Moves the Chuck Z axis to the specified height. If contact is set, only moves up\nto Contact Height will be allowed. If Overtravel is enabled - up to Overtravel\nheight.\nStatus: published\n----------\nParameters:\n    Height:Decimal = 0\n    PosRef:str = "Zero"\n    Unit:str = "Microns"\n    Velocity:Decimal = 100\n    Comp:str = "Technology"\n----------\nCommand Timeout: 60000\nExample:MoveChuckZ 1000. R Y 67'),
+    'SearchChuckContact': ('Height:Decimal,PosRef:str,Unit:str,Velocity:Decimal,Comp:str,NoFinalMoveToOvertravel:int', 'ContactHeight:Decimal',
+        'Moves the Chuck Z axis to the specified height and sets contact. The move stops\nimmediately if the Edge Sensor is triggered.   If no contact has been found and\nContact Height was previously set, the previous Contact Height is kept but the\nChuck will not move to it.   Typical Velocity values are < 5% and thus a\nvelocity should always be set to avoid risk of probe damage.\nStatus: published\n----------\nParameters:\n    Height:Decimal = 100\n    PosRef:str = "Relative"\n    Unit:str = "Microns"\n    Velocity:Decimal = 100\n    Comp:str = "Technology"\n    NoFinalMoveToOvertravel:int = 0\n----------\nResponse:\n    ContactHeight:Decimal\n----------\nCommand Timeout: 60000\nExample:SearchChuckContact 1000 R Y 10 T 0'),
+    'MoveChuckVelocity': ('PolarityX:str,PolarityY:str,PolarityZ:str,VelocityX:Decimal,VelocityY:Decimal,VelocityZ:Decimal', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nMoves the Chuck stage in velocity mode. The motion continues until the\nStopChuckMovement command is received, or the end limit is reached.\nStatus: internal\n----------\nParameters:\n    PolarityX:str = "Fixed"\n    PolarityY:str = "Fixed"\n    PolarityZ:str = "Fixed"\n    VelocityX:Decimal = 100\n    VelocityY:Decimal = 0\n    VelocityZ:Decimal = 0\n----------\nCommand Timeout: 30000\nExample:MoveChuckVelocity + + 0 100 30 0'),
+    'StopChuckMovement': ('FlagsStop:int', '',
+        'Stops Chuck movement for the given axis. Notifications: 31 / 32 / 5\nStatus: published\n----------\nParameters:\n    FlagsStop:int = 15\n----------\nCommand Timeout: 5000\nExample:StopChuckMovement 7'),
+    'SetChuckMode': ('Overtravel:int,AutoZ:int,Interlock:int,ContactSearch:int,EdgeInterlock:int,QuietContact:int', '',
+        'Mode manages the way the Chuck behaves when it is in Contact Height. Chuck mode\nis made from 6 flags and you can control all of them using this command. Every\nflag can be turned on by using value 1 or turned off by using value 0. If you do\nnot want to change a flag - use value of 2.\nStatus: published\n----------\nParameters:\n    Overtravel:int = 2\n    AutoZ:int = 2\n    Interlock:int = 2\n    ContactSearch:int = 2\n    EdgeInterlock:int = 2\n    QuietContact:int = 2\n----------\nCommand Timeout: 5000\nExample:SetChuckMode 2 2 2 2 2 2'),
+    'SetChuckHome': ('Mode:str,Unit:str,XValue:Decimal,YValue:Decimal', '',
+        'Sets wafer and die home position, which can be used later as coordinate system\nfor movements.\nStatus: published\n----------\nParameters:\n    Mode:str = "0"\n    Unit:str = "Microns"\n    XValue:Decimal = 0\n    YValue:Decimal = 0\n----------\nCommand Timeout: 5000\nExample:SetChuckHome 0 Y'),
+    'SetChuckIndex': ('XValue:Decimal,YValue:Decimal,Unit:str', '',
+        'Sets the wafer index size. Normally the size of one die.\nStatus: published\n----------\nParameters:\n    XValue:Decimal = 0\n    YValue:Decimal = 0\n    Unit:str = "Microns"\n----------\nCommand Timeout: 5000\nExample:SetChuckIndex 5000. 5000. Y'),
+    'SetChuckHeight': ('PresetHeight:str,Mode:str,Unit:str,Value:Decimal', '',
+        'Defines the predefined Contact Height and corresponding gaps for Overtravel,\nalign and separation. A predefined contact search gap is able to write. No data\nin the optional parameters sets contact height at current position. If Mode is\n\'0\', Contact Height can be set at current position. The levels O, A, S and T\nsupport no Mode \'0\'. If Mode is \'V\' and no value for height is specified -\ndefault 0 will be used, what potentially can be not what you expect. If Mode is\n\'R\', Contact Height can be invalidated. The levels O, A, S and T support no Mode\n\'R\'.\nStatus: published\n----------\nParameters:\n    PresetHeight:str = "Contact"\n    Mode:str = "0"\n    Unit:str = "Microns"\n    Value:Decimal = 0\n----------\nCommand Timeout: 5000\nExample:SetChuckHeight C V Y 5000.'),
+    'ReadChuckIndex': ('Unit:str', 'IndexX:Decimal,IndexY:Decimal',
+        'The command gets the current die size which is stored in the Kernel.\nStatus: published\n----------\nParameters:\n    Unit:str = "Microns"\n----------\nResponse:\n    IndexX:Decimal\n    IndexY:Decimal\n----------\nCommand Timeout: 5000\nExample:ReadChuckIndex Y'),
+    'MoveChuckTransfer': ('', '',
+        "Moves the Chuck to the Transfer Position. If the movement starts in Load\nPosition (where it's possible to pull out the Chuck) the handling of the Add On\nPlaten or the Pin Chuck is integrated.\nStatus: published\n----------\nCommand Timeout: 90000\nExample:MoveChuckTransfer"),
+    'MoveChuckLift': ('SetLift:int', '',
+        'Moves the Chuck to the upper (0) or lower = lifted (1) position. This initiates\nmotion only, the actual movement may take some seconds.\nStatus: published\n----------\nParameters:\n    SetLift:int = 1\n----------\nCommand Timeout: 10000\nExample:MoveChuckLift 1'),
+    'SetChuckThermoScale': ('ScaleX:Decimal,ScaleY:Decimal', '',
+        "Thermal drifts of the wafer will be compensated. The compensation is not\npersistent, (power off - this compensation is deleted). The algorithm works as\nan additional one.  This is for an iterative usage, so:  1. `ResetProber H` 2.\n`SetChuckThermoScale 1.5 1.5` 3. `SetChuckThermoScale 1.5 1.5`  will result in a\nscale of 2.25 in both directions. The thermal scale can also be reset using the\ncommand 'SetChuckThermoValue 20 C'\nStatus: published\n----------\nParameters:\n    ScaleX:Decimal = 1\n    ScaleY:Decimal = 1\n----------\nCommand Timeout: 5000\nExample:SetChuckThermoScale 1.000005 1.0000045"),
+    'ReadChuckThermoScale': ('', 'ScaleX:Decimal,ScaleY:Decimal',
+        'Read the linear scaling value of the Chuck.\nStatus: published\n----------\nResponse:\n    ScaleX:Decimal\n    ScaleY:Decimal\n----------\nCommand Timeout: 5000\nExample:ReadChuckThermoScale'),
+    'SetChuckThermoValue': ('Temperature:Decimal,Unit:str,ExpCoeffX:Decimal,ExpCoeffY:Decimal', '',
+        'Set a temperature and optional the expansion coefficient. The temperature for\nnormal level is 20 degree. The scaling factor at this temperature is 1.0. If you\nset the temperature directly the controller calculates the stage difference in\nthe coordinate system. For the calculation use the set coefficient of expansion\nfrom the controller. The default coefficient of expansion is based on silicon:\n2.33E-06 1/K.\nStatus: published\n----------\nParameters:\n    Temperature:Decimal = 0\n    Unit:str = "Celsius"\n    ExpCoeffX:Decimal = 0\n    ExpCoeffY:Decimal = 0\n----------\nCommand Timeout: 5000\nExample:SetChuckThermoValue 250 C 2.43 2.32'),
+    'ReadChuckThermoValue': ('Unit:str', 'Temperature:Decimal,ExpCoeffX:Decimal,ExpCoeffY:Decimal',
+        'Read the current temperature (either set or calculated) for the thermal scaling.\nWith SetChuckThermoScale in use, the value will be calculated by the current\nscale and the expansion factor of silicon. The temperature that is read with\nthis command is not identical to the current Chuck temperature.\nStatus: published\n----------\nParameters:\n    Unit:str = "Celsius"\n----------\nResponse:\n    Temperature:Decimal\n    ExpCoeffX:Decimal\n    ExpCoeffY:Decimal\n----------\nCommand Timeout: 5000\nExample:ReadChuckThermoValue C'),
+    'GetChuckTableID': ('TableName:str', 'TableID:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturn the TableID Number of the stored Chuck table or create a new table. The\nID Number is unique for the name and the Chuck. The table itself has a string\nname, this name is not case sensitive. This command has to be used before all\nother table commands can be used. Accesses to the table is possible only with an\nID Number (name dependent).\nStatus: internal\n----------\nParameters:\n    TableName:str = "ChuckTable"\n----------\nResponse:\n    TableID:int\n----------\nCommand Timeout: 5000\nExample:GetChuckTableID ChuckTable'),
+    'MoveChuckTablePoint': ('TableID:int,PointID:int,Velocity:Decimal', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nMove the Chuck to the next stored table site.\nStatus: internal\n----------\nParameters:\n    TableID:int = 0\n    PointID:int = 0\n    Velocity:Decimal = 100\n----------\nCommand Timeout: 30000\nExample:MoveChuckTablePoint 3 10 67'),
+    'ReadChuckTablePoint': ('TableID:int,PointID:int,Unit:str', 'CoordX:Decimal,CoordY:Decimal,CoordSystem:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nRead back the table site information for this point from the Kernel.\nStatus: internal\n----------\nParameters:\n    TableID:int = 0\n    PointID:int = 0\n    Unit:str = "Microns"\n----------\nResponse:\n    CoordX:Decimal\n    CoordY:Decimal\n    CoordSystem:str\n----------\nCommand Timeout: 5000\nExample:ReadChuckTablePoint 10 250 Y'),
+    'SetChuckTablePoint': ('TableID:int,PointID:int,CoordX:Decimal,CoordY:Decimal,Unit:str,CoordSystem:str', 'ValidPoint:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSet one point of the Chuck table inside of the Kernel. If there is still a point\nwith this index loaded, the Kernel returns an error. Number of positions and\nnumber of tables are dependent on the internal memory. All positions are stored\npersistent, that means after switching power on or off the positions are still\navailable. The table starts with point number 1 and ends with the ID 16. The\ntable can contain 65535 points with the ID 0 up to 65534. Overwriting of\nposition points is not possible. The point has to be deleted before other values\nare set.\nStatus: internal\n----------\nParameters:\n    TableID:int = 0\n    PointID:int = 0\n    CoordX:Decimal = 0\n    CoordY:Decimal = 0\n    Unit:str = "Microns"\n    CoordSystem:str = "HomeSystem"\n----------\nResponse:\n    ValidPoint:int\n----------\nCommand Timeout: 5000\nExample:SetChuckTablePoint 10 12000.0 2344.0 Y F'),
+    'ClearChuckTablePoint': ('TableID:int,StartPoint:int,EndPoint:int', 'ClearNumber:int,ValidNumber:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nClear one or a range of Chuck table site points in the in the Kernel. If Start\nPoint is -1 or negative the whole table will be deleted.\nStatus: internal\n----------\nParameters:\n    TableID:int = 0\n    StartPoint:int = -1\n    EndPoint:int = 0\n----------\nResponse:\n    ClearNumber:int\n    ValidNumber:int\n----------\nCommand Timeout: 5000\nExample:ClearChuckTablePoint 5 10 15'),
+    'AttachAmbientWafer': ('MoveTimeMs:Decimal', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nCommand is moved to slowly attach a wafer that is at ambient temperature while\nthe Chuck is hot.   The command acts similar to MoveChuckTransfer when moving\nout of Load 2 but will use a much slower Z velocity.   This is only supported\nfor BnR/ACS stations (CM300 and SUMMIT200) at the moment.\nStatus: internal\n----------\nParameters:\n    MoveTimeMs:Decimal = 30000\n----------\nCommand Timeout: 300000\nExample:AttachAmbientWafer'),
+    'ReadThetaStatus': ('', 'IsInit:int,FlagsLimit:int,IsMoving:int',
+        'Returns the actual status of the Chuck Theta axis.\nStatus: published\n----------\nResponse:\n    IsInit:int\n    FlagsLimit:int\n    IsMoving:int\n----------\nCommand Timeout: 5000\nExample:ReadThetaStatus'),
+    'ReadThetaPosition': ('Unit:str,PosRef:str', 'Position:Decimal',
+        'Returns the actual Theta position.\nStatus: published\n----------\nParameters:\n    Unit:str = "Degrees"\n    PosRef:str = "Home"\n----------\nResponse:\n    Position:Decimal\n----------\nCommand Timeout: 5000\nExample:ReadThetaPosition D Z'),
+    'InitTheta': ('FlagsDoPlus:int,FlagsMoveRange:int', '',
+        'Performs an initialization move and resets the coordinate system of the Theta\naxis.\nStatus: published\n----------\nParameters:\n    FlagsDoPlus:int = 0\n    FlagsMoveRange:int = 0\n----------\nCommand Timeout: 120000\nExample:InitTheta 0 0'),
+    'MoveTheta': ('Position:Decimal,PosRef:str,Unit:str,Velocity:Decimal', '',
+        'Moves the Chuck Theta axis to the specified position. The positive direction is\ncounter-clockwise.\nStatus: published\n----------\nParameters:\n    Position:Decimal = 0\n    PosRef:str = "Home"\n    Unit:str = "Degrees"\n    Velocity:Decimal = 100\n----------\nCommand Timeout: 30000\nExample:MoveTheta 1000. R E'),
+    'MoveThetaVelocity': ('Polarity:str,Velocity:Decimal', '',
+        'Moves the Chuck Theta axis in velocity mode. The positive direction is counter-\nclockwise. The motion continues until the StopThetaMovement command is received,\nor the end limit (error condition) is reached. This command is mostly used for\njoystick movements that do not have a target destination.\nStatus: published\n----------\nParameters:\n    Polarity:str = "Fixed"\n    Velocity:Decimal = 0\n----------\nCommand Timeout: 240000\nExample:MoveThetaVelocity + 67'),
+    'StopThetaMovement': ('', '',
+        'Stops any type (velocity, position etc.) of Chuck Theta axis movement. This is\ntreated as a smooth stop rather than an emergency stop.\nStatus: published\n----------\nCommand Timeout: 5000\nExample:StopThetaMovement'),
+    'SetThetaHome': ('Mode:str,Unit:str,Position:Decimal', '',
+        'Sets the Chuck Theta position to home. This position is usable as reference\nposition for other commands.\nStatus: published\n----------\nParameters:\n    Mode:str = "0"\n    Unit:str = "Degrees"\n    Position:Decimal = 0\n----------\nCommand Timeout: 5000\nExample:SetThetaHome 0'),
+    'ScanChuckZ': ('ZDistance:Decimal,TriggerEveryNthCycle:int,Velocity:Decimal', 'NumberOfPositions:int,TriggerPositions:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nStarts moving the Chuck from the current position with Velocity [%] over\nZDistance (sign is important, as a negative sign will move Chuck down during\nscan) - Predefined camera trigger pulses (TTL active high for at least 5us) will\nbe sent during the scan every passed number of BnR cycles (800us per cycle)\nuntil the ZDistance has been reached.  Command returns number of positions and\nall compensated Z Positions from Zero, where the trigger was sent.\nStatus: internal\n----------\nParameters:\n    ZDistance:Decimal = 1000\n    TriggerEveryNthCycle:int = 3\n    Velocity:Decimal = 10\n----------\nResponse:\n    NumberOfPositions:int\n    TriggerPositions:str\n----------\nCommand Timeout: 60000\nExample:ScanChuckZ 300 3 1.5'),
+    'MoveChuckZSafe': ('', '',
+        'Moves the Chuck Z axis to a z height considered safe. This is either the lower\nZ-Fence or the Kernel item Chuck:SafeTransferHeight (whichever is larger)\nStatus: published\n----------\nCommand Timeout: 60000\nExample:MoveChuckZSafe'),
+    'ReadManualPlatenState': ('', 'IsUp:int,IsDown:int,IsSafe:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReads the current status of the manual platen.\nStatus: internal\n----------\nResponse:\n    IsUp:int\n    IsDown:int\n    IsSafe:int\n----------\nCommand Timeout: 5000'),
+    'ReadScopeStatus': ('', 'FlagsInit:int,FlagsLimit:int,FlagsMoving:int,Comp:str,IsScopeLiftUp:int,PresetHeight:str,IsScopeLight:int,FlagsMode:int,IsQuiet:int',
+        'Returns the current Scope status.\nStatus: published\n----------\nResponse:\n    FlagsInit:int\n    FlagsLimit:int\n    FlagsMoving:int\n    Comp:str\n    IsScopeLiftUp:int\n    PresetHeight:str\n    IsScopeLight:int\n    FlagsMode:int\n    IsQuiet:int\n----------\nCommand Timeout: 5000\nExample:ReadScopeStatus'),
+    'ReadScopePosition': ('Unit:str,PosRef:str,Comp:str', 'X:Decimal,Y:Decimal,Z:Decimal',
+        'Returns the actual Scope stage position in X, Y and Z. The Technology\nCompensation Mode is the currently activated compensation mode of the Kernel.\nStatus: published\n----------\nParameters:\n    Unit:str = "Microns"\n    PosRef:str = "Home"\n    Comp:str = "Technology"\n----------\nResponse:\n    X:Decimal\n    Y:Decimal\n    Z:Decimal\n----------\nCommand Timeout: 5000\nExample:ReadScopePosition Y Z'),
+    'ReadScopeHeights': ('Unit:str', 'FocusHeight:Decimal,AlignDist:Decimal,SepDist:Decimal',
+        'Returns the actual settings of the focus height, align gap and separation gap\nfor the Scope Z axis.\nStatus: published\n----------\nParameters:\n    Unit:str = "Microns"\n----------\nResponse:\n    FocusHeight:Decimal\n    AlignDist:Decimal\n    SepDist:Decimal\n----------\nCommand Timeout: 5000\nExample:ReadScopeHeights Y'),
+    'InitScope': ('FlagsInit:int,FlagsDirection:int,FlagsMoveRange:int', '',
+        'Initializes the microscope stage in X, Y and Z. The Axis default is all axes and\nthe Direction default is XY in minus and Z in plus. Should be used only in cases\nwhen the reported coordinates do not correspond to real position of mechanics.\nFind Move Range starts the initialization in the defined direction and then\nmoves to the other limit and finds the whole range of the axes.\nStatus: published\n----------\nParameters:\n    FlagsInit:int = 0\n    FlagsDirection:int = 0\n    FlagsMoveRange:int = 0\n----------\nCommand Timeout: 240000\nExample:InitScope 3 0 0'),
+    'MoveScope': ('XValue:Decimal,YValue:Decimal,PosRef:str,Unit:str,Velocity:Decimal,Comp:str', '',
+        'Moves the microscope stage to the specified X,Y position relative to the per\nPosRef specified reference position.\nStatus: published\n----------\nParameters:\n    XValue:Decimal = 0\n    YValue:Decimal = 0\n    PosRef:str = "Home"\n    Unit:str = "Microns"\n    Velocity:Decimal = 100\n    Comp:str = "Technology"\n----------\nCommand Timeout: 70000\nExample:MoveScope 5000 5000 R Y 100'),
+    'MoveScopeIndex': ('XSteps:int,YSteps:int,PosRef:str,Velocity:Decimal', '',
+        'Moves the microscope stage in index steps. If no PositionReference byte is\npassed the Scope will step relative to the wafer home position. (\'R\' means the\nstep relative to current position).\nStatus: published\n----------\nParameters:\n    XSteps:int = 0\n    YSteps:int = 0\n    PosRef:str = "Home"\n    Velocity:Decimal = 100\n----------\nCommand Timeout: 30000\nExample:MoveScopeIndex 1 1 R 100'),
+    'MoveScopeZ': ('Height:Decimal,PosRef:str,Unit:str,Velocity:Decimal,Comp:str', '',
+        'Moves the microscope Z axis to the specified height. Default velocity is 100%.\nStatus: published\n----------\nParameters:\n    Height:Decimal = 0\n    PosRef:str = "Zero"\n    Unit:str = "Microns"\n    Velocity:Decimal = 100\n    Comp:str = "Technology"\n----------\nCommand Timeout: 120000\nExample:MoveScopeZ 1000. R Y 67'),
+    'SetScopeMode': ('QuietMode:int,FollowMode:int', '',
+        'Scope mode is made up of two flags which can be controlled using this command.\nEach flag can be turned on by using value 1 or turned off by using value 0. If\nyou do not want to change a flag, use value of 2.\nStatus: published\n----------\nParameters:\n    QuietMode:int = 2\n    FollowMode:int = 2\n----------\nCommand Timeout: 5000\nExample:SetScopeMode 2 2'),
+    'MoveScopeVelocity': ('PolarityX:str,PolarityY:str,PolarityZ:str,VelocityX:Decimal,VelocityY:Decimal,VelocityZ:Decimal', '',
+        'Moves the microscope stage in velocity mode. The motion continues until the\nStopScopeMovement command is received, or the end limit (error condition) is\nreached. Axes parameter: \'+\' move this axis in plus direction \'-\' move this axis\nin minus direction \'0\' Do not change this axis\nStatus: published\n----------\nParameters:\n    PolarityX:str = "Fixed"\n    PolarityY:str = "Fixed"\n    PolarityZ:str = "Fixed"\n    VelocityX:Decimal = 100\n    VelocityY:Decimal = 0\n    VelocityZ:Decimal = 0\n----------\nCommand Timeout: 30000\nExample:MoveScopeVelocity + + 0 67 100 0'),
+    'StopScopeMovement': ('FlagsStop:int', '',
+        'Stops Scope movement for the given axis. A smooth stop is executed, no emergency\nstop.\nStatus: published\n----------\nParameters:\n    FlagsStop:int = 7\n----------\nCommand Timeout: 5000\nExample:StopScopeMovement 7'),
+    'SetScopeHome': ('Mode:str,Unit:str,XValue:Decimal,YValue:Decimal', '',
+        'Sets the Scope Home position in X and Y. It identifies the Scope coordinate\nsystem for later movements. Usually this position is identical to the die home\nlocation.\nStatus: published\n----------\nParameters:\n    Mode:str = "0"\n    Unit:str = "Microns"\n    XValue:Decimal = 0\n    YValue:Decimal = 0\n----------\nCommand Timeout: 5000\nExample:SetScopeHome 0 Y'),
+    'SetScopeIndex': ('XValue:Decimal,YValue:Decimal,Unit:str', '',
+        'Sets the microscope index size. Normally set in relation to the wafer index\nsize.\nStatus: published\n----------\nParameters:\n    XValue:Decimal = 0\n    YValue:Decimal = 0\n    Unit:str = "Microns"\n----------\nCommand Timeout: 5000\nExample:SetScopeIndex 5000. 5000. Y'),
+    'SetScopeHeight': ('PresetHeight:str,Mode:str,Unit:str,Value:Decimal', '',
+        'This command defines Scope focus height and the corresponding gaps for alignment\nor separation. No data sets focus height at current position.\nStatus: published\n----------\nParameters:\n    PresetHeight:str = "Focus"\n    Mode:str = "0"\n    Unit:str = "Microns"\n    Value:Decimal = 0\n----------\nCommand Timeout: 5000\nExample:SetScopeHeight F 0 Y'),
+    'ReadScopeIndex': ('Unit:str', 'IndexX:Decimal,IndexY:Decimal',
+        'Returns the actual Scope stage index values in X and Y.\nStatus: published\n----------\nParameters:\n    Unit:str = "Microns"\n----------\nResponse:\n    IndexX:Decimal\n    IndexY:Decimal\n----------\nCommand Timeout: 5000\nExample:ReadScopeIndex Y'),
+    'MoveScopeFocus': ('Velocity:Decimal', '',
+        'Moves the microscope stage to the specified X,Y position relative to the per\nPosRef specified reference position.\nStatus: published\n----------\nParameters:\n    Velocity:Decimal = 100\n----------\nCommand Timeout: 25000\nExample:MoveScopeFocus 100'),
+    'MoveScopeAlign': ('Velocity:Decimal', '',
+        'Moves the Scope Z axis to the alignment height. If no focus height is set an\nerror will be returned.\nStatus: published\n----------\nParameters:\n    Velocity:Decimal = 100\n----------\nCommand Timeout: 25000\nExample:MoveScopeAlign 100'),
+    'MoveScopeSeparation': ('Velocity:Decimal', '',
+        'Moves the Scope Z axis to the separation height. Returns an error if no focus\nheight is set.\nStatus: published\n----------\nParameters:\n    Velocity:Decimal = 100\n----------\nCommand Timeout: 60000\nExample:MoveScopeSeparation 100'),
+    'MoveScopeLift': ('SetLift:int', '',
+        'Moves the microscope lift to the lower (0) or upper = lifted (1) position. This\ninitiates the motion only, the actual movement may take some seconds.\nStatus: published\n----------\nParameters:\n    SetLift:int = 1\n----------\nCommand Timeout: 10000\nExample:MoveScopeLift 1'),
+    'ReadTurretStatus': ('', 'IsMoving:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the current status of the motorized turret.\nStatus: internal\n----------\nResponse:\n    IsMoving:int\n----------\nCommand Timeout: 5000\nExample:ReadTurretStatus'),
+    'SelectLens': ('Lens:int', '',
+        'Parfocality and parcentricity are adjusted according to the stored values. This\ncan be used with manual turrets to compensate for XYZ differences between\nlenses.\nStatus: published\n----------\nParameters:\n    Lens:int = 1\n----------\nCommand Timeout: 30000\nExample:SelectLens 1'),
+    'GetScopeTable': ('TableName:str', 'TableID:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturn the TableID Number of the stored Chuck table or create a new table. The\nID Number is unique for the name and the Chuck. The table itself has a string\nname, this name is not case sensitive. This command has to be used before all\nother table commands can be used. Accesses to the table is possible only with an\nID Number (name dependet).\nStatus: internal\n----------\nParameters:\n    TableName:str = "ScopeTable"\n----------\nResponse:\n    TableID:int\n----------\nCommand Timeout: 5000\nExample:GetScopeTable ScopeTable'),
+    'MoveScopeTablePoint': ('TableID:int,PointID:int,Velocity:Decimal', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nMoves the microscope stage to the specified X,Y position relative to the per\nPosRef specified reference position.\nStatus: internal\n----------\nParameters:\n    TableID:int = 0\n    PointID:int = 0\n    Velocity:Decimal = 100\n----------\nCommand Timeout: 30000\nExample:MoveScopeTablePoint 10 5 67'),
+    'ReadScopeTablePoint': ('TableID:int,PointID:int,Unit:str', 'CoordX:Decimal,CoordY:Decimal,CoordSystem:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nRead back the Scope table site Information for this point from the Kernel.\nStatus: internal\n----------\nParameters:\n    TableID:int = 0\n    PointID:int = 0\n    Unit:str = "Microns"\n----------\nResponse:\n    CoordX:Decimal\n    CoordY:Decimal\n    CoordSystem:str\n----------\nCommand Timeout: 5000\nExample:ReadScopeTablePoint 2 10 Y'),
+    'ReadCurrentLens': ('', 'Lens:int',
+        'Returns the number of the current microscope lens.\nStatus: published\n----------\nResponse:\n    Lens:int\n----------\nCommand Timeout: 5000\nExample:ReadCurrentLens'),
+    'SetScopeTablePoint': ('TableID:int,PointID:int,CoordX:Decimal,CoordY:Decimal,Unit:str,CoordSystem:str', 'ValidPoint:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSet one point of the Scope table inside of the Kernel. If there is still a point\nwith this index loaded, the Kernel returns an error. Number of positions and\nnumber of tables are dependent on the internal memory. All positions are stored\npersistent, that means after switching power on or off the positions are still\navailable. The table starts with point number 1 and ends with the ID 16. The\ntable can contain 65535 points with the ID 0 up to 65534. Overwriting of\nposition points is not possible. The point has to be deleted before other values\nare set.\nStatus: internal\n----------\nParameters:\n    TableID:int = 0\n    PointID:int = 0\n    CoordX:Decimal = 0\n    CoordY:Decimal = 0\n    Unit:str = "Microns"\n    CoordSystem:str = "HomeSystem"\n----------\nResponse:\n    ValidPoint:int\n----------\nCommand Timeout: 5000\nExample:SetScopeTablePoint 10 10 8992.5 7883.0 Y H'),
+    'ClearScopeTablePoint': ('TableID:int,StartPoint:int,EndPoint:int', 'ClearNumber:int,ValidNumber:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nClear one or a range of Scope table site points in the Kernel. If Start Point is\n-1 or negative the whole table will be deleted.\nStatus: internal\n----------\nParameters:\n    TableID:int = 0\n    StartPoint:int = -1\n    EndPoint:int = 0\n----------\nResponse:\n    ClearNumber:int\n    ValidNumber:int\n----------\nCommand Timeout: 5000\nExample:ClearScopeTablePoint 2 10 15'),
+    'ReadScopeSiloCount': ('', 'Count:int',
+        'Returns the number of silos in the Scope fence. Will be zero if no silos are\nconfigured.\nStatus: published\n----------\nResponse:\n    Count:int\n----------\nCommand Timeout: 5000\nExample:ReadScopeSiloCount'),
+    'ReadProbeStatus': ('Probe:int', 'ProbeEcho:int,FlagsInit:int,FlagsMode:int,FlagsLimit:int,FlagsMoving:int,Comp:str,Side:str,PresetHeight:str,IsLiftUp:int,IsQuiet:int',
+        "Returns the current Positioner's status.\nStatus: published\n----------\nParameters:\n    Probe:int = 1\n----------\nResponse:\n    ProbeEcho:int\n    FlagsInit:int\n    FlagsMode:int\n    FlagsLimit:int\n    FlagsMoving:int\n    Comp:str\n    Side:str\n    PresetHeight:str\n    IsLiftUp:int\n    IsQuiet:int\n----------\nCommand Timeout: 5000\nExample:ReadProbeStatus 1"),
+    'ReadProbePosition': ('Probe:int,Unit:str,PosRef:str,Comp:str', 'ProbeEcho:int,X:Decimal,Y:Decimal,Z:Decimal',
+        'Returns the actual Positioner\'s position in X, Y and Z. The Technology\nCompensation Mode is the currently activated compensation mode of the Kernel.\nStatus: published\n----------\nParameters:\n    Probe:int = 1\n    Unit:str = "Microns"\n    PosRef:str = "Home"\n    Comp:str = "Technology"\n----------\nResponse:\n    ProbeEcho:int\n    X:Decimal\n    Y:Decimal\n    Z:Decimal\n----------\nCommand Timeout: 5000\nExample:ReadProbePosition 1 Y Z'),
+    'ReadProbeHeights': ('Probe:int,Unit:str', 'ProbeEcho:int,Contact:Decimal,Overtravel:Decimal,AlignDist:Decimal,SepDist:Decimal',
+        'Returns the actual settings for the probe Z movement.\nStatus: published\n----------\nParameters:\n    Probe:int = 1\n    Unit:str = "Microns"\n----------\nResponse:\n    ProbeEcho:int\n    Contact:Decimal\n    Overtravel:Decimal\n    AlignDist:Decimal\n    SepDist:Decimal\n----------\nCommand Timeout: 5000\nExample:ReadProbeHeights 1 Y'),
+    'OrientProbe': ('Probe:int,Side:str', 'ProbeEcho:int',
+        'Defines the orientation of the Positioner\'s coordinate system and turns the\nY-axis of the probe coordinate system.\nStatus: published\n----------\nParameters:\n    Probe:int = 1\n    Side:str = "Left"\n----------\nResponse:\n    ProbeEcho:int\n----------\nCommand Timeout: 5000\nExample:OrientProbe 1 R'),
+    'InitProbe': ('Probe:int,FlagsInit:int,FlagsDirection:int,FlagsMoveRange:int,FlagsInitInPlace:int', 'ProbeEcho:int',
+        'Performs an initialization move and resets the coordinate system of the given\nPositioner.\nStatus: published\n----------\nParameters:\n    Probe:int = 1\n    FlagsInit:int = 0\n    FlagsDirection:int = 0\n    FlagsMoveRange:int = 0\n    FlagsInitInPlace:int = 0\n----------\nResponse:\n    ProbeEcho:int\n----------\nCommand Timeout: 240000\nExample:InitProbe 1 7 0 0'),
+    'MoveProbe': ('Probe:int,XValue:Decimal,YValue:Decimal,PosRef:str,Unit:str,Velocity:Decimal,Comp:str', 'ProbeEcho:int',
+        'Moves a defined Positioner to a X, Y position relative to a per PosRef specified\nreference position. Notifications: 51 / 52 / 5\nStatus: published\n----------\nParameters:\n    Probe:int = 1\n    XValue:Decimal = 0\n    YValue:Decimal = 0\n    PosRef:str = "Home"\n    Unit:str = "Microns"\n    Velocity:Decimal = 100\n    Comp:str = "Technology"\n----------\nResponse:\n    ProbeEcho:int\n----------\nCommand Timeout: 30000\nExample:MoveProbe 1 1000. 1000. R Y 100'),
+    'MoveProbeIndex': ('Probe:int,XSteps:int,YSteps:int,PosRef:str,Velocity:Decimal', 'ProbeEcho:int',
+        'Moves a defined Positioner to a X, Y position relative to a per PosRef specified\nreference position. Notifications: 51 / 52 / 5\nStatus: published\n----------\nParameters:\n    Probe:int = 1\n    XSteps:int = 0\n    YSteps:int = 0\n    PosRef:str = "Home"\n    Velocity:Decimal = 100\n----------\nResponse:\n    ProbeEcho:int\n----------\nCommand Timeout: 30000\nExample:MoveProbeIndex 1 1 1 R 100'),
+    'MoveProbeContact': ('Probe:int,Velocity:Decimal', 'ProbeEcho:int',
+        "Moves the given Positioner Z axis to the preset Contact Height. If no Contact\nHeight is set, the Kernel will return a 'Contact Height not set' error.\nStatus: published\n----------\nParameters:\n    Probe:int = 1\n    Velocity:Decimal = 100\n----------\nResponse:\n    ProbeEcho:int\n----------\nCommand Timeout: 30000\nExample:MoveProbeContact 1 100"),
+    'MoveProbeAlign': ('Probe:int,Velocity:Decimal', 'ProbeEcho:int',
+        'Moves the given Positioner Z axis to the align height.\nStatus: published\n----------\nParameters:\n    Probe:int = 1\n    Velocity:Decimal = 100\n----------\nResponse:\n    ProbeEcho:int\n----------\nCommand Timeout: 30000\nExample:MoveProbeAlign 1 100'),
+    'MoveProbeSeparation': ('Probe:int,Velocity:Decimal', 'ProbeEcho:int',
+        'Moves a defined Positioner to a X, Y position relative to a per PosRef specified\nreference position. Notifications: 51 / 52 / 5\nStatus: published\n----------\nParameters:\n    Probe:int = 1\n    Velocity:Decimal = 100\n----------\nResponse:\n    ProbeEcho:int\n----------\nCommand Timeout: 30000\nExample:MoveProbeSeparation 1 100'),
+    'MoveProbeZ': ('Probe:int,Height:Decimal,PosRef:str,Unit:str,Velocity:Decimal,Comp:str', 'ProbeEcho:int',
+        'Moves a given Positioner Z axis to a defined Z height.\nStatus: published\n----------\nParameters:\n    Probe:int = 1\n    Height:Decimal = 0\n    PosRef:str = "Zero"\n    Unit:str = "Microns"\n    Velocity:Decimal = 100\n    Comp:str = "Technology"\n----------\nResponse:\n    ProbeEcho:int\n----------\nCommand Timeout: 30000\nExample:MoveProbeZ 1 1000. R Y 67'),
+    'MoveProbeLift': ('Probe:int,SetLift:int', 'ProbeEcho:int',
+        'Moves the Positioner to the lower (0) or upper = lifted (1) position. The\ncommand initiates the motion only, the whole movement may take some seconds.\nStatus: published\n----------\nParameters:\n    Probe:int = 1\n    SetLift:int = 1\n----------\nResponse:\n    ProbeEcho:int\n----------\nCommand Timeout: 10000\nExample:MoveProbeLift 1'),
+    'MoveProbeVelocity': ('Probe:int,PolarityX:str,PolarityY:str,PolarityZ:str,VelocityX:Decimal,VelocityY:Decimal,VelocityZ:Decimal', 'ProbeEcho:int',
+        '\'+\' Move this axis into plus direction \'-\' Move this axis into minus direction\n\'0\' Do not change this axis\nStatus: published\n----------\nParameters:\n    Probe:int = 1\n    PolarityX:str = "Fixed"\n    PolarityY:str = "Fixed"\n    PolarityZ:str = "Fixed"\n    VelocityX:Decimal = 100\n    VelocityY:Decimal = 0\n    VelocityZ:Decimal = 0\n----------\nResponse:\n    ProbeEcho:int\n----------\nCommand Timeout: 30000\nExample:MoveProbeVelocity 1 + + 0 67 100 0'),
+    'StopProbeMovement': ('Probe:int,FlagsStop:int', 'ProbeEcho:int',
+        'Stops Positioner movement for the given axes immediately. A smooth stop is\nperformed.\nStatus: published\n----------\nParameters:\n    Probe:int = 1\n    FlagsStop:int = 7\n----------\nResponse:\n    ProbeEcho:int\n----------\nCommand Timeout: 5000\nExample:StopProbeMovement 1 7'),
+    'SetProbeMode': ('Probe:int,Overtravel:int,AutoZ:int,Interlock:int,AutoZFollow:int,AutoQuiet:int', 'ProbeEcho:int',
+        'The mode manages the way the Chuck behaves when it is in Contact Height.\nPositioner mode is made up from 5 flags and the user can control all of them by\nusing this command. Every flag can be turned on by setting value 1, or turned\noff by setting value 0. Use the value 2 if no change for a flag is needed.\nStatus: published\n----------\nParameters:\n    Probe:int = 1\n    Overtravel:int = 2\n    AutoZ:int = 2\n    Interlock:int = 2\n    AutoZFollow:int = 2\n    AutoQuiet:int = 2\n----------\nResponse:\n    ProbeEcho:int\n----------\nCommand Timeout: 5000\nExample:SetProbeMode 1 2 2 2 2'),
+    'SetProbeHome': ('Probe:int,Mode:str,Unit:str,XValue:Decimal,YValue:Decimal', 'ProbeEcho:int',
+        'Sets the Positioner\'s Home position in X and Y. This position identifies the\nprobe coordinate system for later movements. Usually this position is identical\nto the die home position.\nStatus: published\n----------\nParameters:\n    Probe:int = 1\n    Mode:str = "0"\n    Unit:str = "Microns"\n    XValue:Decimal = 0\n    YValue:Decimal = 0\n----------\nResponse:\n    ProbeEcho:int\n----------\nCommand Timeout: 5000\nExample:SetProbeHome 1 0 Y'),
+    'SetProbeIndex': ('Probe:int,XValue:Decimal,YValue:Decimal,Unit:str', 'ProbeEcho:int',
+        'Sets the Positioner\'s index size or the location of the reference die relative\nto the home die.\nStatus: published\n----------\nParameters:\n    Probe:int = 1\n    XValue:Decimal = 0\n    YValue:Decimal = 0\n    Unit:str = "Microns"\n----------\nResponse:\n    ProbeEcho:int\n----------\nCommand Timeout: 5000\nExample:SetProbeIndex 1 1000. 1000. Y'),
+    'SetProbeHeight': ('Probe:int,PresetHeight:str,Mode:str,Unit:str,Value:Decimal', 'ProbeEcho:int',
+        'Defines the predefined Contact Height and corresponding gaps for Overtravel,\nAlign and Separation height. No data sets Contact Height at current position.\nStatus: published\n----------\nParameters:\n    Probe:int = 1\n    PresetHeight:str = "Contact"\n    Mode:str = "0"\n    Unit:str = "Microns"\n    Value:Decimal = 0\n----------\nResponse:\n    ProbeEcho:int\n----------\nCommand Timeout: 5000\nExample:SetProbeHeight 1 C 0 Y'),
+    'ReadProbeIndex': ('Probe:int,Unit:str', 'ProbeEcho:int,IndexX:Decimal,IndexY:Decimal',
+        'Returns the current Positioner\'s wafer index values or the current Positioner\'s\nindex positions for X and Y.\nStatus: published\n----------\nParameters:\n    Probe:int = 1\n    Unit:str = "Microns"\n----------\nResponse:\n    ProbeEcho:int\n    IndexX:Decimal\n    IndexY:Decimal\n----------\nCommand Timeout: 5000\nExample:ReadProbeIndex 1 Y'),
+    'SetProbeBacklash': ('Probe:int,MoveDistX:Decimal,MoveDistY:Decimal,MoveDistZ:Decimal', 'ProbeEcho:int',
+        'Sets the backlash compensation move distance for X, Y and Z\nStatus: published\n----------\nParameters:\n    Probe:int = 1\n    MoveDistX:Decimal = 0\n    MoveDistY:Decimal = 0\n    MoveDistZ:Decimal = 0\n----------\nResponse:\n    ProbeEcho:int\n----------\nCommand Timeout: 5000\nExample:SetProbeBacklash 1 100 100 100'),
+    'SetProbeLED': ('Probe:int,NewLEDState:int', 'ProbeEcho:int,LEDState:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSet the Positioner LED On or Off.\nStatus: internal\n----------\nParameters:\n    Probe:int = 1\n    NewLEDState:int = 0\n----------\nResponse:\n    ProbeEcho:int\n    LEDState:int\n----------\nCommand Timeout: 5000\nExample:SetProbeLED 1 1'),
+    'GetProbeTableID': ('Probe:int,TableName:str', 'ProbeEcho:int,TableID:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the ID of a stored probe table or creates a new table. The ID is unique\nfor the name and the probe. The table itself has a string name. This name is not\ncase sensitive. The command has to be used before all other table commands can\nbe used. Access to tables is possible only with an ID Number (name dependent).\nStatus: internal\n----------\nParameters:\n    Probe:int = 1\n    TableName:str = "ProbeTable"\n----------\nResponse:\n    ProbeEcho:int\n    TableID:int\n----------\nCommand Timeout: 5000\nExample:GetProbeTableID 1 ProbeTable'),
+    'MoveProbeTablePoint': ('Probe:int,TableID:int,PointID:int,Velocity:Decimal', 'ProbeEcho:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nMoves a defined Positioner to a X, Y position relative to a per PosRef specified\nreference position. Notifications: 51 / 52 / 5\nStatus: internal\n----------\nParameters:\n    Probe:int = 1\n    TableID:int = 1\n    PointID:int = 1\n    Velocity:Decimal = 100\n----------\nResponse:\n    ProbeEcho:int\n----------\nCommand Timeout: 30000\nExample:MoveProbeTablePoint 3 14 10 67'),
+    'ReadProbeTablePoint': ('Probe:int,TableID:int,PointID:int,Unit:str', 'ProbeEcho:int,CoordX:Decimal,CoordY:Decimal,CoordSystem:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReads the data from a point of a stored table in the Kernel.\nStatus: internal\n----------\nParameters:\n    Probe:int = 1\n    TableID:int = 0\n    PointID:int = 0\n    Unit:str = "Microns"\n----------\nResponse:\n    ProbeEcho:int\n    CoordX:Decimal\n    CoordY:Decimal\n    CoordSystem:str\n----------\nCommand Timeout: 5000\nExample:ReadProbeTablePoint 2 4 10 Y'),
+    'SetProbeTablePoint': ('Probe:int,TableID:int,PointID:int,CoordX:Decimal,CoordY:Decimal,Unit:str,CoordSystem:str', 'ProbeEcho:int,ValidPoint:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSets one point of a Positioner table inside the Kernel. If there is still a\npoint with this index loaded, the Kernel returns an error. Number of positions\nand number of tables are dependent on the internal memory. All positions are\nstored persistent, that means after switching power on or off the positions are\nstill available. The table starts with point number 1 and ends with the ID 16.\nThe table can contain 65535 points with the ID 0 up to 65534. Overwriting of\nposition points is not possible. The point has to be deleted before other values\nare set.\nStatus: internal\n----------\nParameters:\n    Probe:int = 1\n    TableID:int = 0\n    PointID:int = 0\n    CoordX:Decimal = 0\n    CoordY:Decimal = 0\n    Unit:str = "Microns"\n    CoordSystem:str = "HomeSystem"\n----------\nResponse:\n    ProbeEcho:int\n    ValidPoint:int\n----------\nCommand Timeout: 5000\nExample:SetProbeTablePoint 3 12 10 8992.5 7883.0 Y Z M'),
+    'ClearProbeTablePoint': ('Probe:int,TableID:int,StartPoint:int,EndPoint:int', 'ProbeEcho:int,ClearNumber:int,ValidNumber:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nClear one or a range of Positioner table site points in the Kernel. If\nStartPoint is a negative value, the whole table will be deleted.\nStatus: internal\n----------\nParameters:\n    Probe:int = 1\n    TableID:int = 0\n    StartPoint:int = -1\n    EndPoint:int = 0\n----------\nResponse:\n    ProbeEcho:int\n    ClearNumber:int\n    ValidNumber:int\n----------\nCommand Timeout: 5000\nExample:ClearProbeTablePoint 3 4 10 15'),
+    'MoveScopeSilo': ('Index:int', '',
+        'Move the Scope to the reference position of the given silo. The reference\nposition should be - if not defined otherwise - 200 um above the safe z-height\nin the center of the Scope.\nStatus: published\n----------\nParameters:\n    Index:int = 1\n----------\nCommand Timeout: 70000\nExample:MoveScopeSilo 1'),
+    'SetScopeSiloReference': ('Index:int,X:Decimal,Y:Decimal,Z:Decimal', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSet the reference position of a silo. The next time the Scope moves to this\nsilo, it will go to this position. The Reference position must be inside the\nsilo in xy and above the lower Z-Fence of the silo.  Setting the reference\nposition directly on the fence in x, y or z typically leads to errors. Try to\nkeep a safety margin.\nStatus: internal\n----------\nParameters:\n    Index:int = 1\n    X:Decimal = 0\n    Y:Decimal = 0\n    Z:Decimal = 0\n----------\nCommand Timeout: 5000\nExample:SetScopeSiloReference 1 1000 2000 3000'),
+    'AlignChuckTheta': ('XDistance:Decimal,YDistance:Decimal,PosRef:str', '',
+        'This command causes a Chuck Theta axis rotation to align the wafer to the Chuck\nX,Y movements.   It can be used to perform a two point alignment with P1(X1,Y1)\nand P2(X2,Y2) as two points on a wafer street line.   The units of the distances\nare not important - but both distances should use the same unit.    If one or\nboth distances are zero, the command does not return an error and instead ignore\nthis alignment\nStatus: published\n----------\nParameters:\n    XDistance:Decimal = 0\n    YDistance:Decimal = 0\n    PosRef:str = "Relative"\n----------\nCommand Timeout: 10000\nExample:AlignChuckTheta 10000 10 R'),
+    'AlignScopeTheta': ('XDistance:Decimal,YDistance:Decimal,PosRef:str', '',
+        'This command causes a virtual rotation of the Scope coordinate system to align\nthe Scope to the Chuck X,Y axis or/and to the wafer alignment. It can be used to\nperform a two point alignment with the points P1(X1,Y1) and P2(X2,Y2).\nCalculation of X and Y distances:\nStatus: published\n----------\nParameters:\n    XDistance:Decimal = 0\n    YDistance:Decimal = 0\n    PosRef:str = "Relative"\n----------\nCommand Timeout: 10000\nExample:AlignScopeTheta 10000 10 R'),
+    'AlignProbeTheta': ('Probe:int,XDistance:Decimal,YDistance:Decimal,PosRef:str', 'ProbeEcho:int',
+        'This command causes a rotation of the coordinate system of given probe to align\nthe probe to the Chuck X,Y axis or/and to the wafer alignment. It can be used to\nperform a two point alignment with the points P1(X1,Y1) and P2(X2,Y2).\nCalculation of Y and Y distances:\nStatus: published\n----------\nParameters:\n    Probe:int = 1\n    XDistance:Decimal = 0\n    YDistance:Decimal = 0\n    PosRef:str = "Relative"\n----------\nResponse:\n    ProbeEcho:int\n----------\nCommand Timeout: 10000\nExample:AlignProbeTheta 1 10000 10 R'),
+    'AlignCardTheta': ('Angle:Decimal,Unit:str,PosRef:str', '',
+        'This command causes a rotation of the Chuck coordinate system to align the Chuck\nX, Y axis to the probecard.   The polarity of the data determines a left or a\nright rotation of the Chuck coordinate system.\nStatus: published\n----------\nParameters:\n    Angle:Decimal = 0\n    Unit:str = "Degrees"\n    PosRef:str = "Relative"\n----------\nCommand Timeout: 10000\nExample:AlignCardTheta 2.5 D R'),
+    'ReadCardTheta': ('Unit:str', 'Angle:Decimal',
+        'Returns the angle between the Chuck coordinate-system and the probecard\ncoordinate-system.\nStatus: published\n----------\nParameters:\n    Unit:str = "Degrees"\n----------\nResponse:\n    Angle:Decimal\n----------\nCommand Timeout: 5000\nExample:ReadCardTheta D'),
+    'ReadChuckTheta': ('Unit:str', 'Angle:Decimal',
+        'Returns the current Chuck alignment angle which is identical to the current\nvalue of theta rotation.\nStatus: published\n----------\nParameters:\n    Unit:str = "Degrees"\n----------\nResponse:\n    Angle:Decimal\n----------\nCommand Timeout: 5000\nExample:ReadChuckTheta D'),
+    'ReadScopeTheta': ('Unit:str', 'Angle:Decimal',
+        'Returns the Scope\'s alignment angle, which is the angle between the Chuck\ncoordinate system and the Scope coordinate system.\nStatus: published\n----------\nParameters:\n    Unit:str = "Degrees"\n----------\nResponse:\n    Angle:Decimal\n----------\nCommand Timeout: 5000\nExample:ReadScopeTheta D'),
+    'ReadProbeTheta': ('Probe:int,Unit:str', 'ProbeEcho:int,Angle:Decimal',
+        'Returns the actual Positioner\'s alignment angle, which is the angle between the\nChuck coordinate system and the Positioner coordinate system.\nStatus: published\n----------\nParameters:\n    Probe:int = 1\n    Unit:str = "Degrees"\n----------\nResponse:\n    ProbeEcho:int\n    Angle:Decimal\n----------\nCommand Timeout: 5000\nExample:ReadProbeTheta 1 D'),
+    'ReadJoystickSpeeds': ('Stage:str,Axis:str', 'JogTime:Decimal,Speed2:Decimal,Speed3:Decimal,Speed4:Decimal,IndexTime:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nGets the preset speeds, which are used by the joystick controller for moving a\nsingle stage. The speeds can be read for XY, for Z and for Theta axis\nseparately. Jog timing and index timing are the times, the joystick controller\nwaits between two single jog or index moves.\nStatus: internal\n----------\nParameters:\n    Stage:str = "Chuck"\n    Axis:str = "X"\n----------\nResponse:\n    JogTime:Decimal\n    Speed2:Decimal\n    Speed3:Decimal\n    Speed4:Decimal\n    IndexTime:Decimal\n----------\nCommand Timeout: 5000\nExample:ReadJoystickSpeeds S Z'),
+    'SetJoystickSpeeds': ('Stage:str,JogTime:Decimal,Speed2:Decimal,Speed3:Decimal,Speed4:Decimal,IndexTime:Decimal,Axis:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSets the preset speeds, which are used by the joystick controller for moving a\nsingle stage. After setting, the speeds can be selected by pressing the Speed n\nbuttons at the controller. The speeds must be set separately for XY, for Z and\nfor Theta axis. Jog timing and index timing are the times, the joystick\ncontroller waits between two single jog or index moves.\nStatus: internal\n----------\nParameters:\n    Stage:str = "Chuck"\n    JogTime:Decimal = 0\n    Speed2:Decimal = 0\n    Speed3:Decimal = 0\n    Speed4:Decimal = 0\n    IndexTime:Decimal = 0\n    Axis:str = "X"\n----------\nCommand Timeout: 5000\nExample:SetJoystickSpeeds S 10 20 30 40 50 Z'),
+    'SetLoaderGate': ('Open:int', '',
+        'Opens or closes the loader gate. Automatic handling systems can load wafers to\nthe Chuck through the gate.\nStatus: published\n----------\nParameters:\n    Open:int = 0\n----------\nCommand Timeout: 5000\nExample:SetLoaderGate 0'),
+    'ReadWaferStatus': ('', 'SensedByVac:str',
+        'Returns whether the system detected a wafer. This feature can be used if the\nProbe Station is equipped with a vacuum sensor and while vacuum is activated.\nStatus: published\n----------\nResponse:\n    SensedByVac:str\n----------\nCommand Timeout: 5000\nExample:ReadWaferStatus'),
+    'ReadContactCount': ('Stage:str', 'Count:int',
+        'Returns the number of times this stage moved to contact since the last time the\ncounter was reset.\nStatus: published\n----------\nParameters:\n    Stage:str = "Chuck"\n----------\nResponse:\n    Count:int\n----------\nCommand Timeout: 5000\nExample:ReadContactCount C'),
+    'ResetContactCount': ('Stage:str', '',
+        'Resets the contact counter for the specified stage to zero. Notifications: 23\nStatus: published\n----------\nParameters:\n    Stage:str = "Chuck"\n----------\nCommand Timeout: 5000\nExample:ResetContactCount C'),
+    'SetManualMode': ('Enable:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command enables the manual mode on stations with XY knobs. This mode will\nallow to move the Chuck using the knobs.\nStatus: internal\n----------\nParameters:\n    Enable:int = 1\n----------\nCommand Timeout: 10000\nExample:SetManualMode 1'),
+    'GetManualMode': ('', 'Enable:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command returns the state of the manual mode for stations with XY knobs.\nStatus: internal\n----------\nResponse:\n    Enable:int\n----------\nCommand Timeout: 10000\nExample:GetManualMode 1'),
+    'GetAxisReverse': ('Stage:str,Axis:str', 'IsReverse:int',
+        'Allows reading if an axis is reverse.\nStatus: published\n----------\nParameters:\n    Stage:str = "Chuck"\n    Axis:str = "XAxis"\n----------\nResponse:\n    IsReverse:int\n----------\nCommand Timeout: 5000\nExample:GetAxisReverse C X'),
+    'EnableEdgeSensor': ('EdgeSensor:int,Enable:int', '',
+        'Enables/disables the use of an edge sensor.\nStatus: published\n----------\nParameters:\n    EdgeSensor:int = 1\n    Enable:int = 1\n----------\nCommand Timeout: 5000\nExample:EnableEdgeSensor 1 1'),
+    'SetTypedOutput': ('Channel:str,WantOutputOn:int,PulseTime:int', '',
+        'Controls the Velox output channel signals. It can be used to activate/deactivate\noutputs.\nStatus: published\n----------\nParameters:\n    Channel:str = "NoSensor"\n    WantOutputOn:int = 0\n    PulseTime:int = -1\n----------\nCommand Timeout: 5000\nExample:SetTypedOutput DO_WaferVacuum 1'),
+    'ReadTypedSensor': ('Channel:str', 'IsSensorOn:int',
+        'Returns the status of the specified input channel, output channel, or edge\nsensor.\nStatus: published\n----------\nParameters:\n    Channel:str = "NoSensor"\n----------\nResponse:\n    IsSensorOn:int\n----------\nCommand Timeout: 10000\nExample:ReadTypedSensor DI_EMO'),
+    'MoveCoolDownPosition': ('', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nMoves the Chuck to the cool down position that is defined in KernelSetup. The\ncooldown position is used to move the Chuck away in XY while the robot is in the\nchamber and tries to get a hot wafer.\nStatus: internal\n----------\nCommand Timeout: 30000\nExample:MoveCoolDownPosition'),
+    'ReadJoystickSpeedsCycle': ('Stage:str', 'CycleJog:int,CycleSpeed2:int,CycleSpeed3:int,CycleSpeed4:int,CycleIndex:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command reads the cycling speeds - these are the speeds that are used by\nthe USB joystick when cycling through the speeds. Can be setup in Control\nCenter.\nStatus: internal\n----------\nParameters:\n    Stage:str = "Chuck"\n----------\nResponse:\n    CycleJog:int\n    CycleSpeed2:int\n    CycleSpeed3:int\n    CycleSpeed4:int\n    CycleIndex:int\n----------\nCommand Timeout: 5000\nExample:ReadJoystickSpeedsCycle S'),
+    'SetJoystickSpeedsCycle': ('Stage:str,CycleJog:int,CycleSpeed2:int,CycleSpeed3:int,CycleSpeed4:int,CycleIndex:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command sets the cycling speeds - these are the speeds that are used by the\nUSB joystick when cycling through the speeds. Can be setup in Control Center.\nStatus: internal\n----------\nParameters:\n    Stage:str = "Chuck"\n    CycleJog:int = 0\n    CycleSpeed2:int = 0\n    CycleSpeed3:int = 0\n    CycleSpeed4:int = 0\n    CycleIndex:int = 0\n----------\nCommand Timeout: 5000\nExample:SetJoystickSpeedsCycle C 1 1 1 1 1'),
+    'SendAUCSCommand': ('Command:str', 'Response:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command allows sending low level AUCS commands to the ECX box stage. Only\napplies to Elite/12k/S300 stations.\nStatus: internal\n----------\nParameters:\n    Command:str = ""\n----------\nResponse:\n    Response:str\n----------\nCommand Timeout: 60000\nExample:SendAUCSCommand "MM 1 0 INIT 0"'),
+    'ReadCompensationStatus': ('Stage:str,Compensation:str', 'Enabled:int,Active:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nCommand allows reading if a specific type of compensation is enabled or\ndisabled. Returns an error if this type of compensation is not available for\nthis stage.\nStatus: internal\n----------\nParameters:\n    Stage:str = "None"\n    Compensation:str = "None"\n----------\nResponse:\n    Enabled:int\n    Active:int\n----------\nCommand Timeout: 5000\nExample:ReadCompensationStatus C A'),
+    'RegisterNotification': ('NotificationCode:int,WantNotification:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nDeprecated. All Kernel notifications are enabled by default.\nStatus: internal\n----------\nParameters:\n    NotificationCode:int = 0\n    WantNotification:int = 1\n----------\nCommand Timeout: 5000'),
+    'SetCompensationStatus': ('Stage:str,Compensation:str,Status:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nEnables or disables a compensation mode for the specified stage\nStatus: internal\n----------\nParameters:\n    Stage:str = "None"\n    Compensation:str = "None"\n    Status:int = -1\n----------\nCommand Timeout: 5000\nExample:SetCompensationStatus C A 1'),
+    'GetControllerInfo': ('ControllerInfo:str', 'Value:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nCommand gets the value "Value" for the parameter "Parameter". The unit is\nparameter specific.\nStatus: internal\n----------\nParameters:\n    ControllerInfo:str = "Unknown"\n----------\nResponse:\n    Value:Decimal\n----------\nCommand Timeout: 1000\nExample:GetControllerInfo HasScanChuckZ'),
+    'SetOperationalMode': ('OperationalMode:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nIn unprotected mode a number of security features like software fence and\ninitialization necessity are deactivated.          Unprotected mode is\ndeactivated automatically after 5 minutes. Sending \'SetOperationalMode U\'\nanytime before resets the timer back to 5 minutes. It is not necessary to\ndeactivate it before.  **WARNING**: If unprotected mode is enabled, even the\nmost basic safety- and sanity-checks are skipped. Any movement may cause\nirreparable damage to the prober or attached hardware.\nStatus: internal\n----------\nParameters:\n    OperationalMode:str = "ProtectedMode"\n----------\nCommand Timeout: 5000\nExample:SetOperationalMode P'),
+    'GetNanoChamberState': ('', 'NanoChamberState:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nGet the currently configured Nano-chamber-state.\nStatus: internal\n----------\nResponse:\n    NanoChamberState:str\n----------\nCommand Timeout: 1000'),
+    'SetNanoChamberState': ('NanoChamberState:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSet the NanoChamber-state.\nStatus: internal\n----------\nParameters:\n    NanoChamberState:str = "Free"\n----------\nCommand Timeout: 1000'),
+    'SetCameraCool': ('State:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nAllows to force activate/deactivate the camera cool output or to let it be set\nautomatically by purge control.\nStatus: internal\n----------\nParameters:\n    State:int = 2\n----------\nCommand Timeout: 10000\nExample:SetCameraCool 0'),
+    'ActivateChuckVacuum': ('', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nActivates the Chuck vacuum and forces it to be on. This command ignores the\nvacuum sensor and timeout.\nStatus: internal\n----------\nCommand Timeout: 10000\nExample:ActivateChuckVacuum'),
+    'ReadMatrixValues': ('Stage:str,MatrixIndexX:int,MatrixIndexY:int', 'XVal:Decimal,YVal:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command returns a point from the matrix compensation table for the\nspecified axis from the Kernel. All command parameters are mandatory.\nStatus: internal\n----------\nParameters:\n    Stage:str = "Chuck"\n    MatrixIndexX:int = 0\n    MatrixIndexY:int = 0\n----------\nResponse:\n    XVal:Decimal\n    YVal:Decimal\n----------\nCommand Timeout: 5000\nExample:ReadMatrixValues C 0 0'),
+    'SetMatrixValues': ('Stage:str,MatrixIndexX:int,MatrixIndexY:int,XVal:Decimal,YVal:Decimal', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nDownloads a point of the matrix compensation table for a specified stage to the\nKernel. All command parameters are mandatory.\nStatus: internal\n----------\nParameters:\n    Stage:str = "Chuck"\n    MatrixIndexX:int = 0\n    MatrixIndexY:int = 0\n    XVal:Decimal = 0\n    YVal:Decimal = 0\n----------\nCommand Timeout: 5000\nExample:SetMatrixValues C 0 0 5000.0 5000.0 2500.0'),
+    'ReadMEAStatus': ('Stage:str,Type:int', 'Enable:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReads if the MEA file for a stage is loaded/enabled (Nucleus legacy stations\nonly)\nStatus: internal\n----------\nParameters:\n    Stage:str = "Chuck"\n    Type:int = 0\n----------\nResponse:\n    Enable:int\n----------\nCommand Timeout: 5000\nExample:ReadMEAStatus C 0'),
+    'LoadMEAFile': ('Stage:str,Type:int,Load:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nLoad the MEA file for a stage (Nucleus legacy stations only)\nStatus: internal\n----------\nParameters:\n    Stage:str = "Chuck"\n    Type:int = 0\n    Load:int = 0\n----------\nCommand Timeout: 5000\nExample:LoadMEAFile C 0 1'),
+    'ReadSoftwareLimits': ('Stage:str', 'ZLowValue:Decimal,ZHighValue:Decimal,X1Value:Decimal,Y1Value:Decimal,X2Value:Decimal,Y2Value:Decimal,X3Value:Decimal,Y3Value:Decimal,X4Value:Decimal,Y4Value:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThe command returns the positions of the actual software limits (end of move\nrange) for each axis of the specified stage in microns. If the Theta stage is\nselected Z1 and Z2 include the values for the Theta limits.\nStatus: internal\n----------\nParameters:\n    Stage:str = "Chuck"\n----------\nResponse:\n    ZLowValue:Decimal\n    ZHighValue:Decimal\n    X1Value:Decimal\n    Y1Value:Decimal\n    X2Value:Decimal\n    Y2Value:Decimal\n    X3Value:Decimal\n    Y3Value:Decimal\n    X4Value:Decimal\n    Y4Value:Decimal\n----------\nCommand Timeout: 5000\nExample:ReadSoftwareLimits C'),
+    'SetSoftwareFence': ('Stage:str,AuxID:int,FenceForm:str,XBase:Decimal,YBase:Decimal,XDist:Decimal,YDist:Decimal', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command sets types and dimensions of technological software fences. It can\nalso be used for enabling and disabling the software fence.\nStatus: internal\n----------\nParameters:\n    Stage:str = "Chuck"\n    AuxID:int = 0\n    FenceForm:str = "None"\n    XBase:Decimal = 0\n    YBase:Decimal = 0\n    XDist:Decimal = 0\n    YDist:Decimal = 0\n----------\nCommand Timeout: 10000\nExample:SetSoftwareFence C 0 R 5000 5000 25000 25000'),
+    'GetSoftwareFence': ('Stage:str,AuxID:int', 'FenceForm:str,XValue1:Decimal,YValue1:Decimal,XValue2:Decimal,YValue2:Decimal,XValue3:Decimal,YValue3:Decimal,XValue4:Decimal,YValue4:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command reads the type and the dimensions of an actual set technological\nsoftware fence. In case of a rectangular software fence, X and Y coordinates of\nthe four edge points of the fence are given back. In case of a circular software\nfence, X and Y coordinates of the center point and the radius are given back.\nAll other return values are filled with zeros. All position values are in\nmicrons from zero.\nStatus: internal\n----------\nParameters:\n    Stage:str = "Chuck"\n    AuxID:int = 0\n----------\nResponse:\n    FenceForm:str\n    XValue1:Decimal\n    YValue1:Decimal\n    XValue2:Decimal\n    YValue2:Decimal\n    XValue3:Decimal\n    YValue3:Decimal\n    XValue4:Decimal\n    YValue4:Decimal\n----------\nCommand Timeout: 10000\nExample:GetSoftwareFence C'),
+    'GetZFence': ('Stage:str,CompLayer:str', 'Enabled:int,ZLow:Decimal,ZHigh:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis commands reads if the Z-Fence is activated and the currently set Z-fence\nvalues for the specified stage.\nStatus: internal\n----------\nParameters:\n    Stage:str = "Chuck"\n    CompLayer:str = "Technology"\n----------\nResponse:\n    Enabled:int\n    ZLow:Decimal\n    ZHigh:Decimal\n----------\nCommand Timeout: 10000\nExample:GetZFence S'),
+    'SetZFence': ('Stage:str,Enabled:int,ZLow:Decimal,ZHigh:Decimal,CompLayer:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis commands sets Z-Fence and the Z-fence values for the specified stage.\nValues are stored uncompensated internally and set Technology compensated as\ndefault.\nStatus: internal\n----------\nParameters:\n    Stage:str = "Chuck"\n    Enabled:int = 0\n    ZLow:Decimal = 0\n    ZHigh:Decimal = 0\n    CompLayer:str = "Technology"\n----------\nCommand Timeout: 10000\nExample:SetZFence S 1 5000 10000'),
+    'ResetProber': ('Mode:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nRestarts the Prober and replaces the current configuration with a formerly\nwritten recovery file. If no recovery file was written, the configuration is\nreset to the version of the last Prober restart. For ProberBench electronics,\n\'H\' will restart the Operating system, \'S\' will only restart the Kernel\napplication. For Windows Kernel, \'H\' and \'S\' are identical and will only restart\nthe Kernel software.\nStatus: internal\n----------\nParameters:\n    Mode:str = "S"\n----------\nCommand Timeout: 20000\nExample:ResetProber S'),
+    'ResetCBox': ('ResetMode:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReboots the operation system inside the Joystick Controller and restarts the\nfunctionality. The restart will need a time of around 20 seconds. Only applies\nto PA stations.\nStatus: internal\n----------\nParameters:\n    ResetMode:str = "S"\n----------\nCommand Timeout: 20000\nExample:ResetCBox S'),
+    'ReadStageLocations': ('Stage:str,LocationType:str,AuxID:int', 'X:Decimal,Y:Decimal,Z:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command allows reading the Home, Load, Transfer, Transfer for Load, Die\nHome and Station Rest locations for each stage (if applicable) and for any AUX\nsite.   The Home Position on the Chuck or Positioner Z axis is also called\nContact Height. The Home Position on the Scope Z axis is also called Focus\nHeight.\nStatus: internal\n----------\nParameters:\n    Stage:str = "Chuck"\n    LocationType:str = "Center"\n    AuxID:int = 0\n----------\nResponse:\n    X:Decimal\n    Y:Decimal\n    Z:Decimal\n----------\nCommand Timeout: 5000\nExample:ReadStageLocations C C 0'),
+    'GetDataIterator': ('ShowAll:int', 'IdentityToken:int,SizeNoAll:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns a data stream handle which represents a data stream of setup parameters.\nand requires the GetNextDatum command.\nStatus: internal\n----------\nParameters:\n    ShowAll:int = 0\n----------\nResponse:\n    IdentityToken:int\n    SizeNoAll:int\n----------\nCommand Timeout: 10000\nExample:GetDataIterator 1'),
+    'GetNextDatum': ('IdentityToken:int', 'IsLastDatum:int,DatumCode:int,Attributes:int,PathNameDescrValue:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the next parameter from the data stream. Fields are separated by a\ncolon. Structure of the response parameter Value:\nPath_Path:Name:Description:Value\nStatus: internal\n----------\nParameters:\n    IdentityToken:int = 0\n----------\nResponse:\n    IsLastDatum:int\n    DatumCode:int\n    Attributes:int\n    PathNameDescrValue:str\n----------\nCommand Timeout: 10000\nExample:GetNextDatum 0'),
+    'SetDatum': ('PathNameAndValue:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSets the value of a parameter. An empty parameter string saves the whole\nconfiguration to non-volatile memory. Fields are separated by a colon.\nStatus: internal\n----------\nParameters:\n    PathNameAndValue:str = ""\n----------\nCommand Timeout: 20000\nExample:SetDatum Chuck:AlignGap:25'),
+    'GetDatum': ('PathName:str', 'Attributes:int,DatumCode:int,ValueDesc:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns a value string. The Value string consists of the value and the\ndescription. The Locator only consists of the path and the name. All fields are\nseparated by a colon.  Structure of the command parameter Locator:\nPath_Path:Name Structure of the response parameter Value: Value:Description\nStatus: internal\n----------\nParameters:\n    PathName:str = ""\n----------\nResponse:\n    Attributes:int\n    DatumCode:int\n    ValueDesc:str\n----------\nCommand Timeout: 5000\nExample:GetDatum Chuck:AlignGap'),
+    'SetRecoveryDatum': ('PathNameAndValue:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSets the value of a parameter. An empty parameter string saves the whole\nconfiguration to non-volatile memory. Fields are separated by a colon.\nStatus: internal\n----------\nParameters:\n    PathNameAndValue:str = ""\n----------\nCommand Timeout: 5000\nExample:SetRecoveryDatum Chuck:AlignGap:25'),
+    'SetZProfilePoint': ('Stage:str,XValue:Decimal,YValue:Decimal,ZGap:Decimal,PosRef:str,Unit:str,ZProfileType:int', 'ValueCount:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSet a point for the Z height profile. If this profile is enabled, the Z height\ndepends on a X and Y coordinate. The Z value is a gap to the current Z height.\nPositive values are elevated spots, negative values are hollows. The height\nprofile is used to adjust the Z height. The adjusted Z height at a X and Y\nposition is derived from the nearest profile point. The Z contact level will be\ncalculated from the Contact Height and the stored Z gap at this point.  See\nGetZProfilePoint for details.\nStatus: internal\n----------\nParameters:\n    Stage:str = "Chuck"\n    XValue:Decimal = 0\n    YValue:Decimal = 0\n    ZGap:Decimal = 0\n    PosRef:str = "Home"\n    Unit:str = "Microns"\n    ZProfileType:int = 0\n----------\nResponse:\n    ValueCount:int\n----------\nCommand Timeout: 5000\nExample:SetZProfilePoint C 5000 5000 -3 H Y'),
+    'ReadZProfilePoint': ('Stage:str,Index:int,PosRef:str,Unit:str,ZProfileType:int', 'XValue:Decimal,YValue:Decimal,ZGap:Decimal,ValueCount:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nGet a single point and the corresponding Z gap of the Z height profile.  The\ndifferent z profiles are:  - transient: meant to be used on a per-wafer-basis,\ndefault - persistent: configured once, stays in memory - persistent-offset: same\nas persistent, active when offset is enabled - scratch: not used internally. Can\nbe used to translate KernelDatums <-> ZProfile-Points\nStatus: internal\n----------\nParameters:\n    Stage:str = "Chuck"\n    Index:int = 0\n    PosRef:str = "Home"\n    Unit:str = "Microns"\n    ZProfileType:int = 0\n----------\nResponse:\n    XValue:Decimal\n    YValue:Decimal\n    ZGap:Decimal\n    ValueCount:int\n----------\nCommand Timeout: 5000\nExample:ReadZProfilePoint C 1 H'),
+    'ClearZProfile': ('Stage:str,ZProfileType:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nClears all profile points. See GetZProfile for type description.\nStatus: internal\n----------\nParameters:\n    Stage:str = "Chuck"\n    ZProfileType:int = 0\n----------\nCommand Timeout: 5000\nExample:ClearZProfile C'),
+    'ReadScopeSilo': ('Index:int', 'Type:str,CenterX:Decimal,CenterY:Decimal,Radius:Decimal,Pos2X:Decimal,Pos2Y:Decimal,ZHigh:Decimal,RefX:Decimal,RefY:Decimal,RefZ:Decimal',
+        'Returns the definition of a silo. If the type is rectangle, center means\n_Point1_. If the type is circle, the meaning of Pos2X and Pos2Y is undefined.\nStatus: published\n----------\nParameters:\n    Index:int = 1\n----------\nResponse:\n    Type:str\n    CenterX:Decimal\n    CenterY:Decimal\n    Radius:Decimal\n    Pos2X:Decimal\n    Pos2Y:Decimal\n    ZHigh:Decimal\n    RefX:Decimal\n    RefY:Decimal\n    RefZ:Decimal\n----------\nCommand Timeout: 5000\nExample:ReadScopeSilo 1'),
+    'OpenProjectDialog': ('ProjectFilename:str,Option:int', '',
+        'Asks if the current project should be saved and then brings up the Open Project\nwindow which opens the selected project file if the user clicks ok.\nStatus: published\n----------\nParameters:\n    ProjectFilename:str = ""\n    Option:int = 0\n----------\nCommand Timeout: 5000'),
+    'SaveProjectAsDialog': ('', '',
+        'Brings up the Save Project window which saves the project if the user clicks ok.\nStatus: published\n----------\nCommand Timeout: 5000'),
+    'LoginDialog': ('LevelToOffer:str', '',
+        'Brings up the Login window and sends a New Access Level alert if the user enters\na valid password.\nStatus: published\n----------\nParameters:\n    LevelToOffer:str = "1"\n----------\nCommand Timeout: 5000'),
+    'GetStatus': ('', 'DummyCommonMode:int,RunningMode:str,AccessLevel:str,ExternalMode:int,LicenseDaysLeft:int,MKH:int',
+        'Returns the current software status. The server holds and maintains the software\nstatus. Status can be changed by using any of the following commands:\nLoginDialog and SetExternalMode.\nStatus: published\n----------\nResponse:\n    DummyCommonMode:int\n    RunningMode:str\n    AccessLevel:str\n    ExternalMode:int\n    LicenseDaysLeft:int\n    MKH:int\n----------\nCommand Timeout: 5000'),
+    'LicensingDialog': ('', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nBrings up the Licensing window.\nStatus: internal\n----------\nCommand Timeout: 5000'),
+    'GetLicenseInfo': ('', 'AnnualEnabled:int,AnnualDaysLeft:int,VeloxProEnabled:int,VueTrackEnabled:int,VueTrack4PEnabled:int,ReAlignEnabled:int,AutomationEnabled:int,IdToolsEnabled:int,IVistaEnabled:int,IVistaProEnabled:int,LaserCutterEnabled:int,SiPToolsEnabled:int,AutoRfEnabled:int,SecsGemEnabled:int,Evue5ProEnabled:int,Evue5_40XEnabled:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the current license information.\nStatus: internal\n----------\nResponse:\n    AnnualEnabled:int\n    AnnualDaysLeft:int\n    VeloxProEnabled:int\n    VueTrackEnabled:int\n    VueTrack4PEnabled:int\n    ReAlignEnabled:int\n    AutomationEnabled:int\n    IdToolsEnabled:int\n    IVistaEnabled:int\n    IVistaProEnabled:int\n    LaserCutterEnabled:int\n    SiPToolsEnabled:int\n    AutoRfEnabled:int\n    SecsGemEnabled:int\n    Evue5ProEnabled:int\n    Evue5_40XEnabled:int\n----------\nCommand Timeout: 5000'),
+    'GetProjectFile': ('', 'ProjectFilename:str',
+        'Returns the current project file.\nStatus: published\n----------\nResponse:\n    ProjectFilename:str\n----------\nCommand Timeout: 5000'),
+    'ReportSoftwareVersion': ('', 'SoftwareVersion:str',
+        'Returns the Velox software version as string.\nStatus: published\n----------\nResponse:\n    SoftwareVersion:str\n----------\nCommand Timeout: 5000'),
+    'OpenProject': ('ProjectFilename:str', '',
+        'The OpenProject command opens the specified project.\nStatus: published\n----------\nParameters:\n    ProjectFilename:str = ""\n----------\nCommand Timeout: 15000'),
+    'IsAppRegistered': ('Application:str', 'IsAppRegistered:int',
+        'Checks the server to see if the application "AppName" is registered with the\nserver.\nStatus: published\n----------\nParameters:\n    Application:str = ""\n----------\nResponse:\n    IsAppRegistered:int\n----------\nCommand Timeout: 5000\nExample:IsAppRegistered WaferMap'),
+    'SaveProject': ('ProjectFilename:str', '',
+        'Saves the current data to the project file.\nStatus: published\n----------\nParameters:\n    ProjectFilename:str = ""\n----------\nCommand Timeout: 15000'),
+    'GetSoftwarePath': ('PathType:str', 'SoftwarePath:str',
+        'Returns the path for either the applications/data or project files.\nStatus: published\n----------\nParameters:\n    PathType:str = "User"\n----------\nResponse:\n    SoftwarePath:str\n----------\nCommand Timeout: 5000\nExample:GetSoftwarePath User'),
+    'CCSelectLens': ('Lens:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nInternal AZoom Helper Command.\nStatus: internal\n----------\nParameters:\n    Lens:int = 1\n----------\nCommand Timeout: 10000\nExample:CCSelectLens 1'),
+    'CCReadCurrentLens': ('', 'Lens:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nInternal AZoom Helper Command. Probably no longer used.\nStatus: internal\n----------\nResponse:\n    Lens:int\n----------\nCommand Timeout: 5000'),
+    'CCMoveAuxSite': ('AuxID:int', '',
+        "***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command calls the Kernel command MoveAuxSite to move the Chuck to the\nposition of a given AUX Site. For the transfer move a safe height is used. If\nAUX ID is set to 0, the target of the move is the Wafer Site. If the flag 'Auto\nAlign by Spectrum' in Velox Settings is True, the Spectrum command AlignAux is\nexecuted after MoveAuxSite to align the Site automatically. The flag is only\nvisible, if the AUX Site type is CalSubstrate and Spectrum is installed. AUX ID\nin the response is the ID of the new active Site.\nStatus: internal\n----------\nParameters:\n    AuxID:int = 1\n----------\nCommand Timeout: 200000"),
+    'ExecuteCleaningSequence': ('SequenceName:str,AllowMediaReuse:int,SkipAlignAux:int,SkipReturnMove:int', '',
+        'This command moves to the single cleaning Site, executes CleanProbeTip, moves to\nthe contact verify Site, and then moves to contact. Returns an error if the\nclean or verify Sites aren\'t defined.\nStatus: published\n----------\nParameters:\n    SequenceName:str = ""\n    AllowMediaReuse:int = 0\n    SkipAlignAux:int = 0\n    SkipReturnMove:int = 0\n----------\nCommand Timeout: 1800000\nExample:ExecuteCleaningSequence "DeepClean"'),
+    'GetAlignmentMode': ('', 'AlignmentMode:str',
+        'Get the active alignment mode (either on axis or off axis).\nStatus: published\n----------\nResponse:\n    AlignmentMode:str\n----------\nCommand Timeout: 5000'),
+    'SetAlignmentMode': ('AlignmentMode:str', '',
+        'Sets the active alignment mode (either on axis or off axis).\nStatus: published\n----------\nParameters:\n    AlignmentMode:str = "OnAxis"\n----------\nCommand Timeout: 5000'),
+    'GetLoginData': ('CmdUserName:str', 'UserName:str,LongUserName:str,UserGroup:str,AccessLevel:str,VeloxLocked:int',
+        'Gets the Velox user data: name, full name, group, access level.     If the\ncommanded user name is empty, the data of the current user will be returned\nStatus: published\n----------\nParameters:\n    CmdUserName:str = ""\n----------\nResponse:\n    UserName:str\n    LongUserName:str\n    UserGroup:str\n    AccessLevel:str\n    VeloxLocked:int\n----------\nCommand Timeout: 5000\nExample:GetLoginData'),
+    'NucleusInitChuck': ('', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nBrings up message box to warn user of Chuck initialization for Nucleus stations.\nAllows user to OK/Cancel.\nStatus: internal\n----------\nCommand Timeout: 1000'),
+    'ShutdownVeloxWithSave': ('', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nBrings up message box to allow saving project before shutting down Velox. Allows\nuser to OK/Cancel. This command returns an error if the shutdown is canceled.\nStatus: internal\n----------\nCommand Timeout: 600000'),
+    'WinCalAutoCal': ('', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSends the WinCalAutoCal command to WinCal.\nStatus: internal\n----------\nCommand Timeout: 300000'),
+    'WinCalCheckAutoRFStability': ('AllowMove:int', 'StabilityPassed:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSends the WinCalCheckAutoRFStability command to WinCal.\nStatus: internal\n----------\nParameters:\n    AllowMove:int = 0\n----------\nResponse:\n    StabilityPassed:int\n----------\nCommand Timeout: 300000'),
+    'WinCalCloseRFStabilityReport': ('', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSends the WinCalCloseRFStabilityReport command to WinCal.\nStatus: internal\n----------\nCommand Timeout: 10000'),
+    'WinCalMoveToIssRef': ('IssIdx:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSends the WinCalMoveToIssRef command to WinCal to move to the specified ISS\nreference.     The ISS index is the IssIdxMap index as returned from\nWinCalGetIssListForAuxSite.\nStatus: internal\n----------\nParameters:\n    IssIdx:int = 0\n----------\nCommand Timeout: 60000'),
+    'WinCalVerifyIssRefLocAtHome': ('IssIdx:int', 'AllRefAtHome:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSends the WinCalVerifyIssRefLocAtHome command to WinCal and returns AllRefAtHome\nas 1 if stage and Positioners at home.\nStatus: internal\n----------\nParameters:\n    IssIdx:int = 0\n----------\nResponse:\n    AllRefAtHome:int\n----------\nCommand Timeout: 60000'),
+    'WinCalGetIssForAuxSite': ('AuxID:int', 'IssIdx:int,IssPN:str,IssDescription:str,IssEnabled:int,AuxSiteName:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSends the WinCalGetIssForAuxSite command to WinCal and returns the ISS\ninformation for the given AUX Site ID.\nStatus: internal\n----------\nParameters:\n    AuxID:int = 0\n----------\nResponse:\n    IssIdx:int\n    IssPN:str\n    IssDescription:str\n    IssEnabled:int\n    AuxSiteName:str\n----------\nCommand Timeout: 10000'),
+    'WinCalGetNameAndVersion': ('', 'ServerName:str,Version:str,MajorVersion:int,MinorVersion:int,Revision:int,Build:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSends the WinCalGetNameAndVersion command to WinCal.\nStatus: internal\n----------\nResponse:\n    ServerName:str\n    Version:str\n    MajorVersion:int\n    MinorVersion:int\n    Revision:int\n    Build:int\n----------\nCommand Timeout: 30000'),
+    'WinCalMonitorNoMove': ('', 'MonitorPassed:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSends the CalMonitorNoMove command to WinCal. Triggers WinCal to measure the\nmonitor portion of the current calibration setup.\nStatus: internal\n----------\nResponse:\n    MonitorPassed:int\n----------\nCommand Timeout: 300000'),
+    'WinCalValidateAdvanced': ('ProbeSpacing:Decimal,ResetTrace:int,AllowMove:int', 'ValidationPassed:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSends the CalValidateAdvanced command to WinCal. Performs the validation step of\nthe currently selected calibration setup.     Resets the model used in WinCal\nfor validation.\nStatus: internal\n----------\nParameters:\n    ProbeSpacing:Decimal = 130\n    ResetTrace:int = 1\n    AllowMove:int = 1\n----------\nResponse:\n    ValidationPassed:int\n----------\nCommand Timeout: 300000'),
+    'WinCalMeasureMonitorReference': ('AllowMove:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSends the CalMeasureMonitorReference command to WinCal.\nStatus: internal\n----------\nParameters:\n    AllowMove:int = 0\n----------\nCommand Timeout: 300000'),
+    'WinCalGetNumValidationPorts': ('', 'NumValidationPorts:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSends the CalGetNumValidationPorts command to WinCal.\nStatus: internal\n----------\nResponse:\n    NumValidationPorts:int\n----------\nCommand Timeout: 10000'),
+    'WinCalSetNumValidationPorts': ('NumValidationPorts:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSends the CalSetNumValidationPorts command to WinCal.\nStatus: internal\n----------\nParameters:\n    NumValidationPorts:int = 2\n----------\nCommand Timeout: 10000'),
+    'WinCalGetNumMonitoringPorts': ('', 'NumMonitoringPorts:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSends the CalGetNumMonitoringPorts command to WinCal.\nStatus: internal\n----------\nResponse:\n    NumMonitoringPorts:int\n----------\nCommand Timeout: 10000'),
+    'WinCalSetNumMonitoringPorts': ('NumMonitoringPorts:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSends the CalSetNumMonitoringPorts command to WinCal.\nStatus: internal\n----------\nParameters:\n    NumMonitoringPorts:int = 2\n----------\nCommand Timeout: 10000'),
+    'WinCalGetNumRepeatabilityPorts': ('', 'NumRepeatabilityPorts:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSends the CalGetNumRepeatabilityPorts command to WinCal.\nStatus: internal\n----------\nResponse:\n    NumRepeatabilityPorts:int\n----------\nCommand Timeout: 10000'),
+    'WinCalSetNumRepeatabilityPorts': ('NumRepeatabilityPorts:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSends the CalSetNumRepeatabilityPorts command to WinCal.\nStatus: internal\n----------\nParameters:\n    NumRepeatabilityPorts:int = 2\n----------\nCommand Timeout: 10000'),
+    'WinCalValidate': ('', 'ValidationPassed:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSends the CalValidate command to WinCal. Performs the validation step of the\ncurrently selected calibration setup in WinCal.\nStatus: internal\n----------\nResponse:\n    ValidationPassed:int\n----------\nCommand Timeout: 300000'),
+    'WinCalGetValidationSetup': ('Port:int', 'StandardType:str,StandardPorts:int,StandardCompareType:int,StructureType:str,PostCorrect:int,PostCorrectMatching:int,AutoConfigure:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSends CalGetValidationSetup command to WinCal. Returns calibration setup\nparameters.\nStatus: internal\n----------\nParameters:\n    Port:int = 1\n----------\nResponse:\n    StandardType:str\n    StandardPorts:int\n    StandardCompareType:int\n    StructureType:str\n    PostCorrect:int\n    PostCorrectMatching:int\n    AutoConfigure:int\n----------\nCommand Timeout: 10000'),
+    'WinCalAutoCalNoValidation': ('ProbeSpacing:Decimal', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSends the WinCalAutoCalNoValidation command to WinCal. Performs an AutoCal\nwithout the validation step\nStatus: internal\n----------\nParameters:\n    ProbeSpacing:Decimal = 130\n----------\nCommand Timeout: 300000'),
+    'WinCalHideAllWindows': ('', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSends the WinCalHideAllWindows command to WinCal. This minimizes all the WinCal\nwindows\nStatus: internal\n----------\nCommand Timeout: 10000'),
+    'WinCalGetReferenceStructureInfo': ('IssIdx:int', 'ReferenceInfo:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSends the CalGetReferenceStructureInfo command to WinCal. Given the WinCal ISS\nindex it will return a string with the reference information\nStatus: internal\n----------\nParameters:\n    IssIdx:int = 0\n----------\nResponse:\n    ReferenceInfo:str\n----------\nCommand Timeout: 10000'),
+    'WinCalSystemSetupHasUnappliedChanges': ('ShowErrors:int', 'HasUnappliedChanges:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSends the WinCalSystemSetupHasUnappliedChanges command to WinCal. Returns true\nif WinCal has unapplied changes\nStatus: internal\n----------\nParameters:\n    ShowErrors:int = 0\n----------\nResponse:\n    HasUnappliedChanges:int\n----------\nCommand Timeout: 10000'),
+    'WinCalRecordIssRefAtCurrentLoc': ('IssIdx:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSends the CalRecordIssRefAtCurrentLoc command to WinCal. Record the ISS,\nindicated by the index, reference as being the current location\nStatus: internal\n----------\nParameters:\n    IssIdx:int = 0\n----------\nCommand Timeout: 10000'),
+    'WinCalGetNumPortsAndProbes': ('', 'MaxPorts:int,NumPortsConnectedtoProbes:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns Max Ports and Number of probes connected to a port\nStatus: internal\n----------\nResponse:\n    MaxPorts:int\n    NumPortsConnectedtoProbes:int\n----------\nCommand Timeout: 1000\nExample:WinCalGetNumPortsAndProbes'),
+    'WinCalGetProbeInfoForPort': ('VnaPortNum:int', 'IsSelected:int,BaseProbe:str,Options:str,PhysicalOrient:str,IsDual:int,IsSymmetric:int,SignalConfig:str,SelectedPitch:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the properties from one probe, based on the passed in index. Pass in a\nphysical VNA port number that is less than or equal to Max Probes from the call\nto CalGetNumPortsAndProbes\nStatus: internal\n----------\nParameters:\n    VnaPortNum:int = 1\n----------\nResponse:\n    IsSelected:int\n    BaseProbe:str\n    Options:str\n    PhysicalOrient:str\n    IsDual:int\n    IsSymmetric:int\n    SignalConfig:str\n    SelectedPitch:int\n----------\nCommand Timeout: 10000\nExample:WinCalGetProbeInfoForPort 1'),
+    'GetMachineState': ('', 'MachineState:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nGets the current state of the machine.\nStatus: internal\n----------\nResponse:\n    MachineState:str\n----------\nCommand Timeout: 10000'),
+    'ShowAboutDialog': ('Pid:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nShows the help about dialog for the given application\nStatus: internal\n----------\nParameters:\n    Pid:int = -1\n----------\nCommand Timeout: 10000'),
+    'ShowSplashScreen': ('Pid:int,TimeoutMs:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nShows the splash screen for the given application\nStatus: internal\n----------\nParameters:\n    Pid:int = -1\n    TimeoutMs:int = 0\n----------\nCommand Timeout: 10000'),
+    'CloseSplashScreen': ('Pid:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nCloses the splash screen for the given application\nStatus: internal\n----------\nParameters:\n    Pid:int = -1\n----------\nCommand Timeout: 10000'),
+    'GetLastFourProjects': ('', 'ProjectFile1:str,ProjectFile2:str,ProjectFile3:str,ProjectFile4:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the last four project files that were opened.\nStatus: internal\n----------\nResponse:\n    ProjectFile1:str\n    ProjectFile2:str\n    ProjectFile3:str\n    ProjectFile4:str\n----------\nCommand Timeout: 5000'),
+    'WinCalExecuteCommand': ('Command:str', 'Response:str',
+        'Sends the WinCalExecuteCommand command to WinCal and returns the response\nstring.\nStatus: published\n----------\nParameters:\n    Command:str = ""\n----------\nResponse:\n    Response:str\n----------\nCommand Timeout: 300000'),
+    'WinCalUseNextGoodGroupOnIss': ('', '',
+        "***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nMarks the current ISS group as bad and selects the next good one, using WinCal's\nnormal criteria.\nStatus: internal\n----------\nCommand Timeout: 10000\nExample:WinCalUseNextGoodGroupOnIss"),
+    'WinCalGetCompleteEnabledIssList': ('', 'IssEnabled:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSends the CalGetCompleteIssList command to WinCal. Returns a string with all the\nenabled ISS in WinCal regardless of training or Aux site\nStatus: internal\n----------\nResponse:\n    IssEnabled:str\n----------\nCommand Timeout: 10000'),
+    'SetDemoMode': ('TurnOnDemoMode:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThe DemoMode is not supported anymore. Use ChangeDemoRsp to install a demo mode.\nThis command will return an error if its called with any other parameter as 0.\nStatus: internal\n----------\nParameters:\n    TurnOnDemoMode:int = 1\n----------\nCommand Timeout: 5000\nExample:SetDemoMode 0'),
+    'ChangeDemoRsp': ('Param:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nOverride a command with a demo response. The command will not reach its\ndestination but the supplied demo response will be returned. An active override\nfor a command will be removed if the provided timeout is negative. Format:  [ID]\n[Time] [ErrorCode]:[Response]  - Id: command id in hex without leading 0x -\nTime: time in ms between command and response, negative to reset demo mode for\nthis command - Errorcode: 0 for success, everything else indicates an error -\nResponse: response string\nStatus: internal\n----------\nParameters:\n    Param:str = ""\n----------\nCommand Timeout: 5000\nExample:ChangeDemoRsp 31 200 0:5000.0 5000.0 8500'),
+    'GetDemoMode': ('', 'DemoModeOn:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThe DemoMode is not supported anymore. Use ChangeDemoRsp to install a demo mode.\nThis command will always return 0.\nStatus: internal\n----------\nResponse:\n    DemoModeOn:int\n----------\nCommand Timeout: 5000'),
+    'ResetNetworkPort': ('Param:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\n(Re)sets the IP address and listen port of the socket to which the NetworkDriver\ntries to connect to (IP address and listen port of Kernel socket). Dummy\nimplementation for Kernel to support backwards.\nStatus: internal\n----------\nParameters:\n    Param:str = ""\n----------\nCommand Timeout: 10000\nExample:ResetNetworkPort 192.168.3.1 10000'),
+    'GetNDriverClientStatus': ('ClientNum:int,Param:str', 'Response:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nGets status information about the connection NetworkDriver to Kernel. Socket\nError is the Windows socket error, Description the Windows socket error\ndescription. If Socket Error is 0, the description \'Registered\' informs that the\nKernel is ready to receive Remote Commands.\nStatus: internal\n----------\nParameters:\n    ClientNum:int = 1\n    Param:str = ""\n----------\nResponse:\n    Response:str\n----------\nCommand Timeout: 5000\nExample:GetNDriverClientStatus'),
+    'OverrideCommandTimeout': ('CmdID:int,TimeoutMilliSec:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command allows specifying a separate command timeout for a single instance\nof a command. This is especially useful if the application that receives a\ncommand knows how long a command will take.  This command had been added for\nSoakTime-handling of StepNextDie. A safe guess for the timeout of StepNextDie is\n5s.\nStatus: internal\n----------\nParameters:\n    CmdID:int = 0\n    TimeoutMilliSec:int = 1000\n----------\nCommand Timeout: 5000\nExample:OverrideCommandTimeout 3234 20000'),
+    'ShutdownVelox': ('IgnorePID:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nShut down all Velox applications in an ordered fashion. When this command\nreturns success, all non-mandatory apps are closed and the mandatory ones will\nfollow shortly\nStatus: internal\n----------\nParameters:\n    IgnorePID:int = 0\n----------\nCommand Timeout: 120000\nExample:ShutdownVelox'),
+    'InitializationDone': ('CommandGroup:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nRegistration of an application can be delayed. To trigger this behavior,\nRegisterProberApp has to be called with flag 3 set (0x04). From\nRegisterProberApp to the time this command is sent, the application can send\ncommands but can\'t receive commands. This is necessary because some application\nhave to communicate with others during initialization and can not handle\ncommands properly during this time.  The command group is necessary because of\narchitectural reasons (By design, the command receiver does not now the sender\nof a command).\nStatus: internal\n----------\nParameters:\n    CommandGroup:str = ""\n----------\nCommand Timeout: 5000'),
+    'CloseTableView': ('', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nCloses the TableView application.\nStatus: internal\n----------\nCommand Timeout: 5000'),
+    'StepChuckSite': ('Site:str,UseLabel:int', 'SiteRet:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSteps the wafer Chuck stage to the requested Site no. of the Chuck table view.\nIf no Site number is specified the Chuck will step automatically to the next\nlogical site location. The first site in the table is site 1. A label can also\nbe specified to move to the first table point with the matching label.\nStatus: internal\n----------\nParameters:\n    Site:str = "-1"\n    UseLabel:int = 0\n----------\nResponse:\n    SiteRet:int\n----------\nCommand Timeout: 60000'),
+    'StepChuckSubsite': ('Site:str,UseLabel:int', 'SiteRet:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSteps the wafer Chuck stage to the requested Subsite no. of the Chuck subsite\ntable view. If no Subsite number is specified the Chuck will step automatically\nto the next logical site location. The first site in the table is site 1. A\nlabel can also be specified to move to the first table point with the matching\nlabel.\nStatus: internal\n----------\nParameters:\n    Site:str = "-1"\n    UseLabel:int = 0\n----------\nResponse:\n    SiteRet:int\n----------\nCommand Timeout: 60000'),
+    'StepScopeSite': ('Site:str,UseLabel:int', 'SiteRet:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSteps the microscope stage to the requested Site no. of the Scope table view. If\nno Site number is specified the Scope will step automatically to the next\nlogical site location. The first site in the table is site 1. A label can also\nbe specified to move to the first table point with the matching label.\nStatus: internal\n----------\nParameters:\n    Site:str = "-1"\n    UseLabel:int = 0\n----------\nResponse:\n    SiteRet:int\n----------\nCommand Timeout: 60000'),
+    'StepProbeSite': ('Probe:int,Site:str,UseLabel:int', 'ProbeRet:int,SiteRet:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSteps the specified probe to the requested Site no. of the Probe no table view.\nIf no Site number is specified the Positioner will step automatically to the\nnext logical site location. The first site in the table is site 1. A label can\nalso be specified to move to the first table point with the matching label.\nStatus: internal\n----------\nParameters:\n    Probe:int = -1\n    Site:str = "-1"\n    UseLabel:int = 0\n----------\nResponse:\n    ProbeRet:int\n    SiteRet:int\n----------\nCommand Timeout: 60000'),
+    'ReadChuckSitePosition': ('ID:str,UseLabel:int', 'Site:int,X:Decimal,Y:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the actual Chuck site position. The first site in the table is site 1. A\nlabel can also be specified to read the XY position of the first table entry\nwith the matching label.\nStatus: internal\n----------\nParameters:\n    ID:str = "-1"\n    UseLabel:int = 0\n----------\nResponse:\n    Site:int\n    X:Decimal\n    Y:Decimal\n----------\nCommand Timeout: 5000'),
+    'ReadScopeSitePosition': ('ID:str,UseLabel:int', 'Site:int,X:Decimal,Y:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the site position of the specified probe. The first site in the table is\nsite 1. A label can also be specified to read the XY position of the first table\nentry with the matching label.\nStatus: internal\n----------\nParameters:\n    ID:str = "-1"\n    UseLabel:int = 0\n----------\nResponse:\n    Site:int\n    X:Decimal\n    Y:Decimal\n----------\nCommand Timeout: 5000'),
+    'ReadProbeSitePosition': ('Probe:int,ID:str,UseLabel:int', 'ProbeRet:int,Site:int,X:Decimal,Y:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the site position of the specified probe. The first site in the table is\nsite 1. A label can also be specified to read the XY position of the first table\nentry with the matching label.\nStatus: internal\n----------\nParameters:\n    Probe:int = -1\n    ID:str = "-1"\n    UseLabel:int = 0\n----------\nResponse:\n    ProbeRet:int\n    Site:int\n    X:Decimal\n    Y:Decimal\n----------\nCommand Timeout: 5000'),
+    'ReadChuckSubsitePosition': ('ID:str,UseLabel:int', 'Site:int,X:Decimal,Y:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the Chuck subsite position. The first site in the table is site 1. A\nlabel can also be specified to read the XY position of the first table entry\nwith the matching label.\nStatus: internal\n----------\nParameters:\n    ID:str = "-1"\n    UseLabel:int = 0\n----------\nResponse:\n    Site:int\n    X:Decimal\n    Y:Decimal\n----------\nCommand Timeout: 5000'),
+    'StepFirstDie': ('ClearBins:int,RecalcRoute:int', 'DieX:int,DieY:int,CurSite:int,LastSiteIndex:int',
+        'Steps the Chuck to the first die of the wafer map. Returns the row and column\nnumber of the actual die location after the move is completed. If ClearBins is\n1, all binning data will be cleared from dies. If yes the route will be\nrecalculated. All dies marked to skip during the last test (marked to skip with\nSetDieStatus) will be eliminated from the route.\nStatus: published\n----------\nParameters:\n    ClearBins:int = 1\n    RecalcRoute:int = 1\n----------\nResponse:\n    DieX:int\n    DieY:int\n    CurSite:int\n    LastSiteIndex:int\n----------\nCommand Timeout: 6000000'),
+    'StepNextDie': ('CDieX:int,CDieY:int,Site:int', 'RDieX:int,RDieY:int,CurSite:int,LastSiteIndex:int',
+        "Steps the chuck to the specified x,y die location of the wafer map. If no\ncommand data is passed, the chuck automatically steps to the next logical wafer\nmap die location. Returns the row and column number of the actual die location\nafter the move is completed. In addition, the SubDie location, and total number\nof SubDies is also returned.  If Site (i.e. SubDie) is -1, the chuck will move\nto SubDie 0, on the next die; in this case, the first 2 parameters are ignored.\nIf sent without parameters, it will literally 'step to the next die'. When using\nthis command from shared code, use SendWithoutParameter().\nStatus: published\n----------\nParameters:\n    CDieX:int = 0\n    CDieY:int = 0\n    Site:int = 0\n----------\nResponse:\n    RDieX:int\n    RDieY:int\n    CurSite:int\n    LastSiteIndex:int\n----------\nCommand Timeout: 6000000"),
+    'BinMapDie': ('Bin:int,CDieX:int,CDieY:int', 'RDieX:int,RDieY:int',
+        'Assigns the bin information to the wafer map at the current die, unless a row\nand column is specified. Inks the device if the real time inking option (of the\nwafer map) is enabled.\nStatus: published\n----------\nParameters:\n    Bin:int = 0\n    CDieX:int = 0\n    CDieY:int = 0\n----------\nResponse:\n    RDieX:int\n    RDieY:int\n----------\nCommand Timeout: 30000\nExample:BinMapDie 1'),
+    'AssignMapBins': ('Bins:str', '',
+        'Assigns the pass or fail information to the actual bin value. Redundant to\nSetBinCode.\nStatus: published\n----------\nParameters:\n    Bins:str = ""\n----------\nCommand Timeout: 10000\nExample:AssignMapBins PFFFFFF'),
+    'StepFailedBack': ('', 'DieIndex:int',
+        'Steps the Chuck back the number of consecutive failed dies (goes back to the\nlast known good die) and returns the number of consecutive failed dies.\nStatus: published\n----------\nResponse:\n    DieIndex:int\n----------\nCommand Timeout: 6000000'),
+    'StepFailedForward': ('', 'DieIndex:int',
+        'Steps the Chuck forward the number of consecutive failed dies (goes to next\nuntested die).\nStatus: published\n----------\nResponse:\n    DieIndex:int\n----------\nCommand Timeout: 6000000'),
+    'ReadMapPosition': ('Pos:int,FromPos:str', 'DieX:int,DieY:int,XFromHome:Decimal,YFromHome:Decimal,CurSite:int,LastSiteIndex:int,CurDie:int,DiesCount:int,CurCluster:int,ClustersCount:int',
+        'Returns the actual Wafer Map Chuck position. The SubDie collection is 1-based,\nthe first value is 1, not 0.     CurSite returns the currently selected Subdie\n(1-based) or 0 if no Subdie is currently selected. This command (i.e.\nReadMapPosition) has been included for legacy support.       ReadMapPosition2 is\nthe preferred method for reading Wafer Map Chuck position.\nStatus: published\n----------\nParameters:\n    Pos:int = 0\n    FromPos:str = "R"\n----------\nResponse:\n    DieX:int\n    DieY:int\n    XFromHome:Decimal\n    YFromHome:Decimal\n    CurSite:int\n    LastSiteIndex:int\n    CurDie:int\n    DiesCount:int\n    CurCluster:int\n    ClustersCount:int\n----------\nCommand Timeout: 10000'),
+    'ReadMapYield': ('', 'TotalDies:int,TestedDies:int,Passed:int,Failed:int',
+        'Returns the actual wafer map yield data information.\nStatus: published\n----------\nResponse:\n    TotalDies:int\n    TestedDies:int\n    Passed:int\n    Failed:int\n----------\nCommand Timeout: 10000'),
+    'BinStepDie': ('Bin:int,CDieX:int,CDieY:int,Site:int', 'RDieX:int,RDieY:int,CurSite:int,LastSiteIndex:int',
+        'Bins the current die and steps the chuck to the next selected die location of\nthe wafer map (default) or steps to the specified Column and Row position, if\nthese values are passed.  In contrast to StepNextDie, the BinStepDie command\nwill only step from die to die while staying on the current subdie. It will not\nstep through the subdies so it cannot be used for subdie stepping.\nStatus: published\n----------\nParameters:\n    Bin:int = 0\n    CDieX:int = 0\n    CDieY:int = 0\n    Site:int = 0\n----------\nResponse:\n    RDieX:int\n    RDieY:int\n    CurSite:int\n    LastSiteIndex:int\n----------\nCommand Timeout: 6000000\nExample:BinStepDie 1'),
+    'SetMapHome': ('DieX:int,DieY:int', '',
+        'If the command has no parameters it sets the current position as home position\nboth for the wafer map and for the Chuck. Otherwise, it changes the wafer map\nhome position using the given die coordinates.\nStatus: published\n----------\nParameters:\n    DieX:int = 0\n    DieY:int = 0\n----------\nCommand Timeout: 10000'),
+    'SaveMapFile': ('FileName:str,FileType:str', '',
+        'Saves current map file with specified name.\nStatus: published\n----------\nParameters:\n    FileName:str = ""\n    FileType:str = "m"\n----------\nCommand Timeout: 10000'),
+    'SetWaferMapMode': ('Mode:str', 'ModeType:str',
+        'Enables or disables an external mode for the application. In the external mode,\nall controls are disabled. The application handles all its remote commands in\nboth modes. Special interactive modes can also be turned on.\nStatus: published\n----------\nParameters:\n    Mode:str = ""\n----------\nResponse:\n    ModeType:str\n----------\nCommand Timeout: 10000'),
+    'GetWaferMapMode': ('ModeType:str', 'Mode:str',
+        'Returns whether the application is in external mode or not.\nStatus: published\n----------\nParameters:\n    ModeType:str = ""\n----------\nResponse:\n    Mode:str\n----------\nCommand Timeout: 10000'),
+    'SetWaferNum': ('Number:str', '',
+        'Specifies the wafer number.\nStatus: published\n----------\nParameters:\n    Number:str = "0"\n----------\nCommand Timeout: 10000'),
+    'GetWaferNum': ('', 'Number:str',
+        'Returns the wafer number for the current wafer.\nStatus: published\n----------\nResponse:\n    Number:str\n----------\nCommand Timeout: 10000'),
+    'SetWaferID': ('ID:str', '',
+        'Specifies the ID for the current wafer.\nStatus: published\n----------\nParameters:\n    ID:str = "0"\n----------\nCommand Timeout: 10000'),
+    'GetWaferID': ('', 'ID:str',
+        'Returns the wafer ID for the current wafer.\nStatus: published\n----------\nResponse:\n    ID:str\n----------\nCommand Timeout: 10000'),
+    'SetProductID': ('ID:str', '',
+        'Specifies the product ID for the current wafer.\nStatus: published\n----------\nParameters:\n    ID:str = "0"\n----------\nCommand Timeout: 10000'),
+    'GetProductID': ('', 'ID:str',
+        'Displays the product ID for the current wafer.\nStatus: published\n----------\nResponse:\n    ID:str\n----------\nCommand Timeout: 10000'),
+    'DoInkerRun': ('', 'InkedDies:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nInstructs the Wafer Map to perform an ink run on the current wafer. Returns the\nnumber of dies which were inked during the inker run.\nStatus: internal\n----------\nResponse:\n    InkedDies:int\n----------\nCommand Timeout: 30000'),
+    'CloseWaferMap': ('', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nCloses the Wafer Map application.\nStatus: internal\n----------\nCommand Timeout: 10000'),
+    'GetNumSelectedDies': ('', 'SelectedDies:int',
+        'Gets the number of dies in the map which are selected for probing.\nStatus: published\n----------\nResponse:\n    SelectedDies:int\n----------\nCommand Timeout: 10000'),
+    'GetSelectedDieCoords': ('Die:int', 'DieX:int,DieY:int',
+        'Given the index of a selected die in the range [1..NumSelectedDies], returns the\ncolumn and row indices for the selected die.\nStatus: published\n----------\nParameters:\n    Die:int = 0\n----------\nResponse:\n    DieX:int\n    DieY:int\n----------\nCommand Timeout: 10000'),
+    'StepNextDieOffset': ('XOffset:Decimal,YOffset:Decimal,CDieX:int,CDieY:int', 'RDieX:int,RDieY:int',
+        'Moves to a user-specified offset within a die. The optional col row params can\nbe used to specify the die. If they are omitted, WaferMap moves to the specified\noffset within the next selected die.\nStatus: published\n----------\nParameters:\n    XOffset:Decimal = 0\n    YOffset:Decimal = 0\n    CDieX:int = 0\n    CDieY:int = 0\n----------\nResponse:\n    RDieX:int\n    RDieY:int\n----------\nCommand Timeout: 6000000'),
+    'ReadMapPosition2': ('Pos:int,FromPos:str', 'DieX:int,DieY:int,XFromHome:Decimal,YFromHome:Decimal,CurSite:int,LastSiteIndex:int,CurDie:int,DiesCount:int,CurCluster:int,ClustersCount:int',
+        'Returns the actual Wafer Map Chuck position. The SubDie collection is 0-based,\nthe first value is 0, not 1. CurSite returns the currently selected Subdie\n(0-based) or -1 if no Subdie is currently selected.  This command is the\npreferred method for reading Wafer Map Chuck position.\nStatus: published\n----------\nParameters:\n    Pos:int = 0\n    FromPos:str = "R"\n----------\nResponse:\n    DieX:int\n    DieY:int\n    XFromHome:Decimal\n    YFromHome:Decimal\n    CurSite:int\n    LastSiteIndex:int\n    CurDie:int\n    DiesCount:int\n    CurCluster:int\n    ClustersCount:int\n----------\nCommand Timeout: 10000'),
+    'DeleteSubDie2': ('Site:int', 'SitesCount:int',
+        'Deletes selected subdie. The SubDie collection is 0-based, the first value is 0,\nnot 1.       This command is the preferred method for deleting a selected\nsubdie.\nStatus: published\n----------\nParameters:\n    Site:int = 0\n----------\nResponse:\n    SitesCount:int\n----------\nCommand Timeout: 10000'),
+    'DeleteAllSubDie': ('', '',
+        'Deletes all subdies for all dies.\nStatus: published\n----------\nCommand Timeout: 10000'),
+    'GetDieLabel': ('DieX:int,DieY:int', 'Label:str',
+        'Returns a label from the wafer map at the current die, unless a row and column\nare specified.\nStatus: published\n----------\nParameters:\n    DieX:int = 0\n    DieY:int = 0\n----------\nResponse:\n    Label:str\n----------\nCommand Timeout: 10000'),
+    'SetDieLabel': ('Label:str,DieX:int,DieY:int', '',
+        'Assigns a label to the wafer map at the current die, unless a row and column are\nspecified.\nStatus: published\n----------\nParameters:\n    Label:str = ""\n    DieX:int = 0\n    DieY:int = 0\n----------\nCommand Timeout: 10000'),
+    'StepNextSubDie': ('Site:int', 'CurSite:int,LastSiteIndex:int',
+        'Steps the Chuck to the specified SubDie number relative to the current die\norigin of the wafer map. Returns the SubDie number of the actual die location\nafter the move is completed and the total number of subdies.\nStatus: published\n----------\nParameters:\n    Site:int = 0\n----------\nResponse:\n    CurSite:int\n    LastSiteIndex:int\n----------\nCommand Timeout: 6000000'),
+    'OpenWaferMap': ('FileName:str', '',
+        'Opens a Wafer Map supported file (.map,.vsd,.stv,.bct,.dpt).\nStatus: published\n----------\nParameters:\n    FileName:str = ""\n----------\nCommand Timeout: 240000'),
+    'SetDieResult': ('Result:str,DieX:int,DieY:int', '',
+        'Assigns a measurement result to the wafer map at the current die, unless a row\nand column are specified.\nStatus: published\n----------\nParameters:\n    Result:str = ""\n    DieX:int = 0\n    DieY:int = 0\n----------\nCommand Timeout: 10000'),
+    'GetDieResult': ('DieX:int,DieY:int', 'Result:str',
+        'Returns a measurement result from the wafer map at the current die, unless a row\nand column are specified.\nStatus: published\n----------\nParameters:\n    DieX:int = 0\n    DieY:int = 0\n----------\nResponse:\n    Result:str\n----------\nCommand Timeout: 10000'),
+    'SetDieMapResult': ('Result:str,DieX:int,DieY:int,Site:int', '',
+        'Assigns a measurement result to the wafer die map at the current die and the\ncurrent subdie, unless a subdie, row and column are specified. The SubDie\ncollection is 0-based, the first value is 0, not 1.\nStatus: published\n----------\nParameters:\n    Result:str = ""\n    DieX:int = 0\n    DieY:int = 0\n    Site:int = 0\n----------\nCommand Timeout: 10000'),
+    'GetDieMapResult': ('DieX:int,DieY:int,Site:int', 'Result:str',
+        'Returns a measurement result from the wafer map at the current die and current\nsubdie, unless a row, column and subdie are specified. The SubDie collection is\n0-based, the first value is 0, not 1.\nStatus: published\n----------\nParameters:\n    DieX:int = 0\n    DieY:int = 0\n    Site:int = 0\n----------\nResponse:\n    Result:str\n----------\nCommand Timeout: 10000'),
+    'BinSubDie': ('Bin:int,CDieX:int,CDieY:int,Site:int', 'RDieX:int,RDieY:int,CurSite:int,LastSiteIndex:int',
+        'Assigns the bin information for the current subdie in the current die, unless a\nsubdie, row and column are specified. The SubDie collection is 0-based, the\nfirst value is 0, not 1.\nStatus: published\n----------\nParameters:\n    Bin:int = 0\n    CDieX:int = 0\n    CDieY:int = 0\n    Site:int = 0\n----------\nResponse:\n    RDieX:int\n    RDieY:int\n    CurSite:int\n    LastSiteIndex:int\n----------\nCommand Timeout: 10000'),
+    'SetSubDieData': ('Site:int,X:Decimal,Y:Decimal,Label:str', '',
+        'Sets up SubDie data. The SubDie collection is 0-based, the first value is 0, not\n1.\nStatus: published\n----------\nParameters:\n    Site:int = 0\n    X:Decimal = 0\n    Y:Decimal = 0\n    Label:str = ""\n----------\nCommand Timeout: 10000'),
+    'GetSubDieData': ('Site:int', 'CurSite:int,X:Decimal,Y:Decimal,Label:str,Layout:str',
+        'Returns the information of a SubDie. The SubDie collection is 0-based, the first\nvalue is 0, not 1.\nStatus: published\n----------\nParameters:\n    Site:int = 0\n----------\nResponse:\n    CurSite:int\n    X:Decimal\n    Y:Decimal\n    Label:str\n    Layout:str\n----------\nCommand Timeout: 10000'),
+    'GetMapHome': ('', 'DieX:int,DieY:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command reads the home die location of the Wafer Map.\nStatus: internal\n----------\nResponse:\n    DieX:int\n    DieY:int\n----------\nCommand Timeout: 10000'),
+    'GetMapDims': ('', 'MapType:str,XIndex:Decimal,YIndex:Decimal,Columns:int,Rows:int',
+        'Returns the parameters for the current wafer.\nStatus: published\n----------\nResponse:\n    MapType:str\n    XIndex:Decimal\n    YIndex:Decimal\n    Columns:int\n    Rows:int\n----------\nCommand Timeout: 10000'),
+    'SetWaferMapParams': ('Diameter:Decimal,DieWidth:Decimal,DieHeight:Decimal,FlatLength:Decimal,FlatAngle:int,XOffset:Decimal,YOffset:Decimal,EdgeArea:Decimal', '',
+        'Creates the circle wafer with specified parameters. If parameter is omitted,\nthen zero is used. For this version of the command, units for XOffset and\nYOffset are percentages.\nStatus: published\n----------\nParameters:\n    Diameter:Decimal = 200\n    DieWidth:Decimal = 10000\n    DieHeight:Decimal = 10000\n    FlatLength:Decimal = 20\n    FlatAngle:int = 0\n    XOffset:Decimal = 0\n    YOffset:Decimal = 0\n    EdgeArea:Decimal = 0\n----------\nCommand Timeout: 240000'),
+    'SetRectMapParams': ('DieWidth:Decimal,DieHeight:Decimal,Columns:int,Rows:int', '',
+        'Creates the rectangle wafer with specified parameters.\nStatus: published\n----------\nParameters:\n    DieWidth:Decimal = 0\n    DieHeight:Decimal = 0\n    Columns:int = 0\n    Rows:int = 0\n----------\nCommand Timeout: 240000'),
+    'StepToDie': ('DieNumber:int,Site:int', 'RDieX:int,RDieY:int,CurSite:int,LastSiteIndex:int',
+        'Steps the Chuck to the die location specified by the die number of the wafer\nmap. If no command data is passed, the Chuck automatically steps to the next\nlogical wafer map die location. Returns the row and column number of the actual\ndie location after the move is completed. In addition, the SubDie location and\ntotal number of SubDies is also returned.\nStatus: published\n----------\nParameters:\n    DieNumber:int = -1\n    Site:int = 0\n----------\nResponse:\n    RDieX:int\n    RDieY:int\n    CurSite:int\n    LastSiteIndex:int\n----------\nCommand Timeout: 6000000'),
+    'GetMapOrientation': ('UseOrientationCornerForShift:int', 'Orientation:int,OriginShiftX:int,OriginShiftY:int,UseAlphas:int,UseIOs:int',
+        'Returns parameters of the map coordinate system.\nStatus: published\n----------\nParameters:\n    UseOrientationCornerForShift:int = 0\n----------\nResponse:\n    Orientation:int\n    OriginShiftX:int\n    OriginShiftY:int\n    UseAlphas:int\n    UseIOs:int\n----------\nCommand Timeout: 10000'),
+    'SetMapOrientation': ('Orientation:int,OriginShiftX:int,OriginShiftY:int,UseAlphas:int,UseIOs:int,UseOrientationCornerForShift:int', '',
+        'Sets up new map origin and new coordinate system after that.\nStatus: published\n----------\nParameters:\n    Orientation:int = 0\n    OriginShiftX:int = 0\n    OriginShiftY:int = 0\n    UseAlphas:int = 0\n    UseIOs:int = 1\n    UseOrientationCornerForShift:int = 0\n----------\nCommand Timeout: 10000'),
+    'SetDieStatus': ('DieX:int,DieY:int,Status:str', '',
+        'Sets the die status.\nStatus: published\n----------\nParameters:\n    DieX:int = 0\n    DieY:int = 0\n    Status:str = ""\n----------\nCommand Timeout: 10000'),
+    'GetDieStatus': ('DieX:int,DieY:int', 'Status:str',
+        'Gets the die status.\nStatus: published\n----------\nParameters:\n    DieX:int = 0\n    DieY:int = 0\n----------\nResponse:\n    Status:str\n----------\nCommand Timeout: 10000'),
+    'SetSubDieStatus': ('Site:int,Status:str', '',
+        'Sets the SubDie status. The SubDie collection is 0-based, the first value is 0,\nnot 1.\nStatus: published\n----------\nParameters:\n    Site:int = 0\n    Status:str = "0"\n----------\nCommand Timeout: 10000'),
+    'GetSubDieStatus': ('Site:int', 'Status:str',
+        'Returns the SubDie status. The SubDie collection is 0-based, the first value is\n0, not 1.\nStatus: published\n----------\nParameters:\n    Site:int = 0\n----------\nResponse:\n    Status:str\n----------\nCommand Timeout: 10000'),
+    'GetBinCode': ('Bin:int', 'Chars:str,Color:int,Status:str,Inker1:int,Inker2:int,Inker3:int,Inker4:int',
+        'Returns the binning information for a specific bin code.\nStatus: published\n----------\nParameters:\n    Bin:int = 0\n----------\nResponse:\n    Chars:str\n    Color:int\n    Status:str\n    Inker1:int\n    Inker2:int\n    Inker3:int\n    Inker4:int\n----------\nCommand Timeout: 10000'),
+    'SetBinCode': ('Bin:int,Chars:str,Color:int,Status:str,Inker1:int,Inker2:int,Inker3:int,Inker4:int', '',
+        'Appends the Bin information to a bin code.\nStatus: published\n----------\nParameters:\n    Bin:int = 0\n    Chars:str = ""\n    Color:int = 0\n    Status:str = ""\n    Inker1:int = 0\n    Inker2:int = 0\n    Inker3:int = 0\n    Inker4:int = 0\n----------\nCommand Timeout: 10000'),
+    'GetDieDataAsNum': ('CDieIndex:int', 'RDieIndex:int,DieX:int,DieY:int,Bin:int,Result:str',
+        'Returns the Die Information in the Row Column format. If the Die Number is\ninvalid it returns an error. If the Die Number is absent it uses the current die\non the wafer.\nStatus: published\n----------\nParameters:\n    CDieIndex:int = 0\n----------\nResponse:\n    RDieIndex:int\n    DieX:int\n    DieY:int\n    Bin:int\n    Result:str\n----------\nCommand Timeout: 10000'),
+    'SetDieDataAsNum': ('DieIndex:int,Bin:int,Result:str', '',
+        'Sets the Die Information. If the Die Number is invalid it returns an error.\nStatus: published\n----------\nParameters:\n    DieIndex:int = 0\n    Bin:int = 0\n    Result:str = ""\n----------\nCommand Timeout: 10000'),
+    'GetSubDieDataAsNum': ('CDieIndex:int,Site:int', 'RDieIndex:int,DieX:int,DieY:int,CurSite:int,Bin:int,Result:str',
+        'Returns the information of a SubDie. The SubDie collection is 0-based, the first\nvalue is 0, not 1.\nStatus: published\n----------\nParameters:\n    CDieIndex:int = 0\n    Site:int = 0\n----------\nResponse:\n    RDieIndex:int\n    DieX:int\n    DieY:int\n    CurSite:int\n    Bin:int\n    Result:str\n----------\nCommand Timeout: 10000'),
+    'SetSubDieDataAsNum': ('DieIndex:int,Site:int,Bin:int,Result:str', '',
+        'Sets up SubDie data. The SubDie collection is 0-based, the first value is 0, not\n1.\nStatus: published\n----------\nParameters:\n    DieIndex:int = 0\n    Site:int = 0\n    Bin:int = 0\n    Result:str = ""\n----------\nCommand Timeout: 10000'),
+    'GetDieDataAsColRow': ('CDieX:int,CDieY:int', 'DieIndex:int,RDieX:int,RDieY:int,Bin:int,Result:str',
+        'Returns the Die Information in the Row Column format. If the Die Number is\ninvalid it returns an error. If the Die Column and Row are absent it uses the\ncurrent die on the wafer.\nStatus: published\n----------\nParameters:\n    CDieX:int = 0\n    CDieY:int = 0\n----------\nResponse:\n    DieIndex:int\n    RDieX:int\n    RDieY:int\n    Bin:int\n    Result:str\n----------\nCommand Timeout: 10000'),
+    'SetDieDataAsColRow': ('DieX:int,DieY:int,Bin:int,Result:str', '',
+        'Sets the Data in the Row Column format. If the Die is invalid it returns an\nerror.\nStatus: published\n----------\nParameters:\n    DieX:int = 0\n    DieY:int = 0\n    Bin:int = 0\n    Result:str = ""\n----------\nCommand Timeout: 10000'),
+    'GetSubDieDataAsColRow': ('CDieX:int,CDieY:int,Site:int', 'DieIndex:int,RDieX:int,RDieY:int,CurSite:int,Bin:int,Result:str',
+        'Returns the information of a SubDie. The SubDie collection is 0-based, the first\nvalue is 0, not 1.\nStatus: published\n----------\nParameters:\n    CDieX:int = 0\n    CDieY:int = 0\n    Site:int = 0\n----------\nResponse:\n    DieIndex:int\n    RDieX:int\n    RDieY:int\n    CurSite:int\n    Bin:int\n    Result:str\n----------\nCommand Timeout: 10000'),
+    'SetSubDieDataAsColRow': ('DieX:int,DieY:int,Site:int,Bin:int,Result:str', '',
+        'Sets up SubDie data. The SubDie collection is 0-based, the first value is 0, not\n1.\nStatus: published\n----------\nParameters:\n    DieX:int = 0\n    DieY:int = 0\n    Site:int = 0\n    Bin:int = 0\n    Result:str = ""\n----------\nCommand Timeout: 10000'),
+    'SelectAllDiesForProbing': ('DoSelectAll:int,DoEdgeDies:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nEnables all dies.\nStatus: internal\n----------\nParameters:\n    DoSelectAll:int = 0\n    DoEdgeDies:int = 0\n----------\nCommand Timeout: 10000'),
+    'GetMapName': ('', 'Name:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the current Wafer Map Filename.\nStatus: internal\n----------\nResponse:\n    Name:str\n----------\nCommand Timeout: 10000'),
+    'SetLotID': ('ID:str', '',
+        'Specifies the ID for the current wafer.\nStatus: published\n----------\nParameters:\n    ID:str = ""\n----------\nCommand Timeout: 10000'),
+    'GetLotID': ('', 'ID:str',
+        'Returns the Lot ID for the current wafer.\nStatus: published\n----------\nResponse:\n    ID:str\n----------\nCommand Timeout: 10000'),
+    'StepFirstCluster': ('ClearBins:int,RecalcRoute:int', 'ClusterX:int,ClusterY:int,ClusterIndex:int,IncompleteCluster:int,DieX:int,DieY:int,DieIndex:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSteps the Chuck to the first die cluster of the cluster map. If clusters are not\ndefined, the first Die is used. Returns the row and column information of the\nactual cluster and die location after the move is completed. Switches to remote\ncontrol if the "Disable Velox" flag is set in the external options window.\nStatus: internal\n----------\nParameters:\n    ClearBins:int = 1\n    RecalcRoute:int = 1\n----------\nResponse:\n    ClusterX:int\n    ClusterY:int\n    ClusterIndex:int\n    IncompleteCluster:int\n    DieX:int\n    DieY:int\n    DieIndex:int\n----------\nCommand Timeout: 6000000'),
+    'StepNextCluster': ('CClusterX:int,CClusterY:int', 'RClusterX:int,RClusterY:int,ClusterIndex:int,IncompleteCluster:int,DieX:int,DieY:int,DieIndex:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSteps the Chuck to the specified x,y cluster die location of the cluster map. If\nno command data is passed, the Chuck automatically steps to the next logical\ncluster map location. If clusters are not defined, the Die information is used.\nReturns the row and column number of the actual die location after the move is\ncompleted.\nStatus: internal\n----------\nParameters:\n    CClusterX:int = 0\n    CClusterY:int = 0\n----------\nResponse:\n    RClusterX:int\n    RClusterY:int\n    ClusterIndex:int\n    IncompleteCluster:int\n    DieX:int\n    DieY:int\n    DieIndex:int\n----------\nCommand Timeout: 6000000'),
+    'SetMapRoute': ('MoveMode:str,StartColumn:str,StartRow:str,MoveParam:str', '',
+        'Specifies the Move Path for the Probe Station inside the Wafer Map. Optimization\nis done for the shortest move way for the station.\nStatus: published\n----------\nParameters:\n    MoveMode:str = "B"\n    StartColumn:str = "L"\n    StartRow:str = "T"\n    MoveParam:str = "H"\n----------\nCommand Timeout: 10000'),
+    'GetMapRoute': ('', 'MoveMode:str,StartColumn:str,StartRow:str,MoveParam:str',
+        'Returns the specified move path for the Probe Station inside the Wafer Map.\nStatus: published\n----------\nResponse:\n    MoveMode:str\n    StartColumn:str\n    StartRow:str\n    MoveParam:str\n----------\nCommand Timeout: 10000'),
+    'SetClusterParams': ('UseClusters:int,ClusterWidth:int,ClusterHeight:int,TestIncomplete:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSpecifies the clusters parameters.\nStatus: internal\n----------\nParameters:\n    UseClusters:int = 0\n    ClusterWidth:int = 1\n    ClusterHeight:int = 1\n    TestIncomplete:int = 0\n----------\nCommand Timeout: 10000'),
+    'GetClusterParams': ('', 'UseClusters:int,ClusterWidth:int,ClusterHeight:int,TestIncomplete:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns current clusters parameters.\nStatus: internal\n----------\nResponse:\n    UseClusters:int\n    ClusterWidth:int\n    ClusterHeight:int\n    TestIncomplete:int\n----------\nCommand Timeout: 10000'),
+    'NewWaferMap': ('', '',
+        'Deletes current wafer map, sub dies and binning information; then creates new\nwafer map with defaults parameters.\nStatus: published\n----------\nCommand Timeout: 10000'),
+    'AddSubDie': ('X:Decimal,Y:Decimal,Label:str', 'SitesCount:int',
+        'Adds new subdie at the end of the table.\nStatus: published\n----------\nParameters:\n    X:Decimal = 0\n    Y:Decimal = 0\n    Label:str = ""\n----------\nResponse:\n    SitesCount:int\n----------\nCommand Timeout: 10000'),
+    'DeleteSubDie': ('Site:int', 'SitesCount:int',
+        'Deletes selected subdie. The SubDie collection is 1-based, the first value is 1,\nnot 0. If 0 is passed in as the subdie index, Wafer Map will delete all subdies\nfor all dies.This command (i.e. DeleteSubDie) has been included for legacy\nsupport.       DeleteSubDie2 is the preferred method for deleting a selected\nsubdie. DeleteAllSubDie is the preferred method for deleting all subdies for all\ndies.\nStatus: published\n----------\nParameters:\n    Site:int = 0\n----------\nResponse:\n    SitesCount:int\n----------\nCommand Timeout: 10000'),
+    'GetNumSelectedClusters': ('', 'SelectedClusters:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nGets the number of clusters in the map which are selected for probing.\nStatus: internal\n----------\nResponse:\n    SelectedClusters:int\n----------\nCommand Timeout: 10000'),
+    'GetSelectedClusterCoords': ('ClusterIndex:int', 'ClusterX:int,ClusterY:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nGiven the index of a selected cluster in the range [1..NumSelectedClusters],\nreturns the column and row indices for the selected cluster.\nStatus: internal\n----------\nParameters:\n    ClusterIndex:int = 0\n----------\nResponse:\n    ClusterX:int\n    ClusterY:int\n----------\nCommand Timeout: 10000'),
+    'GetClusterDieStatus': ('ClusterX:int,ClusterY:int,DieX:int,DieY:int', 'Status:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nGets the die status in the cluster. Die coordinates are internal for the cluster\nusing the wafer map coordinate system. (0,0) die in the cluster is left top\ncorner (whether this die exists or not).\nStatus: internal\n----------\nParameters:\n    ClusterX:int = 0\n    ClusterY:int = 0\n    DieX:int = 0\n    DieY:int = 0\n----------\nResponse:\n    Status:str\n----------\nCommand Timeout: 10000'),
+    'SetClusterDieStatus': ('ClusterX:int,ClusterY:int,DieX:int,DieY:int,Status:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSets the die status in the cluster. Die coordinates are internal for the cluster\nusing the wafer map coordinate system. (0,0) die in the cluster is left top\ncorner (whether this die exists or not).\nStatus: internal\n----------\nParameters:\n    ClusterX:int = 0\n    ClusterY:int = 0\n    DieX:int = 0\n    DieY:int = 0\n    Status:str = ""\n----------\nCommand Timeout: 10000'),
+    'OpenBinCodeTable': ('FileName:str', '',
+        'Opens a Bin Code Table file (.bct) with the specified name.\nStatus: published\n----------\nParameters:\n    FileName:str = ""\n----------\nCommand Timeout: 240000'),
+    'SaveBinCodeTable': ('FileName:str', '',
+        'Saves bin code table to a file with the specified name.\nStatus: published\n----------\nParameters:\n    FileName:str = ""\n----------\nCommand Timeout: 240000'),
+    'SetBinTableSize': ('BinsSize:int', '',
+        'Sets size of the bin code table. This is the size of bins used in statistics and\nbinning.\nStatus: published\n----------\nParameters:\n    BinsSize:int = 0\n----------\nCommand Timeout: 10000'),
+    'GetBinTableSize': ('', 'BinsSize:int',
+        'Gets size of the bin code table.\nStatus: published\n----------\nResponse:\n    BinsSize:int\n----------\nCommand Timeout: 10000'),
+    'StepFailedClusterBack': ('', 'FailedClusters:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSteps the Chuck the consecutive failed clusters back (goes back to the last\nknown good cluster) and returns the number of consecutive failed clusters.\nStatus: internal\n----------\nResponse:\n    FailedClusters:int\n----------\nCommand Timeout: 6000000'),
+    'StepFailedClusterForward': ('', 'FailedClusters:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSteps the Chuck the consecutive failed clusters forward and returns the number\nof consecutive failed clusters (goes to next untested cluster).\nStatus: internal\n----------\nResponse:\n    FailedClusters:int\n----------\nCommand Timeout: 6000000'),
+    'GoToWaferHome': ('', '',
+        'Moves the Chuck to the wafer home position.\nStatus: published\n----------\nCommand Timeout: 6000000'),
+    'GetWaferInfo': ('', 'ClustersCount:int,DiesCount:int,SitesCount:int',
+        'Returns a number of all units marked to test. Note that TestSites is a number of\nall sites for all dies.\nStatus: published\n----------\nResponse:\n    ClustersCount:int\n    DiesCount:int\n    SitesCount:int\n----------\nCommand Timeout: 10000'),
+    'GetClusterInfo': ('Cluster:int', 'DiesCount:int,SitesCount:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns a number of all dies and sites marked to test in the given cluster.\nStatus: internal\n----------\nParameters:\n    Cluster:int = 0\n----------\nResponse:\n    DiesCount:int\n    SitesCount:int\n----------\nCommand Timeout: 10000'),
+    'GetDieInfo': ('Die:int', 'SitesCount:int',
+        'Returns a number of sites marked to test in the given die.\nStatus: published\n----------\nParameters:\n    Die:int = 0\n----------\nResponse:\n    SitesCount:int\n----------\nCommand Timeout: 10000'),
+    'SetActiveLayer': ('Layer:str', '',
+        'Sets new active layer.\nStatus: published\n----------\nParameters:\n    Layer:str = ""\n----------\nCommand Timeout: 10000'),
+    'GetActiveLayer': ('', 'Layer:str',
+        'Returns current active layer.\nStatus: published\n----------\nResponse:\n    Layer:str\n----------\nCommand Timeout: 10000'),
+    'SetDieRefPoint': ('RefX:Decimal,RefY:Decimal', '',
+        'Sets a new reference point for the die. This point is NOT used for die stepping,\nnor for subdie stepping. When using the "Chuck Position from Home" Wafer Map GUI\nsetting, the Die Reference Point can be set to be more representative of the\nactual reference location within the die. A setting of (0.0, 0.0) is defined as\nthe upper left corner of the die. All subdie coordinates are relative to upper\nleft corner of the die.\nStatus: published\n----------\nParameters:\n    RefX:Decimal = 0\n    RefY:Decimal = 0\n----------\nCommand Timeout: 10000'),
+    'GetDieRefPoint': ('', 'RefX:Decimal,RefY:Decimal',
+        'Returns current reference point for the die. For details see SetDieRefPoint\ncommand.\nStatus: published\n----------\nResponse:\n    RefX:Decimal\n    RefY:Decimal\n----------\nCommand Timeout: 10000'),
+    'ClearAllBins': ('', '',
+        'Clears all binning data in the wafer map.\nStatus: published\n----------\nCommand Timeout: 10000'),
+    'SetWindowState': ('State:str,Window:str', '',
+        'Has sense in the application only (not for ActiveX controls). It shows or hides\na window. All parameters are case-insensitive.\nStatus: published\n----------\nParameters:\n    State:str = "s"\n    Window:str = "setup"\n----------\nCommand Timeout: 10000'),
+    'SetCurrentBin': ('Bin:int,ButtonStatus:int', '',
+        'Sets the current bin for the application. Second parameter allows to enable or\ndisable "Mark with Bin" mode in the application.\nStatus: published\n----------\nParameters:\n    Bin:int = 0\n    ButtonStatus:int = 0\n----------\nCommand Timeout: 10000'),
+    'GetCurrentBin': ('', 'Bin:int',
+        'Returns the current bin in the application.\nStatus: published\n----------\nResponse:\n    Bin:int\n----------\nCommand Timeout: 10000'),
+    'ReadClusterPosition': ('Pos:int,FromPos:str', 'ClusterX:int,ClusterY:int,ClusterIndex:int,DieX:int,DieY:int,DieIndex:int,ClusterWidth:int,ClusterHeight:int,EnabledDies:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the actual wafer map cluster position. If the cluster probing is\ndisabled, the command will assume a cluster of size 1x1.\nStatus: internal\n----------\nParameters:\n    Pos:int = 0\n    FromPos:str = "R"\n----------\nResponse:\n    ClusterX:int\n    ClusterY:int\n    ClusterIndex:int\n    DieX:int\n    DieY:int\n    DieIndex:int\n    ClusterWidth:int\n    ClusterHeight:int\n    EnabledDies:str\n----------\nCommand Timeout: 10000'),
+    'GetWaferMapParams': ('', 'Diameter:Decimal,DieWidth:Decimal,DieHeight:Decimal,FlatLength:Decimal,FlatAngle:int,XOffset:Decimal,YOffset:Decimal,EdgeArea:Decimal',
+        'Returns the circle wafer parameters. For this version of the command, units for\nXOffset and YOffset are percentages.\nStatus: published\n----------\nResponse:\n    Diameter:Decimal\n    DieWidth:Decimal\n    DieHeight:Decimal\n    FlatLength:Decimal\n    FlatAngle:int\n    XOffset:Decimal\n    YOffset:Decimal\n    EdgeArea:Decimal\n----------\nCommand Timeout: 10000'),
+    'GetRectMapParams': ('', 'DieWidth:Decimal,DieHeight:Decimal,Columns:int,Rows:int',
+        'Creates a rectangular Wafer Map with specified parameters.\nStatus: published\n----------\nResponse:\n    DieWidth:Decimal\n    DieHeight:Decimal\n    Columns:int\n    Rows:int\n----------\nCommand Timeout: 10000'),
+    'AddSubDieWithLayout': ('X:Decimal,Y:Decimal,Layout:str,Label:str', 'SitesCount:int',
+        'Adds new subdie at the end of the table with the specified Motorized Positioner\nLayout.\nStatus: published\n----------\nParameters:\n    X:Decimal = 0\n    Y:Decimal = 0\n    Layout:str = ""\n    Label:str = ""\n----------\nResponse:\n    SitesCount:int\n----------\nCommand Timeout: 10000'),
+    'GetZProfilingStatus': ('', 'Started:int',
+        'Returns a status of the Z-Profiling process. If this status is true it means the\nprocess is started.\nStatus: published\n----------\nResponse:\n    Started:int\n----------\nCommand Timeout: 10000\nExample:GetZProfilingStatus'),
+    'SyncMapHome': ('X:Decimal,Y:Decimal', '',
+        'Tries to find an appropriate position in the wafer for the current Chuck\nposition. X and Y describe the Chuck position of the wafer center relatively to\nthe Chuck zero position. If the wafer position is found the command sets it as\nthe wafer map home position and sets the current Chuck position as the Chuck\nhome position. If there is no corresponding wafer position the command returns\nerror 701. Command is used by Auto Align for the BuildMap feature.\nStatus: published\n----------\nParameters:\n    X:Decimal = 0\n    Y:Decimal = 0\n----------\nCommand Timeout: 10000'),
+    'SetWaferProfileOptions': ('ProfileSensor:str,SearchSpeed:Decimal,Gap:Decimal,SuccessRatio:Decimal,ProfDistX:Decimal,ProfDistY:Decimal', '',
+        'Sets some Wafer Map profiling options remotely.\nStatus: published\n----------\nParameters:\n    ProfileSensor:str = "e"\n    SearchSpeed:Decimal = 50\n    Gap:Decimal = 10\n    SuccessRatio:Decimal = 75\n    ProfDistX:Decimal = 0\n    ProfDistY:Decimal = 0\n----------\nCommand Timeout: 10000'),
+    'GetWaferProfileOptions': ('', 'ProfileSensor:str,SearchSpeed:Decimal,Gap:Decimal,SuccessRatio:Decimal,ProfDistX:Decimal,ProfDistY:Decimal',
+        'Returns predefined settings of the Wafer Map profiling options.\nStatus: published\n----------\nResponse:\n    ProfileSensor:str\n    SearchSpeed:Decimal\n    Gap:Decimal\n    SuccessRatio:Decimal\n    ProfDistX:Decimal\n    ProfDistY:Decimal\n----------\nCommand Timeout: 10000'),
+    'StartWaferProfiling': ('DoContinue:int', '',
+        'Starts the Z-Profiling process. To determine the current profiling state, use\nGetWaferProfilingStatus command.\nStatus: published\n----------\nParameters:\n    DoContinue:int = 0\n----------\nCommand Timeout: 10000'),
+    'GetWaferProfilingStatus': ('', 'Started:int',
+        'Returns status of the Z-Profiling process. If this status is true, the process\nis started.\nStatus: published\n----------\nResponse:\n    Started:int\n----------\nCommand Timeout: 10000'),
+    'StopWaferProfiling': ('', '',
+        'Stops the Z-Profiling process.\nStatus: published\n----------\nCommand Timeout: 10000'),
+    'DoWaferProfiling': ('', '',
+        'Profiles the wafer and downloads the Z-Profile to the Kernel. Points to be\nprofiled are auto-generated when "Load Z-Profile from Map File" is false.\nStatus: published\n----------\nCommand Timeout: 36000000'),
+    'DoWaferProfilingOffAxis': ('', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nProfiles the wafer and returns a status of the profiling as an error code.\nExecutes profiling using the off axis camera\nStatus: internal\n----------\nCommand Timeout: 36000000'),
+    'GetSubDieLabel': ('DieX:int,DieY:int,Site:int', 'Label:str',
+        'Returns a label from the wafer map at the current die and current subdie, unless\na row, column, and subdie are specified. The SubDie collection is 0-based, the\nfirst value is 0, not 1.\nStatus: published\n----------\nParameters:\n    DieX:int = 0\n    DieY:int = 0\n    Site:int = 0\n----------\nResponse:\n    Label:str\n----------\nCommand Timeout: 10000'),
+    'SetSubDieLabel': ('Label:str,DieX:int,DieY:int,Site:int', '',
+        'Assigns a label to the wafer map at the current die and the current subdie,\nunless a subdie, row, and column are specified. The SubDie collection is\n0-based, the first value is 0, not 1.\nStatus: published\n----------\nParameters:\n    Label:str = ""\n    DieX:int = 0\n    DieY:int = 0\n    Site:int = 0\n----------\nCommand Timeout: 10000'),
+    'GetSubDieLabelAsNum': ('CDieIndex:int,Site:int', 'Label:str',
+        'Returns a label from the wafer map the current die and the current subdie,\nunless a subdie, and die number are specified. The SubDie collection is 0-based,\nthe first value is 0, not 1.\nStatus: published\n----------\nParameters:\n    CDieIndex:int = 0\n    Site:int = 0\n----------\nResponse:\n    Label:str\n----------\nCommand Timeout: 10000'),
+    'SetSubDieLabelAsNum': ('Label:str,CDieIndex:int,Site:int', '',
+        'Assigns a label to the wafer map at the current die and the current subdie,\nunless a subdie, and die number are specified. The SubDie collection is 0-based,\nthe first value is 0, not 1.\nStatus: published\n----------\nParameters:\n    Label:str = ""\n    CDieIndex:int = 0\n    Site:int = 0\n----------\nCommand Timeout: 10000'),
+    'GetDieLabelAsNum': ('CDieIndex:int', 'Label:str',
+        'Returns a label from the wafer map at the current die, unless a die number is\nspecified.\nStatus: published\n----------\nParameters:\n    CDieIndex:int = 0\n----------\nResponse:\n    Label:str\n----------\nCommand Timeout: 10000'),
+    'SetDieLabelAsNum': ('Label:str,CDieIndex:int', '',
+        'Assigns a label to the wafer map at the current die, unless a die number is\nspecified.\nStatus: published\n----------\nParameters:\n    Label:str = ""\n    CDieIndex:int = 0\n----------\nCommand Timeout: 10000'),
+    'GetHomeDieOffset': ('', 'X:Decimal,Y:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the XY offset from the reference position of the Home Die to wafer\ncenter in Chuck coordinates.\nStatus: internal\n----------\nResponse:\n    X:Decimal\n    Y:Decimal\n----------\nCommand Timeout: 10000'),
+    'SaveZProfileFile': ('FileName:str', 'NumberOfPoints:int,NumberOfEPoints:int',
+        'Saves the current Z-Profile table to the specified .prf file.\nStatus: published\n----------\nParameters:\n    FileName:str = ""\n----------\nResponse:\n    NumberOfPoints:int\n    NumberOfEPoints:int\n----------\nCommand Timeout: 10000\nExample:SaveZProfileFile Profile1.prf'),
+    'ReadZProfile': ('', 'NumberOfPoints:int',
+        'Uploads the Z-Profile from the Kernel to the Wafer Map Z-Profile table. Returns\nthe number of points.\nStatus: published\n----------\nResponse:\n    NumberOfPoints:int\n----------\nCommand Timeout: 10000\nExample:ReadZProfile'),
+    'SetZProfile': ('', 'NumberOfPoints:int',
+        'Downloads the current Z-Profile table to the Kernel. Returns a number of written\npoints.\nStatus: published\n----------\nResponse:\n    NumberOfPoints:int\n----------\nCommand Timeout: 10000\nExample:SetZProfile'),
+    'StopZProfiling': ('', '',
+        'Stops the profiling process.\nStatus: published\n----------\nCommand Timeout: 10000\nExample:StopZProfiling'),
+    'OpenZProfileFile': ('FileName:str', 'NumberOfPoints:int,NumberOfEPoints:int',
+        'Loads the file into the Wafer Map Z-Profile table, but does not download it to\nthe Kernel. Use SetZProfile to download.\nStatus: published\n----------\nParameters:\n    FileName:str = ""\n----------\nResponse:\n    NumberOfPoints:int\n    NumberOfEPoints:int\n----------\nCommand Timeout: 240000\nExample:OpenZProfileFile Profile1.prf'),
+    'StartZProfiling': ('', '',
+        'Starts the Z-Profiling process (see ZProfileWafer). To determine the current\nprofiling state, use GetZProfilingStatus.\nStatus: published\n----------\nCommand Timeout: 10000\nExample:StartZProfiling'),
+    'ZProfileWafer': ('', 'NumberOfPoints:int,NumberOfEPoints:int',
+        'Performs Z-Profilng for the points defined in the Z-Profile table, downloads the\nnew Z-Profile to the Kernel, and returns the number of tested points.\nStatus: published\n----------\nResponse:\n    NumberOfPoints:int\n    NumberOfEPoints:int\n----------\nCommand Timeout: 36000000\nExample:ZProfileWafer'),
+    'SetWaferMapParams2': ('Diameter:Decimal,DieWidth:Decimal,DieHeight:Decimal,FlatLength:Decimal,FlatAngle:int,XOffset:Decimal,YOffset:Decimal,EdgeArea:Decimal', '',
+        'Creates the circle wafer with specified parameters. If parameter is omitted,\nthen zero is used. For this version of the command, units for XOffset and\nYOffset are microns.\nStatus: published\n----------\nParameters:\n    Diameter:Decimal = 200\n    DieWidth:Decimal = 10000\n    DieHeight:Decimal = 10000\n    FlatLength:Decimal = 20\n    FlatAngle:int = 0\n    XOffset:Decimal = 0\n    YOffset:Decimal = 0\n    EdgeArea:Decimal = 0\n----------\nCommand Timeout: 240000'),
+    'GetWaferMapParams2': ('', 'Diameter:Decimal,DieWidth:Decimal,DieHeight:Decimal,FlatLength:Decimal,FlatAngle:int,XOffset:Decimal,YOffset:Decimal,EdgeArea:Decimal',
+        'Returns the circle wafer parameters. For this version of the command, units for\nXOffset and YOffset are microns.\nStatus: published\n----------\nResponse:\n    Diameter:Decimal\n    DieWidth:Decimal\n    DieHeight:Decimal\n    FlatLength:Decimal\n    FlatAngle:int\n    XOffset:Decimal\n    YOffset:Decimal\n    EdgeArea:Decimal\n----------\nCommand Timeout: 10000'),
+    'SetWaferTestAngle': ('Angle:int', '',
+        'This command sets the Wafer Test Angle. This is different from the notch angle\nand allows rotating the Wafer Map.\nStatus: published\n----------\nParameters:\n    Angle:int = 0\n----------\nCommand Timeout: 10000'),
+    'GetWaferTestAngle': ('', 'Angle:int',
+        'This returns the Wafer Test Angle. This is different from the notch angle and\nallows rotating the Wafer Map.\nStatus: published\n----------\nResponse:\n    Angle:int\n----------\nCommand Timeout: 10000'),
+    'LoadPreMappedDiesTable': ('FileName:str,ClearMap:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nLoads the Pre-Mapped Dies Table file with specified name.\nStatus: internal\n----------\nParameters:\n    FileName:str = ""\n    ClearMap:int = 1\n----------\nCommand Timeout: 240000'),
+    'GetPreMappedDieInfo': ('DieX:int,DieY:int', 'UseZ:int,UseTheta:int,ActualX:Decimal,ActualY:Decimal,ActualZ:Decimal,Theta:Decimal',
+        'This command is valid when a PreMapped Dies Table has been loaded. Returns\nvalues at the current die, unless a column (M_pnDieX) and row (M_pnDieY) are\nspecified.  Returns actual (as measured during the Pre-Mapping) x, y, z, and\ntheta die positions. Also returns whether or not Z and Theta are being used.\nThis command is only valid when a Pre-Mapped Dies Table has been loaded. If a\nPreMapped Dies Table has NOT been loaded, ERR_IllegalParameters (715) is\nreturned.\nStatus: published\n----------\nParameters:\n    DieX:int = 0\n    DieY:int = 0\n----------\nResponse:\n    UseZ:int\n    UseTheta:int\n    ActualX:Decimal\n    ActualY:Decimal\n    ActualZ:Decimal\n    Theta:Decimal\n----------\nCommand Timeout: 10000'),
+    'GetDieResultAsNum': ('CDieIndex:int', 'Result:str',
+        'Returns a measurement result from the wafer map at the current die, unless a die\nnumber is specified.\nStatus: published\n----------\nParameters:\n    CDieIndex:int = 0\n----------\nResponse:\n    Result:str\n----------\nCommand Timeout: 10000'),
+    'SetDieResultAsNum': ('Result:str,CDieIndex:int', '',
+        'Assigns a measurement result to the wafer map at the current die, unless a die\nnumber is specified.\nStatus: published\n----------\nParameters:\n    Result:str = ""\n    CDieIndex:int = 0\n----------\nCommand Timeout: 10000'),
+    'GetDieMapResultAsNum': ('CDieIndex:int,Site:int', 'Result:str',
+        'Returns a measurement result from the wafer map the current die and the current\nsubdie, unless a subdie and die number are specified. The SubDie collection is\n0-based, the first value is 0, not 1.\nStatus: published\n----------\nParameters:\n    CDieIndex:int = 0\n    Site:int = 0\n----------\nResponse:\n    Result:str\n----------\nCommand Timeout: 10000'),
+    'SetDieMapResultAsNum': ('Result:str,CDieIndex:int,Site:int', '',
+        'Assigns a measurement result to the wafer die map at the current die at the\ncurrent subdie, unless a subdie and die number are specified. The SubDie\ncollection is 0-based, the first value is 0, not 1.\nStatus: published\n----------\nParameters:\n    Result:str = ""\n    CDieIndex:int = 0\n    Site:int = 0\n----------\nCommand Timeout: 10000'),
+    'MapEdgeDies': ('Enable:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nEnables or disables edge dies for test\nStatus: internal\n----------\nParameters:\n    Enable:int = 0\n----------\nCommand Timeout: 10000'),
+    'AddSubDieWithLayoutPosition': ('X:Decimal,Y:Decimal,Label:str,P1X:Decimal,P1Y:Decimal,P1InUse:int,P2X:Decimal,P2Y:Decimal,P2InUse:int,P3X:Decimal,P3Y:Decimal,P3InUse:int,P4X:Decimal,P4Y:Decimal,P4InUse:int,P5X:Decimal,P5Y:Decimal,P5InUse:int,P6X:Decimal,P6Y:Decimal,P6InUse:int', 'SitesCount:int',
+        'Adds new subdie at the end of the table with the Motorized Positioner Layout\ncorresponding to the positions. The Layout must already exist.\nStatus: published\n----------\nParameters:\n    X:Decimal = 0\n    Y:Decimal = 0\n    Label:str = ""\n    P1X:Decimal = 0\n    P1Y:Decimal = 0\n    P1InUse:int = 1\n    P2X:Decimal = 0\n    P2Y:Decimal = 0\n    P2InUse:int = 1\n    P3X:Decimal = 0\n    P3Y:Decimal = 0\n    P3InUse:int = 1\n    P4X:Decimal = 0\n    P4Y:Decimal = 0\n    P4InUse:int = 1\n    P5X:Decimal = 0\n    P5Y:Decimal = 0\n    P5InUse:int = 1\n    P6X:Decimal = 0\n    P6Y:Decimal = 0\n    P6InUse:int = 1\n----------\nResponse:\n    SitesCount:int\n----------\nCommand Timeout: 10000'),
+    'GetSpectrumData': ('DataPath:str', 'Value:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nAllows access to read any data item in Spectrum explorer.     GetSpectrumData\nAlignWafer/ProjectData/Mark1/ChuckPosition/X     GetSpectrumData Chuck\nCamera/Camera Settings/Shutter\nStatus: internal\n----------\nParameters:\n    DataPath:str = ""\n----------\nResponse:\n    Value:str\n----------\nCommand Timeout: 10000\nExample:GetSpectrumData Chuck Camera/Camera Settings/Shutter'),
+    'SetSpectrumData': ('PathAndValue:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nAllows changing any data item in Spectrum explorer. Works independent of access\nlevel. SetSpectrumData AlignWafer/ProjectData/Mark1/ChuckPosition/X=1000\nSetSpectrumData Chuck Camera/Camera Settings/Shutter=17\nStatus: internal\n----------\nParameters:\n    PathAndValue:str = ""\n----------\nCommand Timeout: 6000\nExample:SetSpectrumData Scope Camera/Camera Settings/Shutter=17'),
+    'ReadVMPosition': ('ToolName:str,XY:int,Z:int,Model:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command reads the current Chuck and microscope position and sets them as\nnew model or Chuck and microscope positions.     within Spectrum Vision.\nStatus: internal\n----------\nParameters:\n    ToolName:str = ""\n    XY:int = 1\n    Z:int = 0\n    Model:int = -1\n----------\nCommand Timeout: 60000\nExample:ReadVMPosition AlignWafer 1 0 0'),
+    'MoveToVMPosition': ('ToolName:str,XYChuck:int,ZChuck:int,XYScope:int,ZScope:int,Model:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command moves to trained stages positions of a requested tool. Supported\ntools are AutoAlign, AlignWafer and ReAlignWizard.\nStatus: internal\n----------\nParameters:\n    ToolName:str = ""\n    XYChuck:int = 1\n    ZChuck:int = 1\n    XYScope:int = 0\n    ZScope:int = 0\n    Model:int = -1\n----------\nCommand Timeout: 120000\nExample:MoveToVMPosition AlignWafer 1 0 0 0 0'),
+    'DetectWaferHeight': ('SetStartPosition:int,Synchronize:int,ChuckX:Decimal,ChuckY:Decimal', 'PositionX:Decimal,PositionY:Decimal,WaferHeight:Decimal,SynchGap:Decimal,ZOffset:Decimal,Stage:str',
+        'Synchronizes Chuck and top camera in X, Y and Z. Then the wafer surface is\nfocused on the trained Chuck position or the manual adjusted reference position.\nStatus: published\n----------\nParameters:\n    SetStartPosition:int = 0\n    Synchronize:int = 0\n    ChuckX:Decimal = -1\n    ChuckY:Decimal = -1\n----------\nResponse:\n    PositionX:Decimal\n    PositionY:Decimal\n    WaferHeight:Decimal\n    SynchGap:Decimal\n    ZOffset:Decimal\n    Stage:str\n----------\nCommand Timeout: 300000\nExample:DetectWaferHeight 0 1'),
+    'SetG85FileOptions': ('BinDataFormat:str,NullBin:str,DataDelimiter:str,UseSubdieData:int,SubdieIndex:int', '',
+        'Set G85 file data format options.\nStatus: published\n----------\nParameters:\n    BinDataFormat:str = "Decimal"\n    NullBin:str = "255"\n    DataDelimiter:str = ","\n    UseSubdieData:int = 0\n    SubdieIndex:int = 0\n----------\nCommand Timeout: 100000'),
+    'SetSubDieDataWithLayout': ('Site:int,X:Decimal,Y:Decimal,Layout:str,Label:str', '',
+        'Sets up SubDie data with layout name. The SubDie collection is 0-based, the\nfirst value is 0, not 1.\nStatus: published\n----------\nParameters:\n    Site:int = 0\n    X:Decimal = 0\n    Y:Decimal = 0\n    Layout:str = ""\n    Label:str = ""\n----------\nCommand Timeout: 10000'),
+    'CheckSpectrumPlugin': ('Plugin:str', 'PluginAvailable:int,Message:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nCommand checks if a tool is trained and returns a string of error/warning\nmessages including information about what is not trained, setup for the tool to\nrun.\nStatus: internal\n----------\nParameters:\n    Plugin:str = ""\n----------\nResponse:\n    PluginAvailable:int\n    Message:str\n----------\nCommand Timeout: 10000\nExample:CheckSpectrumPlugin AlignWafer'),
+    'AutoAlign': ('SetValue:int,SkipSettingHome:int', '',
+        'Executes the AutoAlign tool to do a theta alignment of the wafer with optional\nindex calculation or thermal expansion measurement. The command will update home\nif home was trained. It will only move to its trained chuck/scope position\nbefore starting the alignment if the option "MoveToTrainedXYPosition" and/or\n"MoveToTrainedZPosition" is true.\nStatus: published\n----------\nParameters:\n    SetValue:int = 0\n    SkipSettingHome:int = 0\n----------\nCommand Timeout: 300000\nExample:AutoAlign 1'),
+    'SetCameraQuiet': ('Active:int', '',
+        'Activates/deactivates the camera quiet mode. (Applies only to CM300/SUMMIT200\nstations.)     The camera quiet mode deactivates the Chuck, Platen and Contact\nView camera and triggers a digital output     which connects/disconnects these\ncameras firewire/USB connection to the PC.\nStatus: published\n----------\nParameters:\n    Active:int = 0\n----------\nCommand Timeout: 60000\nExample:SetCameraQuiet 1'),
+    'SetRefDieOffset': ('RefDieCol:int,RefDieRow:int,RefDieDistToCentreX:Decimal,RefDieDistToCentreY:Decimal', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command is based on the SetMapOrientation command. It allows shifting the\ncenter of the Home die to the center of the wafer.\nStatus: internal\n----------\nParameters:\n    RefDieCol:int = 0\n    RefDieRow:int = 0\n    RefDieDistToCentreX:Decimal = 0\n    RefDieDistToCentreY:Decimal = 0\n----------\nCommand Timeout: 10000'),
+    'GetUsePositionerSubdie': ('', 'UsePositionerSubdie:int',
+        'Returns whether or not Wafer Map is configured to use motorized positioners for\nsubdie stepping.\nStatus: published\n----------\nResponse:\n    UsePositionerSubdie:int\n----------\nCommand Timeout: 10000'),
+    'SetSelectiveDieAlignmentMode': ('UseSelectiveDieAlignment:int', '',
+        'Enable/disable the selective die alignment mode.\nStatus: published\n----------\nParameters:\n    UseSelectiveDieAlignment:int = 0\n----------\nCommand Timeout: 10000'),
+    'GetSelectiveDieAlignmentMode': ('', 'UseSelectiveDieAlignment:int',
+        'Returns the selective die alignment mode status.\nStatus: published\n----------\nResponse:\n    UseSelectiveDieAlignment:int\n----------\nCommand Timeout: 10000'),
+    'SetSelectiveDieAlignmentDieStatus': ('DieX:int,DieY:int,DoAlign:int', '',
+        'Enable/disable selective die alignment for the given die.\nStatus: published\n----------\nParameters:\n    DieX:int = 0\n    DieY:int = 0\n    DoAlign:int = 0\n----------\nCommand Timeout: 10000'),
+    'GetSelectiveDieAlignmentDieStatus': ('DieX:int,DieY:int', 'DoAlign:int',
+        'Get the selective die alignment status for the given die.\nStatus: published\n----------\nParameters:\n    DieX:int = 0\n    DieY:int = 0\n----------\nResponse:\n    DoAlign:int\n----------\nCommand Timeout: 10000'),
+    'SetSelectiveDieSoakingMode': ('UseSelectiveDieSoaking:int', '',
+        'Enable/disable the selective die soaking mode.\nStatus: published\n----------\nParameters:\n    UseSelectiveDieSoaking:int = 0\n----------\nCommand Timeout: 10000'),
+    'GetSelectiveDieSoakingMode': ('', 'UseSelectiveDieSoaking:int',
+        'Returns the selective die soaking mode status.\nStatus: published\n----------\nResponse:\n    UseSelectiveDieSoaking:int\n----------\nCommand Timeout: 10000'),
+    'SetSelectiveDieSoakingDieStatus': ('DieX:int,DieY:int,DoSoaking:int', '',
+        'Enable/disable selective die soaking for the given die.\nStatus: published\n----------\nParameters:\n    DieX:int = 0\n    DieY:int = 0\n    DoSoaking:int = 0\n----------\nCommand Timeout: 10000'),
+    'GetSelectiveDieSoakingDieStatus': ('DieX:int,DieY:int', 'DoSoaking:int',
+        'Get the selective die soaking status for the given die.\nStatus: published\n----------\nParameters:\n    DieX:int = 0\n    DieY:int = 0\n----------\nResponse:\n    DoSoaking:int\n----------\nCommand Timeout: 10000'),
+    'GetVisionAssistedSteppingActive': ('', 'Active:int',
+        'Command to tell if Vision Assisted Stepping is active.\nStatus: published\n----------\nResponse:\n    Active:int\n----------\nCommand Timeout: 10000\nExample:GetVisionAssistedSteppingActive'),
+    'SetVisionAssistedSteppingActive': ('Activate:int', '',
+        'Command to set if Vision Assisted Stepping is active. Command can be used to\ne.g. deactivate Vision Assisted Stepping     programmatically in case it is no\nlonger used.     When activating Vision Assisted Stepping, the command will\nreturn an error in case it is not possible (e.g. not trained)\nStatus: published\n----------\nParameters:\n    Activate:int = 0\n----------\nCommand Timeout: 10000\nExample:SetVisionAssistedSteppingActive 1'),
+    'SetUsePositionerSubdie': ('UsePositionerSubdie:int', '',
+        'Sets whether or not Wafer Map is configured to use motorized positioners for\nsubdie stepping.\nStatus: published\n----------\nParameters:\n    UsePositionerSubdie:int = 0\n----------\nCommand Timeout: 10000'),
+    'GetLocalSubDieStatus': ('Site:int,DieX:int,DieY:int', 'CurSite:int,Status:int,RDieX:int,RDieY:int',
+        'Returns the Die Local SubDie status, per-die basis.\nStatus: published\n----------\nParameters:\n    Site:int = 0\n    DieX:int = 0\n    DieY:int = 0\n----------\nResponse:\n    CurSite:int\n    Status:int\n    RDieX:int\n    RDieY:int\n----------\nCommand Timeout: 10000'),
+    'GetLocalSubDieStatusAsNum': ('Site:int,DieIndex:int', 'CurSite:int,RStatus:int,RDieIndex:int',
+        'Returns the Die Local SubDie status, per-die basis.\nStatus: published\n----------\nParameters:\n    Site:int = 0\n    DieIndex:int = 0\n----------\nResponse:\n    CurSite:int\n    RStatus:int\n    RDieIndex:int\n----------\nCommand Timeout: 10000'),
+    'SetLocalSubDieStatus': ('Site:int,Status:int,DieX:int,DieY:int', 'CurSite:int,RStatus:int,RDieX:int,RDieY:int',
+        'Enables Local SubDies and sets the Die Local SubDie status, per-die basis.\nStatus: published\n----------\nParameters:\n    Site:int = 0\n    Status:int = 1\n    DieX:int = 0\n    DieY:int = 0\n----------\nResponse:\n    CurSite:int\n    RStatus:int\n    RDieX:int\n    RDieY:int\n----------\nCommand Timeout: 10000'),
+    'SetLocalSubDieStatusAsNum': ('Site:int,Status:int,DieIndex:int', 'CurSite:int,RStatus:int,RDieIndex:int',
+        'Enables Local SubDies and sets the Die Local SubDie status, per-die basis.\nStatus: published\n----------\nParameters:\n    Site:int = 0\n    Status:int = 1\n    DieIndex:int = 0\n----------\nResponse:\n    CurSite:int\n    RStatus:int\n    RDieIndex:int\n----------\nCommand Timeout: 10000'),
+    'AlignWafer': ('TrackPosition:int', 'ThetaOffset:Decimal',
+        'Performs a two-point alignment and moves Chuck to the trained align position. XY\ncorrection is made afterwards to calculate the new home position.\nStatus: published\n----------\nParameters:\n    TrackPosition:int = 0\n----------\nResponse:\n    ThetaOffset:Decimal\n----------\nCommand Timeout: 120000\nExample:AlignWafer'),
+    'AlignChip': ('', 'ThetaOffset:Decimal,XOffset:Decimal,YOffset:Decimal',
+        'Performs a single or two point alignment and moves the current chip to the\ntrained aligned position in Theta (in degrees) and X, Y (in microns). The\ncurrent chip is assumed to be in the region of interest when the command is\ncalled.\nStatus: published\n----------\nResponse:\n    ThetaOffset:Decimal\n    XOffset:Decimal\n    YOffset:Decimal\n----------\nCommand Timeout: 180000\nExample:AlignChip'),
+    'FindFocus': ('StepCount:int,Range:Decimal', 'ZPosition:Decimal,Stage:str',
+        'Determines the Z axis position where an object in the region of interest is in\nfocus. First output parameter is the Z axis value in microns from zero of the\nnew focus height. Second output parameter is the used stage to perform focus\nsearch.\nStatus: published\n----------\nParameters:\n    StepCount:int = -1\n    Range:Decimal = -1\n----------\nResponse:\n    ZPosition:Decimal\n    Stage:str\n----------\nCommand Timeout: 120000\nExample:FindFocus 50 500'),
+    'AlignAux': ('AuxSiteID:int', '',
+        'Performs an automated AUX Site alignment in XYZ. Tool can correct reference\nposition and Contact Height for the given AUX Site.\nStatus: published\n----------\nParameters:\n    AuxSiteID:int = 0\n----------\nCommand Timeout: 300000\nExample:AlignAux 1'),
+    'FindFeature': ('Model:int,ReturnDistanceFromModelOrigin:int,UseSingleImageAcquisition:int', 'Data:str',
+        'Search user-defined models. Up to 40 different models can be trained. After\ntraining, these models can be searched on screen either by direct user\ninteraction or from external applications with a remote command. The remote\ncommand returns the X/Y-Positions, angle (degree) and score value (0 - 1.0) for\neach instance of the model found in the region of interest.\nStatus: published\n----------\nParameters:\n    Model:int = 1\n    ReturnDistanceFromModelOrigin:int = 0\n    UseSingleImageAcquisition:int = 1\n----------\nResponse:\n    Data:str\n----------\nCommand Timeout: 10000\nExample:FindFeature 1'),
+    'CloseSpectrum': ('', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nCloseSpectrum closes the Spectrum Vision application. Used internally by\nCommonCommands during Project loading. Does save configuration data but does not\nsave project data.\nStatus: internal\n----------\nCommand Timeout: 10000\nExample:CloseSpectrum'),
+    'SnapImage': ('MountPos:str,FullPath:str,SnapShotMode:int,DecimationFactor:int', '',
+        'Saves the currently displayed image to the specified file. The image is stored\nin the requested file format (bmp, jpg or png). By default. it will save the raw\ncamera image and an image with the overlays that are currently visible on the\ncamera view. Using a parameter, one can decide to only save either raw image,\noverlay image or both. By Specifying \'ALL\' as the mount position, the captured\nscreenshot will consist of the currently selected camera layout without\nproviding the raw image. If MountPos and FullPath are empty then the current\ncamera view with overlays is copied to the clipboard.\nStatus: published\n----------\nParameters:\n    MountPos:str = "Scope"\n    FullPath:str = "Image.bmp"\n    SnapShotMode:int = 2\n    DecimationFactor:int = 1\n----------\nCommand Timeout: 60000\nExample:SnapImage Scope C:/Temp/Image.bmp'),
+    'SetCameraView': ('Name:str,Zoom:int,LiveVideo:int,WindowState:int', '',
+        'Switches the desired video window of Spectrum as foreground and active view. The\ncamera view can be determined over a tool name or the camera mount position. The\nsecond parameter defines the displays zoom factor to be used. Third parameter is\nused to toggle the live video. Last parameter can be used to maximize a window\nor to simply remove temporary on-screen items.\nStatus: published\n----------\nParameters:\n    Name:str = ""\n    Zoom:int = 0\n    LiveVideo:int = 2\n    WindowState:int = 1\n----------\nCommand Timeout: 10000\nExample:SetCameraView AlignWafer 0 2 2'),
+    'SetCameraLight': ('Name:str,State:int,Shutter:Decimal,Gain:Decimal,Brightness:int,Contrast:int,Sharpness:int,Illumination:int', '',
+        'Switches the light of the chosen camera on or off. Light values of -1 will cause\nthat the parameter is not affected.\nStatus: published\n----------\nParameters:\n    Name:str = ""\n    State:int = 0\n    Shutter:Decimal = -1\n    Gain:Decimal = -1\n    Brightness:int = -1\n    Contrast:int = -1\n    Sharpness:int = -1\n    Illumination:int = -1\n----------\nCommand Timeout: 10000\nExample:SetCameraLight AlignWafer 1 20 5'),
+    'ShowWizard': ('ToolName:str,MountPosition:str', 'Canceled:int',
+        'Starts the wizard of a given tool on the display defined in the tool settings.\nAdditionally it can start a wizard for training single models with the syntax\ne.g. ShowWizard FindFeature/ProjectData/Features/Feature1/Model For the tools\nMeasureOnScreen, Calibrate and CameraOrigin you can specify a mount position\ne.g. ShowWizard Calibrate Platen\nStatus: published\n----------\nParameters:\n    ToolName:str = ""\n    MountPosition:str = ""\n----------\nResponse:\n    Canceled:int\n----------\nCommand Timeout: 10000000\nExample:ShowWizard AlignWafer'),
+    'ProbeToPadAlign': ('Position:str', 'XOffsetWafer:Decimal,YOffsetWafer:Decimal',
+        'Sets a new Home position. The command is used during ReAlign to search the\ntrained home reference model and to calculate the new xy home position.\nStatus: published\n----------\nParameters:\n    Position:str = "H"\n----------\nResponse:\n    XOffsetWafer:Decimal\n    YOffsetWafer:Decimal\n----------\nCommand Timeout: 120000\nExample:ProbeToPadAlign H'),
+    'ReadOcrString': ('', 'OcrString:str',
+        "Reads the wafer ID string from the wafer's surface. Returns the read ID as\nstring. Requires IDTools license.\nStatus: published\n----------\nResponse:\n    OcrString:str\n----------\nCommand Timeout: 60000\nExample:ReadOcrString"),
+    'ReadBarCode': ('', 'BarCodeString:str',
+        'Reads the wafers barcode and decodes it to a string. Requires IDTools license.\nStatus: published\n----------\nResponse:\n    BarCodeString:str\n----------\nCommand Timeout: 60000\nExample:ReadBarCode'),
+    'Read2DMatrixCode': ('', 'MatrixCodeString:str',
+        'Reads the wafers matrix code and decodes it to a string. Requires IDTools\nlicense.\nStatus: published\n----------\nResponse:\n    MatrixCodeString:str\n----------\nCommand Timeout: 60000\nExample:Read2DMatrixCode'),
+    'ReadQRCode': ('', 'QRCodeString:str',
+        'Reads the wafers qr code and decodes it to a string. Requires IDTools license.\nStatus: published\n----------\nResponse:\n    QRCodeString:str\n----------\nCommand Timeout: 60000\nExample:ReadQRCode'),
+    'SetSpectrumRemote': ('Activate:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nActivates the Spectrum remote mode. In this mode all user interface elements are\nhidden and disabled. This is used when Spectrum is hosted inside VeloxPro.\nStatus: internal\n----------\nParameters:\n    Activate:int = 1\n----------\nCommand Timeout: 10000\nExample:SetSpectrumRemote 1'),
+    'GetCameraLight': ('Name:str', 'MountPosition:str,State:int,Shutter:Decimal,Gain:Decimal,Brightness:int,Contrast:int,Sharpness:int,Illumination:int',
+        'Returns light properties of chosen camera.\nStatus: published\n----------\nParameters:\n    Name:str = ""\n----------\nResponse:\n    MountPosition:str\n    State:int\n    Shutter:Decimal\n    Gain:Decimal\n    Brightness:int\n    Contrast:int\n    Sharpness:int\n    Illumination:int\n----------\nCommand Timeout: 10000\nExample:GetCameraLight Scope'),
+    'GetCameraView': ('Name:str', 'MountPosition:str,Zoom:int,LiveVideo:int,WindowState:int',
+        'Returns the present camera view state of a desired tool or active view.\nStatus: published\n----------\nParameters:\n    Name:str = ""\n----------\nResponse:\n    MountPosition:str\n    Zoom:int\n    LiveVideo:int\n    WindowState:int\n----------\nCommand Timeout: 10000\nExample:GetCameraView AlignWafer'),
+    'GetPattern': ('ToolName:str,ModelName:str', 'BitmapPath:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nTransforms the specific model of a demanded tool into a bitmap. This bitmap will\nbe stored in the same folder as the project file.     The command was originally\nrequired by ReAlignWizard and is currently no longer in use.\nStatus: internal\n----------\nParameters:\n    ToolName:str = ""\n    ModelName:str = ""\n----------\nResponse:\n    BitmapPath:str\n----------\nCommand Timeout: 30000\nExample:GetPattern AlignWafer Model1'),
+    'ShowPosition': ('MountPosition:str,DistPositionX:Decimal,DistPositionY:Decimal', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nMoves the ChuckCenter under a given camera. When no camera mount position is\ngiven, Spectrum uses active view. If there is an Offset different from zero,\nthis position will be moved under the camera.\nStatus: internal\n----------\nParameters:\n    MountPosition:str = ""\n    DistPositionX:Decimal = 0\n    DistPositionY:Decimal = 0\n----------\nCommand Timeout: 60000\nExample:ShowPosition Scope'),
+    'GetCameraHomePosition': ('', 'XPosition:Decimal,YPosition:Decimal,ZPosition:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the home die coordinates when the home die is under the alignment camera\n(for instance, the top camera).     Command was used during TrainReAlign to get\nthe start position for Z-Profiling. Command is no longer used.\nStatus: internal\n----------\nResponse:\n    XPosition:Decimal\n    YPosition:Decimal\n    ZPosition:Decimal\n----------\nCommand Timeout: 10000\nExample:GetCameraHomePosition'),
+    'SynchronizeCamera': ('MountPos:str,SynchronizeXY:int,SynchronizeZ:int', 'XPosition:Decimal,YPosition:Decimal,ZPosition:Decimal',
+        'Synchronizes the Platen camera with the calibration mark. The mark is mounted on\nthe Chuck camera. The Chuck must be moved to get the mark in view of the\nspecified camera.\nStatus: published\n----------\nParameters:\n    MountPos:str = "Platen"\n    SynchronizeXY:int = 0\n    SynchronizeZ:int = 0\n----------\nResponse:\n    XPosition:Decimal\n    YPosition:Decimal\n    ZPosition:Decimal\n----------\nCommand Timeout: 240000\nExample:SynchronizeCamera Platen 1 1'),
+    'ProbeCardOCS': ('UpdateZ:int,MeasureBothGroups:int', 'ZPosition:Decimal',
+        'Determines the Chuck XYZ axis position where the probe tips of the Probe Card\nare in focus. The output parameter is the Z axis value in microns from zero of\nthe new focus height.\nStatus: published\n----------\nParameters:\n    UpdateZ:int = 1\n    MeasureBothGroups:int = 1\n----------\nResponse:\n    ZPosition:Decimal\n----------\nCommand Timeout: 360000\nExample:ProbeCardOCS 1'),
+    'MoveChuckAutoXY': ('XPosition:Decimal,YPosition:Decimal,XSubsiteOffset:Decimal,YSubsiteOffset:Decimal,SoakTime:Decimal,DoVisionAlign:int', 'XOffset:Decimal,YOffset:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nCommand is sent by Wafer Map to trigger AutoXY, AutoZ or VueTrack for each die\nmove. Autonomous Assistant must be activated/trained before command can be used.\nResponse is X, Y relative distance of adjustment from requested position.\nStatus: internal\n----------\nParameters:\n    XPosition:Decimal = 0\n    YPosition:Decimal = 0\n    XSubsiteOffset:Decimal = 0\n    YSubsiteOffset:Decimal = 0\n    SoakTime:Decimal = -1\n    DoVisionAlign:int = 1\n----------\nResponse:\n    XOffset:Decimal\n    YOffset:Decimal\n----------\nCommand Timeout: 6000000\nExample:MoveChuckAutoXY 5000 10000'),
+    'VueTrackAlign': ('FullVueTrackAlign:int', '',
+        'Alignment for the next wafer when using VueTrack.\nStatus: published\n----------\nParameters:\n    FullVueTrackAlign:int = 1\n----------\nCommand Timeout: 6000000\nExample:VueTrackAlign'),
+    'MoveChuckReAlign': ('XPosition:Decimal,YPosition:Decimal,XSubsiteOffset:Decimal,YSubsiteOffset:Decimal,SoakTime:Decimal,PostReAlignSoakTime:Decimal,DoVisionAlign:int', 'XOffset:Decimal,YOffset:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nCommand is sent by Wafer Map to trigger ReAlign at Die for each die move.\nReAlign must be trained before command can be used. Response is X, Y relative\ndistance of adjustment from requested position.\nStatus: internal\n----------\nParameters:\n    XPosition:Decimal = 0\n    YPosition:Decimal = 0\n    XSubsiteOffset:Decimal = 0\n    YSubsiteOffset:Decimal = 0\n    SoakTime:Decimal = -1\n    PostReAlignSoakTime:Decimal = -1\n    DoVisionAlign:int = 1\n----------\nResponse:\n    XOffset:Decimal\n    YOffset:Decimal\n----------\nCommand Timeout: 6000000\nExample:MoveChuckReAlign 5000 10000'),
+    'AutoFocusEVue': ('DistBelow:Decimal,DistAbove:Decimal,XOffsetCenter:int,YOffsetCenter:int', 'FocusScore:Decimal,ZPosition:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nCommand is only used internally for software testing and for providing backwards\ncompatibility with SCPI legacy commands. It executes a focus search using the\neVue focus drive.\nStatus: internal\n----------\nParameters:\n    DistBelow:Decimal = 0\n    DistAbove:Decimal = 0\n    XOffsetCenter:int = 0\n    YOffsetCenter:int = 0\n----------\nResponse:\n    FocusScore:Decimal\n    ZPosition:Decimal\n----------\nCommand Timeout: 30000\nExample:AutoFocusEVue 200 200 0 0'),
+    'AutoAlignOffAxis': ('SetValue:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nExecutes the ReAlign Wafer Alignment tool to do a theta alignment of the wafer\nwith optional index calculation or thermal expansion measurement. AutoAlign is\nperformed using the Platen camera. Only supported for systems with off-axis\ncamera.\nStatus: internal\n----------\nParameters:\n    SetValue:int = 0\n----------\nCommand Timeout: 300000\nExample:AutoAlignOffAxis 1'),
+    'FindFocusOffAxis': ('StepCount:int,Range:Decimal', 'ZPosition:Decimal,Stage:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nDetermines the Z axis position where an object in the region of interest is in\nfocus. First output parameter is the Z axis value in microns from zero of the\nnew focus height. Second output parameter is the used stage to perform focus\nsearch. Focus search is performed using the Platen camera. Only supported for\nsystems with off-axis camera.\nStatus: internal\n----------\nParameters:\n    StepCount:int = -1\n    Range:Decimal = -1\n----------\nResponse:\n    ZPosition:Decimal\n    Stage:str\n----------\nCommand Timeout: 120000\nExample:FindFocusOffAxis 50 500'),
+    'AlignAuxOffAxis': ('AuxSiteID:int', '',
+        'Performs an automated AUX Site alignment in XYZ using the Off Axis camera. Tool\ncan correct reference position and Contact Height for the given AUX Site.\nStatus: published\n----------\nParameters:\n    AuxSiteID:int = 0\n----------\nCommand Timeout: 300000\nExample:AlignAuxOffAxis 1'),
+    'FindFocusPlaten': ('StepCount:int,Range:Decimal', 'ZPosition:Decimal,Stage:str',
+        "***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nDetermines the Z axis position where an object in the region of interest is in\nfocus. First output parameter is the Z axis value in microns from zero of the\nnew focus height. Second output parameter is the used stage to perform focus\nsearch. Uses the FindFocus tool settings but always the Platen camera -\nindependent of the FindFocus mount. This command is used on e.g. BlueRay systems\nthat have a platen camera but can't use ReAlign/DetectWaferHeight as they don't\nhave an upward looking camera.\nStatus: internal\n----------\nParameters:\n    StepCount:int = -1\n    Range:Decimal = -1\n----------\nResponse:\n    ZPosition:Decimal\n    Stage:str\n----------\nCommand Timeout: 120000\nExample:FindFocusPlaten 50 500"),
+    'AlignChipOffAxis': ('', 'ThetaOffset:Decimal,XOffset:Decimal,YOffset:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nPerforms a single or two point alignment and moves the current chip to the\ntrained aligned position in Theta (in degrees) and X, Y (in microns). This\ncommand is using the off axis platen camera with functionality of ReAlign.\nStatus: internal\n----------\nResponse:\n    ThetaOffset:Decimal\n    XOffset:Decimal\n    YOffset:Decimal\n----------\nCommand Timeout: 180000\nExample:AlignChipOffAxis'),
+    'SelectAZoomLens': ('Lens:int', '',
+        'Selects 1 of 4 symbolic lenses (4 classified coarse ranges).\nStatus: published\n----------\nParameters:\n    Lens:int = 1\n----------\nCommand Timeout: 10000\nExample:SelectAZoomLens 1'),
+    'GetAZoomLens': ('', 'Lens:int',
+        'Returns 1 of 4 symbolic lenses, coarse ranges.\nStatus: published\n----------\nResponse:\n    Lens:int\n----------\nCommand Timeout: 5000\nExample:GetAZoomLens'),
+    'AZoomSetupDialog': ('', '',
+        'Opens the operator panel. In this window you can change the settings for all\ndefined lenses.\nStatus: published\n----------\nCommand Timeout: 5000\nExample:AZoomSetupDialog'),
+    'MoveAZoomFocus': ('Focus:int,Ref:str', 'RetFocus:int',
+        'Changes the focus magnitude.\nStatus: published\n----------\nParameters:\n    Focus:int = 100\n    Ref:str = "R"\n----------\nResponse:\n    RetFocus:int\n----------\nCommand Timeout: 10000\nExample:MoveAZoomFocus 100'),
+    'ReadAZoomFocus': ('', 'Focus:int',
+        'Returns the focus magnitude.\nStatus: published\n----------\nResponse:\n    Focus:int\n----------\nCommand Timeout: 5000\nExample:ReadAZoomFocus'),
+    'MoveAZoomVelocity': ('Direction:str,Velocity:int', 'RetVelocity:Decimal',
+        'Moves the A-Zoom using the set focus speed.\nStatus: published\n----------\nParameters:\n    Direction:str = ""\n    Velocity:int = 100\n----------\nResponse:\n    RetVelocity:Decimal\n----------\nCommand Timeout: 240000\nExample:MoveAZoomVelocity + 67'),
+    'StopAZoom': ('', '',
+        'Stops the A-Zoom movements.\nStatus: published\n----------\nCommand Timeout: 5000\nExample:StopAZoom'),
+    'SetAZoomLight': ('Light:int', '',
+        'Switches all lights ON or OFF. ON means the values defined by the current lens.\n1 switches the light on, 0 switches the light off. Without parameter toggles\nbetween on an off.\nStatus: published\n----------\nParameters:\n    Light:int = 0\n----------\nCommand Timeout: 5000\nExample:SetAZoomLight 1'),
+    'CloseAZoom': ('', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nCloses the OpticalControl application. Used during Project File handling.\nStatus: internal\n----------\nCommand Timeout: 5000\nExample:CloseAZoom'),
+    'OCLightVal': ('Value:int,Channel:int,Segment:int', '',
+        'Set the brightness of given channel and segment to the given value.\nStatus: published\n----------\nParameters:\n    Value:int = 0\n    Channel:int = 1\n    Segment:int = 1\n----------\nCommand Timeout: 5000\nExample:OCLightVal 128 1 4'),
+    'OCLightOn': ('On:int,Channel:int', '',
+        'Switch the light (if it has segments then all) in a given channel ON or OFF.\nSwitch ON - that means: light to the before adjusted brightness.\nStatus: published\n----------\nParameters:\n    On:int = 0\n    Channel:int = 1\n----------\nCommand Timeout: 5000\nExample:OCLightOn 1 1'),
+    'OCSetZoomLevel': ('Zoom:int,Motor:int', '',
+        'Set logical zoom factor for given motor (if has more then one, else to the one)\nStatus: published\n----------\nParameters:\n    Zoom:int = 0\n    Motor:int = 1\n----------\nCommand Timeout: 5000\nExample:OCSetZoomLevel 50 1'),
+    'OCGetZoomLevel': ('Motor:int', 'Zoom:int',
+        'Get logical zoom factor for given motor (if has more then one, else to the one)\nStatus: published\n----------\nParameters:\n    Motor:int = 1\n----------\nResponse:\n    Zoom:int\n----------\nCommand Timeout: 5000\nExample:OCGetZoomLevel 1'),
+    'StartReAlignTemperature': ('TargetTemperature:Decimal,ThetaAlignOnFinish:int,ContactOnFinish:int', '',
+        'Starts temperature ramping using ReAlign. ReAlign will re-adjust the probes and\nwafer during ramping to the new target temperature. Command returns immediately.\nThe status of temperature ramping must be checked using the\nGetReAlignTemperatureStatus command.\nStatus: published\n----------\nParameters:\n    TargetTemperature:Decimal = 0\n    ThetaAlignOnFinish:int = 0\n    ContactOnFinish:int = 0\n----------\nCommand Timeout: 10000\nExample:StartReAlignTemperature 150'),
+    'StopReAlignTemperature': ('', '',
+        'Stops temperature ramping using ReAlign.\nStatus: published\n----------\nCommand Timeout: 10000\nExample:StopReAlignTemperature'),
+    'GetReAlignTemperatureStatus': ('', 'StatusId:int,StatusStr:str',
+        'Returns the status of the current temperature ramping using ReAlign process.\nStatus: published\n----------\nResponse:\n    StatusId:int\n    StatusStr:str\n----------\nCommand Timeout: 300000\nExample:GetReAlignTemperatureStatus'),
+    'ReAlign': ('Repeats:int,Mode:str,AlignProbeCard:int,AdjustContact:int', 'XOffsetWafer:Decimal,YOffsetWafer:Decimal,ZOffsetWafer:Decimal,XOffsetCard:Decimal,YOffsetCard:Decimal,ZOffsetCard:Decimal',
+        'Performs an automatic realignment of the wafer. This includes measuring the\nneedle drift XYZ, aligning the wafer, measuring Chuck expansion, measuring Chuck\ndrift XYZ and optionally a Z-Profile. Alternatively the tool performs a\nProbeToDie Alignment to correct the needle position for the current die. Command\nreturns once ReAlign is finished or aborted because of an error.\nStatus: published\n----------\nParameters:\n    Repeats:int = 1\n    Mode:str = "H"\n    AlignProbeCard:int = 2\n    AdjustContact:int = 2\n----------\nResponse:\n    XOffsetWafer:Decimal\n    YOffsetWafer:Decimal\n    ZOffsetWafer:Decimal\n    XOffsetCard:Decimal\n    YOffsetCard:Decimal\n    ZOffsetCard:Decimal\n----------\nCommand Timeout: 1000000\nExample:ReAlign 2 H 0 0'),
+    'NextWafer': ('', 'Canceled:int',
+        'Starts the ReAlign training routine.\nStatus: published\n----------\nResponse:\n    Canceled:int\n----------\nCommand Timeout: 60000000\nExample:NextWafer'),
+    'StartReAlign': ('Repeats:int,Mode:str,AlignProbeCard:int,AdjustContact:int', '',
+        'Starts an automatic realignment of the wafer. This includes measuring the needle\ndrift XYZ, aligning the wafer, measuring Chuck expansion, measuring Chuck drift\nXYZ and optionally a Z-Profile. Alternatively the tool performs a ProbeToPad\nAlignment to correct the needle position for the current die. Command returns\nimmediately. The status of the asynchronous ReAlign execution must be checked\nusing the GetReAlignStatus command.\nStatus: published\n----------\nParameters:\n    Repeats:int = 1\n    Mode:str = "H"\n    AlignProbeCard:int = 2\n    AdjustContact:int = 2\n----------\nCommand Timeout: 60000\nExample:StartReAlign 2 H 0 0'),
+    'StopReAlign': ('', '',
+        'Stops the ReAlign procedure.\nStatus: published\n----------\nCommand Timeout: 120000\nExample:StopReAlign'),
+    'GetReAlignStatus': ('', 'Running:int,LastError:int',
+        'Returns a status of the ReAlign procedure and the error code of the last\nexecution. If the return value is true, ReAlign is running.\nStatus: published\n----------\nResponse:\n    Running:int\n    LastError:int\n----------\nCommand Timeout: 60000\nExample:GetReAlignStatus'),
+    'EnableOverlay': ('Overlay:int', '',
+        'Allows activating the overlay of the probe tips for the Platen camera.\nStatus: published\n----------\nParameters:\n    Overlay:int = 0\n----------\nCommand Timeout: 10000\nExample:EnableOverlay 0'),
+    'SwitchOffset': ('Offset:int,MoveToWaferFocus:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSwitches the offset compensation. Applicable for MicroAlign stations only.\nStatus: internal\n----------\nParameters:\n    Offset:int = 0\n    MoveToWaferFocus:int = 1\n----------\nCommand Timeout: 60000\nExample:SwitchOffset 1'),
+    'MoveEvueFocusStage': ('EvueZ:Decimal,EvueVelocity:Decimal', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nMoves the eVue focus stage to a specified position. Implemented for supporting\nSCPI legacy command.\nStatus: internal\n----------\nParameters:\n    EvueZ:Decimal = 0\n    EvueVelocity:Decimal = 100\n----------\nCommand Timeout: 30000\nExample:MoveEvueFocusStage 1000'),
+    'GetEvueFocusStagePos': ('PosRef:str', 'EvueZ:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the current position of the eVue focus stage. Implemented for supporting\nSCPI legacy command.\nStatus: internal\n----------\nParameters:\n    PosRef:str = "Zero"\n----------\nResponse:\n    EvueZ:Decimal\n----------\nCommand Timeout: 10000\nExample:GetEvueFocusStagePos'),
+    'RunEvueAutoExpose': ('UseCB:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nCommand runs the AutoExpose function for the eVue. Implemented for supporting\nSCPI legacy command.\nStatus: internal\n----------\nParameters:\n    UseCB:int = 1\n----------\nCommand Timeout: 20000\nExample:RunEvueAutoExpose 1'),
+    'GetEvueZoomLevel': ('', 'Zoom:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nValid only with the eVue microscope that is connected to Velox.     On eVue\nsystems, this command, returns values ranging from 0.5 to 5.0 for a 10x system\nand 0.5 to 20.0 for a 40x system.\nStatus: internal\n----------\nResponse:\n    Zoom:Decimal\n----------\nCommand Timeout: 10000\nExample:GetEvueZoomLevel'),
+    'SetEvueZoomLevel': ('Zoom:Decimal', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nValid only with the eVue microscope or an A-Zoom microscope that is connected to\nVelox. On eVue systems, this command sets the proper CCD zoom level to the\nappropriate optical path.\nStatus: internal\n----------\nParameters:\n    Zoom:Decimal = 0\n----------\nCommand Timeout: 10000\nExample:SetEvueZoomLevel 2.0'),
+    'StartAutomationTemperature': ('TargetTemperature:Decimal,ThetaAlignOnFinish:int,ContactOnFinish:int,AlignOnFinish:int', '',
+        'Starts temperature ramping using Autonomous Assistant. The Autonomous Assistant\n(mostly VueTrack) will re-adjust the probes and wafer during ramping to the new\ntarget temperature.\nStatus: published\n----------\nParameters:\n    TargetTemperature:Decimal = 0\n    ThetaAlignOnFinish:int = 0\n    ContactOnFinish:int = 0\n    AlignOnFinish:int = 1\n----------\nCommand Timeout: 10000\nExample:StartAutomationTemperature 150'),
+    'StopAutomationTemperature': ('', '',
+        'Stops temperature ramping using Autonomous Assistant.\nStatus: published\n----------\nCommand Timeout: 10000\nExample:StopAutomationTemperature'),
+    'GetAutomationTemperatureStatus': ('', 'StatusId:int,StatusStr:str',
+        'Returns the status of the current temperature ramping using Autonomous Assistant\nprocess.\nStatus: published\n----------\nResponse:\n    StatusId:int\n    StatusStr:str\n----------\nCommand Timeout: 300000\nExample:GetAutomationTemperatureStatus'),
+    'GetAutomationActive': ('', 'Active:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nCommand to read from Spectrum Vision if Autonomous Assistant (AutoXY, AutoZ or\nVueTrack) is active. Command is used     by Wafer Map to read if it must send\nMoveChuckAutoXY instead of MoveChuck\nStatus: internal\n----------\nResponse:\n    Active:int\n----------\nCommand Timeout: 10000\nExample:GetAutomationActive'),
+    'AutomationNeedleSearch': ('ProbeIndex:int,MoveScope:int', 'XOffset:Decimal,YOffset:Decimal,ZOffset:Decimal,XYMatchScore:Decimal,ZMatchScore:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nVueTrack vision search of the given probe tip index.\nStatus: internal\n----------\nParameters:\n    ProbeIndex:int = 1\n    MoveScope:int = 1\n----------\nResponse:\n    XOffset:Decimal\n    YOffset:Decimal\n    ZOffset:Decimal\n    XYMatchScore:Decimal\n    ZMatchScore:Decimal\n----------\nCommand Timeout: 60000\nExample:AutomationNeedleSearch 1 1'),
+    'AutomationReferenceSearch': ('', 'XOffset:Decimal,YOffset:Decimal,ZOffset:Decimal,XYMatchScore:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nAutomationReferenceSearch exposes the functionality of searching the Autonomous\nAssistant reference target via remote command\nStatus: internal\n----------\nResponse:\n    XOffset:Decimal\n    YOffset:Decimal\n    ZOffset:Decimal\n    XYMatchScore:Decimal\n----------\nCommand Timeout: 60000\nExample:AutomationReferenceSearch'),
+    'MovePositionersSafe': ('', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nMoves the configured motorized Positioners to a safe position\nStatus: internal\n----------\nCommand Timeout: 60000\nExample:MovePositionersSafe'),
+    'SetConstantContactMode': ('IsOn:int,ForceLastCorrection:int', '',
+        'Starts Constant Contact mode using Autonomous Assistant. The Autonomous\nAssistant will re-adjust the wafer during ramping to the new target temperature.\nStatus: published\n----------\nParameters:\n    IsOn:int = 0\n    ForceLastCorrection:int = 0\n----------\nCommand Timeout: 10000\nExample:SetConstantContactMode 1'),
+    'GetConstantContactModeStatus': ('', 'StatusId:int,StatusStr:str',
+        'Returns the status of the current ConstantContact Autonomous Assistant process.\nStatus: published\n----------\nResponse:\n    StatusId:int\n    StatusStr:str\n----------\nCommand Timeout: 10000\nExample:GetConstantContactModeStatus'),
+    'SetAutomationActive': ('Activate:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nCommand to set if Autonomous Assistant (AutoXY, AutoZ or VueTrack) is active.\nCommand can be used to e.g. deactivate Autonomous Assistant     programmatically\nin case it is no longer used.     When activating Autonomous Assistant, the\ncommand will return an error in case it is not possible (e.g. not trained)\nStatus: internal\n----------\nParameters:\n    Activate:int = 0\n----------\nCommand Timeout: 10000\nExample:SetAutomationActive 1'),
+    'AutomationSearchCurrentDie': ('', 'XOffset:Decimal,YOffset:Decimal',
+        'Performs an Autonomous Assistant search and position correction using the\ncurrent Chuck position. Response is X, Y relative distance of adjustment.\nStatus: published\n----------\nResponse:\n    XOffset:Decimal\n    YOffset:Decimal\n----------\nCommand Timeout: 6000000\nExample:AutomationSearchCurrentDie'),
+    'PreMapWafer': ('', 'NumberOfDies:int',
+        'PreMapWafer finds actual singulated die locations and updates positions used by\nWafer Map.\nStatus: published\n----------\nResponse:\n    NumberOfDies:int\n----------\nCommand Timeout: 14400000\nExample:PreMapWafer'),
+    'ISSProbeAlign': ('', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nPerforms an probe to pad operation on the ISS with two RF Positioners.\nStatus: internal\n----------\nCommand Timeout: 6000000\nExample:ISSProbeAlign'),
+    'FindWaferCenter': ('NoManualRecovery:int', 'ChuckX:Decimal,ChuckY:Decimal',
+        'FindWaferCenter finds the center of the wafer using edge detection.\nStatus: published\n----------\nParameters:\n    NoManualRecovery:int = 0\n----------\nResponse:\n    ChuckX:Decimal\n    ChuckY:Decimal\n----------\nCommand Timeout: 300000\nExample:FindWaferCenter'),
+    'LocateHomeDie': ('NoManualRecovery:int', 'ChuckX:Decimal,ChuckY:Decimal',
+        'LocateHomeDie finds the center of the wafer using edge detection and sets the\nhome position.\nStatus: published\n----------\nParameters:\n    NoManualRecovery:int = 0\n----------\nResponse:\n    ChuckX:Decimal\n    ChuckY:Decimal\n----------\nCommand Timeout: 300000\nExample:LocateHomeDie'),
+    'DeletePositionerLayout': ('LayoutName:str,ProbeID:int', '',
+        'Delete the specified layout. If LayoutName is \'All\' then all layouts are\ndeleted. If optional ProbeID parameter is set, it removes just that probe from\nthe layout.\nStatus: published\n----------\nParameters:\n    LayoutName:str = ""\n    ProbeID:int = 0\n----------\nCommand Timeout: 10000\nExample:DeletePositionerLayout "layout1"'),
+    'CapturePositionerLayout': ('LayoutName:str,ProbeID:int', '',
+        'Capture the specified layout. If optional ProbeID parameter is set, it captures\njust that probe from the layout.\nStatus: published\n----------\nParameters:\n    LayoutName:str = ""\n    ProbeID:int = 0\n----------\nCommand Timeout: 30000\nExample:CapturePositionerLayout "layout1"'),
+    'MoveToPositionerLayout': ('LayoutName:str', '',
+        'Move to the probes to specified layout which are offsets from the trained\npositions.\nStatus: published\n----------\nParameters:\n    LayoutName:str = ""\n----------\nCommand Timeout: 300000\nExample:MoveToPositionerLayout "layout1"'),
+    'ResetAutomation': ('', '',
+        'Reset Autonomous Assistant data back to trained values.\nStatus: published\n----------\nCommand Timeout: 10000\nExample:ResetAutomation'),
+    'GetWaferCenter': ('', 'ChuckX:Decimal,ChuckY:Decimal',
+        'GetWaferCenter returns the Chuck location (zero based) of the wafer center. It\nreturns 0 0 if FindWaferCenter has not been executed for the current wafer.\nStatus: published\n----------\nResponse:\n    ChuckX:Decimal\n    ChuckY:Decimal\n----------\nCommand Timeout: 10000\nExample:GetWaferCenter'),
+    'AutomationRFProbeSearch': ('ImageFilename:str', 'X:Decimal,Y:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the distance in X,Y between the center tips of the RF probes.\nStatus: internal\n----------\nParameters:\n    ImageFilename:str = ""\n----------\nResponse:\n    X:Decimal\n    Y:Decimal\n----------\nCommand Timeout: 10000\nExample:AutomationRFProbeSearch'),
+    'StartAutoRFCalibration': ('', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nStarts the Auto RF calibration sequence.\nStatus: internal\n----------\nCommand Timeout: 10000\nExample:StartAutoRFCalibration'),
+    'StopAutoRFCalibration': ('', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nStops the currently running Auto RF calibration.\nStatus: internal\n----------\nCommand Timeout: 10000\nExample:StopAutoRFCalibration'),
+    'GetAutoRFCalibrationStatus': ('', 'StatusId:int,StatusStr:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the status of the Auto RF calibration sequence.\nStatus: internal\n----------\nResponse:\n    StatusId:int\n    StatusStr:str\n----------\nCommand Timeout: 10000\nExample:GetAutoRFCalibrationStatus'),
+    'GetEvueVersion': ('Index:int', 'EvueVersionDriver:int,EvueVersionMastodon:int,EvueVersionDaughter:int,EvueVersionStonehenge:int,EvueVersionBluestone:int,EvueVersionBlackPill:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the version numbers for eVue driver and eVue firmwares.\nStatus: internal\n----------\nParameters:\n    Index:int = 0\n----------\nResponse:\n    EvueVersionDriver:int\n    EvueVersionMastodon:int\n    EvueVersionDaughter:int\n    EvueVersionStonehenge:int\n    EvueVersionBluestone:int\n    EvueVersionBlackPill:int\n----------\nCommand Timeout: 10000\nExample:GetEvueVersion'),
+    'GetEvueFocusStageRange': ('', 'EvueZMax:Decimal,EvueZMin:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the minimum and maximum position of the eVue focus stage.\nStatus: internal\n----------\nResponse:\n    EvueZMax:Decimal\n    EvueZMin:Decimal\n----------\nCommand Timeout: 10000\nExample:GetEvueFocusStageRange'),
+    'GetCameraScale': ('Name:str', 'ScaleX:Decimal,ScaleY:Decimal,PixelX:Decimal,PixelY:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the micron to pixel ratio of requested mount.\nStatus: internal\n----------\nParameters:\n    Name:str = ""\n----------\nResponse:\n    ScaleX:Decimal\n    ScaleY:Decimal\n    PixelX:Decimal\n    PixelY:Decimal\n----------\nCommand Timeout: 10000\nExample:GetCameraScale'),
+    'SetTestParameterData': ('Index:int,StartBin:int,NumBins:int,LowLimit:Decimal,HighLimit:Decimal,Name:str,EnabledForAnalysis:int,AnalysisLowLimit:Decimal,AnalysisHighLimit:Decimal', '',
+        'Sets the Test Parameter data.\nStatus: published\n----------\nParameters:\n    Index:int = 0\n    StartBin:int = 0\n    NumBins:int = 0\n    LowLimit:Decimal = 0\n    HighLimit:Decimal = 1\n    Name:str = ""\n    EnabledForAnalysis:int = 0\n    AnalysisLowLimit:Decimal = 0\n    AnalysisHighLimit:Decimal = 1\n----------\nCommand Timeout: 10000'),
+    'GetTestParameterData': ('Index:int', 'StartBin:int,NumBins:int,LowLimit:Decimal,HighLimit:Decimal,Name:str,EnabledForAnalysis:int,AnalysisLowLimit:Decimal,AnalysisHighLimit:Decimal',
+        'Sets the Test Parameter data.\nStatus: published\n----------\nParameters:\n    Index:int = 0\n----------\nResponse:\n    StartBin:int\n    NumBins:int\n    LowLimit:Decimal\n    HighLimit:Decimal\n    Name:str\n    EnabledForAnalysis:int\n    AnalysisLowLimit:Decimal\n    AnalysisHighLimit:Decimal\n----------\nCommand Timeout: 10000'),
+    'SetTestParameterValueAsNum': ('TestParamIndex:int,Value:Decimal,SequenceNumber:int,Site:int', '',
+        'Sets the Test Parameter value for a given Die/SubDie.\nStatus: published\n----------\nParameters:\n    TestParamIndex:int = 0\n    Value:Decimal = 0\n    SequenceNumber:int = -1\n    Site:int = -1\n----------\nCommand Timeout: 10000'),
+    'SetTestParameterValueAsColRow': ('TestParamIndex:int,Value:Decimal,DieX:int,DieY:int,Site:int', '',
+        'Sets the Test Parameter value for a given Die/SubDie.\nStatus: published\n----------\nParameters:\n    TestParamIndex:int = 0\n    Value:Decimal = 0\n    DieX:int = 0\n    DieY:int = 0\n    Site:int = -1\n----------\nCommand Timeout: 10000'),
+    'GetTestParameterValueAsNum': ('TestParamIndex:int,SequenceNumber:int,Site:int', 'SequenceNumberResponse:int,Value:Decimal',
+        'Sets the Test Parameter value for a given Die/SubDie.\nStatus: published\n----------\nParameters:\n    TestParamIndex:int = 0\n    SequenceNumber:int = -1\n    Site:int = -1\n----------\nResponse:\n    SequenceNumberResponse:int\n    Value:Decimal\n----------\nCommand Timeout: 10000'),
+    'GetTestParameterValueAsColRow': ('TestParamIndex:int,DieX:int,DieY:int,Site:int', 'DieXResponse:int,DieYResponse:int,Value:Decimal',
+        'Sets the Test Parameter value for a given Die/SubDie.\nStatus: published\n----------\nParameters:\n    TestParamIndex:int = 0\n    DieX:int = 0\n    DieY:int = 0\n    Site:int = -1\n----------\nResponse:\n    DieXResponse:int\n    DieYResponse:int\n    Value:Decimal\n----------\nCommand Timeout: 10000'),
+    'DeleteAllTestParameters': ('', '',
+        'Deletes all the Test Parameters.\nStatus: published\n----------\nCommand Timeout: 10000'),
+    'SetTestParameterForDisplay': ('TestParamIndex:int', '',
+        'Sets the Test Parameter bins to show on the Wafer Display.\nStatus: published\n----------\nParameters:\n    TestParamIndex:int = 0\n----------\nCommand Timeout: 10000'),
+    'NewTesterProject': ('LotID:str,TileID:str', 'ProjectName:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command informs the tester that a new Lot/Tile is to be tested. The tester\nresponds with the correct project name for the test. This is needed because the\nProbe Station needs to verify that the correct project is loaded. In case no\nvalid project is available, the command is returned with an error.\nStatus: internal\n----------\nParameters:\n    LotID:str = ""\n    TileID:str = ""\n----------\nResponse:\n    ProjectName:str\n----------\nCommand Timeout: 30000\nExample:NewTesterProject Lot01 Tile01'),
+    'StartMeasurement': ('DieColumn:int,DieRow:int,ActiveDies:str,SubDieIndex:int', 'BinNumbers:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command tells the tester to begin measuring (Needles are in correct\nposition and in contact). The command is responded when the measurement has\nfinished. The response string holds the binning information separated by comma.\nFor deactivated dies, a bin value of \'0\' should be responded.\nStatus: internal\n----------\nParameters:\n    DieColumn:int = 0\n    DieRow:int = 0\n    ActiveDies:str = ""\n    SubDieIndex:int = 0\n----------\nResponse:\n    BinNumbers:str\n----------\nCommand Timeout: 100000\nExample:StartMeasurement 1 1 1 0'),
+    'EndOfWafer': ('', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command tells the tester, that the test of the current substrate has\nfinished. It enables the tester application to save measurement data and/or\nprepare for the next substrate.\nStatus: internal\n----------\nCommand Timeout: 30000\nExample:EndOfWafer'),
+    'EndOfLot': ('', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command tells the tester, that the test of the current lot has finished. It\nenables the tester application to save measurement data and/or prepare for the\nnext lot.\nStatus: internal\n----------\nCommand Timeout: 30000\nExample:EndOfLot'),
+    'VerifyProductID': ('ProductID:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command informs the tester about the ProductID that is to be tested. The\ntester can respond with an error in case the ProductID is not allowed for\ntesting.\nStatus: internal\n----------\nParameters:\n    ProductID:str = ""\n----------\nCommand Timeout: 30000\nExample:VerifyProductID Product123'),
+    'VerifyLotID': ('LotID:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command informs the tester about the LotID that is to be tested. The tester\ncan respond with an error in case the LotID is not allowed for testing.\nStatus: internal\n----------\nParameters:\n    LotID:str = ""\n----------\nCommand Timeout: 30000\nExample:VerifyLotID Lot123'),
+    'VerifySubstrateID': ('SubstrateID:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command informs the tester about the SubstrateID that is to be tested. The\ntester can respond with an error in case the SubstrateID is not allowed for\ntesting.\nStatus: internal\n----------\nParameters:\n    SubstrateID:str = ""\n----------\nCommand Timeout: 30000\nExample:VerifySubstrateID Substrate123'),
+    'VerifyProbecard': ('ProbeCard:str,Touchdowns:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command informs the tester about the ProbecardID and touchdowns that is\nused for testing. The tester can respond with an error in case the Probecard is\nnot allowed for testing.\nStatus: internal\n----------\nParameters:\n    ProbeCard:str = ""\n    Touchdowns:int = 0\n----------\nCommand Timeout: 30000\nExample:VerifyProbecard Probecard123 10596'),
+    'VerifyUserID': ('User:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command informs the tester about the User ID. The tester can respond with\nan error in case the User ID is not allowed for testing.\nStatus: internal\n----------\nParameters:\n    User:str = ""\n----------\nCommand Timeout: 30000\nExample:VerifyUserID User123'),
+    'TesterAbort': ('', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command informs the tester that the job was aborted and no more test will\nhappen.\nStatus: internal\n----------\nCommand Timeout: 30000\nExample:TesterAbort'),
+    'VerifySOTReady': ('', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command informs the tester that a wafer is ready for testing which will\nimmediately start. This command is sent in the recipe sequence "Verify\nSOTReady".\nStatus: internal\n----------\nCommand Timeout: 30000\nExample:VerifySOTReady'),
+    'VerifyWaferStart': ('SubstrateID:str,CassettePlace:str,LotID:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command is sent in the VeloxPro recipe sequence "Verify Wafer Start" and\ninforms the tester about the current wafer on the Chuck.\nStatus: internal\n----------\nParameters:\n    SubstrateID:str = ""\n    CassettePlace:str = ""\n    LotID:str = ""\n----------\nCommand Timeout: 30000\nExample:VerifyWaferStart Wafer01 1 Lot01'),
+    'TesterCassetteInfo': ('CassetteCmd:str', 'CassetteRsp:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command will be sent after the user selected which wafers are to be tested.\nIt contains a string which represents the state of each wafer: 0 = empty, 1 =\nfull (and selected), 2 = error (e.g. double slotted), 3 = unknown, 4 =\ndeselected\nStatus: internal\n----------\nParameters:\n    CassetteCmd:str = ""\n----------\nResponse:\n    CassetteRsp:str\n----------\nCommand Timeout: 30000\nExample:TesterCassetteInfo 0000001110000000010010111'),
+    'VerifyProject': ('ProjectName:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command is sent after selecting a project file in the VeloxPro product\nsetup page. The command sends the name of the project to tester for\nverification.\nStatus: internal\n----------\nParameters:\n    ProjectName:str = ""\n----------\nCommand Timeout: 30000\nExample:VerifyProject C:/Users/Public/Documents/Velox/Projects/Test.spp'),
+    'TesterAbortWafer': ('', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command informs the tester that the test for the current wafer was aborted\nand no more tests will happen with the current wafer. The job will continue\nthough.\nStatus: internal\n----------\nCommand Timeout: 30000\nExample:TesterAbortWafer'),
+    'StartScript': ('ScriptName:str', '',
+        'Starts the script and returns the response immediately.\nStatus: published\n----------\nParameters:\n    ScriptName:str = ""\n----------\nCommand Timeout: 10000\nExample:StartScript myscript'),
+    'GetRunStatus': ('ScriptName:str', 'Running:int,LastError:int,Title:str',
+        'Command returns information about Communicator status.\nStatus: published\n----------\nParameters:\n    ScriptName:str = ""\n----------\nResponse:\n    Running:int\n    LastError:int\n    Title:str\n----------\nCommand Timeout: 5000\nExample:GetRunStatus'),
+    'CloseCommunicator': ('', '',
+        'Command closes the program. Used during ProjectFile handling.\nStatus: published\n----------\nCommand Timeout: 10000\nExample:CloseCommunicator'),
+    'DoScript': ('ScriptName:str', '',
+        'Executes the script and returns the response afterwards.\nStatus: published\n----------\nParameters:\n    ScriptName:str = ""\n----------\nCommand Timeout: 10000000\nExample:DoScript myscript'),
+    'ReadKernelData': ('SilentMode:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReads Kernel Data to KernelSetup (Left Program pane).\nStatus: internal\n----------\nParameters:\n    SilentMode:int = 0\n----------\nCommand Timeout: 300000\nExample:ReadKernelData 0'),
+    'SaveKernelDataAs': ('FileName:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSaves Kernel Data (Left Program pane) to File. An existing File will be\noverwritten. If the Folder does not exist, it will be created\nStatus: internal\n----------\nParameters:\n    FileName:str = ""\n----------\nCommand Timeout: 10000\nExample:SaveKernelDataAs C:/Temp/RCConfigSample1.xml'),
+    'LoadConfigFile': ('FileName:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nLoads File Data to KernelSetup (Right Program pane).\nStatus: internal\n----------\nParameters:\n    FileName:str = ""\n----------\nCommand Timeout: 10000\nExample:LoadConfigFile C:/Temp/RCConfigSample1.xml'),
+    'ReplaceKernelDataByFileData': ('SilentMode:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReplaces Kernel Data (Left pane) by File Data (Right pane).\nStatus: internal\n----------\nParameters:\n    SilentMode:int = 0\n----------\nCommand Timeout: 300000\nExample:ReplaceKernelDataByFileData 0'),
+    'ReplaceFileTreeByKernelData': ('SilentMode:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReplaces File Tree (Right pane) by Kernel Data (Left pane).\nStatus: internal\n----------\nParameters:\n    SilentMode:int = 0\n----------\nCommand Timeout: 300000\nExample:ReplaceFileTreeByKernelData 0'),
+    'SaveFileTreeAs': ('FileName:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSaves File Tree (Right pane) to File. An existing File will be overwritten. If\nthe Folder does not exist, it will be created.\nStatus: internal\n----------\nParameters:\n    FileName:str = ""\n----------\nCommand Timeout: 10000\nExample:SaveFileTreeAs C:/Temp/RCConfigSample2.xml'),
+    'HeatChuck': ('Temperature:Decimal,Unit:str,ReduceContact:int', 'RespTemperature:Decimal,RespUnit:str',
+        'Sets a new target temperature and starts the heating or cooling of the Chuck. An\nanswer to the command will be returned after reaching the given temperature and\nwaiting the soak time or an unexpected interrupt of the process. Given back is\nthe already reached temperature.\nStatus: published\n----------\nParameters:\n    Temperature:Decimal = 25\n    Unit:str = "Celsius"\n    ReduceContact:int = 1\n----------\nResponse:\n    RespTemperature:Decimal\n    RespUnit:str\n----------\nCommand Timeout: 36000000\nExample:HeatChuck 61.3 C'),
+    'SetHeaterTemp': ('Temperature:Decimal,Unit:str,UseContactSafety:int', 'RespTemperature:Decimal,RespUnit:str',
+        'Sets a new target temperature and starts the heating or cooling of the thermal\nChuck. The new target temperature is returned immediately as the command does\nnot wait until heating is complete.\nStatus: published\n----------\nParameters:\n    Temperature:Decimal = 25\n    Unit:str = "Celsius"\n    UseContactSafety:int = 1\n----------\nResponse:\n    RespTemperature:Decimal\n    RespUnit:str\n----------\nCommand Timeout: 60000\nExample:SetHeaterTemp 55.5 C'),
+    'GetHeaterTemp': ('Unit:str,ExternalHeaterID:int', 'RespTemperature:Decimal,RespUnit:str,Status:str',
+        'Reads the current temperature of the Chuck and determines the status of the\nthermal system.\nStatus: published\n----------\nParameters:\n    Unit:str = "Celsius"\n    ExternalHeaterID:int = 0\n----------\nResponse:\n    RespTemperature:Decimal\n    RespUnit:str\n    Status:str\n----------\nCommand Timeout: 60000\nExample:GetHeaterTemp C'),
+    'EnableHeaterHoldMode': ('HoldMode:int', 'RespHoldMode:int',
+        'Switches the Thermal Chuck devices hold mode on or off. In hold mode the Chuck\nis heated with a constant current to avoid noise from the temperature control.\nThe hold mode can be enabled only in HoldReady state.\nStatus: published\n----------\nParameters:\n    HoldMode:int = 1\n----------\nResponse:\n    RespHoldMode:int\n----------\nCommand Timeout: 60000\nExample:EnableHeaterHoldMode 1'),
+    'StopHeatChuck': ('', '',
+        'Stops a pending heating or cooling process. If the device is not at temperature,\nthe actual temperature is set as target temperature.\nStatus: published\n----------\nCommand Timeout: 60000\nExample:StopHeatChuck'),
+    'GetDewPointTemp': ('Unit:str', 'RespTemperature:Decimal,RespUnit:str',
+        'Returns the current dew point temperature if a dew point sensor is connected.\nStatus: published\n----------\nParameters:\n    Unit:str = "Celsius"\n----------\nResponse:\n    RespTemperature:Decimal\n    RespUnit:str\n----------\nCommand Timeout: 60000\nExample:GetDewPointTemp C'),
+    'GetTemperatureChuckOptions': ('', 'UseSoakTime:int,Unused:int,CurrConnection:int,MinTemperature:Decimal,MaxTemperature:Decimal,UsePurge:int,UseDynamicSoakTime:int,UseFixedDieSoakTime:int,UseDynamicDieSoakTime:int,UseEcoMode:int,PurgeOnChamberDoor:int,ForceBypassPurge:int,DoorClosedTime:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the currently set thermal Chuck options.\nStatus: internal\n----------\nResponse:\n    UseSoakTime:int\n    Unused:int\n    CurrConnection:int\n    MinTemperature:Decimal\n    MaxTemperature:Decimal\n    UsePurge:int\n    UseDynamicSoakTime:int\n    UseFixedDieSoakTime:int\n    UseDynamicDieSoakTime:int\n    UseEcoMode:int\n    PurgeOnChamberDoor:int\n    ForceBypassPurge:int\n    DoorClosedTime:int\n----------\nCommand Timeout: 10000'),
+    'SetTemperatureChuckOptions': ('UseFixedWaferSoak:int,Unused:int,CurrConnection:int,UsePurge:int,UseDynamicWaferSoak:int,UseFixedDieSoakTime:int,UseDynamicDieSoakTime:int,UseEcoMode:int,PurgeOnChamberDoor:int,ForceBypassPurge:int,DoorClosedTime:int', 'UseFixedWaferSoakRsp:int,SyncTempRsp:int,CurrConnectionRsp:int,UsePurgeRsp:int,UseDynamicWaferSoakRsp:int,UseFixedDieSoakTimeRsp:int,UseDynamicDieSoakTimeRsp:int,UseEcoModeRsp:int,PurgeOnChamberDoorRsp:int,ForceBypassPurgeRsp:int,DoorClosedTimeRsp:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command is used to change the currently set thermal Chuck options.\nStatus: internal\n----------\nParameters:\n    UseFixedWaferSoak:int = -1\n    Unused:int = -1\n    CurrConnection:int = -1\n    UsePurge:int = -1\n    UseDynamicWaferSoak:int = -1\n    UseFixedDieSoakTime:int = -1\n    UseDynamicDieSoakTime:int = -1\n    UseEcoMode:int = -1\n    PurgeOnChamberDoor:int = -1\n    ForceBypassPurge:int = -1\n    DoorClosedTime:int = -1\n----------\nResponse:\n    UseFixedWaferSoakRsp:int\n    SyncTempRsp:int\n    CurrConnectionRsp:int\n    UsePurgeRsp:int\n    UseDynamicWaferSoakRsp:int\n    UseFixedDieSoakTimeRsp:int\n    UseDynamicDieSoakTimeRsp:int\n    UseEcoModeRsp:int\n    PurgeOnChamberDoorRsp:int\n    ForceBypassPurgeRsp:int\n    DoorClosedTimeRsp:int\n----------\nCommand Timeout: 300000\nExample:SetTemperatureChuckOptions 1 0 1 1 1 1 1'),
+    'GetHeaterSoak': ('', 'FixedWaferSoakTime:int,FixedWaferSoakStatus:int,DynamicWaferSoakTime:Decimal,DynamicWaferSoakStatus:int,FixedDieSoakTime:Decimal,DynamicDieSoakTime:Decimal,FixedDieSoakStatus:int,DynamicDieSoakStatus:int',
+        'Returns the current soak time values in seconds and the soaking status.\nStatus: published\n----------\nResponse:\n    FixedWaferSoakTime:int\n    FixedWaferSoakStatus:int\n    DynamicWaferSoakTime:Decimal\n    DynamicWaferSoakStatus:int\n    FixedDieSoakTime:Decimal\n    DynamicDieSoakTime:Decimal\n    FixedDieSoakStatus:int\n    DynamicDieSoakStatus:int\n----------\nCommand Timeout: 60000\nExample:GetHeaterSoak'),
+    'SetHeaterSoak': ('FixedWaferSoakTime:int,DynamicWaferSoakTime:Decimal,FixedDieSoakTime:Decimal,DynamicDieSoakTime:Decimal', '',
+        'Sets the new soak time values. The unit of the values is seconds. If soak time\nis actually running, it may be affected by the change.\nStatus: published\n----------\nParameters:\n    FixedWaferSoakTime:int = 60\n    DynamicWaferSoakTime:Decimal = -1\n    FixedDieSoakTime:Decimal = -1\n    DynamicDieSoakTime:Decimal = -1\n----------\nCommand Timeout: 60000\nExample:SetHeaterSoak 60'),
+    'EnableHeaterStandby': ('Standby:int', 'RespStandby:int',
+        'Switches the power save (standby) mode of the device on or off. If the device is\nin power save mode, setting and reading temperatures switches off the power save\nmode automatically.\nStatus: published\n----------\nParameters:\n    Standby:int = 1\n----------\nResponse:\n    RespStandby:int\n----------\nCommand Timeout: 60000\nExample:EnableHeaterStandby 1'),
+    'ReadTemperatureChuckStatus': ('', 'Status:str,DPSensor:int,SoakTimeLeft:int,HasEcoMode:int',
+        "Returns values of the thermal Chuck status. The status byte gives information\nabout the current controller's action. The dew point sensor status encapsulates\ninformation, if such a sensor is connected and if the actual dew point\ndifference temperature is readable (active). It can be used for purge control.\nSoak time left (in seconds) is used when soak time is actually running.\nStatus: published\n----------\nResponse:\n    Status:str\n    DPSensor:int\n    SoakTimeLeft:int\n    HasEcoMode:int\n----------\nCommand Timeout: 60000\nExample:ReadTemperatureChuckStatus"),
+    'GetTargetTemp': ('Unit:str', 'RespTemperature:Decimal,RespUnit:str',
+        'Reads the target temperature of the Chuck.\nStatus: published\n----------\nParameters:\n    Unit:str = "Celsius"\n----------\nResponse:\n    RespTemperature:Decimal\n    RespUnit:str\n----------\nCommand Timeout: 60000\nExample:GetTargetTemp C'),
+    'SetThermoWindow': ('Window:Decimal', 'RespWindow:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nCommand sets the window for the target temperature which is the window in which\na station is assumed to be at temp. Only supported on Nucleus stations.\nStatus: internal\n----------\nParameters:\n    Window:Decimal = 1\n----------\nResponse:\n    RespWindow:Decimal\n----------\nCommand Timeout: 60000\nExample:SetThermoWindow 2.0'),
+    'GetThermoWindow': ('', 'RespWindow:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nCommand returns the current Thermal window which is the window in which a\nstation is assumed to be at temp. Only supported on Nucleus stations.\nStatus: internal\n----------\nResponse:\n    RespWindow:Decimal\n----------\nCommand Timeout: 60000\nExample:GetThermoWindow'),
+    'SendThermoCommand': ('Command:str', 'Response:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSends a command string to the thermal Chuck using the thermal Chuck protocol and\nreturns the thermal Chucks response as command response. This command can be\nused to access thermal Chuck features that are not exposed as standalone SCI\ncommands. Command is currently implemented for ERS and ATT Chucks.\nStatus: internal\n----------\nParameters:\n    Command:str = ""\n----------\nResponse:\n    Response:str\n----------\nCommand Timeout: 5000\nExample:SendThermoCommand RH'),
+    'ReadAuxStatus': ('AuxID:int', 'AuxIDEcho:int,FlagsMode:int,Comp:str,PresetHeight:str,AuxSiteType:str',
+        'Returns the status of a single AUX site.\nStatus: published\n----------\nParameters:\n    AuxID:int = -1\n----------\nResponse:\n    AuxIDEcho:int\n    FlagsMode:int\n    Comp:str\n    PresetHeight:str\n    AuxSiteType:str\n----------\nCommand Timeout: 10000\nExample:ReadAuxStatus 1'),
+    'ReadAuxPosition': ('AuxID:int,Unit:str,PosRef:str,Comp:str', 'AuxIDEcho:int,X:Decimal,Y:Decimal,Z:Decimal',
+        'Returns the actual AUX sites position in X, Y and Z. With AUX ID set to 0, the\nposition is read for the Chuck stage. If no AUX ID is given, it tries to read\nthe position from the active site.\nStatus: published\n----------\nParameters:\n    AuxID:int = -1\n    Unit:str = "Microns"\n    PosRef:str = "Home"\n    Comp:str = "Technology"\n----------\nResponse:\n    AuxIDEcho:int\n    X:Decimal\n    Y:Decimal\n    Z:Decimal\n----------\nCommand Timeout: 10000\nExample:ReadAuxPosition 1 Y Z'),
+    'ReadAuxHeights': ('AuxID:int,Unit:str', 'AuxIDEcho:int,Contact:Decimal,Overtravel:Decimal,AlignDist:Decimal,SepDist:Decimal',
+        'Returns the actual technology heights from an AUX site. If AUX ID is set to 0,\nall response values are read from Chuck stage. If no AUX ID is given, it tries\nto read the heights from the active site.\nStatus: published\n----------\nParameters:\n    AuxID:int = -1\n    Unit:str = "Microns"\n----------\nResponse:\n    AuxIDEcho:int\n    Contact:Decimal\n    Overtravel:Decimal\n    AlignDist:Decimal\n    SepDist:Decimal\n----------\nCommand Timeout: 10000\nExample:ReadAuxHeights 1 Y'),
+    'SetAuxMode': ('AuxID:int,Overtravel:int', 'AuxIDEcho:int',
+        'Modes manage the way a stage behaves when it is in Contact Height. AUX site mode\nholds only a single flag. Flags can be turned on by using the value 1 or turned\noff by using the value 0. If you do not want to change the flag - use the value\nof 2. If AUX ID is set to 0, all flags are set for Chuck stage. AUX site will\nmove an additional overtravel on every contact move.\nStatus: published\n----------\nParameters:\n    AuxID:int = -1\n    Overtravel:int = 2\n----------\nResponse:\n    AuxIDEcho:int\n----------\nCommand Timeout: 10000\nExample:SetAuxMode 1 2'),
+    'SetAuxHome': ('AuxID:int,Mode:str,Unit:str,XValue:Decimal,YValue:Decimal', 'AuxIDEcho:int',
+        'Sets the AUX sites Home position in X and Y. It defines the origin of the AUX\nsites coordinate system for later movements. Usually this position is identical\nto the die home position.\nStatus: published\n----------\nParameters:\n    AuxID:int = -1\n    Mode:str = "0"\n    Unit:str = "Microns"\n    XValue:Decimal = 0\n    YValue:Decimal = 0\n----------\nResponse:\n    AuxIDEcho:int\n----------\nCommand Timeout: 10000\nExample:SetAuxHome 1 0 Y'),
+    'SetAuxIndex': ('AuxID:int,XValue:Decimal,YValue:Decimal,Unit:str', 'AuxIDEcho:int',
+        'Sets the AUX sites index size. If AUX ID is set to 0, index size is set for\nChuck stage.\nStatus: published\n----------\nParameters:\n    AuxID:int = -1\n    XValue:Decimal = 0\n    YValue:Decimal = 0\n    Unit:str = "Microns"\n----------\nResponse:\n    AuxIDEcho:int\n----------\nCommand Timeout: 10000\nExample:SetAuxIndex 1 1000. 1000. Y'),
+    'SetAuxHeight': ('AuxID:int,PresetHeight:str,Mode:str,Unit:str,Value:Decimal', 'AuxIDEcho:int',
+        'Sets the AUX sites Contact Height and corresponding gaps for Overtravel,\nalignment and separation height. A Contact Height search gap for contact search\nwith edge sensor can also be set. This search gap is always identical for all\nAUX sites. Without any optional parameters the command sets Contact Height to\nthe current position.\nStatus: published\n----------\nParameters:\n    AuxID:int = -1\n    PresetHeight:str = "Contact"\n    Mode:str = "0"\n    Unit:str = "Microns"\n    Value:Decimal = 0\n----------\nResponse:\n    AuxIDEcho:int\n----------\nCommand Timeout: 10000\nExample:SetAuxHeight 1 C 0 Y'),
+    'ReadAuxIndex': ('AuxID:int,Unit:str', 'AuxIDEcho:int,IndexX:Decimal,IndexY:Decimal',
+        'Returns the actual AUX sites index values. If AUX ID is set to 0, the index size\nis read from Chuck stage. If no AUX ID is given, it tries to read the index from\nthe active site.\nStatus: published\n----------\nParameters:\n    AuxID:int = -1\n    Unit:str = "Microns"\n----------\nResponse:\n    AuxIDEcho:int\n    IndexX:Decimal\n    IndexY:Decimal\n----------\nCommand Timeout: 10000\nExample:ReadAuxIndex 1 Y'),
+    'SetAuxThetaHome': ('AuxID:int,Mode:str,Unit:str,Position:Decimal', 'AuxIDEcho:int',
+        'Sets the AUX sites theta home position. It defines the origin of the AUX sites\ntheta coordinate system for later movements. If AUX ID is set to 0, theta home\nposition is set for Chuck stage.\nStatus: published\n----------\nParameters:\n    AuxID:int = -1\n    Mode:str = "0"\n    Unit:str = "Microns"\n    Position:Decimal = 0\n----------\nResponse:\n    AuxIDEcho:int\n----------\nCommand Timeout: 10000\nExample:SetAuxThetaHome 1 0'),
+    'EnableOffset': ('Stage:str,Enable:int,Move:int', '',
+        'Enables or disables the Offset XY compensation for the selected stage. If the\ncompensation holds an offset different from zero, the Chuck is automatically\nmoved the distance of the offset. The Chuck also moves automatically to a safe\nheight. The move can be disabled by the third parameter. This may put the stage\noutside the software fence.\nStatus: published\n----------\nParameters:\n    Stage:str = "Chuck"\n    Enable:int = 1\n    Move:int = 1\n----------\nCommand Timeout: 60000\nExample:EnableOffset C 1'),
+    'SetOffset': ('Stage:str,OffsetX:Decimal,OffsetY:Decimal', '',
+        'Sets the offset values for the Offset XY compensation for the selected stage.\nThe changes take effect immediately. Note that the Offset XY compensation must\nbe enabled for the values to take effect. The compensation is enabled or\ndisabled using EnableOffset command.\nStatus: published\n----------\nParameters:\n    Stage:str = "Chuck"\n    OffsetX:Decimal = 0\n    OffsetY:Decimal = 0\n----------\nCommand Timeout: 5000\nExample:SetOffset C 100000.0 0.0'),
+    'GetOffsetInfo': ('Stage:str', 'Enable:int,OffsetX:Decimal,OffsetY:Decimal',
+        'Gets information about the Offset XY compensation of the selected stage,\nincluding the stored offset values and whether the compensation is enabled or\ndisabled.\nStatus: published\n----------\nParameters:\n    Stage:str = "Chuck"\n----------\nResponse:\n    Enable:int\n    OffsetX:Decimal\n    OffsetY:Decimal\n----------\nCommand Timeout: 5000\nExample:GetOffsetInfo C'),
+    'SetSwitchPosition': ('Stage:str,AuxSite:int,X:Decimal,Y:Decimal', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSets the switch position of a stage. This is the position to move to if an AUX\nSite gets active. This is only supported for the Chuck and it\'s aux sites. Aux\nindex 0 means wafer site, 1 means aux site 1 and so on.\nStatus: internal\n----------\nParameters:\n    Stage:str = "Chuck"\n    AuxSite:int = 0\n    X:Decimal = 0\n    Y:Decimal = 0\n----------\nCommand Timeout: 5000\nExample:SetSwitchPosition C 0 5000 5000'),
+    'MoveAuxSite': ('AuxID:int', 'AuxIDEcho:int',
+        'Moves the Chuck to the position of a given AUX site. A safe height is used for\nthe move. If AUX ID is set to 0, the target of the move is the wafer site.\nStatus: published\n----------\nParameters:\n    AuxID:int = -1\n----------\nResponse:\n    AuxIDEcho:int\n----------\nCommand Timeout: 60000\nExample:MoveAuxSite 1'),
+    'SetAuxSiteCount': ('AuxSiteCount:int', '',
+        'Sets the number of available AUX sites. For preparing for example two cal\nChucks, the count must be set to 2. For the changes to take effect the system\nneeds to be restarted.\nStatus: published\n----------\nParameters:\n    AuxSiteCount:int = 0\n----------\nCommand Timeout: 10000\nExample:SetAuxSiteCount 2'),
+    'GetAuxSiteCount': ('', 'AuxSiteCount:int,ActualAuxSite:int',
+        'Reads the number of available AUX sites and the ID of the actual active AUX\nsite. If this is 0, the Chuck stage is currently active.\nStatus: published\n----------\nResponse:\n    AuxSiteCount:int\n    ActualAuxSite:int\n----------\nCommand Timeout: 10000\nExample:GetAuxSiteCount'),
+    'SetAuxSiteName': ('AuxID:int,AuxSiteName:str', 'AuxIDEcho:int',
+        'Sets the description of an AUX site. With AUX ID zero, the description of the\nwafer site can be set.\nStatus: published\n----------\nParameters:\n    AuxID:int = -1\n    AuxSiteName:str = ""\n----------\nResponse:\n    AuxIDEcho:int\n----------\nCommand Timeout: 10000\nExample:SetAuxSiteName 1 AUX Site 1'),
+    'GetAuxSiteName': ('AuxID:int', 'AuxIDEcho:int,AuxSiteName:str',
+        'This command reads the description of an AUX site. If AUX ID is set to 0, the\ndescription of the Chuck stage is given back. If no AUX ID is given, it tries to\nread from the active site.\nStatus: published\n----------\nParameters:\n    AuxID:int = -1\n----------\nResponse:\n    AuxIDEcho:int\n    AuxSiteName:str\n----------\nCommand Timeout: 10000\nExample:GetAuxSiteName 1'),
+    'CleanProbeTip': ('AuxID:str', 'AuxIDEcho:int',
+        'Starts a probe tip cleaning on the given AUX site. The cleaning algorithm is\ndependent from the type of the AUX site and from the duration and the cleaning\ncount that is set in configuration. The cleaning algorithm includes both a move\nto the pad site and a move back to the source site.\nStatus: published\n----------\nParameters:\n    AuxID:str = "-1"\n----------\nResponse:\n    AuxIDEcho:int\n----------\nCommand Timeout: 300000\nExample:CleanProbeTip 1'),
+    'SetAuxSiteType': ('AuxID:int,AuxSiteType:str', 'AuxIDEcho:int',
+        'Sets the type for a given AUX site. It depends on the type of the AUX site, if\nthere is a cleaning algorithm available. It is not possible to set the type of\nthe wafer site (AUX site 0).\nStatus: published\n----------\nParameters:\n    AuxID:int = -1\n    AuxSiteType:str = "AuxUnknown"\n----------\nResponse:\n    AuxIDEcho:int\n----------\nCommand Timeout: 10000\nExample:SetAuxSiteType 1 G'),
+    'SetCleaningParams': ('AuxID:int,Count:int,Time:int', 'AuxIDEcho:int',
+        'Sets the cleaning parameters for a given AUX site. It is not possible to set the\ncleaning parameters of the wafer site (AUX site 0). If no AUX ID is given, it\ntries to set the parameters of the active site.   The cleaning count defines,\nhow much times the cleaning is performed repeatedly. The cleaning time defines,\nhow much   milliseconds the needles wait in cleaning position during each\ncleaning cycle.\nStatus: published\n----------\nParameters:\n    AuxID:int = -1\n    Count:int = 1\n    Time:int = 0\n----------\nResponse:\n    AuxIDEcho:int\n----------\nCommand Timeout: 10000\nExample:SetCleaningParams 1 5 1000'),
+    'GetCleaningParams': ('AuxID:int', 'AuxIDEcho:int,Count:int,Time:int,Remaining:int',
+        'Reads the cleaning parameters of a given AUX site. It is not possible to read\ncleaning parameters of the wafer site (AUX site 0).\nStatus: published\n----------\nParameters:\n    AuxID:int = -1\n----------\nResponse:\n    AuxIDEcho:int\n    Count:int\n    Time:int\n    Remaining:int\n----------\nCommand Timeout: 30000\nExample:GetCleaningParams'),
+    'UpdateAuxSitePositions': ('AuxID:int,XOffset:Decimal,YOffset:Decimal', 'AuxIDEcho:int',
+        "***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nRotate the switch, home and fence positions to match the current Chuck theta\nangle and adjust Home/Switch by XY offset. Should only be used for Aux sites\nthat don't move theta.\nStatus: internal\n----------\nParameters:\n    AuxID:int = -1\n    XOffset:Decimal = 0\n    YOffset:Decimal = 0\n----------\nResponse:\n    AuxIDEcho:int\n----------\nCommand Timeout: 5000\nExample:UpdateAuxSitePositions 1"),
+    'ResetCleaningPosition': ('AuxID:str,OffsetX:Decimal,OffsetY:Decimal', 'AuxIDEcho:int',
+        'Resets the cleaning position to the beginning of the cleaning AUX Site (home).\nStatus: published\n----------\nParameters:\n    AuxID:str = "-1"\n    OffsetX:Decimal = 0\n    OffsetY:Decimal = 0\n----------\nResponse:\n    AuxIDEcho:int\n----------\nCommand Timeout: 10000\nExample:ResetCleaningPosition 5'),
+    'BnR_EchoData': ('ControllerID:int,TestCmd:str', 'TestRsp:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nTest Command for the Controller Communication. It is like a ping command. The\ngiven text string is returned unchanged.\nStatus: internal\n----------\nParameters:\n    ControllerID:int = 1\n    TestCmd:str = "Test"\n----------\nResponse:\n    TestRsp:str\n----------\nCommand Timeout: 5000\nExample:BnR_EchoData 1 Hello World'),
+    'BnR_ReportKernelVersion': ('ControllerID:int,Module:str', 'Version:Decimal,Description:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the actual version information of the controller software.   The\n\'Version\' value contains version number and revision level of the actual\nimplementation.   The text string contains a code description, version number\nand the revision date.   The \'Module\' byte is optional (default is K).\nStatus: internal\n----------\nParameters:\n    ControllerID:int = 1\n    Module:str = "A"\n----------\nResponse:\n    Version:Decimal\n    Description:str\n----------\nCommand Timeout: 5000\nExample:BnR_ReportKernelVersion 1 K'),
+    'BnR_GetStationType': ('ControllerID:int', 'StationType:str,Type:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns information about the connected station.\nStatus: internal\n----------\nParameters:\n    ControllerID:int = 1\n----------\nResponse:\n    StationType:str\n    Type:str\n----------\nCommand Timeout: 5000\nExample:BnR_GetStationType 1'),
+    'BnR_ResetController': ('ControllerID:int,Mode:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nRestarts the BnR controller.\nStatus: internal\n----------\nParameters:\n    ControllerID:int = 1\n    Mode:str = "X"\n----------\nCommand Timeout: 10000\nExample:BnR_ResetController 1'),
+    'BnR_GetControllerType': ('ControllerID:int', 'ControllerType:str,ControllerGeneration:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the controller type (e.g. CM300, PositionerBox) and the controller\ngeneration (1, 2)\nStatus: internal\n----------\nParameters:\n    ControllerID:int = 1\n----------\nResponse:\n    ControllerType:str\n    ControllerGeneration:int\n----------\nCommand Timeout: 5000\nExample:BnR_GetControllerType 1'),
+    'BnR_SetOutput': ('ControllerID:int,Channel:str,State:int,PulseTime:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nControls the Velox output channel signals. It can be used to activate/deactivate\noutputs.\nStatus: internal\n----------\nParameters:\n    ControllerID:int = 1\n    Channel:str = "DO_WaferVacuum"\n    State:int = 0\n    PulseTime:int = 0\n----------\nCommand Timeout: 5000\nExample:BnR_SetOutput 1 1000 1 2000'),
+    'BnR_GetOutput': ('ControllerID:int,Channel:str', 'State:int,AllOutputs:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the state of an output channel. By using the string identifier DO_ALL, a\nstring list of all outputs is returned in addition\nStatus: internal\n----------\nParameters:\n    ControllerID:int = 1\n    Channel:str = "DO_WaferVacuum"\n----------\nResponse:\n    State:int\n    AllOutputs:str\n----------\nCommand Timeout: 5000\nExample:BnR_GetOutput 1 DO_WaferVacuum'),
+    'BnR_GetInput': ('ControllerID:int,Channel:str', 'State:int,AllInputs:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the state of an input channel. By using the string identifier DI_ALL, a\nstring list of all outputs is returned in addition\nStatus: internal\n----------\nParameters:\n    ControllerID:int = 1\n    Channel:str = "DI_MotorPower"\n----------\nResponse:\n    State:int\n    AllInputs:str\n----------\nCommand Timeout: 5000\nExample:BnR_GetInput 1 DI_MotorPower'),
+    'BnR_SetAnalogOutput': ('ControllerID:int,Channel:str,OutputPercent:Decimal', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSets an analog output channel to a given value.\nStatus: internal\n----------\nParameters:\n    ControllerID:int = 1\n    Channel:str = "AO_PurgeDewPoint"\n    OutputPercent:Decimal = 50\n----------\nCommand Timeout: 5000\nExample:BnR_SetAnalogOutput 1 AO_PurgeDewPoint 50'),
+    'BnR_GetAnalogIO': ('ControllerID:int,Channel:str', 'Value:Decimal,UnderOverflow:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the current value of an analog output or input.\nStatus: internal\n----------\nParameters:\n    ControllerID:int = 1\n    Channel:str = "AO_PurgeDewPoint"\n----------\nResponse:\n    Value:Decimal\n    UnderOverflow:int\n----------\nCommand Timeout: 5000\nExample:BnR_GetAnalogIO 1 AO_PurgeDewPoint'),
+    'BnR_GetStartupStatus': ('ControllerID:int', 'StartupStatus:str,AdditionalStatusInfo:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the startup status of the BnR controller to determine if the controller\nis properly booted or still starting.\nStatus: internal\n----------\nParameters:\n    ControllerID:int = 1\n----------\nResponse:\n    StartupStatus:str\n    AdditionalStatusInfo:str\n----------\nCommand Timeout: 5000\nExample:BnR_GetStartupStatus 1'),
+    'BnR_GetControllerData': ('ControllerID:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nGets controller data from the B&R controller. Currently used for init\ninformation.\nStatus: internal\n----------\nParameters:\n    ControllerID:int = 1\n----------\nCommand Timeout: 10000\nExample:BnR_GetControllerData 1'),
+    'BnR_GetDataIterator': ('ControllerID:int,ShowAll:int', 'IdentityToken:int,SizeNoAll:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns a data stream handle which represents a data stream of setup parameters\nand requires the BnR_GetNextDatum command.\nStatus: internal\n----------\nParameters:\n    ControllerID:int = 1\n    ShowAll:int = 0\n----------\nResponse:\n    IdentityToken:int\n    SizeNoAll:int\n----------\nCommand Timeout: 5000\nExample:BnR_GetDataIterator 1 1'),
+    'BnR_GetNextDatum': ('ControllerID:int,IdentityToken:int', 'IsLastDatum:int,DatumCode:int,PathNameDescrValue:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the next parameter from the data stream. Fields are separated by a\ncolon. Structure of the response parameter Value:\nPath_Path:Name:Description:Value\nStatus: internal\n----------\nParameters:\n    ControllerID:int = 1\n    IdentityToken:int = 0\n----------\nResponse:\n    IsLastDatum:int\n    DatumCode:int\n    PathNameDescrValue:str\n----------\nCommand Timeout: 10000\nExample:BnR_GetNextDatum 1'),
+    'BnR_SetDatum': ('ControllerID:int,PathNameAndValue:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSets the value of a parameter. An empty parameter string saves the whole\nconfiguration to non-volatile memory. Fields are separated by a colon.\nStatus: internal\n----------\nParameters:\n    ControllerID:int = 1\n    PathNameAndValue:str = ""\n----------\nCommand Timeout: 20000\nExample:BnR_SetDatum 1 Chuck_XAxisData:CurrentMaximal:70'),
+    'BnR_GetDatum': ('ControllerID:int,PathName:str', 'DatumCode:int,ValueDesc:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns a value string. The Value string consists of the value and the\ndescription. The Locator only consists of the path and the name. All fields are\nseparated by a colon.  Structure of the command parameter Locator:\nPath_Path:Name Structure of the response parameter Value: Value:Description\nStatus: internal\n----------\nParameters:\n    ControllerID:int = 1\n    PathName:str = ""\n----------\nResponse:\n    DatumCode:int\n    ValueDesc:str\n----------\nCommand Timeout: 5000\nExample:BnR_GetDatum 1 Chuck_XAxisData:CurrentMaximal'),
+    'BnR_GetPosition': ('ControllerID:int,Stage:str,Unit:str', 'XorT:Decimal,Y:Decimal,Z:Decimal,CommandedXorT:Decimal,CommandedY:Decimal,CommandedZ:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the current positions for the X,Y,Z (or T) axis for the specified stage\nas well as the commanded positions.\nStatus: internal\n----------\nParameters:\n    ControllerID:int = 1\n    Stage:str = "Chuck"\n    Unit:str = "Microns"\n----------\nResponse:\n    XorT:Decimal\n    Y:Decimal\n    Z:Decimal\n    CommandedXorT:Decimal\n    CommandedY:Decimal\n    CommandedZ:Decimal\n----------\nCommand Timeout: 5000\nExample:BnR_GetPosition 1 C'),
+    'BnR_Move': ('ControllerID:int,Stage:str,XValue:Decimal,YValue:Decimal,VelX:Decimal,VelY:Decimal,WaitFinished:int,TargetIsFence:int', 'X:Decimal,Y:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command executes a XY movement for a specified stage. This can be either a\nblocking or non blocking move.\nStatus: internal\n----------\nParameters:\n    ControllerID:int = 1\n    Stage:str = "Chuck"\n    XValue:Decimal = 0\n    YValue:Decimal = 0\n    VelX:Decimal = 0\n    VelY:Decimal = 0\n    WaitFinished:int = 1\n    TargetIsFence:int = 1\n----------\nResponse:\n    X:Decimal\n    Y:Decimal\n----------\nCommand Timeout: 60000\nExample:BnR_Move 1 C 5000 5000 100 100 1'),
+    'BnR_MoveZ': ('ControllerID:int,Stage:str,ZValue:Decimal,Vel:Decimal,Dec:Decimal,WaitFinished:int', 'Z:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nMoves the stage Z axis to a new position.\nStatus: internal\n----------\nParameters:\n    ControllerID:int = 1\n    Stage:str = "Chuck"\n    ZValue:Decimal = 0\n    Vel:Decimal = 0\n    Dec:Decimal = 0\n    WaitFinished:int = 1\n----------\nResponse:\n    Z:Decimal\n----------\nCommand Timeout: 600000\nExample:BnR_MoveZ 1 C 12000 100 100 1'),
+    'BnR_ScanMoveZ': ('ControllerID:int,Stage:str,ZDistance:Decimal,TriggerEveryNthCycle:int,Vel:Decimal', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command executes a scan movement of the Z axis that sets a digital output\nevery couple microns to trigger e.g. a camera. After the move is finished, the\ncommand returns a list of Z heights at which the digital output was set.\nStatus: internal\n----------\nParameters:\n    ControllerID:int = 1\n    Stage:str = "Chuck"\n    ZDistance:Decimal = 1000\n    TriggerEveryNthCycle:int = 2\n    Vel:Decimal = 10\n----------\nCommand Timeout: 300000\nExample:BnR_ScanMoveZ 1 C 1000 6 10'),
+    'BnR_MoveT': ('ControllerID:int,TValue:Decimal,Vel:Decimal,WaitFinished:int', 'T:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nExecutes a movement of the theta axis, either blocking or non blocking\nStatus: internal\n----------\nParameters:\n    ControllerID:int = 1\n    TValue:Decimal = 0\n    Vel:Decimal = 0\n    WaitFinished:int = 1\n----------\nResponse:\n    T:Decimal\n----------\nCommand Timeout: 60000\nExample:BnR_MoveT 1 1.003 10 1'),
+    'BnR_StopAxis': ('ControllerID:int,Stage:str,FlagsStop:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nStops 1... all axes of a stage\nStatus: internal\n----------\nParameters:\n    ControllerID:int = 1\n    Stage:str = "Chuck"\n    FlagsStop:int = 15\n----------\nCommand Timeout: 5000\nExample:BnR_StopAxis 1 C 7'),
+    'BnR_InitAxis': ('ControllerID:int,Stage:str,FlagsInit:int,FlagsDirection:int,FlagsInitInPlace:int,LowOrHighLimitX:Decimal,LowOrHighLimitY:Decimal,LowOrHighLimitZ:Decimal,LowOrHighLimitTh:Decimal,InitInPlaceMoveRangeX:Decimal,InitInPlaceMoveRangeY:Decimal,InitInPlaceMoveRangeZ:Decimal,InitInPlaceMoveRangeTh:Decimal', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nMachine Coordinate System: X Y Z Theta  - _FlagsInit_: X, Y, Z, Theta -\n_FlagsDirection_: X, Y, Z, Theta (true means plus direction) -\n_FlagsInitInPlace_: X, Y, Z, Theta   All flags can be accessed by indirect\nmembers. Initializes the stage and resets current coordinate system. Should be\nused only in cases when the reported coordinates do not correspond to real\nposition of mechanics. Init in Place performs the initialization without any\nmovements.\nStatus: internal\n----------\nParameters:\n    ControllerID:int = 1\n    Stage:str = "Chuck"\n    FlagsInit:int = 0\n    FlagsDirection:int = 0\n    FlagsInitInPlace:int = 0\n    LowOrHighLimitX:Decimal = 0\n    LowOrHighLimitY:Decimal = 0\n    LowOrHighLimitZ:Decimal = 0\n    LowOrHighLimitTh:Decimal = 0\n    InitInPlaceMoveRangeX:Decimal = 0\n    InitInPlaceMoveRangeY:Decimal = 0\n    InitInPlaceMoveRangeZ:Decimal = 0\n    InitInPlaceMoveRangeTh:Decimal = 0\n----------\nCommand Timeout: 300000\nExample:BnR_InitAxis 1 C 7'),
+    'BnR_GetAxisState': ('ControllerID:int,Stage:str,Axis:str', 'State:str,AdditionalStateInfo:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command returns the state of an axis (disabled/standstill/errorstop/stoppin\ng/homing/continuousmotion/discretemotion/synchronizedmotion)\nStatus: internal\n----------\nParameters:\n    ControllerID:int = 1\n    Stage:str = "Chuck"\n    Axis:str = "XAxis"\n----------\nResponse:\n    State:str\n    AdditionalStateInfo:str\n----------\nCommand Timeout: 5000\nExample:BnR_GetAxisState 1 C X'),
+    'BnR_GetAxisStatus': ('ControllerID:int,Stage:str,Axis:str', 'Initialized:int,PositiveEndlimit:int,NegativeEndlimit:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command returns some axis status information\nStatus: internal\n----------\nParameters:\n    ControllerID:int = 1\n    Stage:str = "Chuck"\n    Axis:str = "XAxis"\n----------\nResponse:\n    Initialized:int\n    PositiveEndlimit:int\n    NegativeEndlimit:int\n----------\nCommand Timeout: 5000\nExample:BnR_GetAxisStatus 1 C X'),
+    'BnR_SetQuietMode': ('ControllerID:int,Stage:str,QuietMode:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nCommand to enable the quiet mode for a stage (quiet turns motors powerless)\nStatus: internal\n----------\nParameters:\n    ControllerID:int = 1\n    Stage:str = "Chuck"\n    QuietMode:int = 0\n----------\nCommand Timeout: 5000\nExample:BnR_SetQuietMode 1 C 1'),
+    'BnR_GetQuietMode': ('ControllerID:int,Stage:str', 'QuietMode:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nCommand to query the quiet mode for a stage\nStatus: internal\n----------\nParameters:\n    ControllerID:int = 1\n    Stage:str = "Chuck"\n----------\nResponse:\n    QuietMode:int\n----------\nCommand Timeout: 5000\nExample:BnR_GetQuietMode 1 C'),
+    'BnR_GetInternalAxisInfo': ('ControllerID:int,Stage:str,Axis:str,InfoType:str', 'RspString:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command returns various axis information, dependent on the InfoType\nparameter\nStatus: internal\n----------\nParameters:\n    ControllerID:int = 1\n    Stage:str = "Chuck"\n    Axis:str = "XAxis"\n    InfoType:str = "StallInfo"\n----------\nResponse:\n    RspString:str\n----------\nCommand Timeout: 5000\nExample:BnR_GetInternalAxisInfo 1 C X'),
+    'BnR_MoveAxis': ('ControllerID:int,Stage:str,Axis:str,Value:Decimal,Vel:Decimal,Dec:Decimal,WaitFinished:int', 'PositionAfterMove:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command allows moving a single axis to and e.g. in case of X does not\ntrigger a Y movement\nStatus: internal\n----------\nParameters:\n    ControllerID:int = 1\n    Stage:str = "Chuck"\n    Axis:str = "XAxis"\n    Value:Decimal = 0\n    Vel:Decimal = 0\n    Dec:Decimal = 0\n    WaitFinished:int = 1\n----------\nResponse:\n    PositionAfterMove:Decimal\n----------\nCommand Timeout: 60000\nExample:BnR_MoveAxis 1 C X 20000 100 100 1'),
+    'BnR_MoveZCombined': ('ControllerID:int,ChuckTargetZ:Decimal,WaitFinished:int,ForcedAbsVelocity:int', 'ChuckZ:Decimal,ScopeX:Decimal,ScopeY:Decimal,ScopeZ:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nMove Chuck-Z and (by fixed factor) Scope X, Y and Z\nStatus: internal\n----------\nParameters:\n    ControllerID:int = 1\n    ChuckTargetZ:Decimal = 0\n    WaitFinished:int = 1\n    ForcedAbsVelocity:int = 0\n----------\nResponse:\n    ChuckZ:Decimal\n    ScopeX:Decimal\n    ScopeY:Decimal\n    ScopeZ:Decimal\n----------\nCommand Timeout: 600000\nExample:BnR_MoveZCombined 1 17592.5 1'),
+    'BnR_SyncMove': ('ControllerID:int,Stage:str,XValue:Decimal,YValue:Decimal,Vel:Decimal,WaitFinished:int', 'X:Decimal,Y:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command executes a XY movement for a specified stage. This can be either a\nblocking or non blocking move.\nStatus: internal\n----------\nParameters:\n    ControllerID:int = 1\n    Stage:str = "Chuck"\n    XValue:Decimal = 0\n    YValue:Decimal = 0\n    Vel:Decimal = 0\n    WaitFinished:int = 1\n----------\nResponse:\n    X:Decimal\n    Y:Decimal\n----------\nCommand Timeout: 60000\nExample:BnR_SyncMove 1 C 5000 5000 100 1'),
+    'BnR_SearchEdgeSensor': ('ControllerID:int,SearchEndPos:Decimal,Velocity:Decimal', 'EdgeSensorTriggerPos:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nPerforms a search move until the search end position is reached or the edge\nsensor triggers. If the edge sensor triggers during the move, the trigger\nposition is returned.Otherwise, an edge sensor not found error is returned.\nStatus: internal\n----------\nParameters:\n    ControllerID:int = 1\n    SearchEndPos:Decimal = 0\n    Velocity:Decimal = 0\n----------\nResponse:\n    EdgeSensorTriggerPos:Decimal\n----------\nCommand Timeout: 300000\nExample:BnR_SearchEdgeSensor 1 42000 5'),
+    'ProcessStationGetStatus': ('', 'Status:str,SubstratePresent:int,LastError:int,UseLoaderModule:int,WaferSizes:str,StatusMessage:str,IsLoaderJobRunning:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns process station status (UNKNOWN, IDLE, BUSY, ERROR, PAUSED, Not\nInitialized) and error code with error message when error.\nStatus: internal\n----------\nResponse:\n    Status:str\n    SubstratePresent:int\n    LastError:int\n    UseLoaderModule:int\n    WaferSizes:str\n    StatusMessage:str\n    IsLoaderJobRunning:int\n----------\nCommand Timeout: 25000\nExample:ProcessStationGetStatus'),
+    'ProcessStationInit': ('', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nInitialize process station machine. This is not the Probe Station init it is a\nfast program initialization. Only applies to fully auto systems.\nStatus: internal\n----------\nCommand Timeout: 2400000\nExample:ProcessStationInit'),
+    'ProcessStationFinish': ('', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nFinishes a process station process. This resets some internal test information\nfor the Probe Station. Some data is only reset in case this command is sent\nafter the last wafer in the job was tested. Only applies to fully auto systems.\nStatus: internal\n----------\nCommand Timeout: 7500000\nExample:ProcessStationFinish'),
+    'ProcessStationPrepareForLoad': ('', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nCommand moves the Chuck of the Probe Station to the secondary load position and\nif available also checks the table level sensor. Only applies to fully auto\nsystems.\nStatus: internal\n----------\nCommand Timeout: 120000\nExample:ProcessStationPrepareForLoad'),
+    'ProcessStationLoadComplete': ('', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nMoves the Chuck out of the load position and checks if a wafer is placed. Only\napplies to fully auto systems.\nStatus: internal\n----------\nCommand Timeout: 60000\nExample:ProcessStationLoadComplete'),
+    'ProcessStationPrepareForUnLoad': ('', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThe module should do whatever is necessary to prepare the current wafer for\nunload. Typically this includes things such as moving lift pins and opening\ndoors.\nStatus: internal\n----------\nCommand Timeout: 1200000\nExample:ProcessStationPrepareForUnLoad'),
+    'ProcessStationUnLoadComplete': ('', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThe module should so whatever is necessary after a wafer is unloaded. This may\nfor example include closing doors.\nStatus: internal\n----------\nCommand Timeout: 60000\nExample:ProcessStationUnLoadComplete'),
+    'ProcessStationLoadRecipe': ('ForceReOpenProject:int,ProjectFileName:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThe recipe is a zipped archive that includes all project data. This command\ntells the device to load the recipe.\nStatus: internal\n----------\nParameters:\n    ForceReOpenProject:int = 0\n    ProjectFileName:str = ""\n----------\nCommand Timeout: 60000\nExample:ProcessStationLoadRecipe 1 SampleProject.spp'),
+    'ProcessStationVerifyRecipe': ('ProjectFileName:str', 'Verified:int,ErrorDescription:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nRequests that the device verify that the recipe given can be executed on the\ndevice. It should check that the recipe is correctly formed and conforms to the\nhardware of the device. It should not check for transient things such as whether\nthere is sufficient media or facilities available. those kinds of checks should\nbe done in PrepareForProcess\nStatus: internal\n----------\nParameters:\n    ProjectFileName:str = ""\n----------\nResponse:\n    Verified:int\n    ErrorDescription:str\n----------\nCommand Timeout: 60000\nExample:ProcessStationVerifyRecipe SampleProject.spp'),
+    'ProcessStationStartRecipe': ('CurrentWaferInJob:int,TotalWafersInJob:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nTells VeloxPro to start the current recipe. The station will switch to error if\nan error occurs. If VeloxPro recipe execution is currently paused, this command\ntells the system to continue execution.\nStatus: internal\n----------\nParameters:\n    CurrentWaferInJob:int = -1\n    TotalWafersInJob:int = -1\n----------\nCommand Timeout: 25000\nExample:ProcessStationStartRecipe 1'),
+    'ProcessStationStopRecipe': ('', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nTells the device to stop the current recipe. The station will switch to error if\nan error occurs.\nStatus: internal\n----------\nCommand Timeout: 25000\nExample:ProcessStationStopRecipe'),
+    'ProcessStationRecoverError': ('', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nTells the module to do whatever is necessary to recover from an error condition.\nStatus: internal\n----------\nCommand Timeout: 60000\nExample:ProcessStationRecoverError'),
+    'ProcessStationGetWaferResult': ('', 'Result:str,PercentDone:Decimal,AllowSkipWafer:int,TestInformation:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nGet substrate information from process station controller application.\nStatus: internal\n----------\nResponse:\n    Result:str\n    PercentDone:Decimal\n    AllowSkipWafer:int\n    TestInformation:str\n----------\nCommand Timeout: 25000\nExample:ProcessStationGetWaferResult'),
+    'QueryWaferInfo': ('', 'Size:int,Angle:Decimal,ID:str,LotID:str,ProductID:str',
+        'Returns information about the wafer that is currently on the Probe Station. It\nwill return an error when there is no wafer currently on the Chuck.\nStatus: published\n----------\nResponse:\n    Size:int\n    Angle:Decimal\n    ID:str\n    LotID:str\n    ProductID:str\n----------\nCommand Timeout: 25000\nExample:QueryWaferInfo'),
+    'ProcessStationPauseRecipe': ('', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSets the process station to PAUSE mode\nStatus: internal\n----------\nCommand Timeout: 25000\nExample:ProcessStationPauseRecipe'),
+    'GetProbingStatus': ('', 'Status:str',
+        'Retrieves the current status of the Probe Station. If probing status is\nAtFirstDie the tester can take control.\nStatus: published\n----------\nResponse:\n    Status:str\n----------\nCommand Timeout: 25000\nExample:GetProbingStatus'),
+    'ProceedProbing': ('', '',
+        'Tells the Probe Station to proceed the recipe when current status is AtFirstDie.\nStatus: published\n----------\nCommand Timeout: 25000\nExample:ProceedProbing'),
+    'GetCassetteStatus': ('Cassette:int', 'CassetteStatus:str',
+        'Provides all available wafer information. It returns a set of data for each\nwafer in either cassette. The data contains the cassette and the slot number\nwhere the wafer is located, the status of the wafer and identification\ninformation.\nStatus: published\n----------\nParameters:\n    Cassette:int = 0\n----------\nResponse:\n    CassetteStatus:str\n----------\nCommand Timeout: 25000\nExample:GetCassetteStatus 0'),
+    'QueryWaferID': ('Module:str,Slot:int', 'ID:str',
+        'Queries the wafer ID of a given module and slot.\nStatus: published\n----------\nParameters:\n    Module:str = "Robot"\n    Slot:int = 0\n----------\nResponse:\n    ID:str\n----------\nCommand Timeout: 25000\nExample:QueryWaferID Cassette1 1'),
+    'UpdateWaferID': ('Module:str,Slot:int,ID:str', '',
+        'Overrides the wafer ID of the given module and slot. If the wafer id is empty\nand the module is a Loadport, the id will be read by the idreader if possible.\nThis process behaves as follows:  - the current wafer id is reset - if the read-\nwafer-process would be delayed (e.g. there is already a   wafer on the idreader)\nthe process will be aborted and an error         will be returned - if the id-\nreading fails, the process behaves like a normal inventory  triggered by the UI:\nskip (returns success), abort (returns error)      or "ask user". It is\nrecommended to use either skip or abort for        remote id reading.  If the\nmodule is a Loadport and the slot is set to -1, a regular inventory will be\ntriggered. This behaves similar to an inventory triggered by the UI: The ID\nwon\'t be reset and already scanned wafers won\'t be reset. Setting an ID\nexplicitly with slot -1 is an error:  - Okay, read id of wafer in slot 3 even if\nit is already set: UpdateWaferID Cassette1 3 - Okay, set id of wafer in slot 3\nto XYZ123: UpdateWaferID Cassette1 3 XYZ123 - Okay, start full inventory:\nUpdateWaferID Cassette1 -1  - Error: UpdateWaferID Cassette1 -1 XYZ123\nStatus: published\n----------\nParameters:\n    Module:str = "Robot"\n    Slot:int = 0\n    ID:str = ""\n----------\nCommand Timeout: 1500000\nExample:UpdateWaferID Cassette1 1 Wafer01'),
+    'ConfirmRecipe': ('ProjectFileName:str', 'Verified:int,ErrorDescription:str',
+        'Queries whether the given project/flow name is a valid project/flow at the Probe\nStation.  Using file and folder names without white spaces is recommended. For\nfolders and files with white spaces use quotation marks for the path.  Example\nfor using white spaces:  ConfirmRecipe\n"C:/Users/Public/Documents/Velox/Projects/White Spaces.spp"\nStatus: published\n----------\nParameters:\n    ProjectFileName:str = ""\n----------\nResponse:\n    Verified:int\n    ErrorDescription:str\n----------\nCommand Timeout: 25000\nExample:ConfirmRecipe C:/Temp/Test.spp'),
+    'StartWaferJob': ('RecipeName:str,WaferIDs:str', 'JobID:str',
+        'Creates and starts a new job by specifying the flow/spp file and the wafers to\nbe included in the job.\nStatus: published\n----------\nParameters:\n    RecipeName:str = ""\n    WaferIDs:str = ""\n----------\nResponse:\n    JobID:str\n----------\nCommand Timeout: 25000\nExample:StartWaferJob C:/Users/Public/Documents/Velox/Test.flow 1;1 2;1'),
+    'GetJobParams': ('JobID:str', 'RecipeName:str,WaferIDs:str',
+        'Get job information for a specific job ID including the flow file and the list\nof wafers.\nStatus: published\n----------\nParameters:\n    JobID:str = ""\n----------\nResponse:\n    RecipeName:str\n    WaferIDs:str\n----------\nCommand Timeout: 25000\nExample:GetJobParams 1'),
+    'JobStatus': ('JobID:str', 'Status:str,JobStatusInfo:str',
+        'Retrieves the status of a specific job by its ID. If the status is ErrorWaiting,\nan error string is returned.\nStatus: published\n----------\nParameters:\n    JobID:str = ""\n----------\nResponse:\n    Status:str\n    JobStatusInfo:str\n----------\nCommand Timeout: 25000\nExample:JobStatus 1'),
+    'AbortJob': ('JobID:str,Unload:int', '',
+        'Aborts the job given by the job ID. The status of the job will be set to\n"Aborted". The "Unload" parameter defines whether the wafer remains on the Chuck\nor not. If no JobID is specified (or is set to -1), the currently running\nprobing job will be aborted.\nStatus: published\n----------\nParameters:\n    JobID:str = ""\n    Unload:int = 0\n----------\nCommand Timeout: 25000\nExample:AbortJob 2 1'),
+    'ProcessStationCloseApplication': ('NoUserPrompt:int', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nCloses the VeloxPro application.\nStatus: internal\n----------\nParameters:\n    NoUserPrompt:int = 0\n----------\nCommand Timeout: 25000\nExample:ProcessStationCloseApplication'),
+    'UnloadWafer': ('', '',
+        'Unloads a Wafer from the Chuck to its origin. If no origin is known, the first\nfree Slot of a loadport will be chosen. A Wafer should be on the Chuck.\nStatus: published\n----------\nCommand Timeout: 1800000\nExample:UnloadWafer'),
+    'GetJobList': ('JobType:str', 'GetJobList:str',
+        'Returns a string for the relevant JobIDs.\nStatus: published\n----------\nParameters:\n    JobType:str = "Probing"\n----------\nResponse:\n    GetJobList:str\n----------\nCommand Timeout: 25000\nExample:GetJobList'),
+    'ProceedJob': ('ProceedJob:str', '',
+        'Continues a job that is waiting on an error (Job Status ErrorWaiting). The mode\ndetermines how the job continues.\nStatus: published\n----------\nParameters:\n    ProceedJob:str = "AbortJob"\n----------\nCommand Timeout: 25000\nExample:ProceedJob A'),
+    'QueryCassetteID': ('Cassette:int', 'ID:str',
+        'Returns the ID of a cassette that is placed on the load port. The loadport and\nthe cassette must support RFID reading (additional hardware needed).\nStatus: published\n----------\nParameters:\n    Cassette:int = 1\n----------\nResponse:\n    ID:str\n----------\nCommand Timeout: 25000\nExample:QueryCassetteID 1'),
+    'DockCassette': ('LoadPortId:int,DockUndock:int', '',
+        'Docks or undocks a cassette which is placed on a LoadPort (CM300 only). It will\nreturn an error if no cassette is placed: the LoadPort is not ready/available or\nthe docking failed. The command will do the docking/undocking and return when\nthis is done.\nStatus: published\n----------\nParameters:\n    LoadPortId:int = 0\n    DockUndock:int = 0\n----------\nCommand Timeout: 60000\nExample:DockCassette 1 1'),
+    'LoadWafer': ('LoadportID:int,SlotID:int,AlignmentAngle:Decimal', '',
+        'Load a wafer from a given loadport onto the prober. If no slot id is defined,\nthe first available wafer with the lowest slot id will be loaded. If no loadport\nis defined, it will try to use the first loadport. If there is no suitable\nwafer, it will try the second.  Returns an error if the loading process fails or\nno suitable wafer is found.  To define an alignment angle and still use the\n"autoselect" behavior, use -1 for loadport and slot.\nStatus: published\n----------\nParameters:\n    LoadportID:int = -1\n    SlotID:int = -1\n    AlignmentAngle:Decimal = 0\n----------\nCommand Timeout: 600000\nExample:LoadWafer 1 1'),
+    'UpdateCassetteStatus': ('Cassette:int', 'CassetteStatus:str',
+        'Updates the cassette status with a simple scan.\nStatus: published\n----------\nParameters:\n    Cassette:int = 0\n----------\nResponse:\n    CassetteStatus:str\n----------\nCommand Timeout: 1200000\nExample:UpdateCassetteStatus 1'),
+    'TransportWafer': ('SourceLocation:str,SourceSlot:int,DestinationLocation:str,DestinationSlot:int', '',
+        'Transport a wafer from one location to another. This command behaves like the\nwafer-transport inside the LoaderModule. The Slot must always be set.\nStatus: published\n----------\nParameters:\n    SourceLocation:str = "Cassette1"\n    SourceSlot:int = 1\n    DestinationLocation:str = "Cassette1"\n    DestinationSlot:int = 1\n----------\nCommand Timeout: 600000\nExample:TransportWafer Cassette1 1 PreAligner 1'),
+    'ProcessWafer': ('Module:str,ProcessParam:str', '',
+        '"Process" a wafer on a given location. What is done depends on the current\nstation:  - IDReader: read ID - PreAligner: align wafer (alignment angle\nmandatory) - Prober: Perform current recipe\nStatus: published\n----------\nParameters:\n    Module:str = "Cassette1"\n    ProcessParam:str = ""\n----------\nCommand Timeout: 100000\nExample:ProcessWafer PreAligner 90.0'),
+    'GetIDReaderPos': ('', 'IDReaderPos:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the current position of the IDReader\nStatus: internal\n----------\nResponse:\n    IDReaderPos:str\n----------\nCommand Timeout: 2000'),
+    'SetIDReaderPos': ('IDReaderPos:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSet the current position of the IDReader\nStatus: internal\n----------\nParameters:\n    IDReaderPos:str = "Bottom"\n----------\nCommand Timeout: 10000'),
+    'CryoCommand': ('Process:str', '',
+        'CryoCommand controls automatic cooling and warm up.\nStatus: published\n----------\nParameters:\n    Process:str = "CD"\n----------\nCommand Timeout: 60000\nExample:CryoCommand CD'),
+    'CryoReadTemperature': ('Stage:str', 'Temp:Decimal',
+        'Reads the current temperature from sensor Chuck or Shield.\nStatus: published\n----------\nParameters:\n    Stage:str = "C"\n----------\nResponse:\n    Temp:Decimal\n----------\nCommand Timeout: 10000\nExample:CryoReadTemperature C'),
+    'CryoSetTemperature': ('Stage:str,Temp:Decimal', '',
+        'Sets temperature value for TIC Chuck or Shield. (Only available in process state\n\'Idle\' or \'Cold\'.)\nStatus: published\n----------\nParameters:\n    Stage:str = "C"\n    Temp:Decimal = 320\n----------\nCommand Timeout: 10000\nExample:CryoSetTemperature C 70.5'),
+    'CryoStartRefill': ('Stage:str', '',
+        'Enables refill. (Only available in process state \'Idle\'.)\nStatus: published\n----------\nParameters:\n    Stage:str = "C"\n----------\nCommand Timeout: 10000\nExample:CryoStartRefill C'),
+    'CryoStopRefill': ('Stage:str', '',
+        'Disables refill. (Only available in process state \'Idle\'.)\nStatus: published\n----------\nParameters:\n    Stage:str = "C"\n----------\nCommand Timeout: 10000\nExample:CryoStopRefill C'),
+    'CryoReadState': ('', 'State:str',
+        'Reads current state.\nStatus: published\n----------\nResponse:\n    State:str\n----------\nCommand Timeout: 10000'),
+    'CryoMoveBBPark': ('', '',
+        'Moves the black body to parking position.\nStatus: published\n----------\nCommand Timeout: 60000'),
+    'CryoMoveBBWork': ('NbrPosition:int', '',
+        'Moves the black body to working position.\nStatus: published\n----------\nParameters:\n    NbrPosition:int = 1\n----------\nCommand Timeout: 60000\nExample:CryoMoveBBWork 1'),
+    'CryoMoveShutter': ('Position:str,Shutter:int', '',
+        'Moves one of the two shutters.\nStatus: published\n----------\nParameters:\n    Position:str = "C"\n    Shutter:int = 1\n----------\nCommand Timeout: 60000\nExample:CryoMoveShutter F 1'),
+    'CryoMoveScopeWork': ('', '',
+        'Moves the microscope to working position.\nStatus: published\n----------\nCommand Timeout: 60000'),
+    'CryoMoveScopePark': ('', '',
+        'Moves the microscope to parking position.\nStatus: published\n----------\nCommand Timeout: 60000'),
+    'CryoReadPressure': ('', 'Pressure:Decimal',
+        'Reads the current pressure of the vacuum chamber.\nStatus: published\n----------\nResponse:\n    Pressure:Decimal\n----------\nCommand Timeout: 60000'),
+    'CryoReadFillLevel': ('Stage:str,Unit:str', 'FillLevel:Decimal',
+        'Reads the current fill level from Chuck or Shield dewar bottle in liter or\npercent.\nStatus: published\n----------\nParameters:\n    Stage:str = "C"\n    Unit:str = "L"\n----------\nResponse:\n    FillLevel:Decimal\n----------\nCommand Timeout: 10000\nExample:CryoReadFillLevel C L'),
+    'GetAllCassetteRecipes': ('', 'GetAllCassetteRecipes:str',
+        'Returns a list of all available cassette recipe names.\nStatus: published\n----------\nResponse:\n    GetAllCassetteRecipes:str\n----------\nCommand Timeout: 2000\nExample:GetAllCassetteRecipes'),
+    'GetMTransSWLimits': ('', 'XPositiveFull:Decimal,XNegativeFull:Decimal,XPositveTopHat:Decimal,XNegativeTopHat:Decimal,YPositiveFull:Decimal,YNegativeFull:Decimal,YPositveTopHat:Decimal,YNegativeTopHat:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command gets the software limits for full range and top hat modes of the\nElite microscope. Only applies to Elite station.\nStatus: internal\n----------\nResponse:\n    XPositiveFull:Decimal\n    XNegativeFull:Decimal\n    XPositveTopHat:Decimal\n    XNegativeTopHat:Decimal\n    YPositiveFull:Decimal\n    YNegativeFull:Decimal\n    YPositveTopHat:Decimal\n    YNegativeTopHat:Decimal\n----------\nCommand Timeout: 10000\nExample:GetMTransSWLimits'),
+    'SetMTransSWLimits': ('XPositiveFull:Decimal,XNegativeFull:Decimal,XPositveTopHat:Decimal,XNegativeTopHat:Decimal,YPositiveFull:Decimal,YNegativeFull:Decimal,YPositveTopHat:Decimal,YNegativeTopHat:Decimal', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command sets the software limits for full range and top hat modes of the\nElite microscope. Only applies to Elite station.\nStatus: internal\n----------\nParameters:\n    XPositiveFull:Decimal = 38100\n    XNegativeFull:Decimal = -38100\n    XPositveTopHat:Decimal = 20000\n    XNegativeTopHat:Decimal = -20000\n    YPositiveFull:Decimal = 38100\n    YNegativeFull:Decimal = -38100\n    YPositveTopHat:Decimal = 20000\n    YNegativeTopHat:Decimal = -20000\n----------\nCommand Timeout: 10000\nExample:SetMTransSWLimits'),
+    'GetSoftwareStop': ('', 'StopState:int',
+        'Get the state of the software stop.\nStatus: published\n----------\nResponse:\n    StopState:int\n----------\nCommand Timeout: 1000'),
+    'MoveZCombinedSetStatus': ('Status:str,Message:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nUsed to set the system either in off, on, error or locked state.  For lock, a\nkey is required. To unlock this key, doe a \'SetStatus\' with the same key. So,\nSetStatus without message means enable/ recover from error, with message it\nmeans unlock. If the system wasn\'t enabled or in error state before an unlock,\nit will remain in this state after the unlock.\nStatus: internal\n----------\nParameters:\n    Status:str = "Off"\n    Message:str = ""\n----------\nCommand Timeout: 5000'),
+    'GetTemperaturePresets': ('', 'Preset1:Decimal,Preset2:Decimal,Preset3:Decimal,Preset4:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the temperature presets.\nStatus: internal\n----------\nResponse:\n    Preset1:Decimal\n    Preset2:Decimal\n    Preset3:Decimal\n    Preset4:Decimal\n----------\nCommand Timeout: 5000'),
+    'GetScopeWorkingStage': ('', 'ScopeWorkingStage:int',
+        'Get the currently active ScopeWorkingStage or -1 if unknown. Normally, this\nshould be the same as the currently active ScopeSilo\nStatus: published\n----------\nResponse:\n    ScopeWorkingStage:int\n----------\nCommand Timeout: 5000\nExample:GetScopeWorkingStage'),
+    'DisplayMessage': ('MessageToShow:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nThis command displays a one-line message on the probe station screen. The\nmessage remains until you press Enter or click OK on the message box.\nStatus: internal\n----------\nParameters:\n    MessageToShow:str = ""\n----------\nCommand Timeout: 10000000'),
+    'ShowSetupDialog': ('SetupDialogType:str,Options:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nShow Setup Dialog based on enum SetupDialogType(CleaningManager,\nAuxSiteWizard,...)\nStatus: internal\n----------\nParameters:\n    SetupDialogType:str = "CleaningManager"\n    Options:str = ""\n----------\nCommand Timeout: 30000\nExample:ShowSetupDialog CleaningManager'),
+    'GeteVueZoomPresets': ('', 'Preset1:Decimal,Preset2:Decimal,Preset3:Decimal,Preset4:Decimal,Preset5:Decimal',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the eVue magnification preset values.\nStatus: internal\n----------\nResponse:\n    Preset1:Decimal\n    Preset2:Decimal\n    Preset3:Decimal\n    Preset4:Decimal\n    Preset5:Decimal\n----------\nCommand Timeout: 10000\nExample:GeteVueZoomPresets'),
+    'GetCassetteRecipe': ('Cassette:int', 'CassetteRecipe:str',
+        'Returns the cassette recipe name of the cassette station.\nStatus: published\n----------\nParameters:\n    Cassette:int = 1\n----------\nResponse:\n    CassetteRecipe:str\n----------\nCommand Timeout: 2000\nExample:GetCassetteRecipe 1'),
+    'ProbeStationVerify': ('', 'VerifyMessage:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nVerify probe station communications\nStatus: internal\n----------\nResponse:\n    VerifyMessage:str\n----------\nCommand Timeout: 5000'),
+    'SetPerformanceMode': ('Mode:str', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSet the performance mode in use by remote command. If this feature is not\nsupported and the mode is anything but Standard, an error is returned.\nStatus: internal\n----------\nParameters:\n    Mode:str = "Standard"\n----------\nCommand Timeout: 5000'),
+    'SeteVueZoomPresets': ('Preset1:Decimal,Preset2:Decimal,Preset3:Decimal,Preset4:Decimal,Preset5:Decimal', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSets the eVue magnification preset values.\nStatus: internal\n----------\nParameters:\n    Preset1:Decimal = 0.5\n    Preset2:Decimal = 1\n    Preset3:Decimal = 2\n    Preset4:Decimal = 3\n    Preset5:Decimal = 4\n----------\nCommand Timeout: 10000\nExample:SeteVueZoomPresets'),
+    'GetSoakAtContactEnabled': ('', 'Enabled:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns whether or not soak at Contact is enabled.\nStatus: internal\n----------\nResponse:\n    Enabled:int\n----------\nCommand Timeout: 1000\nExample:GetSoakAtContactEnabled'),
+    'SetScopeWorkingStage': ('ScopeWorkingStage:int', '',
+        'Move to the target working stage\nStatus: published\n----------\nParameters:\n    ScopeWorkingStage:int = -1\n----------\nCommand Timeout: 30000\nExample:SetScopeWorkingStage 1'),
+    'GetPerformanceMode': ('', 'Mode:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nGet the currently configured performance mode. If this feature is not supported\non a station, Standard will be returned\nStatus: internal\n----------\nResponse:\n    Mode:str\n----------\nCommand Timeout: 5000'),
+    'SetCassetteRecipe': ('Cassette:int,RecipeName:str', '',
+        'Set the cassette recipe name of the cassette station.\nStatus: published\n----------\nParameters:\n    Cassette:int = 1\n    RecipeName:str = ""\n----------\nCommand Timeout: 2000\nExample:SetCassetteRecipe 1 recipeName'),
+    'MoveZCombinedGetStatus': ('', 'Status:str,PlatenSafe:int,Height:Decimal,HeightMax:Decimal,HeightRelative:Decimal,SafeHeight:Decimal,Message:str',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nGet the current status of the combined-z-move-system\nStatus: internal\n----------\nResponse:\n    Status:str\n    PlatenSafe:int\n    Height:Decimal\n    HeightMax:Decimal\n    HeightRelative:Decimal\n    SafeHeight:Decimal\n    Message:str\n----------\nCommand Timeout: 5000'),
+    'GeteVueLicense': ('', 'IseVue40x:int,IseVuePro:int',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nReturns the type of licensed eVue model. Could be 40x and Pro.\nStatus: internal\n----------\nResponse:\n    IseVue40x:int\n    IseVuePro:int\n----------\nCommand Timeout: 10000\nExample:GeteVueLicense'),
+    'SetTemperaturePresets': ('Preset1:Decimal,Preset2:Decimal,Preset3:Decimal,Preset4:Decimal', '',
+        '***WARNING: internal command. Do not use without explicit instructions from FormFactor***\nSets the temperature presets.\nStatus: internal\n----------\nParameters:\n    Preset1:Decimal = 0\n    Preset2:Decimal = 0\n    Preset3:Decimal = 0\n    Preset4:Decimal = 0\n----------\nCommand Timeout: 5000'),
+    'LoadScopeFenceConfiguration': ('Enable:int,Path:str', '',
+        'Load a previously saved Scope-Fence-configuration or remove the current\nconfiguration\nStatus: published\n----------\nParameters:\n    Enable:int = 0\n    Path:str = ""\n----------\nCommand Timeout: 5000'),
+    'SetSoftwareStop': ('StopState:int', '',
+        'Set the state of the software stop.\nStatus: published\n----------\nParameters:\n    StopState:int = 0\n----------\nCommand Timeout: 1000'),
+
+}
@@ -22,20 +22,26 @@
 """
 Velox Message Server Interface
 To simplify calls from the SCI commands, many of the class methods are
-defined as static.  Some class variables are required to support a
-connection to the Message Server, but the individual SCI commands
-do not maintain a reference to the MessageServer object. Several
-class global variables are used to maintain state.
+defined as static.  The connection to the Message Server is held by a
+MessageServerInterface instance. The static methods used by the SCI
+commands send to the most recently opened instance.
 Registration with the Message Server is handled in the __init__.
+
+Messages are framed by a newline. Responses are read through a buffer,
+so that long responses are not truncated and several responses that
+arrive in one packet are not lost. Several commands can be outstanding
+at the same time; their responses are matched by the Cmd=<ID> number.
 """
 import re
 import socket
 import sys
+import threading
 from collections import namedtuple
 from os.path import basename
 
 REGISTRATION_MESSAGE_TEMPLATE = "FCN=1:RegisterProberApp:{0} {0} 0\n"
 GET_ALL_COMMANDS_MESSAGE = "FCN=1:GetCommands:\n"
+MAX_OUTSTANDING_COMMANDS = 64
 
 class SciException(Exception):
     """ Contains fields for:
@@ -56,11 +62,19 @@ def __str__(self):
 
 class MessageServerInterface(object):
 
+    # the instance used by the static methods that are called by the SCI commands
+    _activeInstance = None
+
     def __init__(self, ipaddr = 'localhost', targetSocket = 1412):
         """ Initialize a socket and register with the Velox Message Server.
             Uses the python script name as the application name to register.
         """
-        global mySocket, myBytesReceived, myResponse, myCurrentCommand
+        self._socket = None
+        self._buffer = bytearray()
+        self._currentCommand = 1
+        self._receivedResponses = {}    # responses of outstanding commands that were read while waiting for another one
+        self._sendLock = threading.Lock()
+        self._receiveLock = threading.Lock()
 
         try:
             if (sys.argv[0].strip() == ''): 
@@ -69,14 +83,12 @@ def __init__(self, ipaddr = 'localhost', targetSocket = 1412):
             appName = appName.replace(' ', '_') # make sure there are no spaces in the name
             registrationMessage = REGISTRATION_MESSAGE_TEMPLATE.format(appName)
 
-            myCurrentCommand = 1
-            mySocket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            mySocket.connect((ipaddr, targetSocket))
+            self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self._socket.connect((ipaddr, targetSocket))
 
             #register with message server
-            mySocket.send(registrationMessage.encode())
-            myBytesReceived = 0
-            myResponse = mySocket.recv(200)
+            self._socket.sendall(registrationMessage.encode())
+            self._readLine()
         except ConnectionRefusedError:
             errormessage = ('Error: The connection to the Velox Message Server was refused.'
                             ' It probably is not running on IP [' 
@@ -84,7 +96,8 @@ def __init__(self, ipaddr = 'localhost', targetSocket = 1412):
                             ' Start Velox or examine IP Address and Socket parameters.')
 
             raise Exception(errormessage)
-        pass
+
+        MessageServerInterface._activeInstance = self
 
     def __enter__(self):
         return self
@@ -92,16 +105,41 @@ def __enter__(self):
 
     def __exit__(self, type, value, traceback):
         """ Close the socket connected to the Message Server """
-        global mySocket
-        mySocket.close()
-        pass
+        self.close()
+
+    def close(self):
+        """ Close the socket connected to the Message Server """
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+        if MessageServerInterface._activeInstance is self:
+            MessageServerInterface._activeInstance = None
+
+    @staticmethod
+    def _getActiveInstance():
+        if MessageServerInterface._activeInstance is None:
+            raise Exception('No connection to the Velox Message Server. Use "with MessageServerInterface():" first.')
+        return MessageServerInterface._activeInstance
+
+    def _readLine(self):
+        """ Return the next newline terminated message without the newline, reading from the socket as needed """
+        while True:
+            index = self._buffer.find(b'\n')
+            if index >= 0:
+                line = bytes(self._buffer[:index])
+                del self._buffer[:index + 1]
+                return line
+            data = self._socket.recv(65536)
+            if not data:
+                raise ConnectionError('The Velox Message Server closed the connection.')
+            self._buffer += data
 
     def _getcommands(self):
         ''' Return a list of all commands known to the Velox Message Server '''
-        global mySocket, myBytesReceived, myResponse
-        mySocket.send(GET_ALL_COMMANDS_MESSAGE.encode())
-        myBytesReceived = 0
-        myResponse = mySocket.recv(60000)
+        with self._sendLock:
+            self._socket.sendall(GET_ALL_COMMANDS_MESSAGE.encode())
+        with self._receiveLock:
+            myResponse = self._readLine()
         message = str(myResponse.decode('utf-8'))
         # parse the list
         commands = message.split(':')[2].split(';')
@@ -184,31 +222,83 @@ def __parseSciCommandResponse(response):
         commandNumber = command.split('=')[1]
         return int(commandNumber), int(code), values
 
-    @staticmethod
-    def __sendSynchronousCommand(commandName, message=''):
-        global mySocket, myBytesReceived, myResponse, myCurrentCommand
+    def sendSciCommandAsync(self, commandName, *args, **kwargs):
+        """ Send a command without waiting for its response and return the command ID.
+            The response must be collected with receiveSciResponse. Parameters are handled like in sendSciCommand. """
+        if 'rparams' in kwargs: # use the raw parameter string if provided
+            commandParameters = kwargs['rparams']
+        else: # use the positional arguments and build the parameter string
+            commandParameters = ' '.join(str(x) for x in args)
 
         try:
-            myCurrentCommand += 1       # increment the command ID
-            if myCurrentCommand == 0 or myCurrentCommand > 999:
-                myCurrentCommand = 1
-            messageToSend = 'Cmd={}:{}:{}\n'.format(myCurrentCommand,commandName,message)
-            mySocket.send(messageToSend.encode())
-            myBytesReceived = 0
-            myResponse = mySocket.recv(1024)
-
+            with self._sendLock:
+                self._currentCommand += 1       # increment the command ID
+                if self._currentCommand == 0 or self._currentCommand > 999:
+                    self._currentCommand = 1
+                commandId = self._currentCommand
+                messageToSend = 'Cmd={}:{}:{}\n'.format(commandId, commandName, commandParameters)
+                self._socket.sendall(messageToSend.encode())
         except Exception as e:
-            raise Exception('Unable to communicate with Velox Message Server. Start Velox.' + e)
+            raise Exception('Unable to communicate with Velox Message Server. Start Velox. ' + str(e))
+
+        return commandId
+
+    def receiveSciResponse(self, commandId):
+        """ Wait for the response to the command with the given ID and return its values.
+            Responses to other outstanding commands are kept until they are requested. """
+        with self._receiveLock:
+            while commandId not in self._receivedResponses:
+                try:
+                    response = self._readLine()
+                except Exception as e:
+                    raise Exception('Unable to communicate with Velox Message Server. Start Velox. ' + str(e))
+
+                cmd, code, values = MessageServerInterface.__parseSciCommandResponse(response)
+                self._receivedResponses[cmd] = (code, values)
 
-        cmd, code, values = MessageServerInterface.__parseSciCommandResponse(myResponse)
+            code, values = self._receivedResponses.pop(commandId)
 
         # if the response code is not 0, raise an exception
         if code:
             parameters = ' '.join(values)
-            raise SciException(cmd, code, parameters)
+            raise SciException(commandId, code, parameters)
 
         return values
-        pass
+
+    def sendSciCommands(self, commands):
+        """ Send several independent commands without waiting for each response and return the list of values.
+            Each command is a tuple of the command name and a tuple of its arguments. At most
+            MAX_OUTSTANDING_COMMANDS are outstanding at the same time. All responses are read before the first
+            SciException is raised, so that no response is left over for later commands. """
+        results = []
+        firstException = None
+        outstanding = []
+
+        def receiveNext():
+            nonlocal firstException
+            try:
+                results.append(self.receiveSciResponse(outstanding.pop(0)))
+            except SciException as e:
+                results.append(None)
+                if firstException is None:
+                    firstException = e
+
+        for commandName, args in commands:
+            if len(outstanding) >= MAX_OUTSTANDING_COMMANDS:
+                receiveNext()
+            outstanding.append(self.sendSciCommandAsync(commandName, *args))
+        while outstanding:
+            receiveNext()
+
+        if firstException is not None:
+            raise firstException
+        return results
+
+    @staticmethod
+    def __sendSynchronousCommand(commandName, message=''):
+        instance = MessageServerInterface._getActiveInstance()
+        commandId = instance.sendSciCommandAsync(commandName, rparams=message)
+        return instance.receiveSciResponse(commandId)
 
     @staticmethod
     def sendSciCommand(commandName, *args, **kwargs):
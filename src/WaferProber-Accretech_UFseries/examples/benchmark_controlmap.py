@@ -0,0 +1,67 @@
+"""
+Compare the time to read a control map with 160k dies with the previous line-by-line parser and with the cached
+parser of libs/controlmap.py. No prober is needed, the control map is generated in a temporary folder.
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+# add libs folder to sys.path to enable import of controlmap
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "libs"))
+
+from controlmap import load_controlmap  # noqa: E402
+
+size = 400  # dies per row and column
+
+
+def read_controlmap_by_lines(controlmap: str) -> list[str]:
+    """Previous implementation of the driver that splits every line in Python."""
+    with open(controlmap) as mdf_file:
+        die_assignment = {"MARK": [], "PROB": [], "SKIP": [], "INSP": []}
+        last_section = None
+        for line in mdf_file.readlines():
+            line = line.strip()
+            if line.startswith("#"):
+                continue
+            splitted = line.split("=")
+            if len(splitted) == 1:
+                last_section = line
+                continue
+            if last_section == "[DIEINFO]" and splitted[0] in die_assignment:
+                die_assignment[splitted[0]].append(splitted[1])
+        return die_assignment["PROB"]
+
+
+lines = ["# generated control map", "[DIEINFO]"]
+lines += [f"{'SKIP' if (x + y) % 10 == 0 else 'PROB'}={x},{y}" for y in range(size) for x in range(size)]
+
+with tempfile.TemporaryDirectory() as folder:
+    path = os.path.join(folder, "test.MDF")
+    with open(path, "w") as file:
+        file.write("\n".join(lines) + "\n")
+
+    start = time.perf_counter()
+    dies_by_lines = read_controlmap_by_lines(path)
+    by_lines = time.perf_counter() - start
+
+    start = time.perf_counter()
+    dies = load_controlmap(path).get_labels("PROB")
+    first_load = time.perf_counter() - start
+
+    start = time.perf_counter()
+    dies = load_controlmap(path).get_labels("PROB")
+    cached_load = time.perf_counter() - start
+
+    start = time.perf_counter()
+    categories = load_controlmap(path).get_category(range(size), range(size))
+    lookup = time.perf_counter() - start
+
+assert dies == dies_by_lines
+
+print(f"{len(lines) - 2} dies, {len(dies)} to probe")
+print(f"line-by-line parser: {by_lines * 1e3:.0f} ms")
+print(f"parser, first load: {first_load * 1e3:.0f} ms")
+print(f"parser, cached: {cached_load * 1e3:.0f} ms")
+print(f"category of {size} dies: {lookup * 1e3:.2f} ms")
@@ -0,0 +1,160 @@
+# This Device Class is published under the terms of the MIT License.
+# Required Third Party Libraries, which are included in the Device Class
+# package for convenience purposes, may have a different license. You can
+# find those in the corresponding folders or contact the maintainer.
+#
+# MIT License
+#
+# Copyright (c) 2025 SweepMe! GmbH (sweep-me.net)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Read Accretech control map (.MDF) files.
+
+The dies are listed in the section [DIEINFO] as <category>=<x>,<y>, e.g. PROB=12,5. The dies of a file are returned
+as structured numpy array with the fields x, y and category in the order of the file. Files are cached by path,
+modification time and size, so that a control map is only parsed again if the file has changed.
+"""
+
+from __future__ import annotations
+
+import io
+import os
+import re
+import warnings
+
+import numpy as np
+
+CATEGORIES = ("MARK", "PROB", "SKIP", "INSP")
+"""Die categories of the [DIEINFO] section."""
+
+DIE_DTYPE = np.dtype([("x", np.int32), ("y", np.int32), ("category", "U4")])
+
+_die_pattern = re.compile(
+    r"^[ \t]*(" + "|".join(CATEGORIES) + r")[ \t]*=[ \t]*(-?\d+)[ \t]*,[ \t]*(-?\d+)",
+    flags=re.MULTILINE,
+)
+_section_pattern = re.compile(r"^[ \t]*\[[^\]\r\n]*\]", flags=re.MULTILINE)
+
+_cache: dict[str, tuple[tuple[int, int], ControlMap]] = {}
+
+
+class ControlMap:
+    """Dies of a control map with lookup of the category by die coordinate."""
+
+    def __init__(self, dies: np.ndarray) -> None:
+        """Create the lookup table for a structured array with the fields of DIE_DTYPE."""
+        self.dies = dies
+        self.dies.flags.writeable = False
+
+        self.labels: dict[str, list[str]] = {}
+        """Labels per category, created when they are requested for the first time."""
+
+        # Category index + 1 of each die on a grid that spans all dies, 0 for coordinates that are not in the map
+        if len(dies) > 0:
+            self.x_min, self.y_min = int(dies["x"].min()), int(dies["y"].min())
+            shape = (int(dies["y"].max()) - self.y_min + 1, int(dies["x"].max()) - self.x_min + 1)
+        else:
+            self.x_min, self.y_min = 0, 0
+            shape = (0, 0)
+        self.grid = np.zeros(shape, dtype=np.int8)
+        for code, category in enumerate(CATEGORIES, start=1):
+            selected = dies[dies["category"] == category]
+            self.grid[selected["y"] - self.y_min, selected["x"] - self.x_min] = code
+
+    def __len__(self) -> int:
+        """Return the number of dies of all categories."""
+        return len(self.dies)
+
+    def get_dies(self, category: str = "PROB") -> np.ndarray:
+        """Return the dies of a category in the order of the file."""
+        return self.dies[self.dies["category"] == category]
+
+    def get_labels(self, category: str = "PROB") -> list[str]:
+        """Return the dies of a category as "<x>,<y>" labels in the order of the file."""
+        if category not in self.labels:
+            dies = self.get_dies(category)
+            self.labels[category] = [f"{x},{y}" for x, y in zip(dies["x"].tolist(), dies["y"].tolist())]
+        return list(self.labels[category])
+
+    def get_category(self, x: int | np.ndarray, y: int | np.ndarray) -> str | np.ndarray:
+        """Return the category of the die at x, y or an empty string if the die is not in the control map.
+
+        x and y can also be arrays, then an array of categories is returned.
+        """
+        x = np.asarray(x) - self.x_min
+        y = np.asarray(y) - self.y_min
+        inside = (x >= 0) & (y >= 0) & (x < self.grid.shape[1]) & (y < self.grid.shape[0])
+
+        codes = np.zeros(inside.shape, dtype=np.int8)
+        codes[inside] = self.grid[y[inside], x[inside]]
+        categories = np.array(("", *CATEGORIES))[codes]
+        return str(categories) if categories.ndim == 0 else categories
+
+
+def parse_controlmap(text: str) -> ControlMap:
+    """Return the dies of the [DIEINFO] section of the content of a control map file."""
+    start = text.find("[DIEINFO]")
+    if start < 0:
+        return ControlMap(np.empty(0, dtype=DIE_DTYPE))
+    start += len("[DIEINFO]")
+
+    # The section ends with the next section header or the end of the file
+    end = _section_pattern.search(text, start)
+    section = text[start:end.start() if end else len(text)]
+
+    # Replace the categories by their index to read all lines as integers with the C parser of numpy.loadtxt
+    converted = section
+    for code, category in enumerate(CATEGORIES):
+        converted = converted.replace(f"{category}=", f"{code},")
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)  # empty section
+            values = np.loadtxt(io.StringIO(converted), dtype=np.int32, delimiter=",", comments="#", ndmin=2)
+        values = values.reshape(-1, 3)
+    except ValueError:
+        # Lines with other keys or with whitespace around '=' are handled by the slower regular expression
+        values = np.array(
+            [(CATEGORIES.index(category), x, y) for category, x, y in _die_pattern.findall(section)],
+            dtype=np.int32,
+        ).reshape(-1, 3)
+
+    dies = np.empty(len(values), dtype=DIE_DTYPE)
+    dies["category"] = np.array(CATEGORIES)[values[:, 0]]
+    dies["x"] = values[:, 1]
+    dies["y"] = values[:, 2]
+    return ControlMap(dies)
+
+
+def load_controlmap(path: str) -> ControlMap:
+    """Return the control map of a file. The result is cached until the file is modified."""
+    path = os.path.abspath(path)
+    status = os.stat(path)
+    identity = (status.st_mtime_ns, status.st_size)
+
+    cached = _cache.get(path)
+    if cached is not None and cached[0] == identity:
+        return cached[1]
+
+    with open(path) as file:
+        controlmap = parse_controlmap(file.read())
+
+    _cache[path] = (identity, controlmap)
+    return controlmap
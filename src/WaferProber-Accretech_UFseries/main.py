@@ -47,6 +47,9 @@
 _accretech_uf_path = os.path.dirname(os.path.abspath(__file__)) + os.sep + r"libs\accretech_uf.py"
 accretech_uf = load_source("accretech_uf", _accretech_uf_path)
 
+from controlmap import load_controlmap
+from die_order import DIE_ORDERS, order_labels
+
 # this is needed as a fallback solutions as pysweepme.UserInterface is not available for all 1.5.5 update versions
 try:
     from pysweepme.UserInterface import message_box
@@ -98,6 +101,7 @@ def set_GUIparameter(self):
             "SweepValueWafer": "Wafer table",
             "SweepValueDie": "Die table",
             "SweepValueSubsite": "Subsite table",
+            "Die order": DIE_ORDERS,
         }
         return gui_parameter
 
@@ -107,6 +111,7 @@ def get_GUIparameter(self, parameter):
         self.sweep_value_wafer = parameter["SweepValueWafer"]
         self.sweep_value_die = parameter["SweepValueDie"]
         self.sweep_value_subsite = parameter["SweepValueSubsite"]
+        self.die_order = parameter.get("Die order", "As defined")
 
     def get_probeplan(self, probeplan_path):
         # important function to retrieve the probe plan before the measurement starts,
@@ -134,7 +139,7 @@ def get_probeplan(self, probeplan_path):
 
         # Dies
         die_list = self.read_controlmap(probeplan_path)
-        dies = die_list
+        dies = order_labels(die_list, self.die_order)
 
         # Subsites
         subsites = []  # Subsites cannot be defined via file or loaded from the wafer
@@ -640,6 +645,8 @@ def get_wafer_on_chuck(self):
     def read_controlmap(self, controlmap) -> List[str]:
         """Reads a given controlmap file
 
+        The parsed control map is cached until the file is modified, see libs/controlmap.py.
+
         Args:
             controlmap: path to the Control Map .MDF file. 
             Control map files can be exported using Device Commander software
@@ -647,45 +654,13 @@ def read_controlmap(self, controlmap) -> List[str]:
         Returns:
             List of strings with each entry describing the x and y index of the die "<x>,<y>"
         """
-
-        with open(controlmap, "r") as mdf_file:
-
-            die_assignment = {
-                "MARK": [],
-                "PROB": [],
-                "SKIP": [],
-                "INSP": [],
-            }
-
-            last_section = None
-            for line in mdf_file.readlines():
-
-                line = line.strip()
-
-                # Comments
-                if line.startswith("#"):
-                    continue
-
-                splitted = line.split("=")
-
-                # Sections
-                if len(splitted) == 1:
-                    last_section = line
-                    continue
-
-                # Dies
-                if last_section == "[DIEINFO]":
-                    if splitted[0] in die_assignment:
-                        die_assignment[splitted[0]].append(splitted[1])
-
-            # print("Marked dies:", die_assignment["MARK"])
-            # print("Skipped dies:", die_assignment["SKIP"])
-            # print("Inspection dies:", die_assignment["INSP"])
-            # print("Dies to probe:", die_assignment["PROB"])
-
-            return die_assignment["PROB"]
+        return load_controlmap(controlmap).get_labels("PROB")
 
     def read_controlmap_as_tuples(self, controlmap) -> List[Tuple[int, int]]:
         """return die xy positions as [(x,y),...] ints"""
-        xy_die_positions = self.read_controlmap(self, controlmap)
-        return [tuple(int(val) for val in pos.split(",")) for pos in xy_die_positions]
+        dies = load_controlmap(controlmap).get_dies("PROB")
+        return list(zip(dies["x"].tolist(), dies["y"].tolist()))
+
+    def get_die_category(self, controlmap, x: int, y: int) -> str:
+        """return the category (MARK, PROB, SKIP, INSP) of the die at x, y or "" if it is not in the control map"""
+        return load_controlmap(controlmap).get_category(x, y)
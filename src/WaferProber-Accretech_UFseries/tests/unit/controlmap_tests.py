@@ -0,0 +1,73 @@
+"""Unit tests for reading Accretech control map files."""
+
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "libs"))
+
+from controlmap import load_controlmap, parse_controlmap  # noqa: E402
+
+CONTROLMAP = """# exported control map
+[HEADER]
+DEVICE=TEST
+[DIEINFO]
+MARK=0,0
+PROB=1,2
+# comment inside the section
+PROB= -3, 4
+SKIP=5,5
+INSP=6,1
+[OTHER]
+PROB=9,9
+"""
+
+
+class ControlMapTests(unittest.TestCase):
+    """Tests for parsing, lookup and caching of control maps."""
+
+    def test_dies_of_section(self) -> None:
+        """Only dies of [DIEINFO] are read, in the order of the file."""
+        controlmap = parse_controlmap(CONTROLMAP)
+
+        self.assertEqual(len(controlmap), 5)
+        self.assertEqual(controlmap.get_labels("PROB"), ["1,2", "-3,4"])
+        np.testing.assert_array_equal(controlmap.get_dies("SKIP")["x"], [5])
+
+    def test_category_lookup(self) -> None:
+        """Categories are found for single coordinates and arrays, unknown dies return an empty string."""
+        controlmap = parse_controlmap(CONTROLMAP)
+
+        self.assertEqual(controlmap.get_category(1, 2), "PROB")
+        self.assertEqual(controlmap.get_category(2, 2), "")
+        np.testing.assert_array_equal(
+            controlmap.get_category([0, 6, 100, -3], [0, 1, 0, 4]),
+            ["MARK", "INSP", "", "PROB"],
+        )
+
+    def test_empty_controlmap(self) -> None:
+        """A file without [DIEINFO] has no dies."""
+        controlmap = parse_controlmap("[HEADER]\nDEVICE=TEST\n")
+
+        self.assertEqual(controlmap.get_labels(), [])
+        self.assertEqual(controlmap.get_category(0, 0), "")
+
+    def test_cache_is_updated_when_file_changes(self) -> None:
+        """The same file is parsed once and again after it was modified."""
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "test.MDF")
+            Path(path).write_text(CONTROLMAP)
+            first = load_controlmap(path)
+            self.assertIs(load_controlmap(path), first)
+
+            Path(path).write_text(CONTROLMAP.replace("PROB=1,2", "PROB=1,3"))
+            os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 1_000_000))
+            self.assertEqual(load_controlmap(path).get_labels(), ["1,3", "-3,4"])
+
+
+if __name__ == "__main__":
+    unittest.main()
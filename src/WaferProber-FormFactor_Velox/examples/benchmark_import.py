@@ -0,0 +1,55 @@
+"""
+Measure the import time and memory of the velox library and the time to create the functions of SCI commands.
+Velox does not need to be running, as no command is sent.
+Each measurement runs in a new python process, so that velox is not yet imported.
+"""
+
+import os
+import subprocess
+import sys
+
+# the libs folder of the driver where this example file is in
+libs_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "libs")
+
+import_time = """
+import time
+start = time.perf_counter()
+import velox
+print((time.perf_counter() - start) * 1e3)
+"""
+
+import_memory = """
+import tracemalloc
+tracemalloc.start()
+import velox
+print(tracemalloc.get_traced_memory()[0] / 1e6)
+"""
+
+command_creation = """
+import time
+import velox
+start = time.perf_counter()
+velox.ReadMapPosition2
+first_access = time.perf_counter() - start
+start = time.perf_counter()
+for name in velox.scicommands.SCI_COMMANDS:
+    getattr(velox, name)
+print(first_access * 1e6, (time.perf_counter() - start) * 1e3, len(velox.scicommands.SCI_COMMANDS))
+"""
+
+
+def run(code: str) -> list[float]:
+    """Run the code in a new python process in the libs folder and return the printed numbers."""
+    output = subprocess.run([sys.executable, "-c", code], cwd=libs_path, capture_output=True, text=True, check=True)
+    return [float(value) for value in output.stdout.split()]
+
+
+runs = 5
+durations = [run(import_time)[0] for _ in range(runs)]
+memory = run(import_memory)[0]
+first_access, all_commands, number_of_commands = run(command_creation)
+
+print(f"Import of velox: {min(durations):.1f} ms (best of {runs})")
+print(f"Memory after import: {memory:.2f} MB")
+print(f"First access of an SCI command: {first_access:.0f} us")
+print(f"Creating all {number_of_commands:.0f} SCI commands: {all_commands:.1f} ms")
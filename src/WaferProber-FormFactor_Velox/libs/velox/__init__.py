@@ -19,11 +19,23 @@
 # ARISING FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR 
 # OTHER DEALINGS IN THE SOFTWARE.
 
-"""Determines the version of the sci module to import"""
-from sys import version_info
+"""Provides the Velox SCI commands as functions of this package, e.g. velox.ReadMapPosition2().
+The functions are created from the command table in velox.scicommands on first access."""
 from velox.vxmessageserver import *
+from velox import scicommands
 
-if (version_info[0] > 2 and version_info[1] >= 5):
-    from velox.sci35 import *
-else:
-    from velox.sci27 import *
+__all__ = [name for name in dir(vxmessageserver) if not name.startswith('_')] + list(scicommands.SCI_COMMANDS)
+
+
+def __getattr__(name):
+    """ Create the function of an SCI command on first access and keep it as attribute of the package """
+    try:
+        sciCommand = scicommands.createSciCommand(name)
+    except KeyError:
+        raise AttributeError("module 'velox' has no attribute '{}'".format(name)) from None
+    globals()[name] = sciCommand
+    return sciCommand
+
+
+def __dir__():
+    return sorted(set(globals()) | set(scicommands.SCI_COMMANDS))
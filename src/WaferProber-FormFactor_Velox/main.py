@@ -31,11 +31,19 @@
 
 from __future__ import annotations
 
+import os
+
+import numpy as np
 from pysweepme.EmptyDeviceClass import EmptyDevice
 from pysweepme.FolderManager import addFolderToPATH
 
 addFolderToPATH()
 import velox
+from die_order import DIE_ORDERS, order_labels
+
+_probeplan_cache: dict[tuple[str, int], dict] = {}
+"""Subsites of the last read probe plan per Velox connection. Module level, as the GUI creates a new driver instance
+for each refresh."""
 
 
 class Device(EmptyDevice):
@@ -53,6 +61,8 @@ class Device(EmptyDevice):
         <li>Port: Use 'localhost' when running SweepMe! on the same PC as Velox. For TCP/IP remote control, enter
          the Velox PCs IP address either as blank string "192.168.XXX.XXX" or containing a specific port 
          "IP:xxx.xxx.xxx.xxx; Port:xxxx" </li>
+        <li>Die order: Order in which dies and subsites are returned by 'Update'. 'Serpentine' and 'Shortest path'
+         reduce the stage travel, the first die of the Velox selection remains the first die for 'Shortest path'.</li>
     </ul>
     """
 
@@ -79,6 +89,11 @@ def __init__(self) -> None:
         self.subsites: dict = {}
         """Dictionary containing the subsite labels and their corresponding subsite number."""
 
+        self.subsite_positions: dict = {}
+        """Dictionary containing the subsite labels and their x and y position, if defined in Velox."""
+
+        self.die_order: str = "As defined"
+
         self.sweep_mode_wafer: str = "Wafer table"
         self.current_wafer: str = ""
         self.current_die: str = ""
@@ -98,6 +113,7 @@ def set_GUIparameter(self) -> dict[str, float]:  # noqa: N802
         return {
             "Load angle": 0.,
             "SweepValueWafer": ["Wafer table"],  # filled by module
+            "Die order": DIE_ORDERS,
         }
 
     def get_GUIparameter(self, parameter: dict[str, str]) -> None:  # noqa: N802
@@ -105,6 +121,7 @@ def get_GUIparameter(self, parameter: dict[str, str]) -> None:  # noqa: N802
         self.handle_port_string(parameter["Port"])
         self.load_angle = float(parameter.get("Load angle", "0.0"))
         self.sweep_mode_wafer = parameter["SweepValueWafer"]
+        self.die_order = parameter.get("Die order", "As defined")
 
     def handle_port_string(self, port_string: str) -> None:
         """Extract IP address and socket from port string."""
@@ -199,15 +216,40 @@ def disconnect_from_velox(self) -> None:
             self.msg_server = None
 
     def get_probeplan(self) -> tuple[list[str], list[str], list[str]]:
-        """Return selected wafers, dies, and subsites. The currently loaded wafermap in VeloxPro is used."""
+        """Return selected wafers, dies, and subsites. The currently loaded wafermap in VeloxPro is used.
+
+        The dies are read every time with pipelined commands. The subsites are only read from Velox if the selected
+        dies, the number of sites, or the saved project have changed since the last call, see get_probeplan_identity.
+        """
         self.connect_to_velox()
 
         wafer = self.get_wafer_list()
         dies = self.get_die_list()
-        subsites = self.get_subsite_list()
+
+        cache_key = (self.ip_address, self.target_socket)
+        identity = self.get_probeplan_identity(dies)
+        cached_probeplan = _probeplan_cache.get(cache_key)
+        if identity is not None and cached_probeplan is not None and cached_probeplan["identity"] == identity:
+            self.subsites = dict(cached_probeplan["subsites"])
+            self.subsite_positions = dict(cached_probeplan["subsite_positions"])
+            subsites = list(self.subsites.keys())
+        else:
+            subsites = self.get_subsite_list()
+            if identity is not None:
+                _probeplan_cache[cache_key] = {
+                    "identity": identity,
+                    "subsites": dict(self.subsites),
+                    "subsite_positions": dict(self.subsite_positions),
+                }
 
         self.disconnect_from_velox()
 
+        dies = order_labels(dies, self.die_order)
+        # Subsites can only be reordered if all positions are known
+        if len(self.subsite_positions) == len(subsites):
+            positions = np.array([self.subsite_positions[label] for label in subsites], dtype=float).reshape(-1, 2)
+            subsites = order_labels(subsites, self.die_order, positions)
+
         if wafer:
             return wafer, dies, subsites
         else:
@@ -232,17 +274,36 @@ def get_wafer_list(self) -> list[str]:
 
         return wafer
 
+    def get_probeplan_identity(self, dies: list[str]) -> tuple | None:
+        """Return project file, its modification time, selected dies, and wafer info to identify the probe plan.
+
+        The wafer info contains the number of sites marked to test. Returns None if the modification time is not
+        available, e.g. if Velox runs on another PC, as changes of the subsites could not be detected then.
+        """
+        project_file = velox.GetProjectFile()
+        try:
+            modification_time = os.path.getmtime(project_file)
+        except OSError:
+            return None
+
+        return project_file, modification_time, tuple(dies), velox.GetWaferInfo()
+
+    def clear_probeplan_cache(self) -> None:
+        """Remove the cached probe plan of this Velox connection."""
+        _probeplan_cache.pop((self.ip_address, self.target_socket), None)
+
     def get_die_list(self) -> list[str]:
         """Get a list of all selected dies on the current wafer in format x,y."""
-        dies = []
-        for n in range(1, velox.GetNumSelectedDies() + 1):
-            ret = velox.GetDieDataAsNum(n)
-            dies.append(f"{ret[1]},{ret[2]}")
-        return dies
+        # Send all GetDieDataAsNum requests pipelined instead of waiting for each response
+        commands = [("GetDieDataAsNum", (n,)) for n in range(1, velox.GetNumSelectedDies() + 1)]
+        responses = self.msg_server.sendSciCommands(commands)
+        # Response: [0] RDieIndex, [1] DieX, [2] DieY, [3] Bin, [4] Result
+        return [f"{int(ret[1])},{int(ret[2])}" for ret in responses]
 
     def get_subsite_list(self) -> list[str]:
-        """Return a list of all enabled subsite labels. Update self.subsites."""
+        """Return a list of all enabled subsite labels. Update self.subsites and self.subsite_positions."""
         self.subsites = {}
+        self.subsite_positions = {}
         subsite_number = 0
         # GetDieInfo returns only the number of selected subsites, not the total number of subsites
         while True:
@@ -262,6 +323,11 @@ def get_subsite_list(self) -> list[str]:
             if status == "E":  # Enabled
                 # Add the number to the label to ensure uniqueness, as Velox allows multiple subsites with the same label
                 self.subsites[f"#{subsite_number} {label}"] = subsite_number
+                if subdie_data[1] != "" and subdie_data[2] != "":
+                    self.subsite_positions[f"#{subsite_number} {label}"] = (
+                        float(subdie_data[1]),
+                        float(subdie_data[2]),
+                    )
 
             subsite_number += 1
 
@@ -323,6 +389,9 @@ def load_wafer(self, wafer: str, alignment_angle: float = 0) -> None:
                     slot_id = int(status_string.split(" ")[1])
                     break
 
+        # A new wafer can come with a different wafermap
+        self.clear_probeplan_cache()
+
         # TODO: Check if port_id must be chosen differently when using two cassettes
         velox.LoadWafer(port_id, slot_id, str(alignment_angle))
         # Perform wafer alignment on chuck
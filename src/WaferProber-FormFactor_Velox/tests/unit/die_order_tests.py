@@ -0,0 +1,74 @@
+"""Unit tests for reordering dies and subsites to reduce the stage travel."""
+
+import sys
+import unittest
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "libs"))
+
+from die_order import order_labels, parse_positions, path_length  # noqa: E402
+
+
+class DieOrderTests(unittest.TestCase):
+    """Tests that all labels are kept and that the new orders are not longer than the defined order."""
+
+    def setUp(self) -> None:
+        # sparse plan on a round wafer, listed column by column
+        rng = np.random.default_rng(0)
+        positions = [(x, y) for x in range(-10, 11) for y in range(-10, 11) if x**2 + y**2 <= 100]
+        selection = sorted(rng.choice(len(positions), 80, replace=False))
+        self.labels = [f"{positions[i][0]},{positions[i][1]}" for i in selection]
+
+    def test_labels_are_kept(self) -> None:
+        """Every label is returned exactly once and unchanged."""
+        for order in ["As defined", "Serpentine", "Shortest path"]:
+            with self.subTest(order=order):
+                self.assertEqual(sorted(order_labels(self.labels, order)), sorted(self.labels))
+
+    def test_serpentine(self) -> None:
+        """Rows are visited in ascending y with alternating x direction."""
+        labels = ["0,0", "1,0", "2,0", "0,1", "1,1", "2,1", "1,2"]
+        self.assertEqual(
+            order_labels(labels, "Serpentine"),
+            ["0,0", "1,0", "2,0", "2,1", "1,1", "0,1", "1,2"],
+        )
+
+    def test_shortest_path_starts_at_first_die(self) -> None:
+        """The first die remains the first die and the path is shorter than the other orders."""
+        ordered = order_labels(self.labels, "Shortest path")
+        self.assertEqual(ordered[0], self.labels[0])
+
+        length = path_length(parse_positions(ordered))
+        self.assertLess(length, path_length(parse_positions(self.labels)))
+        self.assertLessEqual(length, path_length(parse_positions(order_labels(self.labels, "Serpentine"))))
+
+    def test_labels_with_index_and_spaces(self) -> None:
+        """Positions are read from the first two integers of labels like 'x, y' or 'x,y#index'."""
+        np.testing.assert_array_equal(parse_positions(["1, 13", "-7,5#3"]), [[1, 13], [-7, 5]])
+
+    def test_given_positions(self) -> None:
+        """Subsite labels without coordinates are ordered by the given positions."""
+        labels = ["#0 A", "#1 B", "#2 C", "#3 D"]
+        positions = np.array([[0.0, 0.0], [300.0, 0.0], [100.0, 0.0], [200.0, 0.0]])
+        self.assertEqual(order_labels(labels, "Shortest path", positions), ["#0 A", "#2 C", "#3 D", "#1 B"])
+
+    def test_decimal_positions(self) -> None:
+        """Positions given as Decimal, like the subsite positions returned by Velox, can be ordered."""
+        labels = ["#0 A", "#1 B", "#2 C", "#3 D"]
+        positions = [(Decimal("0"), Decimal("0")), (Decimal("300.5"), Decimal("0")),
+                     (Decimal("100"), Decimal("0")), (Decimal("200"), Decimal("0"))]
+        for order in ["Serpentine", "Shortest path"]:
+            with self.subTest(order=order):
+                self.assertEqual(order_labels(labels, order, positions), ["#0 A", "#2 C", "#3 D", "#1 B"])
+
+    def test_invalid_label(self) -> None:
+        """Labels without two integers cannot be reordered."""
+        with self.assertRaises(ValueError):
+            order_labels(["A", "B", "C"], "Serpentine")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+"""Unit tests for the Velox message server client without a running Velox software."""
+
+import socket
+import sys
+import threading
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "libs"))
+
+import velox  # noqa: E402
+from velox import vxmessageserver  # noqa: E402
+
+
+class MockMessageServer(threading.Thread):
+    """Answers each Cmd=<ID>:<name>:<params> line with Rsp=<ID>:<code>:<params>.
+
+    Responses are written in pairs in reversed order and split across packets to exercise the framing.
+    A parameter string "fail" is answered with error code 5.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(daemon=True)
+        self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.server.bind(("127.0.0.1", 0))
+        self.server.listen(1)
+        self.port = self.server.getsockname()[1]
+
+    def run(self) -> None:
+        connection, _ = self.server.accept()
+        with connection, connection.makefile("rb") as reader:
+            reader.readline()  # registration
+            connection.sendall(b"Rsp=1:0:\n")
+
+            pending = []
+            for line in reader:
+                command, _, parameters = line.decode().strip().split(":", 2)
+                command_id = command.split("=")[1]
+                code = 5 if parameters == "fail" else 0
+                pending.append(f"Rsp={command_id}:{code}:{parameters} \"a b\"\n".encode())
+                if len(pending) == 2 or parameters == "single":
+                    data = b"".join(reversed(pending))
+                    pending = []
+                    connection.sendall(data[:7])
+                    connection.sendall(data[7:])
+
+
+class MessageServerInterfaceTests(unittest.TestCase):
+    """Tests for the newline framing and the matching of responses by command ID."""
+
+    def setUp(self) -> None:
+        self.server = MockMessageServer()
+        self.server.start()
+        self.interface = vxmessageserver.MessageServerInterface("127.0.0.1", self.server.port)
+
+    def tearDown(self) -> None:
+        self.interface.__exit__(None, None, None)
+        self.server.server.close()
+
+    def test_static_command_uses_active_instance(self) -> None:
+        """The static sendSciCommand used by the SCI functions sends to the open connection."""
+        response = vxmessageserver.MessageServerInterface.sendSciCommand("ReadMapPosition2", "single")
+        self.assertEqual(response, ["single", "a b"])
+
+    def test_pipelined_commands_are_matched_by_id(self) -> None:
+        """Responses that arrive out of order are returned in the order of the commands."""
+        responses = self.interface.sendSciCommands([("GetDieDataAsNum", (n,)) for n in range(1, 11)])
+        self.assertEqual([response[0] for response in responses], [str(n) for n in range(1, 11)])
+
+    def test_error_is_raised_after_all_responses(self) -> None:
+        """A failed command raises SciException without leaving responses behind for later commands."""
+        with self.assertRaises(vxmessageserver.SciException) as context:
+            self.interface.sendSciCommands([("GetDieDataAsNum", ("fail",)), ("GetDieDataAsNum", (2,))])
+        self.assertEqual(context.exception.code, "5")
+
+        response = self.interface.sendSciCommand("GetWaferID", "single")
+        self.assertEqual(response, ["single", "a b"])
+
+    def test_sci_command_is_created_on_access(self) -> None:
+        """SCI commands are created from the command table and convert the response to the response fields."""
+        self.assertEqual(velox.EchoData("single"), "single a b")
+        with self.assertRaises(AttributeError):
+            velox.NoSciCommand  # noqa: B018
+
+    def test_no_active_instance_after_exit(self) -> None:
+        """Closing the connection removes it from the static command dispatch."""
+        self.interface.__exit__(None, None, None)
+        with self.assertRaises(Exception):
+            vxmessageserver.MessageServerInterface.sendSciCommand("GetWaferID")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,207 @@
+# This Device Class is published under the terms of the MIT License.
+# Required Third Party Libraries, which are included in the Device Class
+# package for convenience purposes, may have a different license. You can
+# find those in the corresponding folders or contact the maintainer.
+#
+# MIT License
+#
+# Copyright (c) 2025 SweepMe! GmbH (sweep-me.net)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+"""Reorder the dies or subsites of a probe plan to reduce the travel of the prober stage.
+
+The positions are taken from the labels, e.g. "3,5", "3, 5" or "3,5#12", where the first two integers are the x and y
+index. The labels are returned unchanged in the new order, so the drivers can still identify dies by their labels.
+
+The stage moves x and y at the same time, so the time of a move is determined by the longer axis. The distance
+between two positions is therefore the maximum of the distances in x and y (Chebyshev distance).
+"""
+
+from __future__ import annotations
+
+import re
+
+import numpy as np
+
+# Options of the drivers' GUI parameter "Die order"
+DIE_ORDERS = ["As defined", "Serpentine", "Shortest path"]
+
+# 2-opt needs O(n^2) operations per pass, larger plans are only ordered by nearest neighbour
+MAX_TWO_OPT_POSITIONS = 2000
+
+# Maximum number of 2-opt passes over all segments
+MAX_TWO_OPT_PASSES = 50
+
+_integer_pattern = re.compile(r"-?\d+")
+
+
+def parse_positions(labels: list[str]) -> np.ndarray:
+    """Return the x and y index of each label as array with one row per label.
+
+    Raises:
+        ValueError: If a label does not contain two integers.
+    """
+    positions = []
+    for label in labels:
+        numbers = _integer_pattern.findall(label)
+        if len(numbers) < 2:
+            msg = f"Unable to read the position of '{label}'. Expected a label like 'x,y'."
+            raise ValueError(msg)
+        positions.append(numbers[:2])
+    return np.array(positions, dtype=float).reshape(-1, 2)
+
+
+def order_labels(labels: list[str], order: str, positions: np.ndarray | None = None) -> list[str]:
+    """Return the labels in the order of DIE_ORDERS.
+
+    Args:
+        labels: Labels of dies or subsites.
+        order: "As defined", "Serpentine" or "Shortest path".
+        positions: Positions with one row (x, y) per label. By default, the positions are read from the labels.
+    """
+    if order == "As defined" or len(labels) < 3:
+        return list(labels)
+
+    if positions is None:
+        positions = parse_positions(labels)
+    else:
+        # positions can be given as Decimal, e.g. the subsite positions of Velox
+        positions = np.asarray(positions, dtype=float).reshape(-1, 2)
+
+    if order == "Serpentine":
+        indices = serpentine_order(positions)
+    elif order == "Shortest path":
+        indices = shortest_path_order(positions)
+    else:
+        msg = f"Unknown order '{order}'. Use one of {', '.join(DIE_ORDERS)}."
+        raise ValueError(msg)
+
+    return [labels[index] for index in indices]
+
+
+def serpentine_order(positions: np.ndarray) -> np.ndarray:
+    """Return the indices of the positions row by row with alternating direction, starting at the first row in y."""
+    x, y = positions[:, 0], positions[:, 1]
+    rows, row_numbers = np.unique(y, return_inverse=True)
+    # x of every second row is inverted, so that sorting by row and x gives the alternating direction
+    direction = np.where(row_numbers % 2 == 0, 1.0, -1.0)
+    return np.lexsort((direction * x, row_numbers))
+
+
+def shortest_path_order(positions: np.ndarray) -> np.ndarray:
+    """Return the indices of a short path that starts at the first position and visits every position once.
+
+    The path is built by nearest neighbour and improved by 2-opt, which reverses segments of the path as long as
+    this shortens the path. The result is not guaranteed to be the shortest path, but typically close to it.
+    """
+    path = nearest_neighbour_path(positions)
+    if len(path) <= MAX_TWO_OPT_POSITIONS:
+        path = two_opt(positions, path)
+    return path
+
+
+def nearest_neighbour_path(positions: np.ndarray) -> np.ndarray:
+    """Return a path that starts at the first position and always continues with the closest unvisited position."""
+    number_of_positions = len(positions)
+    path = np.empty(number_of_positions, dtype=int)
+    visited = np.zeros(number_of_positions, dtype=bool)
+
+    current = 0
+    for step in range(number_of_positions):
+        path[step] = current
+        visited[current] = True
+        if step == number_of_positions - 1:
+            break
+        distances = np.max(np.abs(positions - positions[current]), axis=1)
+        distances[visited] = np.inf
+        current = int(np.argmin(distances))
+
+    return path
+
+
+def two_opt(positions: np.ndarray, path: np.ndarray) -> np.ndarray:
+    """Improve an open path with fixed start by reversing segments until no reversal shortens the path."""
+    path = path.copy()
+    number_of_positions = len(path)
+
+    for _ in range(MAX_TWO_OPT_PASSES):
+        improved = False
+        for i in range(1, number_of_positions - 1):
+            # Reversing path[i:j + 1] replaces the edges (a, b) and (c, e) by (a, c) and (b, e)
+            points = positions[path]
+            a, b = points[i - 1], points[i]
+            c = points[i + 1:]
+            e = points[i + 2:]
+
+            removed = np.max(np.abs(a - b))
+            added = np.max(np.abs(c - a), axis=1)
+            removed_after = np.zeros(len(c))
+            added_after = np.zeros(len(c))
+            # the last position has no following edge
+            removed_after[:-1] = np.max(np.abs(e - c[:-1]), axis=1)
+            added_after[:-1] = np.max(np.abs(e - b), axis=1)
+
+            gain = removed + removed_after - added - added_after
+            best = int(np.argmax(gain))
+            if gain[best] > 1e-9:
+                j = i + 1 + best
+                path[i:j + 1] = path[i:j + 1][::-1]
+                improved = True
+
+        if not improved:
+            break
+
+    return path
+
+
+def path_length(positions: np.ndarray) -> float:
+    """Return the sum of the distances between consecutive positions."""
+    return float(np.sum(np.max(np.abs(np.diff(positions, axis=0)), axis=1)))
+
+
+def estimate_travel_time(
+    positions: np.ndarray,
+    pitch: tuple[float, float] = (1.0, 1.0),
+    velocity: float = 50.0,
+    acceleration: float = 500.0,
+    settling_time: float = 0.1,
+) -> float:
+    """Return the time in s to move through the positions with a trapezoidal velocity profile per axis.
+
+    Args:
+        positions: Die indices with one row (x, y) per position in the order of the visits.
+        pitch: Die size in x and y in mm.
+        velocity: Maximum stage velocity in mm/s.
+        acceleration: Stage acceleration in mm/s^2.
+        settling_time: Time in s after each move, e.g. to settle and to contact.
+    """
+    distances = np.abs(np.diff(positions, axis=0)) * np.asarray(pitch)
+
+    # Short moves do not reach the maximum velocity
+    ramp_distance = velocity**2 / acceleration
+    times = np.where(
+        distances < ramp_distance,
+        2 * np.sqrt(distances / acceleration),
+        distances / velocity + velocity / acceleration,
+    )
+
+    moves = np.max(times, axis=1)
+    return float(np.sum(moves) + settling_time * np.count_nonzero(moves))
@@ -42,6 +42,8 @@
 
 importlib.reload(sentio)
 
+from die_order import DIE_ORDERS, order_labels
+
 
 class Device(EmptyDevice):
     description = """
@@ -80,7 +82,8 @@ def set_GUIparameter(self):
             "Light at contact": ["As is", "On", "Off"],
             "Light at separation": ["As is", "On", "Off"],
             "": None,
-            "End position": ['None', 'Home', 'Center']
+            "End position": ['None', 'Home', 'Center'],
+            "Die order": DIE_ORDERS,
         }
         return gui_parameter
 
@@ -90,6 +93,7 @@ def get_GUIparameter(self, parameter):
         self.is_light_contact = parameter["Light at contact"]
         self.is_light_separation = parameter["Light at separation"]
         self.end_position = parameter["End position"]
+        self.die_order = parameter.get("Die order", "As defined")
 
         if not (self.port_string.startswith("TCPIP") or self.port_string.startswith("GPIB")):
             self.port_manager = False
@@ -112,6 +116,9 @@ def get_probeplan(self):
             dies.append("%s,%s#%s" % (x, y, i))
             # dies.append("%s" % i)
 
+        # the die index after '#' is kept in the label, so the reordered dies are still stepped by their index
+        dies = order_labels(dies, self.die_order)
+
         subsites = []
         for i in range(0, self.prober.map_subsite_get_num()):
             subsites.append("%s" % i)
@@ -0,0 +1,40 @@
+"""
+Compare the estimated stage travel time of a sparse sampling plan on a 300 mm wafer for the die orders of the
+'Die order' parameter. The plan is listed row by row from left to right like many probe plan files.
+The travel time is estimated with a trapezoidal velocity profile per axis and a settling time per move.
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+# add libs folder to sys.path to enable import of die_order
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "libs"))
+
+from die_order import DIE_ORDERS, estimate_travel_time, order_labels, parse_positions  # noqa: E402
+
+wafer_diameter = 300.0  # mm
+pitch = (5.0, 5.0)  # die size in mm
+sampling_fraction = 0.1  # share of the dies that is probed
+
+# dies that are completely on the wafer
+radius = wafer_diameter / 2
+index_range = np.arange(-int(radius // pitch[0]), int(radius // pitch[0]) + 1)
+dies = [
+    (x, y) for y in index_range for x in index_range
+    if ((abs(x) + 0.5) * pitch[0]) ** 2 + ((abs(y) + 0.5) * pitch[1]) ** 2 <= radius**2
+]
+
+rng = np.random.default_rng(0)
+selection = sorted(rng.choice(len(dies), int(len(dies) * sampling_fraction), replace=False))
+labels = [f"{dies[i][0]},{dies[i][1]}" for i in selection]
+
+print(f"{len(labels)} of {len(dies)} dies with {pitch[0]} x {pitch[1]} mm on a {wafer_diameter:.0f} mm wafer")
+for order in DIE_ORDERS:
+    start = time.perf_counter()
+    ordered = order_labels(labels, order)
+    duration = time.perf_counter() - start
+    travel_time = estimate_travel_time(parse_positions(ordered), pitch=pitch)
+    print(f"{order}: {travel_time:.0f} s stage travel, ordered in {duration * 1e3:.0f} ms")
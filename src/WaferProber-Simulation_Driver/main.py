@@ -32,6 +32,11 @@
 from __future__ import annotations
 
 from pysweepme.EmptyDeviceClass import EmptyDevice
+from pysweepme.FolderManager import addFolderToPATH
+
+addFolderToPATH()
+
+from die_order import DIE_ORDERS, order_labels
 
 
 class Device(EmptyDevice):
@@ -61,6 +66,7 @@ def __init__(self) -> None:
         self.current_die_y: int = 0
         self.current_subsite: str = ""
         self.is_contacted: bool = False
+        self.die_order: str = "As defined"
 
     def find_ports(self) -> list[str]:
         """Find available ports and return them as a list of strings."""
@@ -68,11 +74,14 @@ def find_ports(self) -> list[str]:
 
     def set_GUIparameter(self) -> dict:  # noqa: N802
         """Returns a dictionary with keys and values to generate GUI elements in the SweepMe! GUI."""
-        return {}
+        return {
+            "Die order": DIE_ORDERS,
+        }
 
     def get_GUIparameter(self, parameter: dict) -> None:  # noqa: N802
         """Receive the values of the GUI parameters that were set by the user in the SweepMe! GUI."""
         self.port_string = parameter["Port"]  # can be used to enable device communication
+        self.die_order = parameter.get("Die order", "As defined")
 
     # here functions start that only exists for the WaferProber module and are called by this module
 
@@ -81,10 +90,11 @@ def get_probeplan(self) -> tuple[list[str], list[str], list[str]]:
 
         If this function is implemented with a 'probeplan: str = ""' parameter, it will open a file dialog to select a
         probeplan file. It reads the probeplan from a given file and returns the lists of wafers, dies, and subsites.
+        Dies and subsites are reordered according to the 'Die order' parameter to reduce the stage travel.
         """
         wafers = ["C1W1", "C1W2", "C2W1"]
-        dies = ["1,1", "1, 13", "7,5", "12,8"]
-        subsites = ["Pos 100, 50", "Pos 75, 150"]
+        dies = order_labels(["1,1", "1, 13", "7,5", "12,8"], self.die_order)
+        subsites = order_labels(["Pos 100, 50", "Pos 75, 150"], self.die_order)
 
         return wafers, dies, subsites
 
@@ -0,0 +1,103 @@
+"""Check that libraries vendored into several drivers are identical.
+
+Drivers add their libs folder to sys.path and import vendored libraries by their top-level name, e.g.
+`import velox` or `from yoctopuce.yocto_api import *`. Python keeps only one module per name in sys.modules,
+so within one SweepMe! process every vendored library is imported once and shared by all drivers. The copy of
+the driver that is loaded first wins. If the copies differ, a driver can silently run with the version of
+another driver, depending on the order in which the drivers were loaded.
+
+Usage:
+    From the root of the repository, call
+
+    `python ./tests/vendored_libraries/check_vendored_libraries.py [<library-name> ...]`
+
+    Without arguments, all libraries that are vendored into more than one driver are checked.
+"""
+
+import hashlib
+import logging
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+logging.basicConfig(level=logging.DEBUG, format="%(levelname)s: %(message)s")
+
+# File types that are loaded when importing a library. Other files like licenses or readmes may differ.
+IMPORTED_SUFFIXES = {".py", ".pyd", ".so", ".dll"}
+
+# Folders inside vendored packages that are not imported by the drivers
+IGNORED_FOLDERS = {"__pycache__", "examples", "tests"}
+
+
+def get_library_files(library_path: Path) -> dict[str, str]:
+    """Return the relative path and sha256 digest of each imported file of a vendored library.
+
+    Args:
+        library_path: Path to a vendored package folder or a single module file.
+    """
+    if library_path.is_file():
+        return {library_path.name: hashlib.sha256(library_path.read_bytes()).hexdigest()}
+
+    files = {}
+    for file in sorted(library_path.rglob("*")):
+        relative_path = file.relative_to(library_path)
+        if not file.is_file() or file.suffix.lower() not in IMPORTED_SUFFIXES:
+            continue
+        if IGNORED_FOLDERS.intersection(relative_path.parts[:-1]):
+            continue
+        files[relative_path.as_posix()] = hashlib.sha256(file.read_bytes()).hexdigest()
+    return files
+
+
+def find_vendored_libraries(src_path: Path) -> dict[str, list[Path]]:
+    """Return all importable libraries of the libs folders by their import name.
+
+    Args:
+        src_path: Folder that contains the drivers.
+    """
+    libraries = defaultdict(list)
+    for libs_path in sorted(src_path.glob("*/libs")):
+        for library_path in sorted(libs_path.iterdir()):
+            if library_path.is_dir() and (library_path / "__init__.py").is_file():
+                libraries[library_path.name].append(library_path)
+            elif library_path.is_file() and library_path.suffix == ".py":
+                libraries[library_path.stem].append(library_path)
+    return libraries
+
+
+def check_library(library_name: str, library_paths: list[Path]) -> bool:
+    """Check if all copies of a vendored library are identical and log the differences.
+
+    Args:
+        library_name: Import name of the library.
+        library_paths: Paths to the copies of the library in the different drivers.
+    """
+    reference_path = library_paths[0]
+    reference_files = get_library_files(reference_path)
+    is_identical = True
+
+    for library_path in library_paths[1:]:
+        library_files = get_library_files(library_path)
+        differing_files = sorted(
+            name
+            for name in reference_files.keys() | library_files.keys()
+            if reference_files.get(name) != library_files.get(name)
+        )
+        if differing_files:
+            is_identical = False
+            logging.error(
+                f"{library_name}: {library_path} differs from {reference_path} in {', '.join(differing_files)}",
+            )
+
+    if is_identical:
+        logging.debug(f"{library_name}: {len(library_paths)} identical copies.")
+    return is_identical
+
+
+vendored_libraries = find_vendored_libraries(Path("src"))
+library_names = sys.argv[1:] or sorted(name for name, paths in vendored_libraries.items() if len(paths) > 1)
+
+failed_libraries = [name for name in library_names if not check_library(name, vendored_libraries[name])]
+if failed_libraries:
+    msg = f"Vendored libraries differ between drivers: {', '.join(failed_libraries)}"
+    raise Exception(msg)